@@ -1,6 +1,8 @@
 import uvicorn
 from fastapi import FastAPI, Request
 from config.config import LearnHouseConfig, get_learnhouse_config
+from src.core.events.database_profiling import QueryCounterMiddleware
+from src.core.events.database_routing import DatabaseRoutingMiddleware
 from src.core.events.events import shutdown_app, startup_app
 from src.router import v1_router
 from fastapi.middleware.cors import CORSMiddleware
@@ -41,6 +43,23 @@ app.add_middleware(
 # Gzip Middleware (will add brotli later)
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+# Read replicas routing
+if learnhouse_config.database_config.sql_replica_connection_strings:
+    app.add_middleware(
+        DatabaseRoutingMiddleware,
+        sticky_seconds=learnhouse_config.database_config.replica_sticky_seconds,
+    )
+
+# SQL statements per request (X-DB-Queries / Server-Timing), N+1 warnings in development
+app.add_middleware(
+    QueryCounterMiddleware,
+    warn_threshold=(
+        learnhouse_config.database_config.repeated_statement_threshold
+        if learnhouse_config.general_config.development_mode
+        else None
+    ),
+)
+
 
 # Events
 app.add_event_handler("startup", startup_app(app))
@@ -0,0 +1,199 @@
+"""
+Endpoint benchmarks against a large synthetic organization.
+
+The app is driven in-process through httpx (no network, no server), latency
+percentiles and SQL statement counts (X-DB-Queries) are reported per endpoint:
+
+    LEARNHOUSE_SQL_CONNECTION_STRING=postgresql://.../learnhouse_bench \\
+        poetry run python -m benchmarks.endpoints --requests 200 --output bench.json
+
+The organization is seeded on the first run and reused afterwards, use a
+dedicated database.
+"""
+
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Callable, Optional
+import httpx
+import typer
+from sqlmodel import Session
+from benchmarks.tenant import BenchTenant, TenantScale, seed_bench_tenant
+
+API_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Builds the path of the i-th request, so that requests rotate over resources
+    path: Callable[[BenchTenant, int], str]
+
+
+SCENARIOS = [
+    Scenario(
+        "course_meta",
+        lambda tenant, i: f"/api/v1/courses/{tenant.course_uuids[i % len(tenant.course_uuids)]}/meta",
+    ),
+    Scenario(
+        "course_listing",
+        lambda tenant, i: f"/api/v1/courses/org_slug/{tenant.org_slug}/page/{i % 5 + 1}/limit/20",
+    ),
+    Scenario("trail", lambda tenant, i: f"/api/v1/trail/org/{tenant.org_id}/trail"),
+    Scenario("org_by_slug", lambda tenant, i: f"/api/v1/orgs/slug/{tenant.org_slug}"),
+    Scenario("org_users", lambda tenant, i: f"/api/v1/orgs/{tenant.org_id}/users"),
+    Scenario(
+        "gradebook",
+        lambda tenant, i: f"/api/v1/assignments/{tenant.assignment_uuids[i % len(tenant.assignment_uuids)]}/submissions",
+    ),
+]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    queries_p50: Optional[float]
+    queries_max: Optional[int]
+
+
+def percentile(durations: list[float], percent: int) -> float:
+    if len(durations) == 1:
+        return durations[0]
+    return statistics.quantiles(durations, n=100, method="inclusive")[percent - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    tenant: BenchTenant,
+    scenario: Scenario,
+    requests: int,
+    warmup: int,
+) -> ScenarioResult:
+    for i in range(warmup):
+        await client.get(scenario.path(tenant, i))
+
+    durations: list[float] = []
+    queries: list[int] = []
+    errors = 0
+    for i in range(requests):
+        start = time.perf_counter()
+        response = await client.get(scenario.path(tenant, i))
+        durations.append((time.perf_counter() - start) * 1000)
+
+        if response.status_code >= 400:
+            errors += 1
+        if "X-DB-Queries" in response.headers:
+            queries.append(int(response.headers["X-DB-Queries"]))
+
+    return ScenarioResult(
+        name=scenario.name,
+        requests=requests,
+        errors=errors,
+        p50_ms=round(percentile(durations, 50), 2),
+        p95_ms=round(percentile(durations, 95), 2),
+        p99_ms=round(percentile(durations, 99), 2),
+        mean_ms=round(statistics.fmean(durations), 2),
+        queries_p50=statistics.median(queries) if queries else None,
+        queries_max=max(queries) if queries else None,
+    )
+
+
+def get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=API_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_benchmarks(
+    scale: float, requests: int, warmup: int, only: list[str]
+) -> dict:
+    from app import app
+    from src.core.events.database import engine, prepare_database_schema
+
+    prepare_database_schema(engine)
+
+    start = time.perf_counter()
+    with Session(engine) as db_session:
+        tenant = seed_bench_tenant(db_session, TenantScale.scaled(scale))
+    seed_seconds = time.perf_counter() - start
+
+    transport = httpx.ASGITransport(app=app)  # type: ignore
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        response = await client.post(
+            "/api/v1/auth/login",
+            data={"username": tenant.admin_email, "password": tenant.admin_password},
+        )
+        response.raise_for_status()
+        client.headers["Authorization"] = (
+            f"Bearer {response.json()['tokens']['access_token']}"
+        )
+
+        results = []
+        for scenario in SCENARIOS:
+            if only and scenario.name not in only:
+                continue
+            results.append(
+                await run_scenario(client, tenant, scenario, requests, warmup)
+            )
+
+    return {
+        "date": datetime.now().isoformat(),
+        "revision": get_git_revision(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "scale": asdict(TenantScale.scaled(scale)),
+        "seed_seconds": round(seed_seconds, 2),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(
+    scale: Annotated[float, typer.Option(help="Size of the synthetic org, 1 = 2000 users / 200 courses")] = 1.0,
+    requests: Annotated[int, typer.Option(help="Measured requests per endpoint")] = 100,
+    warmup: Annotated[int, typer.Option(help="Unmeasured requests per endpoint")] = 5,
+    only: Annotated[Optional[list[str]], typer.Option(help="Endpoints to run")] = None,
+    output: Annotated[Optional[Path], typer.Option(help="Write the results as JSON")] = None,
+):
+    # N+1 warnings of the development mode would drown the report
+    logging.disable(logging.WARNING)
+
+    report = asyncio.run(run_benchmarks(scale, requests, warmup, only or []))
+
+    print(
+        f"{'endpoint':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'queries':>10}{'errors':>8}"
+    )
+    for result in report["results"]:
+        print(
+            f"{result['name']:<16}{result['p50_ms']:>10}{result['p95_ms']:>10}"
+            f"{result['p99_ms']:>10}{str(result['queries_p50']):>10}{result['errors']:>8}"
+        )
+
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    typer.run(main)
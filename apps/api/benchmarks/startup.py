@@ -0,0 +1,92 @@
+"""
+Startup benchmark: import time, startup events and first request latency.
+
+Each run starts a fresh interpreter so that nothing is cached between runs,
+run it against a database shaped like production:
+
+    poetry run python -m benchmarks.startup --runs 10 --output startup.json
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Annotated, Optional
+import typer
+
+API_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the fresh interpreter, prints the timings (seconds) as JSON
+CHILD = """
+import json, time
+start = time.perf_counter()
+from app import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    started = time.perf_counter()
+    response = client.get("/api/v1/health")
+    first_request = time.perf_counter()
+assert response.status_code == 200, response.text
+print(json.dumps({
+    "import": imported - start,
+    "startup": started - imported,
+    "first_request": first_request - started,
+}))
+"""
+
+PHASES = ("process", "import", "startup", "first_request")
+
+
+def run_once() -> dict[str, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["process"] = time.perf_counter() - start
+    return timings
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    return {
+        phase: {
+            "min_ms": round(min(run[phase] for run in runs) * 1000, 1),
+            "p50_ms": round(statistics.median(run[phase] for run in runs) * 1000, 1),
+            "max_ms": round(max(run[phase] for run in runs) * 1000, 1),
+        }
+        for phase in PHASES
+    }
+
+
+def main(
+    runs: Annotated[int, typer.Option(help="Number of cold starts")] = 5,
+    output: Annotated[
+        Optional[Path], typer.Option(help="Write the results as JSON")
+    ] = None,
+):
+    results = []
+    for i in range(runs):
+        results.append(run_once())
+        print(f"run {i + 1}/{runs}: {results[-1]['process'] * 1000:.0f} ms", file=sys.stderr)
+
+    summary = summarize(results)
+
+    print(f"{'phase':<15}{'min':>10}{'p50':>10}{'max':>10}")
+    for phase, stats in summary.items():
+        print(
+            f"{phase:<15}{stats['min_ms']:>10}{stats['p50_ms']:>10}{stats['max_ms']:>10}"
+        )
+
+    if output:
+        output.write_text(json.dumps({"runs": results, "summary": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,454 @@
+"""
+Synthetic large organization for the benchmarks, seeded through the models.
+
+The default scale creates 2000 learners, 200 courses of 5 chapters with
+5 activities each, 10000 course runs with ~40000 trail steps and 10000
+assignment submissions. Bulk inserts are used so that seeding stays in the
+order of a minute on PostgreSQL.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+from sqlalchemy import insert
+from sqlmodel import Session, select
+from src.db.courses.activities import (
+    Activity,
+    ActivitySubTypeEnum,
+    ActivityTypeEnum,
+)
+from src.db.courses.assignments import (
+    Assignment,
+    AssignmentTask,
+    AssignmentTaskSubmission,
+    AssignmentTaskTypeEnum,
+    AssignmentUserSubmission,
+    AssignmentUserSubmissionStatus,
+    GradingTypeEnum,
+)
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.chapters import Chapter
+from src.db.courses.course_chapters import CourseChapter, CourseChapter_Graph
+from src.db.courses.courses import Course
+from src.db.organizations import Organization, OrganizationCreate
+from src.db.resource_authors import ResourceAuthor, ResourceAuthorshipEnum
+from src.db.roles import Role
+from src.db.trail_runs import StatusEnum, TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+from src.db.user_organizations import UserOrganization
+from src.db.users import User, UserCreate
+from src.services.install.install import (
+    install_create_organization,
+    install_create_organization_user,
+    install_default_elements,
+)
+
+BENCH_ORG_SLUG = "bench"
+BENCH_ADMIN_EMAIL = "admin@bench.dev"
+BENCH_ADMIN_PASSWORD = "benchmark"
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class TenantScale:
+    users: int = 2000
+    courses: int = 200
+    chapters_per_course: int = 5
+    activities_per_chapter: int = 5
+    courses_per_user: int = 5
+    # Share of a course's activities completed by an enrolled learner
+    completion: float = 0.16
+
+    @classmethod
+    def scaled(cls, factor: float) -> "TenantScale":
+        return cls(
+            users=max(int(cls.users * factor), 1),
+            courses=max(int(cls.courses * factor), 1),
+        )
+
+
+@dataclass
+class BenchTenant:
+    org_id: int
+    org_slug: str
+    admin_email: str
+    admin_password: str
+    # Sample resources hit by the endpoint benchmarks
+    course_uuids: list[str] = field(default_factory=list)
+    assignment_uuids: list[str] = field(default_factory=list)
+
+
+def insert_rows(db_session: Session, model: Any, rows: list[dict]) -> list[int]:
+    """
+    Bulk insert rows in batches and return their ids, in order
+    """
+    ids: list[int] = []
+    for start in range(0, len(rows), BATCH_SIZE):
+        result = db_session.scalars(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            rows[start : start + BATCH_SIZE],
+        )
+        ids.extend(result.all())
+    return ids
+
+
+def get_bench_tenant(db_session: Session) -> BenchTenant | None:
+    org = db_session.exec(
+        select(Organization).where(Organization.slug == BENCH_ORG_SLUG)
+    ).first()
+    if not org:
+        return None
+
+    course_uuids = db_session.exec(
+        select(Course.course_uuid).where(Course.org_id == org.id).limit(20)
+    ).all()
+    assignment_uuids = db_session.exec(
+        select(Assignment.assignment_uuid).where(Assignment.org_id == org.id).limit(20)
+    ).all()
+
+    return BenchTenant(
+        org_id=org.id,  # type: ignore
+        org_slug=org.slug,
+        admin_email=BENCH_ADMIN_EMAIL,
+        admin_password=BENCH_ADMIN_PASSWORD,
+        course_uuids=list(course_uuids),
+        assignment_uuids=list(assignment_uuids),
+    )
+
+
+def seed_bench_tenant(
+    db_session: Session, scale: TenantScale, seed: int = 42
+) -> BenchTenant:
+    """
+    Create the benchmark organization, or return it when it was already seeded
+    """
+    tenant = get_bench_tenant(db_session)
+    if tenant:
+        return tenant
+
+    rng = random.Random(seed)
+    now = str(datetime.now())
+    timestamps = {"creation_date": now, "update_date": now}
+
+    if not db_session.get(Role, 1):
+        install_default_elements(db_session)
+
+    org = install_create_organization(
+        OrganizationCreate(
+            name="Benchmark University",
+            description="Synthetic organization for benchmarks",
+            slug=BENCH_ORG_SLUG,
+            email="hello@bench.dev",
+            logo_image="",
+            thumbnail_image="",
+        ),
+        db_session,
+    )
+    org_id: int = org.id  # type: ignore
+
+    admin = install_create_organization_user(
+        UserCreate(
+            username="bench_admin",
+            email=BENCH_ADMIN_EMAIL,  # type: ignore
+            password=BENCH_ADMIN_PASSWORD,
+        ),
+        BENCH_ORG_SLUG,
+        db_session,
+    )
+    # Hashing thousands of passwords would dominate the seeding time
+    password_hash = db_session.exec(
+        select(User.password).where(User.id == admin.id)
+    ).one()
+
+    # Users, the admin is also a learner so that its trail is not empty
+    user_ids = insert_rows(
+        db_session,
+        User,
+        [
+            {
+                "username": f"learner_{i}",
+                "first_name": "Learner",
+                "last_name": str(i),
+                "email": f"learner_{i}@bench.dev",
+                "password": password_hash,
+                "user_uuid": f"user_{uuid4()}",
+                "email_verified": True,
+                **timestamps,
+            }
+            for i in range(scale.users)
+        ],
+    )
+    insert_rows(
+        db_session,
+        UserOrganization,
+        [
+            {"user_id": user_id, "org_id": org_id, "role_id": 3, **timestamps}
+            for user_id in user_ids
+        ],
+    )
+    learner_ids = [admin.id, *user_ids]
+
+    # Courses, authored by the admin, with their materialized activity count
+    activities_per_course = scale.chapters_per_course * scale.activities_per_chapter
+    course_uuids = [f"course_{uuid4()}" for _ in range(scale.courses)]
+    course_ids = insert_rows(
+        db_session,
+        Course,
+        [
+            {
+                "name": f"Course {i}",
+                "description": "Synthetic course",
+                "about": "About this course",
+                "learnings": "",
+                "tags": "",
+                "thumbnail_image": "",
+                "public": i % 4 != 0,
+                "org_id": org_id,
+                "course_uuid": course_uuid,
+                "activity_count": activities_per_course,
+                **timestamps,
+            }
+            for i, course_uuid in enumerate(course_uuids)
+        ],
+    )
+    insert_rows(
+        db_session,
+        ResourceAuthor,
+        [
+            {
+                "resource_uuid": course_uuid,
+                "user_id": admin.id,
+                "authorship": ResourceAuthorshipEnum.CREATOR,
+                **timestamps,
+            }
+            for course_uuid in course_uuids
+        ],
+    )
+
+    # Chapters, as a linear chain in the chapter graph
+    chapter_rows = [
+        {
+            "name": f"Chapter {i}",
+            "description": "",
+            "thumbnail_image": "",
+            "org_id": org_id,
+            "course_id": course_id,
+            "chapter_uuid": f"chapter_{uuid4()}",
+            **timestamps,
+        }
+        for course_id in course_ids
+        for i in range(scale.chapters_per_course)
+    ]
+    chapter_ids = insert_rows(db_session, Chapter, chapter_rows)
+    insert_rows(
+        db_session,
+        CourseChapter,
+        [
+            {"course_id": row["course_id"], "chapter_id": chapter_id, "org_id": org_id, **timestamps}
+            for row, chapter_id in zip(chapter_rows, chapter_ids)
+        ],
+    )
+    db_session.execute(
+        insert(CourseChapter_Graph),
+        [
+            {
+                "course_id": chapter_rows[i]["course_id"],
+                "chapter_id": chapter_ids[i],
+                "predecessor_id": chapter_ids[i - 1],
+            }
+            for i in range(len(chapter_ids))
+            if i % scale.chapters_per_course != 0
+        ],
+    )
+
+    # Activities, the last one of each course is an assignment
+    activity_rows = []
+    for row, chapter_id in zip(chapter_rows, chapter_ids):
+        for i in range(scale.activities_per_chapter):
+            activity_rows.append(
+                {
+                    "name": f"Activity {i}",
+                    "activity_type": ActivityTypeEnum.TYPE_DYNAMIC,
+                    "activity_sub_type": ActivitySubTypeEnum.SUBTYPE_DYNAMIC_PAGE,
+                    "content": {"type": "doc", "content": [{"type": "paragraph"}]},
+                    "published": True,
+                    "org_id": org_id,
+                    "course_id": row["course_id"],
+                    "activity_uuid": f"activity_{uuid4()}",
+                    "chapter_id": chapter_id,
+                    "order": i,
+                    **timestamps,
+                }
+            )
+    for row in activity_rows[activities_per_course - 1 :: activities_per_course]:
+        row["activity_type"] = ActivityTypeEnum.TYPE_ASSIGNMENT
+        row["activity_sub_type"] = ActivitySubTypeEnum.SUBTYPE_ASSIGNMENT_ANY
+
+    activity_ids = insert_rows(
+        db_session,
+        Activity,
+        [
+            {key: value for key, value in row.items() if key not in ("chapter_id", "order")}
+            for row in activity_rows
+        ],
+    )
+    insert_rows(
+        db_session,
+        ChapterActivity,
+        [
+            {
+                "order": row["order"],
+                "chapter_id": row["chapter_id"],
+                "activity_id": activity_id,
+                "course_id": row["course_id"],
+                "org_id": org_id,
+                **timestamps,
+            }
+            for row, activity_id in zip(activity_rows, activity_ids)
+        ],
+    )
+    activities_by_course: dict[int, list[tuple[int, dict]]] = {}
+    for row, activity_id in zip(activity_rows, activity_ids):
+        activities_by_course.setdefault(row["course_id"], []).append((activity_id, row))
+
+    # One assignment with a single task per course
+    assignment_rows = []
+    for course_id in course_ids:
+        activity_id, row = activities_by_course[course_id][-1]
+        assignment_rows.append(
+            {
+                "title": "Final assignment",
+                "description": "",
+                "due_date": now,
+                "published": True,
+                "grading_type": GradingTypeEnum.PERCENTAGE,
+                "org_id": org_id,
+                "course_id": course_id,
+                "chapter_id": row["chapter_id"],
+                "activity_id": activity_id,
+                "assignment_uuid": f"assignment_{uuid4()}",
+                **timestamps,
+            }
+        )
+    assignment_ids = insert_rows(db_session, Assignment, assignment_rows)
+    task_ids = insert_rows(
+        db_session,
+        AssignmentTask,
+        [
+            {
+                "title": "Task",
+                "description": "",
+                "hint": "",
+                "reference_file": None,
+                "assignment_type": AssignmentTaskTypeEnum.QUIZ,
+                "contents": {},
+                "max_grade_value": 100,
+                "assignment_task_uuid": f"assignmenttask_{uuid4()}",
+                "assignment_id": assignment_id,
+                "org_id": org_id,
+                "course_id": row["course_id"],
+                "chapter_id": row["chapter_id"],
+                "activity_id": row["activity_id"],
+                **timestamps,
+            }
+            for row, assignment_id in zip(assignment_rows, assignment_ids)
+        ],
+    )
+    assignments_by_course = {
+        row["course_id"]: (assignment_id, task_id, row)
+        for row, assignment_id, task_id in zip(assignment_rows, assignment_ids, task_ids)
+    }
+
+    # Enrolments: a trail per learner, course runs, completed steps and submissions
+    trail_ids = insert_rows(
+        db_session,
+        Trail,
+        [
+            {"org_id": org_id, "user_id": user_id, "trail_uuid": f"trail_{uuid4()}", **timestamps}
+            for user_id in learner_ids
+        ],
+    )
+    enrolments = [
+        (user_id, trail_id, course_id)
+        for user_id, trail_id in zip(learner_ids, trail_ids)
+        for course_id in rng.sample(course_ids, min(scale.courses_per_user, len(course_ids)))
+    ]
+    # Every run completes the first steps of its course, counted on the run
+    completed = max(int(activities_per_course * scale.completion), 1)
+    run_ids = insert_rows(
+        db_session,
+        TrailRun,
+        [
+            {
+                "data": {},
+                "status": StatusEnum.STATUS_IN_PROGRESS,
+                "trail_id": trail_id,
+                "course_id": course_id,
+                "org_id": org_id,
+                "user_id": user_id,
+                "completed_steps": completed,
+                **timestamps,
+            }
+            for user_id, trail_id, course_id in enrolments
+        ],
+    )
+
+    step_rows = []
+    user_submission_rows = []
+    task_submission_rows = []
+    for (user_id, trail_id, course_id), run_id in zip(enrolments, run_ids):
+        for activity_id, _ in activities_by_course[course_id][:completed]:
+            step_rows.append(
+                {
+                    "complete": True,
+                    "teacher_verified": False,
+                    "grade": "",
+                    "data": {},
+                    "trailrun_id": run_id,
+                    "trail_id": trail_id,
+                    "activity_id": activity_id,
+                    "course_id": course_id,
+                    "org_id": org_id,
+                    "user_id": user_id,
+                    **timestamps,
+                }
+            )
+
+        assignment_id, task_id, assignment = assignments_by_course[course_id]
+        user_submission_rows.append(
+            {
+                "submission_status": AssignmentUserSubmissionStatus.SUBMITTED,
+                "grade": 0,
+                "user_id": user_id,
+                "assignment_id": assignment_id,
+                "assignmentusersubmission_uuid": f"assignmentusersubmission_{uuid4()}",
+                **timestamps,
+            }
+        )
+        task_submission_rows.append(
+            {
+                "task_submission": {"answers": [rng.randint(0, 3)]},
+                "grade": rng.randint(0, 100),
+                "task_submission_grade_feedback": "",
+                "assignment_type": AssignmentTaskTypeEnum.QUIZ,
+                "user_id": user_id,
+                "activity_id": assignment["activity_id"],
+                "course_id": course_id,
+                "chapter_id": assignment["chapter_id"],
+                "assignment_task_id": task_id,
+                "assignment_task_submission_uuid": f"assignmenttasksubmission_{uuid4()}",
+                **timestamps,
+            }
+        )
+
+    insert_rows(db_session, TrailStep, step_rows)
+    insert_rows(db_session, AssignmentUserSubmission, user_submission_rows)
+    insert_rows(db_session, AssignmentTaskSubmission, task_submission_rows)
+
+    db_session.commit()
+
+    return get_bench_tenant(db_session)  # type: ignore
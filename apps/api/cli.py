@@ -1,11 +1,10 @@
 import random
 import string
-from typing import Annotated
+from typing import Annotated, Optional
 from pydantic import EmailStr
-from sqlalchemy import create_engine
-from sqlmodel import SQLModel, Session
+from sqlmodel import Session
 import typer
-from config.config import get_learnhouse_config
+from src.core.events.database import engine, prepare_database_schema
 from src.db.organizations import OrganizationCreate
 from src.db.users import UserCreate
 from src.services.install.install import (
@@ -13,6 +12,14 @@ from src.services.install.install import (
     install_create_organization_user,
     install_default_elements,
 )
+from src.services.analytics.rollups import rebuild_analytics, refresh_analytics
+from src.services.search.indexing import reindex_search_documents
+from src.services.trail.export import (
+    ExportFormat,
+    get_learning_records,
+    write_learning_records,
+)
+from src.services.trail.progress_counters import rebuild_progress_counters
 
 cli = typer.Typer()
 
@@ -25,15 +32,13 @@ def generate_password(length):
 def install(
     short: Annotated[bool, typer.Option(help="Install with predefined values")] = False
 ):
-    # Get the database session
-    learnhouse_config = get_learnhouse_config()
-    engine = create_engine(
-        learnhouse_config.database_config.sql_connection_string, echo=False, pool_pre_ping=True  # type: ignore
-    )
-    SQLModel.metadata.create_all(engine)
+    prepare_database_schema(engine)
+
+    with Session(engine) as db_session:
+        install_with_session(db_session, short)
 
-    db_session = Session(engine)
 
+def install_with_session(db_session: Session, short: bool = False):
     if short:
         # Install the default elements
         print("Installing default elements...")
@@ -113,6 +118,61 @@ def install(
 
 
 
+@cli.command()
+def reindex_search(
+    org_id: Annotated[Optional[int], typer.Option(help="Only reindex this organization")] = None
+):
+    """
+    Rebuild the full-text search index (after a migration or a bulk import)
+    """
+    with Session(engine) as db_session:
+        count = reindex_search_documents(db_session, org_id)
+    print(f"{count} search documents indexed ✅")
+
+
+@cli.command()
+def rebuild_counters(
+    org_id: Annotated[Optional[int], typer.Option(help="Only rebuild this organization")] = None
+):
+    """
+    Recount the materialized progress counters (after a migration or a bulk import)
+    """
+    with Session(engine) as db_session:
+        courses, runs = rebuild_progress_counters(db_session, org_id)
+    print(f"{courses} courses and {runs} trail runs recounted ✅")
+
+
+@cli.command()
+def refresh_analytics_rollups(
+    rebuild: Annotated[bool, typer.Option(help="Recompute from scratch (after deleting trails)")] = False
+):
+    """
+    Refresh the course analytics rollups (also done periodically by the API)
+    """
+    with Session(engine) as db_session:
+        if rebuild:
+            count = rebuild_analytics(db_session)
+        else:
+            count = refresh_analytics(db_session)
+    print(f"{count} completed steps rolled up ✅")
+
+
+@cli.command()
+def export_learning_records(
+    org_id: int,
+    output: Annotated[typer.FileTextWrite, typer.Option(help="File to write, stdout by default")] = "-",  # type: ignore
+    format: Annotated[str, typer.Option(help="ndjson or csv")] = "ndjson",
+):
+    """
+    Export the trails, runs, steps and assignment grades of an organization
+    """
+    if format not in ExportFormat.__args__:  # type: ignore
+        raise typer.BadParameter("Expected ndjson or csv", param_hint="--format")
+
+    with Session(engine) as db_session:
+        for chunk in write_learning_records(get_learning_records(db_session, org_id), format):  # type: ignore
+            output.write(chunk)
+
 
 @cli.command()
 def main():
@@ -22,6 +22,16 @@ class GeneralConfig(BaseModel):
 
 class SecurityConfig(BaseModel):
     auth_jwt_secret_key: str
+    # Seconds a worker keeps the compiled RBAC rights of a user, 0 to disable
+    rbac_cache_ttl: int = 60
+    # Seconds a worker keeps the user resolved from a token subject, 0 to disable
+    user_cache_ttl: int = 30
+    # pbkdf2_sha256 rounds, stored hashes with other rounds are upgraded on login
+    password_hash_rounds: int = 29000
+    # Threads hashing passwords outside of the event loop
+    password_hashing_workers: int = 2
+    # Operations allowed to wait for a thread, the others are rejected with a 503
+    password_hashing_max_queue: int = 64
 
 
 class ChromaDBConfig(BaseModel):
@@ -65,10 +75,29 @@ class MailingConfig(BaseModel):
 
 class DatabaseConfig(BaseModel):
     sql_connection_string: Optional[str]
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = -1
+    pool_pre_ping: bool = True
+    statement_timeout: Optional[int] = None  # milliseconds
+    sql_replica_connection_strings: list[str] = []
+    replica_sticky_seconds: int = 5
+    # "create_all" (development) or "verify_migrations" (production, Alembic managed)
+    startup_schema_mode: Literal["create_all", "verify_migrations"] = "create_all"
+    # Development mode warns when a request runs the same statement more often
+    repeated_statement_threshold: int = 5
+    # Recorded progress is written to the trails in batches, at most this often
+    progress_flush_interval_ms: int = 1000
+    progress_flush_batch_size: int = 500
+    # Seconds between two refreshes of the analytics rollups, 0 to disable
+    analytics_refresh_interval: int = 300
 
 
 class RedisConfig(BaseModel):
     redis_connection_string: Optional[str]
+    # Seconds a compiled course outline stays in Redis, 0 to disable
+    course_outline_cache_ttl: int = 3600
 
 
 class InternalStripeConfig(BaseModel):
@@ -130,6 +159,28 @@ def get_learnhouse_config() -> LearnHouseConfig:
     auth_jwt_secret_key = env_auth_jwt_secret_key or yaml_config.get(
         "security", {}
     ).get("auth_jwt_secret_key")
+    env_rbac_cache_ttl = os.environ.get("LEARNHOUSE_RBAC_CACHE_TTL")
+    rbac_cache_ttl = env_rbac_cache_ttl or yaml_config.get("security", {}).get(
+        "rbac_cache_ttl"
+    )
+    env_user_cache_ttl = os.environ.get("LEARNHOUSE_USER_CACHE_TTL")
+    user_cache_ttl = env_user_cache_ttl or yaml_config.get("security", {}).get(
+        "user_cache_ttl"
+    )
+    env_password_hash_rounds = os.environ.get("LEARNHOUSE_PASSWORD_HASH_ROUNDS")
+    password_hash_rounds = env_password_hash_rounds or yaml_config.get(
+        "security", {}
+    ).get("password_hash_rounds")
+    env_password_hashing_workers = os.environ.get("LEARNHOUSE_PASSWORD_HASHING_WORKERS")
+    password_hashing_workers = env_password_hashing_workers or yaml_config.get(
+        "security", {}
+    ).get("password_hashing_workers")
+    env_password_hashing_max_queue = os.environ.get(
+        "LEARNHOUSE_PASSWORD_HASHING_MAX_QUEUE"
+    )
+    password_hashing_max_queue = env_password_hashing_max_queue or yaml_config.get(
+        "security", {}
+    ).get("password_hashing_max_queue")
 
     # Check if environment variables are defined
     env_site_name = os.environ.get("LEARNHOUSE_SITE_NAME")
@@ -149,6 +200,37 @@ def get_learnhouse_config() -> LearnHouseConfig:
     env_allowed_regexp = os.environ.get("LEARNHOUSE_ALLOWED_REGEXP")
     env_self_hosted = os.environ.get("LEARNHOUSE_SELF_HOSTED")
     env_sql_connection_string = os.environ.get("LEARNHOUSE_SQL_CONNECTION_STRING")
+    env_sql_pool_size = os.environ.get("LEARNHOUSE_SQL_POOL_SIZE")
+    env_sql_max_overflow = os.environ.get("LEARNHOUSE_SQL_MAX_OVERFLOW")
+    env_sql_pool_timeout = os.environ.get("LEARNHOUSE_SQL_POOL_TIMEOUT")
+    env_sql_pool_recycle = os.environ.get("LEARNHOUSE_SQL_POOL_RECYCLE")
+    env_sql_pool_pre_ping = os.environ.get("LEARNHOUSE_SQL_POOL_PRE_PING")
+    env_sql_statement_timeout = os.environ.get("LEARNHOUSE_SQL_STATEMENT_TIMEOUT")
+    env_sql_replica_connection_strings = os.environ.get(
+        "LEARNHOUSE_SQL_REPLICA_CONNECTION_STRINGS"
+    )
+    env_sql_replica_sticky_seconds = os.environ.get(
+        "LEARNHOUSE_SQL_REPLICA_STICKY_SECONDS"
+    )
+    env_sql_startup_schema_mode = os.environ.get(
+        "LEARNHOUSE_SQL_STARTUP_SCHEMA_MODE"
+    )
+    env_sql_repeated_statement_threshold = os.environ.get(
+        "LEARNHOUSE_SQL_REPEATED_STATEMENT_THRESHOLD"
+    )
+    env_sql_progress_flush_interval_ms = os.environ.get(
+        "LEARNHOUSE_SQL_PROGRESS_FLUSH_INTERVAL_MS"
+    )
+    env_sql_progress_flush_batch_size = os.environ.get(
+        "LEARNHOUSE_SQL_PROGRESS_FLUSH_BATCH_SIZE"
+    )
+    env_sql_analytics_refresh_interval = os.environ.get(
+        "LEARNHOUSE_SQL_ANALYTICS_REFRESH_INTERVAL"
+    )
+
+    # Replica connection strings should be a comma separated string
+    if env_sql_replica_connection_strings:
+        env_sql_replica_connection_strings = env_sql_replica_connection_strings.split(",")
 
     # Sentry Config
     env_sentry_dsn = os.environ.get("LEARNHOUSE_SENTRY_DSN")
@@ -212,6 +294,53 @@ def get_learnhouse_config() -> LearnHouseConfig:
         "database_config", {}
     ).get("sql_connection_string")
 
+    # Integer database options (unset values fall back to the DatabaseConfig defaults)
+    database_yaml_config = yaml_config.get("database_config", {})
+    database_options = {
+        "pool_size": env_sql_pool_size or database_yaml_config.get("pool_size"),
+        "max_overflow": env_sql_max_overflow
+        or database_yaml_config.get("max_overflow"),
+        "pool_timeout": env_sql_pool_timeout
+        or database_yaml_config.get("pool_timeout"),
+        "pool_recycle": env_sql_pool_recycle
+        or database_yaml_config.get("pool_recycle"),
+        "statement_timeout": env_sql_statement_timeout
+        or database_yaml_config.get("statement_timeout"),
+        "replica_sticky_seconds": env_sql_replica_sticky_seconds
+        or database_yaml_config.get("replica_sticky_seconds"),
+        "repeated_statement_threshold": env_sql_repeated_statement_threshold
+        or database_yaml_config.get("repeated_statement_threshold"),
+        "progress_flush_interval_ms": env_sql_progress_flush_interval_ms
+        or database_yaml_config.get("progress_flush_interval_ms"),
+        "progress_flush_batch_size": env_sql_progress_flush_batch_size
+        or database_yaml_config.get("progress_flush_batch_size"),
+        "analytics_refresh_interval": env_sql_analytics_refresh_interval
+        or database_yaml_config.get("analytics_refresh_interval"),
+    }
+    database_options = {
+        key: int(value) for key, value in database_options.items() if value is not None
+    }
+
+    pool_pre_ping = (
+        env_sql_pool_pre_ping.lower() in ("true", "1")
+        if env_sql_pool_pre_ping is not None
+        else database_yaml_config.get("pool_pre_ping", True)
+    )
+
+    # Read replicas (optional)
+    sql_replica_connection_strings = (
+        env_sql_replica_connection_strings
+        or database_yaml_config.get("replica_connection_strings")
+        or []
+    )
+
+    # Schema handling at startup
+    startup_schema_mode = (
+        env_sql_startup_schema_mode
+        or database_yaml_config.get("startup_schema_mode")
+        or "create_all"
+    )
+
     # AI Config
     env_openai_api_key = os.environ.get("LEARNHOUSE_OPENAI_API_KEY")
     env_is_ai_enabled = os.environ.get("LEARNHOUSE_IS_AI_ENABLED")
@@ -236,6 +365,12 @@ def get_learnhouse_config() -> LearnHouseConfig:
     redis_connection_string = env_redis_connection_string or yaml_config.get(
         "redis_config", {}
     ).get("redis_connection_string")
+    env_course_outline_cache_ttl = os.environ.get(
+        "LEARNHOUSE_COURSE_OUTLINE_CACHE_TTL"
+    )
+    course_outline_cache_ttl = env_course_outline_cache_ttl or yaml_config.get(
+        "redis_config", {}
+    ).get("course_outline_cache_ttl")
 
     # Mailing config
     env_resend_api_key = os.environ.get("LEARNHOUSE_RESEND_API_KEY")
@@ -316,6 +451,14 @@ def get_learnhouse_config() -> LearnHouseConfig:
     )
     database_config = DatabaseConfig(
         sql_connection_string=sql_connection_string,
+        pool_pre_ping=bool(pool_pre_ping),
+        sql_replica_connection_strings=[
+            connection_string.strip()
+            for connection_string in sql_replica_connection_strings
+            if connection_string.strip()
+        ],
+        startup_schema_mode=startup_schema_mode,
+        **database_options,
     )
 
     # AI Config
@@ -337,9 +480,35 @@ def get_learnhouse_config() -> LearnHouseConfig:
         ),
         hosting_config=hosting_config,
         database_config=database_config,
-        security_config=SecurityConfig(auth_jwt_secret_key=auth_jwt_secret_key),
+        security_config=SecurityConfig(
+            auth_jwt_secret_key=auth_jwt_secret_key,
+            **({"rbac_cache_ttl": int(rbac_cache_ttl)} if rbac_cache_ttl is not None else {}),
+            **({"user_cache_ttl": int(user_cache_ttl)} if user_cache_ttl is not None else {}),
+            **(
+                {"password_hash_rounds": int(password_hash_rounds)}
+                if password_hash_rounds is not None
+                else {}
+            ),
+            **(
+                {"password_hashing_workers": int(password_hashing_workers)}
+                if password_hashing_workers is not None
+                else {}
+            ),
+            **(
+                {"password_hashing_max_queue": int(password_hashing_max_queue)}
+                if password_hashing_max_queue is not None
+                else {}
+            ),
+        ),
         ai_config=ai_config,
-        redis_config=RedisConfig(redis_connection_string=redis_connection_string),
+        redis_config=RedisConfig(
+            redis_connection_string=redis_connection_string,
+            **(
+                {"course_outline_cache_ttl": int(course_outline_cache_ttl)}
+                if course_outline_cache_ttl is not None
+                else {}
+            ),
+        ),
         mailing_config=MailingConfig(
             resend_api_key=resend_api_key, system_email_address=system_email_address
         ),
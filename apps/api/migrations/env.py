@@ -1,6 +1,4 @@
-import importlib
 from logging.config import fileConfig
-import os
 import alembic_postgresql_enum # noqa: F401
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
@@ -28,28 +26,7 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 
 # IMPORTING ALL SCHEMAS
-base_dir = 'src/db'
-base_module_path = 'src.db'
-
-# Recursively walk through the base directory
-for root, dirs, files in os.walk(base_dir):
-    # Filter out __init__.py and non-Python files
-    module_files = [f for f in files if f.endswith('.py') and f != '__init__.py']
-    # Calculate the module's base path from its directory structure
-    path_diff = os.path.relpath(root, base_dir)
-    if path_diff == '.':
-        # Root of the base_dir, no additional path to add
-        current_module_base = base_module_path
-    else:
-        # Convert directory path to a module path
-        current_module_base = f"{base_module_path}.{path_diff.replace(os.sep, '.')}"
-    
-    # Dynamically import each module
-    for file_name in module_files:
-        module_name = file_name[:-3]  # Remove the '.py' extension
-        full_module_path = f"{current_module_base}.{module_name}"
-        importlib.import_module(full_module_path)
-
+import src.db.models  # noqa: F401, E402
 # IMPORTING ALL SCHEMAS
 
 target_metadata = SQLModel.metadata
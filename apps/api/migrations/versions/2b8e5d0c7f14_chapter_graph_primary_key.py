@@ -0,0 +1,35 @@
+"""Chapter graph primary key
+
+Revision ID: 2b8e5d0c7f14
+Revises: 7c1f4e2b9a30
+Create Date: 2026-10-18 15:21:48.903117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8e5d0c7f14'
+down_revision: Union[str, None] = '7c1f4e2b9a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A chapter can have several predecessors, the edge is the whole key
+    op.drop_constraint('coursechapter_graph_pkey', 'coursechapter_graph', type_='primary')
+    op.create_primary_key(
+        'coursechapter_graph_pkey',
+        'coursechapter_graph',
+        ['course_id', 'chapter_id', 'predecessor_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('coursechapter_graph_pkey', 'coursechapter_graph', type_='primary')
+    op.create_primary_key(
+        'coursechapter_graph_pkey', 'coursechapter_graph', ['course_id', 'chapter_id']
+    )
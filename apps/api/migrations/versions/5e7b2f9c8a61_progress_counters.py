@@ -0,0 +1,49 @@
+"""Progress counters
+
+Revision ID: 5e7b2f9c8a61
+Revises: 9d4a6c1e3b57
+Create Date: 2026-10-18 18:40:27.093615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = '5e7b2f9c8a61'
+down_revision: Union[str, None] = '9d4a6c1e3b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'course', sa.Column('activity_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'trailrun', sa.Column('completed_steps', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # Initial counts, `cli.py rebuild-counters` recounts them later if needed
+    op.execute(
+        """
+        UPDATE course SET activity_count = (
+            SELECT count(*) FROM chapteractivity WHERE chapteractivity.course_id = course.id
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE trailrun SET completed_steps = (
+            SELECT count(*) FROM trailstep
+            WHERE trailstep.trailrun_id = trailrun.id AND trailstep.complete
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('trailrun', 'completed_steps')
+    op.drop_column('course', 'activity_count')
@@ -0,0 +1,52 @@
+"""Search documents
+
+Revision ID: 7c1f4e2b9a30
+Revises: f953ae4a2785
+Create Date: 2026-10-18 14:02:17.514203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f4e2b9a30'
+down_revision: Union[str, None] = 'f953ae4a2785'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors SEARCH_TSVECTOR in src/db/search_documents.py, queries only use the
+# index if they use the exact same expression
+SEARCH_TSVECTOR = "to_tsvector('simple', searchdocument.title || ' ' || searchdocument.body)"
+
+
+def upgrade() -> None:
+    op.create_table('searchdocument',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('org_id', sa.Integer(), nullable=True),
+    sa.Column('resource_type', sa.Enum('COURSE', 'ACTIVITY', 'COLLECTION', name='searchresourcetypeenum'), nullable=False),
+    sa.Column('resource_uuid', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=True),
+    sa.Column('title', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('body', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['org_id'], ['organization.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_searchdocument_resource_uuid', 'searchdocument', ['resource_uuid'], unique=True)
+    op.create_index('ix_searchdocument_course_id', 'searchdocument', ['course_id'], unique=False)
+    op.create_index('ix_searchdocument_org_id_resource_type', 'searchdocument', ['org_id', 'resource_type'], unique=False)
+    op.execute(f"CREATE INDEX ix_searchdocument_tsvector ON searchdocument USING gin (({SEARCH_TSVECTOR}))")
+    # Existing courses, activities and collections are indexed by
+    # `python cli.py reindex-search`
+
+
+def downgrade() -> None:
+    op.drop_index('ix_searchdocument_tsvector', table_name='searchdocument')
+    op.drop_index('ix_searchdocument_org_id_resource_type', table_name='searchdocument')
+    op.drop_index('ix_searchdocument_course_id', table_name='searchdocument')
+    op.drop_index('ix_searchdocument_resource_uuid', table_name='searchdocument')
+    op.drop_table('searchdocument')
+    sa.Enum(name='searchresourcetypeenum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,82 @@
+"""Trail progress unique keys
+
+Revision ID: 9d4a6c1e3b57
+Revises: 2b8e5d0c7f14
+Create Date: 2026-10-18 17:02:11.517284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a6c1e3b57'
+down_revision: Union[str, None] = '2b8e5d0c7f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicates are merged into the oldest row before adding the unique keys
+    op.execute(
+        """
+        UPDATE trailrun SET trail_id = keep.id
+        FROM trail, (SELECT min(id) AS id, org_id, user_id FROM trail GROUP BY org_id, user_id) AS keep
+        WHERE trailrun.trail_id = trail.id AND trail.id <> keep.id
+        AND trail.org_id = keep.org_id AND trail.user_id = keep.user_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE trailstep SET trail_id = keep.id
+        FROM trail, (SELECT min(id) AS id, org_id, user_id FROM trail GROUP BY org_id, user_id) AS keep
+        WHERE trailstep.trail_id = trail.id AND trail.id <> keep.id
+        AND trail.org_id = keep.org_id AND trail.user_id = keep.user_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM trail USING trail AS keep
+        WHERE trail.org_id = keep.org_id AND trail.user_id = keep.user_id AND trail.id > keep.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE trailstep SET trailrun_id = keep.id
+        FROM trailrun, (SELECT min(id) AS id, course_id, user_id FROM trailrun GROUP BY course_id, user_id) AS keep
+        WHERE trailstep.trailrun_id = trailrun.id AND trailrun.id <> keep.id
+        AND trailrun.course_id = keep.course_id AND trailrun.user_id = keep.user_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM trailrun USING trailrun AS keep
+        WHERE trailrun.course_id = keep.course_id AND trailrun.user_id = keep.user_id
+        AND trailrun.id > keep.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM trailstep USING trailstep AS keep
+        WHERE trailstep.trailrun_id = keep.trailrun_id AND trailstep.activity_id = keep.activity_id
+        AND trailstep.id > keep.id
+        """
+    )
+
+    op.create_unique_constraint('uq_trail_org_id_user_id', 'trail', ['org_id', 'user_id'])
+    op.create_unique_constraint(
+        'uq_trailrun_course_id_user_id', 'trailrun', ['course_id', 'user_id']
+    )
+    op.create_unique_constraint(
+        'uq_trailstep_trailrun_id_activity_id', 'trailstep', ['trailrun_id', 'activity_id']
+    )
+    # The unique key covers the former (course_id, user_id) lookup index
+    op.drop_index('ix_trailrun_course_id_user_id', table_name='trailrun', if_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_trailstep_trailrun_id_activity_id', 'trailstep', type_='unique')
+    op.drop_constraint('uq_trailrun_course_id_user_id', 'trailrun', type_='unique')
+    op.drop_constraint('uq_trail_org_id_user_id', 'trail', type_='unique')
@@ -0,0 +1,63 @@
+"""Course analytics rollups
+
+Revision ID: b3f8d2a6e914
+Revises: 5e7b2f9c8a61
+Create Date: 2026-10-18 20:12:54.361842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d2a6e914'
+down_revision: Union[str, None] = '5e7b2f9c8a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'analyticswatermark',
+        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('last_id', sa.Integer(), nullable=False),
+        sa.Column('next_id', sa.Integer(), nullable=False),
+        sa.Column('update_date', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.create_table(
+        'courseanalytics',
+        sa.Column('course_id', sa.BigInteger(), nullable=False),
+        sa.Column('org_id', sa.BigInteger(), nullable=True),
+        sa.Column('learners_started', sa.Integer(), nullable=False),
+        sa.Column('learners_completed', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['org_id'], ['organization.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('course_id'),
+    )
+    op.create_table(
+        'courseactivityanalytics',
+        sa.Column('course_id', sa.BigInteger(), nullable=False),
+        sa.Column('activity_id', sa.BigInteger(), nullable=False),
+        sa.Column('completions', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['activity_id'], ['activity.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('course_id', 'activity_id'),
+    )
+    op.create_table(
+        'coursecompletiontimeanalytics',
+        sa.Column('course_id', sa.BigInteger(), nullable=False),
+        sa.Column('bucket', sa.Integer(), nullable=False),
+        sa.Column('learners', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['course_id'], ['course.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('course_id', 'bucket'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('coursecompletiontimeanalytics')
+    op.drop_table('courseactivityanalytics')
+    op.drop_table('courseanalytics')
+    op.drop_table('analyticswatermark')
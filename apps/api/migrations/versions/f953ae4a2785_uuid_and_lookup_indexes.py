@@ -0,0 +1,58 @@
+"""UUID and lookup indexes
+
+Revision ID: f953ae4a2785
+Revises: a0d67116ca3e
+Create Date: 2026-10-18 09:12:41.120394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa # noqa: F401
+import sqlmodel # noqa: F401
+
+# revision identifiers, used by Alembic.
+revision: str = 'f953ae4a2785'
+down_revision: Union[str, None] = 'a0d67116ca3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, unique), mirrors the index declarations in src/db
+INDEXES = [
+    ('ix_course_course_uuid', 'course', ['course_uuid'], True),
+    ('ix_activity_activity_uuid', 'activity', ['activity_uuid'], True),
+    ('ix_assignment_assignment_uuid', 'assignment', ['assignment_uuid'], True),
+    ('ix_block_block_uuid', 'block', ['block_uuid'], True),
+    ('ix_resourceauthor_resource_uuid_user_id', 'resourceauthor', ['resource_uuid', 'user_id'], False),
+    ('ix_usergroupresource_resource_uuid', 'usergroupresource', ['resource_uuid'], False),
+    ('ix_trailstep_trailrun_id_user_id', 'trailstep', ['trailrun_id', 'user_id'], False),
+    ('ix_trailstep_course_id_user_id', 'trailstep', ['course_id', 'user_id'], False),
+    ('ix_trailrun_trail_id_user_id', 'trailrun', ['trail_id', 'user_id'], False),
+]
+
+
+def upgrade() -> None:
+    # Built concurrently on PostgreSQL so that the tables stay writable,
+    # CREATE INDEX CONCURRENTLY can't run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
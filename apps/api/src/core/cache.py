@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+import redis
+from config.config import get_learnhouse_config
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe in-process cache with a TTL and a size bound (oldest entries
+    are evicted first).
+
+    Loads read `generation` before querying and pass it to `set`, so that a
+    value loaded before an invalidation is never stored.
+    """
+
+    def __init__(self, ttl: int, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.generation = 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: K, value: V, generation: int):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Optional[Iterable[K]] = None):
+        """
+        Drop the given keys, or every entry when `keys` is None
+        """
+        with self._lock:
+            self.generation += 1
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K, V], bool]):
+        with self._lock:
+            self.generation += 1
+            for key in [
+                key for key, (_, value) in self._entries.items() if predicate(key, value)
+            ]:
+                del self._entries[key]
+
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    Shared Redis client, None when Redis is not configured
+    """
+    global _redis_client
+    if _redis_client is None:
+        redis_conn_string = get_learnhouse_config().redis_config.redis_connection_string
+        if not redis_conn_string:
+            return None
+        _redis_client = redis.Redis.from_url(redis_conn_string)
+    return _redis_client
+
+
+class InvalidationChannel:
+    """
+    Propagates cache invalidations to every process through Redis pub/sub.
+
+    `publish` applies the message locally right away, the other processes
+    apply it from a background listener thread. When the listener loses its
+    connection, `on_reset` is called (messages may have been missed) and the
+    listener is restarted by the next `ensure_listener` call. Without Redis,
+    invalidations stay local and other processes rely on their TTL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        on_message: Callable[[str], None],
+        on_reset: Callable[[], None],
+    ):
+        self.name = name
+        self.on_message = on_message
+        self.on_reset = on_reset
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def _handle_message(self, message):
+        data = message["data"]
+        self.on_message(data.decode() if isinstance(data, bytes) else data)
+
+    def _handle_error(self, error, pubsub, thread):
+        logging.warning("Cache invalidation listener %s stopped: %s", self.name, error)
+        thread.stop()
+        pubsub.close()
+        self.on_reset()
+        self._listener = None
+
+    def ensure_listener(self):
+        if self._listener is not None:
+            return
+
+        with self._lock:
+            if self._listener is not None:
+                return
+            client = get_redis_client()
+            if not client:
+                return
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{self.name: self._handle_message})
+            except redis.RedisError as error:
+                logging.warning(
+                    "Cache invalidation listener %s unavailable: %s", self.name, error
+                )
+                return
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self._handle_error
+            )
+
+    def publish(self, message: str):
+        self.on_message(message)
+
+        client = get_redis_client()
+        if not client:
+            return
+        try:
+            client.publish(self.name, message)
+        except redis.RedisError as error:
+            # Other processes catch up when their entries expire
+            logging.warning("Could not publish invalidation on %s: %s", self.name, error)
+
+
+## 🔢 Entity versions ##
+
+
+def _new_version() -> int:
+    # Versions recreated after a Redis flush start past every version handed out
+    return int(time.time() * 1000)
+
+
+def get_entity_versions(keys: list[str]) -> Optional[list[str]]:
+    """
+    Current version of each key (created on first read), None without Redis
+    """
+    client = get_redis_client()
+    if not client:
+        return None
+    if not keys:
+        return []
+    try:
+        versions = client.mget(keys)
+        missing = [key for key, version in zip(keys, versions) if version is None]
+        if missing:
+            pipeline = client.pipeline(transaction=False)
+            for key in missing:
+                pipeline.set(key, _new_version(), nx=True)
+            pipeline.execute()
+            versions = client.mget(keys)
+    except redis.RedisError as error:
+        logging.warning("Entity versions unavailable: %s", error)
+        return None
+    return [version.decode() if version else "0" for version in versions]
+
+
+def bump_entity_versions(keys: Iterable[str]):
+    client = get_redis_client()
+    keys = set(keys)
+    if not client or not keys:
+        return
+    try:
+        pipeline = client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.set(key, _new_version(), nx=True)
+            pipeline.incr(key)
+        pipeline.execute()
+    except redis.RedisError as error:
+        # Readers keep the previous version until Redis is back
+        logging.warning("Could not bump entity versions: %s", error)
@@ -1,54 +1,134 @@
 import logging
 import os
-import importlib
 from config.config import get_learnhouse_config
 from fastapi import FastAPI
+from sqlalchemy import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database_pool import get_engine_options
+from src.core.events.database_routing import RoutingSession, database_routing
+import src.db.models  # noqa: F401
 
-def import_all_models():
-    base_dir = 'src/db'
-    base_module_path = 'src.db'
-    
-    # Recursively walk through the base directory
-    for root, dirs, files in os.walk(base_dir):
-        # Filter out __init__.py and non-Python files
-        module_files = [f for f in files if f.endswith('.py') and f != '__init__.py']
-        
-        # Calculate the module's base path from its directory structure
-        path_diff = os.path.relpath(root, base_dir)
-        if path_diff == '.':
-            current_module_base = base_module_path
-        else:
-            current_module_base = f"{base_module_path}.{path_diff.replace(os.sep, '.')}"
-        
-        # Dynamically import each module
-        for file_name in module_files:
-            module_name = file_name[:-3]  # Remove the '.py' extension
-            full_module_path = f"{current_module_base}.{module_name}"
-            importlib.import_module(full_module_path)
-
-# Import all models before creating engine
-import_all_models()
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "migrations"
+)
 
 learnhouse_config = get_learnhouse_config()
+
+# Single engine per process, shared by the app, the auto-installation and the CLI
 engine = create_engine(
     learnhouse_config.database_config.sql_connection_string,  # type: ignore
-    echo=False, 
-    pool_pre_ping=True  # type: ignore
+    **get_engine_options(learnhouse_config.database_config),
+)
+
+
+def get_async_connection_string(sql_connection_string: str) -> str:
+    """
+    Map a sync connection string to its async driver (asyncpg / aiosqlite)
+    """
+    url = make_url(sql_connection_string)
+
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url.render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    get_async_connection_string(learnhouse_config.database_config.sql_connection_string),  # type: ignore
+    **get_engine_options(learnhouse_config.database_config, is_async=True),
 )
 
-# Create all tables after importing all models
-SQLModel.metadata.create_all(engine)
+# Read replicas (optional), used by read-only request scopes
+replica_engines = [
+    create_engine(
+        replica_connection_string,
+        **get_engine_options(learnhouse_config.database_config),
+    )
+    for replica_connection_string in learnhouse_config.database_config.sql_replica_connection_strings
+]
+async_replica_engines = [
+    create_async_engine(
+        get_async_connection_string(replica_connection_string),
+        **get_engine_options(learnhouse_config.database_config, is_async=True),
+    )
+    for replica_connection_string in learnhouse_config.database_config.sql_replica_connection_strings
+]
+
+
+def is_read_only_scope() -> bool:
+    routing = database_routing.get()
+    return bool(routing and routing.read_only)
+
+
+def verify_migrations(engine: Engine):
+    """
+    Check that the database is at the Alembic head (one version table read)
+    """
+    # Imported here, only production startups pay for loading Alembic
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    heads = set(ScriptDirectory(MIGRATIONS_DIR).get_heads())
+
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+
+    if current != heads:
+        raise RuntimeError(
+            f"Database schema is at {sorted(current) or 'no revision'}, expected "
+            f"{sorted(heads)}. Run `alembic upgrade head` before starting LearnHouse."
+        )
+
+
+def prepare_database_schema(engine: Engine):
+    if learnhouse_config.database_config.startup_schema_mode == "verify_migrations":
+        verify_migrations(engine)
+    else:
+        SQLModel.metadata.create_all(engine)
+
 
 async def connect_to_db(app: FastAPI):
     app.db_engine = engine  # type: ignore
+    app.async_db_engine = async_engine  # type: ignore
+    prepare_database_schema(engine)
     logging.info("LearnHouse database has been started.")
-    SQLModel.metadata.create_all(engine)
 
-def get_db_session():
-    with Session(engine) as session:
+
+async def get_async_db_session():
+    replicas = (
+        [replica.sync_engine for replica in async_replica_engines]
+        if is_read_only_scope()
+        else None
+    )
+    # Objects are not expired on commit so they can still be read
+    # without triggering an implicit (blocking) refresh
+    async with AsyncSession(
+        async_engine,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+    ) as session:
         yield session
 
+
+def get_upsert_insert(db_session: Session):
+    """
+    INSERT construct of the session dialect, with ON CONFLICT support
+    """
+    if db_session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 async def close_database(app: FastAPI):
+    await async_engine.dispose()
+    for async_replica_engine in async_replica_engines:
+        await async_replica_engine.dispose()
     logging.info("LearnHouse has been shut down.")
     return app
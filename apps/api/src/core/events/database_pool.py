@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import Any
+from pydantic import BaseModel
+from sqlalchemy import Engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from config.config import DatabaseConfig
+
+
+class PoolWaitStats:
+    """
+    Thread-safe counters of the time spent waiting for a pooled connection
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats  # type: ignore
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+class PoolWaitRead(BaseModel):
+    checkouts: int
+    timeouts: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+
+
+class PoolStatsRead(BaseModel):
+    engine: str
+    pool_class: str
+    size: int | None
+    max_overflow: int | None
+    checked_out: int | None
+    idle: int | None
+    overflow: int | None
+    wait: PoolWaitRead | None
+
+
+def get_engine_options(
+    database_config: DatabaseConfig, is_async: bool = False
+) -> dict[str, Any]:
+    """
+    Build the create_engine / create_async_engine keyword arguments from the config
+    """
+    options: dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": database_config.pool_pre_ping,
+        "pool_recycle": database_config.pool_recycle,
+    }
+
+    backend = make_url(database_config.sql_connection_string).get_backend_name()  # type: ignore
+
+    # SQLite (tests, local development) keeps SQLAlchemy's default pools
+    if backend == "sqlite":
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=database_config.pool_size,
+        max_overflow=database_config.max_overflow,
+        pool_timeout=database_config.pool_timeout,
+    )
+
+    if backend == "postgresql" and database_config.statement_timeout:
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {
+                    "statement_timeout": str(database_config.statement_timeout)
+                }
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={database_config.statement_timeout}"
+            }
+
+    return options
+
+
+def get_pool_stats(name: str, engine: Engine | AsyncEngine) -> PoolStatsRead:
+    pool = engine.pool
+    stats = PoolStatsRead(
+        engine=name,
+        pool_class=type(pool).__name__,
+        size=None,
+        max_overflow=None,
+        checked_out=None,
+        idle=None,
+        overflow=None,
+        wait=None,
+    )
+
+    if isinstance(pool, QueuePool):
+        stats.size = pool.size()
+        stats.max_overflow = pool._max_overflow
+        stats.checked_out = pool.checkedout()
+        stats.idle = pool.checkedin()
+        # overflow() starts at -size and only becomes positive past pool_size
+        stats.overflow = max(pool.overflow(), 0)
+
+    wait_stats: PoolWaitStats | None = getattr(pool, "wait_stats", None)
+    if wait_stats:
+        attempts = wait_stats.checkouts + wait_stats.timeouts
+        stats.wait = PoolWaitRead(
+            checkouts=wait_stats.checkouts,
+            timeouts=wait_stats.timeouts,
+            total_ms=round(wait_stats.total_wait * 1000, 3),
+            avg_ms=round(wait_stats.total_wait * 1000 / attempts, 3) if attempts else 0,
+            max_ms=round(wait_stats.max_wait * 1000, 3),
+        )
+
+    return stats
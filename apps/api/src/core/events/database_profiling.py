@@ -0,0 +1,104 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from fastapi import Request
+from sqlalchemy import Engine, event
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+
+class QueryStats:
+    """
+    SQL statements executed while tracking, with their total database time
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # Statement text (with placeholders) -> number of executions
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+# Mutated in place, so that sessions running in the threadpool or in
+# SQLAlchemy's async greenlets (copied contexts) report to the same request
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if query_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+    start_times = conn.info.get("query_start_time")
+    if stats is not None and start_times:
+        stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed by every engine in the current context
+    """
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    Reports the SQL statements and database time of each request in the
+    `X-DB-Queries` and `Server-Timing` headers.
+
+    With `warn_threshold` set (development mode), a warning is logged when the
+    same statement runs more than `warn_threshold` times in one request, which
+    is almost always an N+1 query loop.
+    """
+
+    def __init__(self, app, warn_threshold: Optional[int] = None):
+        super().__init__(app)
+        self.warn_threshold = warn_threshold
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers.append(
+            "Server-Timing", f"db;dur={stats.duration * 1000:.1f};desc=\"{stats.count} queries\""
+        )
+
+        if self.warn_threshold:
+            for statement, count in stats.repeated_statements(self.warn_threshold):
+                logging.warning(
+                    "Possible N+1 query: %s %s ran the same statement %d times: %s",
+                    request.method,
+                    request.url.path,
+                    count,
+                    " ".join(statement.split())[:300],
+                )
+
+        return response
@@ -0,0 +1,113 @@
+import random
+import time
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import Engine
+from sqlmodel import Session
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+PRIMARY_STICKY_COOKIE = "learnhouse_db_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class DatabaseRouting:
+    """
+    Per-request routing state shared between the middleware and the sessions
+    """
+
+    def __init__(self, read_only: bool):
+        # Whether the request may read from a replica
+        self.read_only = read_only
+        # Set as soon as a session of this request writes to the primary
+        self.wrote = False
+
+
+database_routing: ContextVar[Optional[DatabaseRouting]] = ContextVar(
+    "database_routing", default=None
+)
+
+
+class RoutingSession(Session):
+    """
+    Session reading from a replica until it writes, then sticking to the primary.
+
+    Replicas are only handed to sessions of read-only request scopes, any other
+    session (writes, CLI, tests) behaves like a plain Session on the primary.
+    """
+
+    def __init__(self, *args, replicas: Optional[list[Engine]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One replica per session so that a request reads a consistent snapshot
+        self.replica = random.choice(replicas) if replicas else None
+        self.use_primary = self.replica is None
+
+    def mark_as_written(self):
+        self.use_primary = True
+        routing = database_routing.get()
+        if routing:
+            routing.wrote = True
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self.use_primary:
+            return primary
+
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.mark_as_written()
+            return primary
+
+        # SELECT ... FOR UPDATE needs the row lock on the primary
+        if getattr(clause, "_for_update_arg", None) is not None:
+            return primary
+
+        return self.replica
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            self.mark_as_written()
+        super().flush(objects)
+
+
+class DatabaseRoutingMiddleware(BaseHTTPMiddleware):
+    """
+    Routes read-only requests to the replicas with read-your-writes stickiness.
+
+    A request is read-only when it uses a safe method and the browser did not
+    write in the last `sticky_seconds` (tracked with a cookie), so that a user
+    reloading a page right after a change never reads a lagging replica.
+    """
+
+    def __init__(self, app, sticky_seconds: int):
+        super().__init__(app)
+        self.sticky_seconds = sticky_seconds
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        try:
+            primary_until = float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+
+        routing = DatabaseRouting(
+            read_only=request.method in SAFE_METHODS and primary_until < time.time()
+        )
+        token = database_routing.set(routing)
+        try:
+            response = await call_next(request)
+        finally:
+            database_routing.reset(token)
+
+        if routing.wrote or request.method not in SAFE_METHODS:
+            response.set_cookie(
+                PRIMARY_STICKY_COOKIE,
+                str(time.time() + self.sticky_seconds),
+                max_age=self.sticky_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+
+        return response
@@ -3,9 +3,11 @@ from fastapi import FastAPI
 from config.config import LearnHouseConfig, get_learnhouse_config
 from src.core.events.autoinstall import auto_install
 from src.core.events.content import check_content_directory
-from src.core.events.database import close_database, connect_to_db
+from src.core.events.database import close_database, connect_to_db, engine
 from src.core.events.logs import create_logs_dir
 from src.core.events.sentry import init_sentry
+from src.services.analytics.rollups import analytics_refresher
+from src.services.trail.progress import progress_flusher
 
 
 def startup_app(app: FastAPI) -> Callable:
@@ -29,11 +31,19 @@ def startup_app(app: FastAPI) -> Callable:
         # Check if auto-installation is needed
         auto_install()
 
+        # Write recorded progress in batches
+        progress_flusher.start(engine)
+
+        # Refresh the analytics rollups incrementally
+        analytics_refresher.start(engine)
+
     return start_app
 
 
 def shutdown_app(app: FastAPI) -> Callable:
     async def close_app() -> None:
+        analytics_refresher.stop()
+        progress_flusher.stop(engine)
         await close_database(app)
 
     return close_app
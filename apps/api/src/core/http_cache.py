@@ -0,0 +1,63 @@
+"""
+Conditional GET helpers.
+
+Services derive a strong ETag from the versions or update dates of what a
+response is built from, and check it before building the response:
+
+    etag = make_etag("org", org.id, org.update_date)
+    not_modified = check_not_modified(request, response, etag, public=True)
+    if not_modified:
+        return not_modified
+"""
+
+import hashlib
+from typing import Optional
+from fastapi import Request, Response, status
+
+# Clients and shared caches may keep responses but have to revalidate them
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("\x1f".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether `If-None-Match` lists `etag`, compared weakly as required for GET
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag in candidates
+
+
+def get_cache_headers(etag: str, public: bool) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": PUBLIC_CACHE_CONTROL if public else PRIVATE_CACHE_CONTROL,
+        # Anonymous and authenticated readers get different responses
+        "Vary": "Authorization, Cookie",
+    }
+
+
+def check_not_modified(
+    request: Request, response: Optional[Response], etag: str, public: bool = False
+) -> Optional[Response]:
+    """
+    304 response if the client already has this version, otherwise the cache
+    headers are set on `response` and None is returned. Internal callers
+    without a response always get None.
+    """
+    if response is None:
+        return None
+    headers = get_cache_headers(etag, public)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,110 @@
+"""
+Keyset (cursor) pagination.
+
+Listings are sorted on a unique key and a page starts right after the key of
+the last row of the previous page, so deep pages cost the same as the first
+one. The key is handed to clients as an opaque cursor:
+
+    page = await paginate(statement, Course.id, db_session, cursor, limit)
+    return page.copy(update={"items": [CourseRead.model_validate(c) for c in page.items]})
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Generic, List, Optional, TypeVar
+from fastapi import HTTPException, status
+from pydantic.generics import GenericModel
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_LIMIT = 10
+MAX_PAGE_LIMIT = 100
+
+# Totals are counted up to this many rows, larger totals are reported as
+# not exact
+TOTAL_COUNT_CAP = 10000
+
+
+class Page(GenericModel, Generic[T]):
+    items: List[T]
+    # None on the last page
+    next_cursor: Optional[str] = None
+    # Only counted when asked for
+    total: Optional[int] = None
+    total_is_exact: bool = True
+
+
+def encode_cursor(key: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([key]).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (key,) = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        key = None
+
+    # Keys are integer ids, anything else would reach the database
+    if not isinstance(key, int) or isinstance(key, bool):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return key
+
+
+async def count_total(
+    statement, db_session: AsyncSession
+) -> tuple[int, bool]:
+    """
+    Number of rows of a listing, up to `TOTAL_COUNT_CAP`, and whether it is exact
+    """
+    capped = statement.order_by(None).limit(TOTAL_COUNT_CAP + 1).subquery()
+    result = await db_session.exec(select(func.count()).select_from(capped))
+    total = result.one()
+    if total > TOTAL_COUNT_CAP:
+        return TOTAL_COUNT_CAP, False
+    return total, True
+
+
+async def paginate(
+    statement,
+    key_column,
+    db_session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    include_total: bool = False,
+) -> Page[Any]:
+    """
+    Page of rows of `statement` sorted on the unique integer `key_column`, starting
+    after `cursor`. Items are the raw rows, callers convert them.
+    """
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+    total, total_is_exact = None, True
+    if include_total:
+        total, total_is_exact = await count_total(statement, db_session)
+
+    if cursor:
+        statement = statement.where(key_column > decode_cursor(cursor))
+
+    # One more row tells if there is a next page
+    statement = statement.order_by(key_column).limit(limit + 1)
+    rows = list((await db_session.exec(statement)).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+
+    return Page[Any](
+        items=rows,
+        next_cursor=next_cursor,
+        total=total,
+        total_is_exact=total_is_exact,
+    )
@@ -0,0 +1,76 @@
+from typing import List, Optional
+from sqlalchemy import BigInteger, Column, ForeignKey
+from sqlmodel import Field, SQLModel
+
+
+class AnalyticsWatermark(SQLModel, table=True):
+    """
+    Progress of the rollup refresh over an append-only table. Rows up to
+    `last_id` are rolled up, rows up to `next_id` (the highest id seen by the
+    previous refresh) are rolled up by the next one.
+    """
+
+    name: str = Field(primary_key=True)
+    last_id: int = 0
+    next_id: int = 0
+    update_date: str = ""
+
+
+class CourseAnalytics(SQLModel, table=True):
+    course_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("course.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    org_id: int = Field(
+        sa_column=Column(BigInteger, ForeignKey("organization.id", ondelete="CASCADE"))
+    )
+    learners_started: int = 0
+    learners_completed: int = 0
+
+
+class CourseActivityAnalytics(SQLModel, table=True):
+    course_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("course.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    activity_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("activity.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    completions: int = 0
+
+
+class CourseCompletionTimeAnalytics(SQLModel, table=True):
+    """
+    Histogram of the time learners took to complete a course, bucket `b`
+    counts durations from 2 ** (b / 4) to 2 ** ((b + 1) / 4) seconds
+    """
+
+    course_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("course.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    bucket: int = Field(primary_key=True)
+    learners: int = 0
+
+
+class ActivityFunnelRead(SQLModel):
+    activity_uuid: str
+    name: str
+    completions: int
+    # Learners who completed the previous step of the funnel but not this one
+    drop_off: int
+
+
+class CourseAnalyticsRead(SQLModel):
+    course_uuid: str
+    learners_started: int
+    learners_completed: int
+    # Seconds from the first to the last completed activity of a learner
+    median_time_to_complete: Optional[float]
+    activities: List[ActivityFunnelRead]
+    refreshed_at: Optional[str]
@@ -44,7 +44,7 @@ class Activity(ActivityBase, table=True):
         default=None,
         sa_column=Column(Integer, ForeignKey("course.id", ondelete="CASCADE")),
     )
-    activity_uuid: str = ""
+    activity_uuid: str = Field(default="", unique=True, index=True)
     creation_date: str = ""
     update_date: str = ""
 
@@ -62,7 +62,7 @@ class Assignment(AssignmentBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     creation_date: Optional[str]
     update_date: Optional[str]
-    assignment_uuid: str
+    assignment_uuid: str = Field(unique=True, index=True)
 
     org_id: int = Field(
         sa_column=Column("org_id", ForeignKey("organization.id", ondelete="CASCADE"))
@@ -25,7 +25,7 @@ class Block(BlockBase, table=True):
     course_id: int = Field(sa_column= Column("course_id", ForeignKey("course.id", ondelete="CASCADE")))
     chapter_id: int = Field(sa_column= Column("chapter_id", ForeignKey("chapter.id", ondelete="CASCADE")))
     activity_id: int = Field(sa_column= Column("activity_id", ForeignKey("activity.id", ondelete="CASCADE")))
-    block_uuid: str
+    block_uuid: str = Field(unique=True, index=True)
     creation_date: str
     update_date: str
 
@@ -66,6 +66,17 @@ class ChapterEdge(BaseModel):
     delete: bool
 
 
+class ChapterEdgeBatch(BaseModel):
+    # Applied in order, all or nothing
+    edges: List[ChapterEdge] = Field(..., max_items=1000)
+
+
+class ChapterEdgeBatchResult(BaseModel):
+    added: int
+    removed: int
+    chapter_order: List[int]
+
+
 class DepreceatedChaptersRead(BaseModel):
     chapterOrder: Any
     chapters: Any
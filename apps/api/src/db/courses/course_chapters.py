@@ -27,6 +27,7 @@ class CourseChapter_Graph(SQLModel, table=True):
     chapter_id: int = Field(
         sa_column=Column(Integer,  ForeignKey("chapter.id", ondelete="CASCADE"), primary_key=True,)
     )
+    # A chapter can have several predecessors
     predecessor_id: int = Field(
-        sa_column=Column(Integer, ForeignKey("chapter.id", ondelete="CASCADE"))
+        sa_column=Column(Integer, ForeignKey("chapter.id", ondelete="CASCADE"), primary_key=True)
     )
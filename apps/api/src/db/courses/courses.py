@@ -21,7 +21,9 @@ class Course(CourseBase, table=True):
     org_id: int = Field(
         sa_column=Column(Integer, ForeignKey("organization.id", ondelete="CASCADE"))
     )
-    course_uuid: str = ""   
+    course_uuid: str = Field(default="", unique=True, index=True)
+    # Activities of the course, see src/services/trail/progress_counters.py
+    activity_count: int = 0
     creation_date: str = ""
     update_date: str = ""
 
@@ -0,0 +1,42 @@
+"""
+Every table of the platform, imported statically so that SQLModel.metadata is
+complete before the engine is used (create_all, Alembic autogenerate).
+
+New modules defining a table must be added here.
+"""
+
+from src.db import (  # noqa: F401
+    analytics,
+    collections,
+    collections_courses,
+    install,
+    organization_config,
+    organizations,
+    resource_authors,
+    roles,
+    search_documents,
+    trail_runs,
+    trail_steps,
+    trails,
+    user_organizations,
+    usergroup_resources,
+    usergroup_user,
+    usergroups,
+    users,
+)
+from src.db.courses import (  # noqa: F401
+    activities,
+    assignments,
+    blocks,
+    chapter_activities,
+    chapters,
+    course_chapters,
+    course_updates,
+    courses,
+)
+from src.db.payments import (  # noqa: F401
+    payments,
+    payments_courses,
+    payments_products,
+    payments_users,
+)
@@ -0,0 +1,90 @@
+from enum import Enum
+from typing import Optional
+from sqlalchemy import DDL, Column, ForeignKey, Index, Integer, event
+from sqlmodel import Field, SQLModel
+
+
+class SearchResourceTypeEnum(str, Enum):
+    COURSE = "COURSE"
+    ACTIVITY = "ACTIVITY"
+    COLLECTION = "COLLECTION"
+
+
+class SearchDocument(SQLModel, table=True):
+    """
+    Searchable text of a course, activity or collection, kept in sync by
+    src/services/search/indexing.py
+    """
+
+    __table_args__ = (
+        Index("ix_searchdocument_org_id_resource_type", "org_id", "resource_type"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    org_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("organization.id", ondelete="CASCADE"))
+    )
+    resource_type: SearchResourceTypeEnum
+    resource_uuid: str = Field(unique=True, index=True)
+    # Course of courses and activities, whose access rules apply
+    course_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer, ForeignKey("course.id", ondelete="CASCADE"), index=True
+        ),
+    )
+    title: str = ""
+    body: str = ""
+
+
+class SearchResult(SQLModel):
+    resource_type: SearchResourceTypeEnum
+    resource_uuid: str
+    course_uuid: Optional[str] = None
+    title: str
+    excerpt: str
+
+
+# Full-text indexes are dialect specific: a GIN expression index on PostgreSQL
+# and an external content FTS5 table on SQLite (tests), kept in sync by triggers
+
+SEARCH_TEXT_CONFIG = "simple"
+SEARCH_TSVECTOR = (
+    f"to_tsvector('{SEARCH_TEXT_CONFIG}', searchdocument.title || ' ' || searchdocument.body)"
+)
+
+event.listen(
+    SearchDocument.__table__,  # type: ignore
+    "after_create",
+    DDL(
+        f"CREATE INDEX IF NOT EXISTS ix_searchdocument_tsvector "
+        f"ON searchdocument USING gin (({SEARCH_TSVECTOR}))"
+    ).execute_if(dialect="postgresql"),
+)
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS searchdocument_fts USING fts5("
+    "title, body, content='searchdocument', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS searchdocument_fts_insert AFTER INSERT ON searchdocument BEGIN "
+    "INSERT INTO searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER IF NOT EXISTS searchdocument_fts_delete AFTER DELETE ON searchdocument BEGIN "
+    "INSERT INTO searchdocument_fts(searchdocument_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER IF NOT EXISTS searchdocument_fts_update AFTER UPDATE ON searchdocument BEGIN "
+    "INSERT INTO searchdocument_fts(searchdocument_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body); END",
+]
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(
+        SearchDocument.__table__,  # type: ignore
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    SearchDocument.__table__,  # type: ignore
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS searchdocument_fts").execute_if(dialect="sqlite"),
+)
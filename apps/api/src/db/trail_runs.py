@@ -1,6 +1,6 @@
 from typing import Optional
 from pydantic import BaseModel
-from sqlalchemy import JSON, Column, ForeignKey, Integer
+from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, UniqueConstraint
 from sqlmodel import Field, SQLModel
 from enum import Enum
 
@@ -19,6 +19,12 @@ class StatusEnum(str, Enum):
 
 
 class TrailRun(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_trailrun_trail_id_user_id", "trail_id", "user_id"),
+        # One run per course and user, progress is upserted on it
+        UniqueConstraint("course_id", "user_id", name="uq_trailrun_course_id_user_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     data: dict = Field(default={}, sa_column=Column(JSON))
     status: StatusEnum = StatusEnum.STATUS_IN_PROGRESS
@@ -35,6 +41,8 @@ class TrailRun(SQLModel, table=True):
     user_id: int = Field(
         sa_column=Column(Integer, ForeignKey("user.id", ondelete="CASCADE"))
     )
+    # Completed steps of the run, see src/services/trail/progress_counters.py
+    completed_steps: int = 0
     # timestamps
     creation_date: str
     update_date: str
@@ -61,5 +69,6 @@ class TrailRunRead(BaseModel):
     update_date: Optional[str]
     # number of activities in course
     course_total_steps: int
+    completed_steps: int = 0
     steps: list[TrailStep]
     pass
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Optional
 from sqlmodel import Field, SQLModel
-from sqlalchemy import ForeignKey, JSON, Column, Integer
+from sqlalchemy import ForeignKey, Index, JSON, Column, Integer, UniqueConstraint
 
 
 class TrailStepTypeEnum(str, Enum):
@@ -11,6 +11,14 @@ class TrailStepTypeEnum(str, Enum):
 
 
 class TrailStep(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_trailstep_trailrun_id_user_id", "trailrun_id", "user_id"),
+        Index("ix_trailstep_course_id_user_id", "course_id", "user_id"),
+        UniqueConstraint(
+            "trailrun_id", "activity_id", name="uq_trailstep_trailrun_id_activity_id"
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     complete: bool
     teacher_verified: bool
@@ -1,6 +1,6 @@
 from typing import Optional
 from pydantic import BaseModel
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Integer, UniqueConstraint
 from sqlmodel import Field, SQLModel
 from src.db.trail_runs import TrailRunRead
 
@@ -15,6 +15,10 @@ class TrailBase(SQLModel):
 
 
 class Trail(TrailBase, table=True):
+    __table_args__ = (
+        UniqueConstraint("org_id", "user_id", name="uq_trail_org_id_user_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     org_id: int = Field(
         sa_column=Column(Integer, ForeignKey("organization.id", ondelete="CASCADE"))
@@ -8,7 +8,7 @@ class UserGroupResource(SQLModel, table=True):
     usergroup_id: int = Field(
         sa_column=Column(Integer, ForeignKey("usergroup.id", ondelete="CASCADE"))
     )
-    resource_uuid: str = ""
+    resource_uuid: str = Field(default="", index=True)
     org_id: int = Field(
         sa_column=Column(Integer, ForeignKey("organization.id", ondelete="CASCADE"))
     )
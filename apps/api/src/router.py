@@ -2,7 +2,7 @@ import os
 from fastapi import APIRouter, Depends
 from src.routers import health
 from src.routers import usergroups
-from src.routers import dev, trail, users, auth, orgs, roles
+from src.routers import dev, trail, users, auth, orgs, roles, search, analytics
 from src.routers.ai import ai
 from src.routers.courses import chapters, collections, courses, assignments
 from src.routers.courses.activities import activities, blocks
@@ -32,6 +32,8 @@ v1_router.include_router(
     collections.router, prefix="/collections", tags=["collections"]
 )
 v1_router.include_router(trail.router, prefix="/trail", tags=["trail"])
+v1_router.include_router(search.router, prefix="/search", tags=["search"])
+v1_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 v1_router.include_router(ai.router, prefix="/ai", tags=["ai"])
 v1_router.include_router(payments.router, prefix="/payments", tags=["payments"])
 
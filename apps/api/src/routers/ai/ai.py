@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, Request
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.services.ai.ai import ai_send_activity_chat_message, ai_start_activity_chat_session
 from src.services.ai.schemas.ai import ActivityAIChatSessionResponse, SendActivityAIChatMessage, StartActivityAIChatSession
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.db.users import PublicUser
 from src.security.auth import get_current_user
 
@@ -15,12 +15,12 @@ async def api_ai_start_activity_chat_session(
     request: Request,
     chat_session_object: StartActivityAIChatSession,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 )-> ActivityAIChatSessionResponse:
     """
     Start a new AI Chat session with a Course Activity
     """
-    return ai_start_activity_chat_session(
+    return await ai_start_activity_chat_session(
         request, chat_session_object, current_user, db_session
     )
 
@@ -29,11 +29,11 @@ async def api_ai_send_activity_chat_message(
     request: Request,
     chat_session_object: SendActivityAIChatMessage,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 )-> ActivityAIChatSessionResponse:
     """
     Send a message to an AI Chat session with a Course Activity
     """
-    return ai_send_activity_chat_message(
+    return await ai_send_activity_chat_message(
         request, chat_session_object, current_user, db_session
     )
\ No newline at end of file
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Request
+from src.core.events.database import get_async_db_session
+from src.db.analytics import CourseAnalyticsRead
+from src.db.users import PublicUser
+from src.security.auth import get_current_user
+from src.services.analytics.analytics import get_course_analytics
+
+
+router = APIRouter()
+
+
+@router.get("/course/{course_uuid}")
+async def api_get_course_analytics(
+    request: Request,
+    course_uuid: str,
+    current_user: PublicUser = Depends(get_current_user),
+    db_session=Depends(get_async_db_session),
+) -> CourseAnalyticsRead:
+    """
+    Get the completion funnel of a course (started, per activity completions
+    and drop-off, median time to complete)
+    """
+    return await get_course_analytics(request, course_uuid, current_user, db_session)
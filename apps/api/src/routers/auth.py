@@ -3,11 +3,16 @@ from typing import Literal, Optional
 from fastapi import Depends, APIRouter, HTTPException, Response, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.users import AnonymousUser, UserRead
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from config.config import get_learnhouse_config
-from src.security.auth import AuthJWT, authenticate_user, get_current_user
+from src.security.auth import (
+    AuthJWT,
+    authenticate_user,
+    get_current_user,
+    get_token_claims,
+)
 from src.services.auth.utils import signWithGoogle
 
 
@@ -25,7 +30,13 @@ def refresh(response: Response, Authorize: AuthJWT = Depends()):
     Authorize.jwt_refresh_token_required()
 
     current_user = Authorize.get_jwt_subject()
-    new_access_token = Authorize.create_access_token(subject=current_user)  # type: ignore
+    raw_jwt = Authorize.get_raw_jwt() or {}
+    new_access_token = Authorize.create_access_token(
+        subject=current_user,  # type: ignore
+        user_claims={
+            claim: raw_jwt[claim] for claim in ("user_id", "user_uuid") if claim in raw_jwt
+        },
+    )
 
     response.set_cookie(
         key="access_token_cookie",
@@ -43,7 +54,7 @@ async def login(
     response: Response,
     Authorize: AuthJWT = Depends(),
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     user = await authenticate_user(
         request, form_data.username, form_data.password, db_session
@@ -55,8 +66,12 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = Authorize.create_access_token(subject=form_data.username)
-    refresh_token = Authorize.create_refresh_token(subject=form_data.username)
+    access_token = Authorize.create_access_token(
+        subject=form_data.username, user_claims=get_token_claims(user)
+    )
+    refresh_token = Authorize.create_refresh_token(
+        subject=form_data.username, user_claims=get_token_claims(user)
+    )
     Authorize.set_refresh_cookies(refresh_token)
 
     # set cookies using fastapi
@@ -90,7 +105,7 @@ async def third_party_login(
     body: ThirdPartyLogin,
     org_id: Optional[int] = None,
     current_user: AnonymousUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     Authorize: AuthJWT = Depends(),
 ):
     # Google
@@ -107,8 +122,12 @@ async def third_party_login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = Authorize.create_access_token(subject=user.email)
-    refresh_token = Authorize.create_refresh_token(subject=user.email)
+    access_token = Authorize.create_access_token(
+        subject=user.email, user_claims=get_token_claims(user)
+    )
+    refresh_token = Authorize.create_refresh_token(
+        subject=user.email, user_claims=get_token_claims(user)
+    )
     Authorize.set_refresh_cookies(refresh_token)
 
     # set cookies using fastapi
@@ -2,7 +2,7 @@ from typing import List
 from fastapi import APIRouter, Depends, UploadFile, Form, Request
 from src.db.courses.activities import ActivityCreate, ActivityRead, ActivityUpdate
 from src.db.users import PublicUser
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.services.courses.activities.activities import (
     create_activity,
     get_activity,
@@ -27,7 +27,7 @@ async def api_create_activity(
     request: Request,
     activity_object: ActivityCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Create new activity
@@ -40,7 +40,7 @@ async def api_get_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Get single activity by activity_id
@@ -54,7 +54,7 @@ async def api_get_activityby_id(
     request: Request,
     activity_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Get single activity by activity_id
@@ -68,7 +68,7 @@ async def api_get_chapter_activities(
     request: Request,
     chapter_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> List[ActivityRead]:
     """
     Get Activities for a chapter
@@ -82,7 +82,7 @@ async def api_update_activity(
     activity_object: ActivityUpdate,
     activity_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Update activity by activity_id
@@ -97,7 +97,7 @@ async def api_delete_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete activity by activity_id
@@ -115,7 +115,7 @@ async def api_create_video_activity(
     chapter_id: str = Form(),
     current_user: PublicUser = Depends(get_current_user),
     video_file: UploadFile | None = None,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Create new activity
@@ -135,7 +135,7 @@ async def api_create_external_video_activity(
     request: Request,
     external_video: ExternalVideo,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Create new activity
@@ -152,7 +152,7 @@ async def api_create_documentpdf_activity(
     chapter_id: str = Form(),
     current_user: PublicUser = Depends(get_current_user),
     pdf_file: UploadFile | None = None,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ActivityRead:
     """
     Create new activity
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, UploadFile, Form, Request
 from src.db.courses.blocks import BlockRead
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.security.auth import get_current_user
 from src.services.blocks.block_types.imageBlock.imageBlock import (
     create_image_block,
@@ -29,7 +29,7 @@ async def api_create_image_file_block(
     request: Request,
     file_object: UploadFile,
     activity_uuid: str = Form(),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
@@ -42,7 +42,7 @@ async def api_create_image_file_block(
 async def api_get_image_file_block(
     request: Request,
     block_uuid: str,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
@@ -61,7 +61,7 @@ async def api_create_video_file_block(
     request: Request,
     file_object: UploadFile,
     activity_uuid: str = Form(),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
@@ -74,7 +74,7 @@ async def api_create_video_file_block(
 async def api_get_video_file_block(
     request: Request,
     block_uuid: str,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
@@ -93,7 +93,7 @@ async def api_create_pdf_file_block(
     request: Request,
     file_object: UploadFile,
     activity_uuid: str = Form(),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
@@ -106,7 +106,7 @@ async def api_create_pdf_file_block(
 async def api_get_pdf_file_block(
     request: Request,
     block_uuid: str,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> BlockRead:
     """
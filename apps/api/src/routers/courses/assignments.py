@@ -9,7 +9,7 @@ from src.db.courses.assignments import (
     AssignmentUserSubmissionCreate,
 )
 from src.db.users import PublicUser
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.security.auth import get_current_user
 from src.services.courses.activities.assignments import (
     create_assignment,
@@ -52,7 +52,7 @@ async def api_create_assignments(
     request: Request,
     assignment_object: AssignmentCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> AssignmentRead:
     """
     Create new activity
@@ -65,7 +65,7 @@ async def api_read_assignment(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> AssignmentRead:
     """
     Read an assignment
@@ -78,7 +78,7 @@ async def api_read_assignment_from_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> AssignmentRead:
     """
     Read an assignment
@@ -94,7 +94,7 @@ async def api_update_assignment(
     assignment_uuid: str,
     assignment_object: AssignmentUpdate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> AssignmentRead:
     """
     Update an assignment
@@ -109,7 +109,7 @@ async def api_delete_assignment(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete an assignment
@@ -122,7 +122,7 @@ async def api_delete_assignment_from_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete an assignment
@@ -141,7 +141,7 @@ async def api_create_assignment_tasks(
     assignment_uuid: str,
     assignment_task_object: AssignmentTaskCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Create new tasks for an assignment
@@ -156,7 +156,7 @@ async def api_read_assignment_tasks(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read tasks for an assignment
@@ -171,7 +171,7 @@ async def api_read_assignment_task(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read task for an assignment
@@ -187,7 +187,7 @@ async def api_update_assignment_tasks(
     assignment_task_uuid: str,
     assignment_task_object: AssignmentTaskUpdate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Update tasks for an assignment
@@ -203,7 +203,7 @@ async def api_put_assignment_task_ref_file(
     assignment_task_uuid: str,
     reference_file: UploadFile | None = None,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Update tasks for an assignment
@@ -219,7 +219,7 @@ async def api_put_assignment_task_sub_file(
     assignment_task_uuid: str,
     sub_file: UploadFile | None = None,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Update tasks for an assignment
@@ -234,7 +234,7 @@ async def api_delete_assignment_tasks(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete tasks for an assignment
@@ -253,7 +253,7 @@ async def api_handle_assignment_task_submissions(
     assignment_task_submission_object: AssignmentTaskSubmissionUpdate,
     assignment_task_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Create new task submissions for an assignment
@@ -275,7 +275,7 @@ async def api_read_user_assignment_task_submissions(
     assignment_task_uuid: str,
     user_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read task submissions for an assignment from a user
@@ -290,7 +290,7 @@ async def api_read_user_assignment_task_submissions_me(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read task submissions for an assignment from a user
@@ -305,7 +305,7 @@ async def api_read_assignment_task_submissions(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read task submissions for an assignment from a user
@@ -322,7 +322,7 @@ async def api_delete_assignment_task_submissions(
     request: Request,
     assignment_task_submission_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete task submissions for an assignment from a user
@@ -340,7 +340,7 @@ async def api_create_assignment_submissions(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Create new submissions for an assignment
@@ -355,7 +355,7 @@ async def api_read_assignment_submissions(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read submissions for an assignment
@@ -370,7 +370,7 @@ async def api_read_user_assignment_submission_me(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read submissions for an assignment from the current user
@@ -386,7 +386,7 @@ async def api_read_user_assignment_submissions(
     assignment_uuid: str,
     user_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Read submissions for an assignment from a user
@@ -403,7 +403,7 @@ async def api_update_user_assignment_submissions(
     user_id: str,
     assignment_submission: AssignmentUserSubmissionCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Update submissions for an assignment from a user
@@ -419,7 +419,7 @@ async def api_delete_user_assignment_submissions(
     assignment_uuid: str,
     user_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete submissions for an assignment from a user
@@ -435,7 +435,7 @@ async def api_get_submission_grade(
     assignment_uuid: str,
     user_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Grade submissions for an assignment from a user
@@ -452,7 +452,7 @@ async def api_final_grade_submission(
     assignment_uuid: str,
     user_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Grade submissions for an assignment from a user
@@ -469,7 +469,7 @@ async def api_submission_mark_as_done(
     assignment_uuid: str,
     user_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Grade submissions for an assignment from a user
@@ -485,7 +485,7 @@ async def api_get_assignments(
     request: Request,
     course_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get assignments for a course
@@ -1,19 +1,22 @@
 from typing import List
 from fastapi import APIRouter, Depends, Request
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.db.courses.chapters import (
     ChapterCreate,
     ChapterRead,
     ChapterUpdate,
     ChapterEdge,
+    ChapterEdgeBatch,
+    ChapterEdgeBatchResult,
 )
 from src.services.courses.chapters import (
-    DEPRECEATED_get_course_chapters,
     create_chapter,
     delete_chapter,
     get_chapter,
     get_course_chapters,
+    get_course_chapters_meta,
     modify_chapter_edge,
+    modify_chapter_edges,
     update_chapter,
 )
 
@@ -28,7 +31,7 @@ async def api_create_coursechapter(
     request: Request,
     coursechapter_object: ChapterCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ChapterRead:
     """
     Create new Course Chapter
@@ -41,7 +44,7 @@ async def api_get_coursechapter(
     request: Request,
     chapter_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ChapterRead:
     """
     Get single CourseChapter by chapter_id
@@ -53,14 +56,15 @@ async def api_get_coursechapter(
 async def api_get_chapter_meta(
     request: Request,
     course_uuid: str,
+    with_content: bool = True,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
-    Get Chapters metadata
+    Get Chapters metadata, without the activities content if `with_content` is false
     """
-    return await DEPRECEATED_get_course_chapters(
-        request, course_uuid, current_user, db_session
+    return await get_course_chapters_meta(
+        request, course_uuid, current_user, db_session, with_content
     )
 
 
@@ -70,7 +74,7 @@ async def api_get_chapter_meta(
 #     course_uuid: str,
 #     order: ChapterUpdateOrder,
 #     current_user: PublicUser = Depends(get_current_user),
-#     db_session=Depends(get_db_session),
+#     db_session=Depends(get_async_db_session),
 # ):
 #     """
 #     Update Chapter metadata
@@ -86,17 +90,32 @@ async def api_update_chapter_add_edge(
     course_uuid: str,
     order: ChapterEdge,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Update Chapter edge
     """
-    print(f"Updating chapter edge | course_uuid = {course_uuid}")
     return await modify_chapter_edge(
         request, course_uuid, order, current_user, db_session
     )
 
 
+@router.put("/course/{course_uuid}/edges")
+async def api_update_chapter_edges(
+    request: Request,
+    course_uuid: str,
+    batch: ChapterEdgeBatch,
+    current_user: PublicUser = Depends(get_current_user),
+    db_session=Depends(get_async_db_session),
+) -> ChapterEdgeBatchResult:
+    """
+    Add and remove Chapter edges in one transaction
+    """
+    return await modify_chapter_edges(
+        request, course_uuid, batch, current_user, db_session
+    )
+
+
 @router.get("/course/{course_id}/page/{page}/limit/{limit}")
 async def api_get_chapter_by(
     request: Request,
@@ -104,7 +123,7 @@ async def api_get_chapter_by(
     page: int,
     limit: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> List[ChapterRead]:
     """
     Get Course Chapters by page and limit
@@ -120,7 +139,7 @@ async def api_update_coursechapter(
     coursechapter_object: ChapterUpdate,
     chapter_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> ChapterRead:
     """
     Update CourseChapters by course_id
@@ -135,7 +154,7 @@ async def api_delete_coursechapter(
     request: Request,
     chapter_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete CourseChapters by ID
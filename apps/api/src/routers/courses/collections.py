@@ -1,6 +1,7 @@
-from typing import List
-from fastapi import APIRouter, Depends, Request
-from src.core.events.database import get_db_session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request
+from src.core.events.database import get_async_db_session
+from src.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, Page
 from src.db.collections import CollectionCreate, CollectionRead, CollectionUpdate
 from src.security.auth import get_current_user
 from src.services.users.users import PublicUser
@@ -8,6 +9,7 @@ from src.services.courses.collections import (
     create_collection,
     get_collection,
     get_collections,
+    get_collections_page,
     update_collection,
     delete_collection,
 )
@@ -21,7 +23,7 @@ async def api_create_collection(
     request: Request,
     collection_object: CollectionCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> CollectionRead:
     """
     Create new Collection
@@ -34,7 +36,7 @@ async def api_get_collection(
     request: Request,
     collection_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> CollectionRead:
     """
     Get single collection by ID
@@ -42,6 +44,24 @@ async def api_get_collection(
     return await get_collection(request, collection_uuid, current_user, db_session)
 
 
+@router.get("/org/{org_id}")
+async def api_get_collections_by_org(
+    request: Request,
+    org_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    include_total: bool = False,
+    current_user: PublicUser = Depends(get_current_user),
+    db_session=Depends(get_async_db_session),
+) -> Page[CollectionRead]:
+    """
+    Get collections of an org, a page at a time from the cursor of the previous page
+    """
+    return await get_collections_page(
+        request, org_id, current_user, db_session, cursor, limit, include_total
+    )
+
+
 @router.get("/org/{org_id}/page/{page}/limit/{limit}")
 async def api_get_collections_by(
     request: Request,
@@ -49,10 +69,10 @@ async def api_get_collections_by(
     limit: int,
     org_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> List[CollectionRead]:
     """
-    Get collections by page and limit
+    Get collections by page and limit (prefer the cursor based listing)
     """
     return await get_collections(request, org_id, current_user, db_session, page, limit)
 
@@ -63,7 +83,7 @@ async def api_update_collection(
     collection_object: CollectionUpdate,
     collection_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> CollectionRead:
     """
     Update collection by ID
@@ -78,7 +98,7 @@ async def api_delete_collection(
     request: Request,
     collection_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Delete collection by ID
@@ -1,12 +1,13 @@
-from typing import List
-from fastapi import APIRouter, Depends, UploadFile, Form, Request
-from sqlmodel import Session
-from src.core.events.database import get_db_session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, UploadFile, Form, Query, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.courses.course_updates import (
     CourseUpdateCreate,
     CourseUpdateRead,
     CourseUpdateUpdate,
 )
+from src.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, Page
 from src.db.users import PublicUser
 from src.db.courses.courses import (
     CourseCreate,
@@ -21,6 +22,7 @@ from src.services.courses.courses import (
     get_course_by_id,
     get_course_meta,
     get_courses_orgslug,
+    get_courses_orgslug_page,
     update_course,
     delete_course,
     update_course_thumbnail,
@@ -47,7 +49,7 @@ async def api_create_course(
     tags: str = Form(None),
     about: str = Form(),
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     thumbnail: UploadFile | None = None,
 ) -> CourseRead:
     """
@@ -73,7 +75,7 @@ async def api_create_course_thumbnail(
     request: Request,
     course_uuid: str,
     thumbnail: UploadFile | None = None,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseRead:
     """
@@ -88,7 +90,7 @@ async def api_create_course_thumbnail(
 async def api_get_course(
     request: Request,
     course_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseRead:
     """
@@ -103,7 +105,7 @@ async def api_get_course(
 async def api_get_course_by_id(
     request: Request,
     course_id: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseRead:
     """
@@ -114,18 +116,41 @@ async def api_get_course_by_id(
     )
 
 
+@router.get("/org_slug/{org_slug}")
+async def api_get_courses_by_orgslug(
+    request: Request,
+    org_slug: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    include_total: bool = False,
+    db_session: AsyncSession = Depends(get_async_db_session),
+    current_user: PublicUser = Depends(get_current_user),
+) -> Page[CourseRead]:
+    """
+    Get courses of an org, a page at a time from the cursor of the previous page
+    """
+    return await get_courses_orgslug_page(
+        request, current_user, org_slug, db_session, cursor, limit, include_total
+    )
+
+
 @router.get("/{course_uuid}/meta")
 async def api_get_course_meta(
     request: Request,
+    response: Response,
     course_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> FullCourseReadWithTrail:
     """
     Get single Course Metadata (chapters, activities) by course_uuid
     """
     return await get_course_meta(
-        request, course_uuid, current_user=current_user, db_session=db_session
+        request,
+        course_uuid,
+        current_user=current_user,
+        db_session=db_session,
+        response=response,
     )
 
 
@@ -135,11 +160,11 @@ async def api_get_course_by_orgslug(
     page: int,
     limit: int,
     org_slug: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> List[CourseRead]:
     """
-    Get courses by page and limit
+    Get courses by page and limit (prefer the cursor based listing)
     """
     return await get_courses_orgslug(
         request, current_user, org_slug, db_session, page, limit
@@ -151,7 +176,7 @@ async def api_update_course(
     request: Request,
     course_object: CourseUpdate,
     course_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseRead:
     """
@@ -166,7 +191,7 @@ async def api_update_course(
 async def api_delete_course(
     request: Request,
     course_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ):
     """
@@ -179,8 +204,9 @@ async def api_delete_course(
 @router.get("/{course_uuid}/updates")
 async def api_get_course_updates(
     request: Request,
+    response: Response,
     course_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> List[CourseUpdateRead]:
     """
@@ -188,7 +214,7 @@ async def api_get_course_updates(
     """
 
     return await get_updates_by_course_uuid(
-        request, course_uuid, current_user, db_session
+        request, course_uuid, current_user, db_session, response
     )
 
 
@@ -197,7 +223,7 @@ async def api_create_course_update(
     request: Request,
     course_uuid: str,
     update_object: CourseUpdateCreate,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseUpdateRead:
     """
@@ -215,7 +241,7 @@ async def api_update_course_update(
     course_uuid: str,
     courseupdate_uuid: str,
     update_object: CourseUpdateUpdate,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> CourseUpdateRead:
     """
@@ -232,7 +258,7 @@ async def api_delete_course_update(
     request: Request,
     course_uuid: str,
     courseupdate_uuid: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ):
     """
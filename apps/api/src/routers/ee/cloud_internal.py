@@ -1,7 +1,7 @@
 import os
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlmodel import Session
-from src.core.events.database import get_db_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.organization_config import OrganizationConfigBase
 from src.services.orgs.orgs import update_org_with_config_no_auth
 
@@ -20,7 +20,7 @@ async def update_org_Config(
     request: Request,
     org_id: int,
     config_object: OrganizationConfigBase,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
 
     res = await update_org_with_config_no_auth(
@@ -1,7 +1,7 @@
 from typing import Literal
 from fastapi import APIRouter, Depends, Request
-from sqlmodel import Session
-from src.core.events.database import get_db_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.payments.payments import PaymentsConfig, PaymentsConfigRead
 from src.db.users import PublicUser
 from src.security.auth import get_current_user
@@ -33,7 +33,7 @@ async def api_create_payments_config(
     org_id: int,
     provider: Literal["stripe"],
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> PaymentsConfig:
     return await init_payments_config(request, org_id, provider, current_user, db_session)
 
@@ -43,7 +43,7 @@ async def api_get_payments_config(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> list[PaymentsConfigRead]:
     return await get_payments_config(request, org_id, current_user, db_session)
 
@@ -52,7 +52,7 @@ async def api_delete_payments_config(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     await delete_payments_config(request, org_id, current_user, db_session)
     return {"message": "Payments config deleted successfully"}
@@ -63,7 +63,7 @@ async def api_create_payments_product(
     org_id: int,
     payments_product: PaymentsProductCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> PaymentsProductRead:
     return await create_payments_product(request, org_id, payments_product, current_user, db_session)
 
@@ -72,7 +72,7 @@ async def api_get_payments_products(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> list[PaymentsProductRead]:
     return await list_payments_products(request, org_id, current_user, db_session)
 
@@ -82,7 +82,7 @@ async def api_get_payments_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> PaymentsProductRead:
     return await get_payments_product(request, org_id, product_id, current_user, db_session)
 
@@ -93,7 +93,7 @@ async def api_update_payments_product(
     product_id: int,
     payments_product: PaymentsProductUpdate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> PaymentsProductRead:
     return await update_payments_product(request, org_id, product_id, payments_product, current_user, db_session)
 
@@ -103,7 +103,7 @@ async def api_delete_payments_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     await delete_payments_product(request, org_id, product_id, current_user, db_session)
     return {"message": "Payments product deleted successfully"}
@@ -115,7 +115,7 @@ async def api_link_course_to_product(
     product_id: int,
     course_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await link_course_to_product(
         request, org_id, course_id, product_id, current_user, db_session
@@ -128,7 +128,7 @@ async def api_unlink_course_from_product(
     product_id: int,
     course_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await unlink_course_from_product(
         request, org_id, course_id, current_user, db_session
@@ -140,7 +140,7 @@ async def api_get_courses_by_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await get_courses_by_product(
         request, org_id, product_id, current_user, db_session
@@ -152,7 +152,7 @@ async def api_get_products_by_course(
     org_id: int,
     course_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await get_products_by_course(
         request, org_id, course_id, current_user, db_session
@@ -163,14 +163,14 @@ async def api_get_products_by_course(
 @router.post("/stripe/webhook")
 async def api_handle_connected_accounts_stripe_webhook(
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await handle_stripe_webhook(request, "standard", db_session)
 
 @router.post("/stripe/webhook/connect")
 async def api_handle_connected_accounts_stripe_webhook_connect(
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await handle_stripe_webhook(request, "connect", db_session)
 
@@ -183,7 +183,7 @@ async def api_create_checkout_session(
     product_id: int,
     redirect_uri: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await create_checkout_session(request, org_id, product_id, redirect_uri, current_user, db_session)
 
@@ -193,7 +193,7 @@ async def api_check_course_paid_access(
     org_id: int,
     course_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Check if current user has paid access to a specific course
@@ -211,7 +211,7 @@ async def api_get_customers(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get list of customers and their subscriptions for an organization
@@ -223,7 +223,7 @@ async def api_get_owned_courses(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await get_owned_courses(request, current_user, db_session)
 
@@ -233,7 +233,7 @@ async def api_update_stripe_account_id(
     org_id: int,
     stripe_account_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await update_stripe_account_id(
         request, org_id, stripe_account_id, current_user, db_session
@@ -245,7 +245,7 @@ async def api_generate_stripe_connect_link(
     org_id: int,
     redirect_uri: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Generate a Stripe OAuth link for connecting a Stripe account
@@ -260,6 +260,6 @@ async def stripe_oauth_callback(
     code: str,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     return await handle_stripe_oauth_callback(request, org_id, code, current_user, db_session)
\ No newline at end of file
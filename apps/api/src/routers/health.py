@@ -1,11 +1,34 @@
-from fastapi import Depends, APIRouter
-from sqlmodel import Session
-from src.services.health.health import check_health
-from src.core.events.database import get_db_session
+from typing import List
+from fastapi import Depends, APIRouter, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database_pool import PoolStatsRead
+from src.security.password_hashing import PasswordHashingStatsRead
+from src.services.health.health import (
+    check_health,
+    get_database_pool_stats,
+    get_password_hashing_stats,
+)
+from src.core.events.database import get_async_db_session
 
 
 router = APIRouter()
 
 @router.get("")
-async def health(db_session: Session = Depends(get_db_session)):
-    return await check_health(db_session)
\ No newline at end of file
+async def health(db_session: AsyncSession = Depends(get_async_db_session)):
+    return await check_health(db_session)
+
+
+@router.get("/pool")
+async def health_pool(request: Request) -> List[PoolStatsRead]:
+    """
+    Connection pool usage: checked-out, idle and overflow connections and wait times
+    """
+    return await get_database_pool_stats(request)
+
+
+@router.get("/password-hashing")
+async def health_password_hashing(request: Request) -> PasswordHashingStatsRead:
+    """
+    Password hashing pool usage: operations in flight, queue wait times and rejections
+    """
+    return await get_password_hashing_stats(request)
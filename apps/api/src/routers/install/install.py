@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Request
 from src.db.install import InstallRead
-from src.core.events.database import get_db_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.organizations import OrganizationCreate
 from src.db.users import UserCreate
 from src.services.install.install import (
@@ -20,7 +21,7 @@ router = APIRouter()
 async def api_create_install_instance(
     request: Request,
     data: dict,
-    db_session=Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> InstallRead:
     # create install
     install = await create_install_instance(request, data, db_session)
@@ -30,7 +31,7 @@ async def api_create_install_instance(
 
 @router.get("/latest")
 async def api_get_latest_install_instance(
-    request: Request, db_session=Depends(get_db_session)
+    request: Request, db_session: AsyncSession = Depends(get_async_db_session)
 ) -> InstallRead:
     # get latest created install
     install = await get_latest_install_instance(request, db_session=db_session)
@@ -40,9 +41,10 @@ async def api_get_latest_install_instance(
 
 @router.post("/default_elements")
 async def api_install_def_elements(
-    db_session=Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    elements = install_default_elements(db_session)
+    # The install steps are shared with the CLI, they run on the sync session
+    elements = await db_session.run_sync(install_default_elements)
 
     return elements
 
@@ -50,9 +52,11 @@ async def api_install_def_elements(
 @router.post("/org")
 async def api_install_org(
         org: OrganizationCreate,
-        db_session=Depends(get_db_session),
+        db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    organization = install_create_organization(org, db_session)
+    organization = await db_session.run_sync(
+        lambda session: install_create_organization(org, session)
+    )
 
     return organization
 
@@ -61,9 +65,11 @@ async def api_install_org(
 async def api_install_user(
     data: UserCreate,
     org_slug: str,
-    db_session=Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    user = install_create_organization_user(data, org_slug, db_session)
+    user = await db_session.run_sync(
+        lambda session: install_create_organization_user(data, org_slug, session)
+    )
 
     return user
 
@@ -73,7 +79,7 @@ async def api_update_install_instance(
     request: Request,
     data: dict,
     step: int,
-    db_session=Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> InstallRead:
 
     # get latest created install
@@ -1,6 +1,6 @@
-from typing import List, Literal
-from fastapi import APIRouter, Depends, Request, UploadFile
-from sqlmodel import Session
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, UploadFile
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.services.orgs.invites import (
     create_invite_code,
     create_invite_code_with_usergroup,
@@ -12,6 +12,7 @@ from src.services.orgs.join import JoinOrg, join_org
 from src.services.orgs.users import (
     get_list_of_invited_users,
     get_organization_users,
+    get_organization_users_page,
     invite_batch_users,
     remove_invited_user,
     remove_user_from_org,
@@ -25,7 +26,8 @@ from src.db.organizations import (
     OrganizationUpdate,
     OrganizationUser,
 )
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
+from src.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, Page
 from src.security.auth import get_current_user
 from src.services.orgs.orgs import (
     create_org,
@@ -50,7 +52,7 @@ async def api_create_org(
     request: Request,
     org_object: OrganizationCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> OrganizationRead:
     """
     Create new organization
@@ -65,7 +67,7 @@ async def api_create_org_withconfig(
     org_object: OrganizationCreate,
     config_object: OrganizationConfigBase,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> OrganizationRead:
     """
     Create new organization
@@ -80,7 +82,7 @@ async def api_get_org(
     request: Request,
     org_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> OrganizationRead:
     """
     Get single Org by ID
@@ -93,7 +95,7 @@ async def api_get_org_users(
     request: Request,
     org_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> list[OrganizationUser]:
     """
     Get single Org by ID
@@ -101,12 +103,30 @@ async def api_get_org_users(
     return await get_organization_users(request, org_id, db_session, current_user)
 
 
+@router.get("/{org_id}/members")
+async def api_get_org_members(
+    request: Request,
+    org_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    include_total: bool = False,
+    current_user: PublicUser = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+) -> Page[OrganizationUser]:
+    """
+    Get users of an org, a page at a time from the cursor of the previous page
+    """
+    return await get_organization_users_page(
+        request, org_id, db_session, current_user, cursor, limit, include_total
+    )
+
+
 @router.post("/join")
 async def api_join_an_org(
     request: Request,
     args: JoinOrg,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get single Org by ID
@@ -121,7 +141,7 @@ async def api_update_user_role(
     user_id: str,
     role_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Update user role
@@ -137,7 +157,7 @@ async def api_remove_user_from_org(
     org_id: int,
     user_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Remove user from org
@@ -154,7 +174,7 @@ async def api_get_org_signup_mechanism(
     org_id: int,
     signup_mechanism: Literal["open", "inviteOnly"],
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get org signup mechanism
@@ -170,7 +190,7 @@ async def api_create_invite_code(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Create invite code
@@ -184,7 +204,7 @@ async def api_create_invite_code_with_ug(
     org_id: int,
     usergroup_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Create invite code
@@ -199,7 +219,7 @@ async def api_get_invite_codes(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get invite codes
@@ -213,7 +233,7 @@ async def api_get_invite_code(
     org_id: int,
     invite_code: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get invite code
@@ -228,7 +248,7 @@ async def api_delete_invite_code(
     org_id: int,
     org_invite_code_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Delete invite code
@@ -245,7 +265,7 @@ async def api_invite_batch_users(
     emails: str,
     invite_code_uuid: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Invite batch users by emails
@@ -260,7 +280,7 @@ async def api_get_org_users_invites(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Get org users invites
@@ -274,7 +294,7 @@ async def api_delete_org_users_invites(
     org_id: int,
     email: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Delete org users invites
@@ -285,14 +305,17 @@ async def api_delete_org_users_invites(
 @router.get("/slug/{org_slug}")
 async def api_get_org_by_slug(
     request: Request,
+    response: Response,
     org_slug: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> OrganizationRead:
     """
     Get single Org by Slug
     """
-    return await get_organization_by_slug(request, org_slug, db_session, current_user)
+    return await get_organization_by_slug(
+        request, org_slug, db_session, current_user, response
+    )
 
 
 @router.put("/{org_id}/logo")
@@ -301,7 +324,7 @@ async def api_update_org_logo(
     org_id: str,
     logo_file: UploadFile,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Update org logo
@@ -321,7 +344,7 @@ async def api_update_org_thumbnail(
     org_id: str,
     thumbnail_file: UploadFile,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Update org thumbnail
@@ -341,7 +364,7 @@ async def api_user_orgs(
     page: int,
     limit: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> List[OrganizationRead]:
     """
     Get orgs by page and limit by current user
@@ -357,7 +380,7 @@ async def api_user_orgs_admin(
     page: int,
     limit: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> List[OrganizationRead]:
     """
     Get orgs by page and limit by current user
@@ -373,7 +396,7 @@ async def api_update_org(
     org_object: OrganizationUpdate,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> OrganizationRead:
     """
     Update Org by ID
@@ -386,7 +409,7 @@ async def api_delete_org(
     request: Request,
     org_id: int,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Delete Org by ID
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Request
-from sqlmodel import Session
-from src.core.events.database import get_db_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.roles import RoleCreate, RoleRead, RoleUpdate
 from src.security.auth import get_current_user
 from src.services.roles.roles import create_role, delete_role, read_role, update_role
@@ -15,7 +15,7 @@ async def api_create_role(
     request: Request,
     role_object: RoleCreate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 )-> RoleRead:
     """
     Create new role
@@ -28,7 +28,7 @@ async def api_get_role(
     request: Request,
     role_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 )-> RoleRead:
     """
     Get single role by role_id
@@ -41,7 +41,7 @@ async def api_update_role(
     request: Request,
     role_object: RoleUpdate,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 )-> RoleRead:
     """
     Update role by role_id
@@ -54,7 +54,7 @@ async def api_delete_role(
     request: Request,
     role_id: str,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     Delete role by ID
@@ -0,0 +1,26 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
+from src.db.search_documents import SearchResult
+from src.db.users import PublicUser
+from src.security.auth import get_current_user
+from src.services.search.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, search_org
+
+
+router = APIRouter()
+
+
+@router.get("/org_slug/{org_slug}")
+async def api_search_org(
+    request: Request,
+    org_slug: str,
+    query: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    current_user: PublicUser = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_async_db_session),
+) -> List[SearchResult]:
+    """
+    Search the courses, activities and collections of an org
+    """
+    return await search_org(request, org_slug, query, current_user, db_session, limit)
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Request
-from src.core.events.database import get_db_session
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
+from src.core.events.database import get_async_db_session
 from src.db.trails import TrailCreate, TrailRead
 from src.security.auth import get_current_user
+from src.services.trail.export import ExportFormat, export_learning_records
+from src.services.trail.progress import record_progress
 from src.services.trail.trail import (
     Trail,
     add_activity_to_trail,
@@ -21,7 +24,7 @@ async def api_start_trail(
     request: Request,
     trail_object: TrailCreate,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> Trail:
     """
     Start trail
@@ -33,7 +36,7 @@ async def api_start_trail(
 async def api_get_user_trail(
     request: Request,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> TrailRead:
     """
     Get a user trails
@@ -46,7 +49,7 @@ async def api_get_trail_by_org_id(
     request: Request,
     org_id: int,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> TrailRead:
     """
     Get a user trails using org slug
@@ -61,7 +64,7 @@ async def api_add_course_to_trail(
     request: Request,
     course_uuid: str,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> TrailRead:
     """
     Add Course to trail
@@ -74,7 +77,7 @@ async def api_remove_course_to_trail(
     request: Request,
     course_uuid: str,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> TrailRead:
     """
     Remove Course from trail
@@ -87,7 +90,7 @@ async def api_add_activity_to_trail(
     request: Request,
     activity_uuid: str,
     user=Depends(get_current_user),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ) -> TrailRead:
     """
     Add Course to trail
@@ -95,3 +98,30 @@ async def api_add_activity_to_trail(
     return await add_activity_to_trail(
         request, user, activity_uuid, db_session
     )
+
+
+@router.post("/progress/{activity_uuid}", status_code=status.HTTP_202_ACCEPTED)
+async def api_record_progress(
+    request: Request,
+    activity_uuid: str,
+    user=Depends(get_current_user),
+    db_session=Depends(get_async_db_session),
+):
+    """
+    Record a completed activity, written to the trail shortly after
+    """
+    return await record_progress(request, user, activity_uuid, db_session)
+
+
+@router.get("/org/{org_id}/export")
+async def api_export_learning_records(
+    request: Request,
+    org_id: int,
+    format: ExportFormat = "ndjson",
+    user=Depends(get_current_user),
+    db_session=Depends(get_async_db_session),
+) -> StreamingResponse:
+    """
+    Export the trails, runs, steps and assignment grades of an org
+    """
+    return await export_learning_records(request, org_id, format, user, db_session)
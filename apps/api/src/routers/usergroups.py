@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Request
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.usergroups import UserGroupCreate, UserGroupRead, UserGroupUpdate
 from src.db.users import PublicUser, UserRead
 from src.services.users.usergroups import (
@@ -16,7 +16,7 @@ from src.services.users.usergroups import (
     update_usergroup_by_id,
 )
 from src.security.auth import get_current_user
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 
 
 router = APIRouter()
@@ -26,7 +26,7 @@ router = APIRouter()
 async def api_create_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_object: UserGroupCreate,
 ) -> UserGroupRead:
@@ -40,7 +40,7 @@ async def api_create_usergroup(
 async def api_get_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
 ) -> UserGroupRead:
@@ -54,7 +54,7 @@ async def api_get_usergroup(
 async def api_get_users_linked_to_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
 ) -> list[UserRead]:
@@ -70,7 +70,7 @@ async def api_get_users_linked_to_usergroup(
 async def api_get_usergroups(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     org_id: int,
 ) -> list[UserGroupRead]:
@@ -86,7 +86,7 @@ async def api_get_usergroups(
 async def api_get_usergroupsby_resource(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     resource_uuid: str,
 ) -> list[UserGroupRead]:
@@ -102,7 +102,7 @@ async def api_get_usergroupsby_resource(
 async def api_update_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
     usergroup_object: UserGroupUpdate,
@@ -119,7 +119,7 @@ async def api_update_usergroup(
 async def api_delete_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
 ) -> str:
@@ -133,7 +133,7 @@ async def api_delete_usergroup(
 async def api_add_users_to_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
     user_ids: str,
@@ -150,7 +150,7 @@ async def api_add_users_to_usergroup(
 async def api_delete_users_from_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
     user_ids: str,
@@ -167,7 +167,7 @@ async def api_delete_users_from_usergroup(
 async def api_add_resources_to_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
     resource_uuids: str,
@@ -184,7 +184,7 @@ async def api_add_resources_to_usergroup(
 async def api_delete_resources_from_usergroup(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     usergroup_id: int,
     resource_uuids: str,
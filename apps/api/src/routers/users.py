@@ -1,14 +1,14 @@
 from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from pydantic import EmailStr
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.services.users.password_reset import (
     change_password_with_reset_code,
     send_reset_password_code,
 )
 from src.services.orgs.orgs import get_org_join_mechanism
 from src.security.auth import get_current_user
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 
 from src.db.users import (
     PublicUser,
@@ -48,7 +48,7 @@ async def api_get_current_user(current_user: User = Depends(get_current_user)):
 @router.get("/session")
 async def api_get_current_user_session(
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ) -> UserSession:
     """
@@ -62,7 +62,7 @@ async def api_get_authorization_status(
     request: Request,
     ressource_uuid: str,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
 ):
     """
@@ -77,7 +77,7 @@ async def api_get_authorization_status(
 async def api_create_user_with_orgid(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_object: UserCreate,
     org_id: int,
@@ -103,7 +103,7 @@ async def api_create_user_with_orgid(
 async def api_create_user_with_orgid_and_invite(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_object: UserCreate,
     invite_code: str,
@@ -132,7 +132,7 @@ async def api_create_user_with_orgid_and_invite(
 async def api_create_user_without_org(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_object: UserCreate,
 ) -> UserRead:
@@ -146,7 +146,7 @@ async def api_create_user_without_org(
 async def api_get_user_by_id(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_id: int,
 ) -> UserRead:
@@ -160,7 +160,7 @@ async def api_get_user_by_id(
 async def api_get_user_by_uuid(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_uuid: str,
 ) -> UserRead:
@@ -174,7 +174,7 @@ async def api_get_user_by_uuid(
 async def api_update_user(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_id: int,
     user_object: UserUpdate,
@@ -189,7 +189,7 @@ async def api_update_user(
 async def api_update_avatar_user(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     avatar_file: UploadFile | None = None,
 ) -> UserRead:
@@ -203,7 +203,7 @@ async def api_update_avatar_user(
 async def api_update_user_password(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_id: int,
     form: UserUpdatePassword,
@@ -218,7 +218,7 @@ async def api_update_user_password(
 async def api_change_password_with_reset_code(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     new_password: str,
     email: EmailStr,
@@ -237,7 +237,7 @@ async def api_change_password_with_reset_code(
 async def api_send_password_reset_email(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     email: EmailStr,
     org_id: int,
@@ -254,7 +254,7 @@ async def api_send_password_reset_email(
 async def api_delete_user(
     *,
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
     current_user: PublicUser = Depends(get_current_user),
     user_id: int,
 ):
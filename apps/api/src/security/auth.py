@@ -1,5 +1,6 @@
-from sqlmodel import Session
-from src.core.events.database import get_db_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.users import AnonymousUser, PublicUser, User, UserRead
 from src.services.users.users import security_get_user
 from config.config import get_learnhouse_config
@@ -9,7 +10,8 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from src.services.dev.dev import isDevModeEnabled
-from src.services.users.users import security_verify_password
+from src.security.password_hashing import verify_and_update_password
+from src.security.user_cache import current_user_cache, ensure_invalidation_listener
 from src.security.security import ALGORITHM, SECRET_KEY
 from fastapi_jwt_auth import AuthJWT
 
@@ -54,13 +56,24 @@ async def authenticate_user(
     request: Request,
     email: str,
     password: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> User | bool:
     user = await security_get_user(request, db_session, email)
     if not user:
         return False
-    if not security_verify_password(password, user.password):
+    verified, new_hash = await verify_and_update_password(password, user.password)
+    if not verified:
         return False
+
+    # The configured rounds changed, store the password hashed with them
+    if new_hash:
+        db_user = await db_session.get(User, user.id)
+        if db_user:
+            db_user.password = new_hash
+            db_session.add(db_user)
+            await db_session.commit()
+        user.password = new_hash
+
     return user
 
 
@@ -75,10 +88,36 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 
+def get_token_claims(user: User | UserRead) -> dict:
+    """
+    Claims identifying the user without an email lookup
+    """
+    return {"user_id": user.id, "user_uuid": user.user_uuid}
+
+
+async def get_token_user(
+    request: Request, db_session: AsyncSession, subject: str, claims: dict
+) -> User:
+    # Tokens carrying the user id are resolved with a primary key lookup,
+    # older tokens and stale claims fall back to the email
+    user_id = claims.get("user_id")
+    if isinstance(user_id, int):
+        statement = select(User).where(User.id == user_id)
+        user = (await db_session.exec(statement)).first()
+        if (
+            user
+            and user.email == subject
+            and user.user_uuid == claims.get("user_uuid")
+        ):
+            return user
+
+    return await security_get_user(request, db_session, email=subject)
+
+
 async def get_current_user(
     request: Request,
     Authorize: AuthJWT = Depends(),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -93,10 +132,24 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     if username:
-        user = await security_get_user(request, db_session, email=token_data.username)  # type: ignore # treated as an email
+        cached_user = current_user_cache.get(username)
+        if cached_user:
+            return cached_user.copy()
+
+        ensure_invalidation_listener()
+        generation = current_user_cache.generation
+
+        user = await get_token_user(
+            request,
+            db_session,
+            subject=token_data.username,  # type: ignore # treated as an email
+            claims=Authorize.get_raw_jwt() or {},
+        )
         if user is None:
             raise credentials_exception
-        return PublicUser(**user.model_dump())
+        public_user = PublicUser(**user.model_dump())
+        current_user_cache.set(username, public_user, generation)
+        return public_user.copy()
     else:
         return AnonymousUser()
 
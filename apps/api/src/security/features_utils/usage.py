@@ -3,7 +3,8 @@ from src.db.organization_config import OrganizationConfig
 from config.config import get_learnhouse_config
 from typing import Literal, TypeAlias
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 FeatureSet: TypeAlias = Literal[
     "ai",
@@ -20,15 +21,15 @@ FeatureSet: TypeAlias = Literal[
 ]
 
 
-def check_limits_with_usage(
+async def check_limits_with_usage(
     feature: FeatureSet,
     org_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     # Get the Organization Config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -82,7 +83,7 @@ def check_limits_with_usage(
 def increase_feature_usage(
     feature: FeatureSet,
     org_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     LH_CONFIG = get_learnhouse_config()
     redis_conn_string = LH_CONFIG.redis_config.redis_connection_string
@@ -113,7 +114,7 @@ def increase_feature_usage(
 def decrease_feature_usage(
     feature: FeatureSet,
     org_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     LH_CONFIG = get_learnhouse_config()
     redis_conn_string = LH_CONFIG.redis_config.redis_connection_string
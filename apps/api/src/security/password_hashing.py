@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from config.config import get_learnhouse_config
+from src.security.security import (
+    security_hash_password,
+    security_verify_and_update_password,
+    security_verify_password,
+)
+
+T = TypeVar("T")
+
+
+class PasswordHashingStatsRead(BaseModel):
+    workers: int
+    max_queue: int
+    in_flight: int
+    completed: int
+    rejected: int
+    rehashed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_duration_ms: float
+
+
+class PasswordHashingPool:
+    """
+    Bounded thread pool running the password hashes outside of the event loop.
+
+    pbkdf2 releases the GIL, so the event loop keeps serving requests while a
+    cohort logs in. Past `workers + max_queue` pending operations, new ones are
+    rejected with a 503 instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hashing"
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_duration = 0.0
+
+    def _record(self, wait: float, duration: float):
+        with self._lock:
+            self.completed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.total_duration += duration
+
+    def record_rehash(self):
+        with self._lock:
+            self.rehashed += 1
+
+    async def run(self, function: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many password operations in progress, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self.in_flight += 1
+
+        submitted = time.perf_counter()
+
+        def task() -> T:
+            started = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                self._record(started - submitted, time.perf_counter() - started)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, task
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def get_stats(self) -> PasswordHashingStatsRead:
+        completed = self.completed
+        return PasswordHashingStatsRead(
+            workers=self.workers,
+            max_queue=self.max_queue,
+            in_flight=self.in_flight,
+            completed=completed,
+            rejected=self.rejected,
+            rehashed=self.rehashed,
+            avg_wait_ms=round(self.total_wait * 1000 / completed, 3) if completed else 0,
+            max_wait_ms=round(self.max_wait * 1000, 3),
+            avg_duration_ms=(
+                round(self.total_duration * 1000 / completed, 3) if completed else 0
+            ),
+        )
+
+
+security_config = get_learnhouse_config().security_config
+password_hashing_pool = PasswordHashingPool(
+    workers=security_config.password_hashing_workers,
+    max_queue=security_config.password_hashing_max_queue,
+)
+
+
+async def hash_password(password: str) -> str:
+    return await password_hashing_pool.run(security_hash_password, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_pool.run(
+        security_verify_password, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password, returning its new hash when the configured rounds changed
+    """
+    verified, new_hash = await password_hashing_pool.run(
+        security_verify_and_update_password, plain_password, hashed_password
+    )
+    if new_hash:
+        password_hashing_pool.record_rehash()
+    return verified, new_hash
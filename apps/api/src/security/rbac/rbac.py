@@ -1,12 +1,14 @@
 from typing import Literal
 from fastapi import HTTPException, status, Request
-from sqlalchemy import null
-from sqlmodel import Session, select
+from sqlmodel import and_, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.collections import Collection
 from src.db.courses.courses import Course
 from src.db.resource_authors import ResourceAuthor, ResourceAuthorshipEnum
-from src.db.roles import Role
-from src.db.user_organizations import UserOrganization
+from src.db.usergroup_resources import UserGroupResource
+from src.db.usergroup_user import UserGroupUser
+from src.db.users import AnonymousUser, PublicUser
+from src.security.rbac.rights_cache import get_user_rights
 from src.security.rbac.utils import check_element_type
 
 
@@ -15,7 +17,7 @@ async def authorization_verify_if_element_is_public(
     request,
     element_uuid: str,
     action: Literal["read"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     element_nature = await check_element_type(element_uuid)
     # Verifies if the element is public
@@ -24,7 +26,8 @@ async def authorization_verify_if_element_is_public(
             statement = select(Course).where(
                 Course.public == True, Course.course_uuid == element_uuid
             )
-            course = db_session.exec(statement).first()
+            result = await db_session.exec(statement)
+            course = result.first()
             if course:
                 return True
             else:
@@ -37,7 +40,8 @@ async def authorization_verify_if_element_is_public(
         statement = select(Collection).where(
             Collection.public == True, Collection.collection_uuid == element_uuid
         )
-        collection = db_session.exec(statement).first()
+        result = await db_session.exec(statement)
+        collection = result.first()
         if collection:
             return True
         else:
@@ -58,26 +62,11 @@ async def authorization_verify_if_user_is_author(
     user_id: int,
     action: Literal["read", "update", "delete", "create"],
     element_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
-    if action == "update" or "delete" or "read":
-        statement = select(ResourceAuthor).where(
-            ResourceAuthor.resource_uuid == element_uuid
-        )
-        resource_author = db_session.exec(statement).first()
-
-        if resource_author:
-            if resource_author.user_id == int(user_id):
-                if (resource_author.authorship == ResourceAuthorshipEnum.CREATOR) or (
-                    resource_author.authorship == ResourceAuthorshipEnum.MAINTAINER
-                ):
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        else:
-            return False
+    # Creators and maintainers of a resource, from the cached rights
+    rights = await get_user_rights(int(user_id), db_session)
+    return rights.is_author(element_uuid)
 
 
 # Tested and working
@@ -86,31 +75,13 @@ async def authorization_verify_based_on_roles(
     user_id: int,
     action: Literal["read", "update", "delete", "create"],
     element_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     element_type = await check_element_type(element_uuid)
 
-    # Get user roles bound to an organization and standard roles
-    statement = (
-        select(Role)
-        .join(UserOrganization)
-        .where((UserOrganization.org_id == Role.org_id) | (Role.org_id == null()))
-        .where(UserOrganization.user_id == user_id)
-    )
-
-    user_roles_in_organization_and_standard_roles = db_session.exec(statement).all()
-
-    # Find in roles list if there is a role that matches users action for this type of element
-    for role in user_roles_in_organization_and_standard_roles:
-        role = Role.model_validate(role)
-        if role.rights:
-            rights = role.rights
-            if rights[element_type][f"action_{action}"] is True:
-                return True
-            else:
-                return False
-    else:
-        return False
+    # Rights of the user roles bound to an organization and standard roles
+    rights = await get_user_rights(int(user_id), db_session)
+    return rights.allows(element_type, action)
 
 
 async def authorization_verify_based_on_org_admin_status(
@@ -118,27 +89,12 @@ async def authorization_verify_based_on_org_admin_status(
     user_id: int,
     action: Literal["read", "update", "delete", "create"],
     element_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     await check_element_type(element_uuid)
 
-    # Get user roles bound to an organization and standard roles
-    statement = (
-        select(Role)
-        .join(UserOrganization)
-        .where((UserOrganization.org_id == Role.org_id) | (Role.org_id == null()))
-        .where(UserOrganization.user_id == user_id)
-    )
-
-    user_roles_in_organization_and_standard_roles = db_session.exec(statement).all()
-
-    # Find in roles list if there is a role that matches users action for this type of element
-    for role in user_roles_in_organization_and_standard_roles:
-        role = Role.model_validate(role)
-        if role.id == 1 or role.id == 2:
-            return True
-    else:
-        return False
+    rights = await get_user_rights(int(user_id), db_session)
+    return rights.is_org_admin()
 
 
 # Tested and working
@@ -147,7 +103,7 @@ async def authorization_verify_based_on_roles_and_authorship(
     user_id: int,
     action: Literal["read", "update", "delete", "create"],
     element_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     isAuthor = await authorization_verify_if_user_is_author(
         request, user_id, action, element_uuid, db_session
@@ -172,3 +128,163 @@ async def authorization_verify_if_user_is_anon(user_id: int):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You should be logged in to perform this action",
         )
+
+
+# Elements resolved by authorize_many: (model, uuid column)
+BATCH_AUTHORIZATION_ELEMENTS = {
+    "courses": (Course, Course.course_uuid),
+    "collections": (Collection, Collection.collection_uuid),
+}
+
+
+async def authorize_many(
+    current_user: PublicUser | AnonymousUser,
+    action: Literal["read", "update", "delete", "create"],
+    element_uuids: list[str],
+    db_session: AsyncSession,
+) -> dict[str, bool]:
+    """
+    Authorize an action on a whole page of courses / collections at once.
+
+    Same rules as the per-element checks: everyone may read public elements,
+    other actions need a role granting them in the element's organization or
+    to be the element's creator / maintainer. Reads of private elements are also limited to the members of
+    the element's usergroups (if any) and its authors, like the course listing.
+
+    Runs a constant number of queries whatever the page size and returns an
+    allow / deny map keyed by element uuid.
+    """
+    decisions = {element_uuid: False for element_uuid in element_uuids}
+
+    uuids_by_type: dict[str, list[str]] = {}
+    for element_uuid in decisions:
+        element_type = await check_element_type(element_uuid)
+        if element_type not in BATCH_AUTHORIZATION_ELEMENTS:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User rights : Batch authorization is not supported for this element",
+            )
+        uuids_by_type.setdefault(element_type, []).append(element_uuid)
+
+    rights = None
+    if current_user.id != 0:
+        rights = await get_user_rights(current_user.id, db_session)
+
+    for element_type, uuids in uuids_by_type.items():
+        model, uuid_column = BATCH_AUTHORIZATION_ELEMENTS[element_type]
+
+        statement = select(uuid_column, model.org_id, model.public).where(
+            uuid_column.in_(uuids)  # type: ignore
+        )
+        result = await db_session.exec(statement)
+        elements = result.all()
+
+        if rights is None:
+            for element_uuid, _, public in elements:
+                decisions[element_uuid] = action == "read" and bool(public)
+            continue
+
+        # Authorships of the user on the page
+        statement = select(ResourceAuthor.resource_uuid, ResourceAuthor.authorship).where(
+            ResourceAuthor.user_id == current_user.id,
+            ResourceAuthor.resource_uuid.in_(uuids),  # type: ignore
+        )
+        result = await db_session.exec(statement)
+        authorships: dict[str, set] = {}
+        for element_uuid, authorship in result.all():
+            authorships.setdefault(element_uuid, set()).add(authorship)
+
+        # Usergroups of the page, and the ones the user is a member of
+        restricted: set[str] = set()
+        member_of: set[str] = set()
+        if action == "read":
+            statement = (
+                select(UserGroupResource.resource_uuid, UserGroupUser.user_id)
+                .outerjoin(
+                    UserGroupUser,
+                    and_(
+                        UserGroupUser.usergroup_id == UserGroupResource.usergroup_id,
+                        UserGroupUser.user_id == current_user.id,
+                    ),
+                )
+                .where(UserGroupResource.resource_uuid.in_(uuids))  # type: ignore
+            )
+            result = await db_session.exec(statement)
+            for element_uuid, member_id in result.all():
+                restricted.add(element_uuid)
+                if member_id is not None:
+                    member_of.add(element_uuid)
+
+        for element_uuid, org_id, public in elements:
+            if action == "read" and public:
+                decisions[element_uuid] = True
+                continue
+
+            is_author = bool(
+                authorships.get(element_uuid, set())
+                & {ResourceAuthorshipEnum.CREATOR, ResourceAuthorshipEnum.MAINTAINER}
+            )
+            allowed = is_author or rights.allows(element_type, action, org_id=org_id)
+
+            if allowed and action == "read" and element_uuid not in authorships:
+                allowed = element_uuid not in restricted or element_uuid in member_of
+
+            decisions[element_uuid] = allowed
+
+    return decisions
+
+
+async def get_visibility_filter(
+    current_user: PublicUser | AnonymousUser,
+    element_type: Literal["courses", "collections"],
+    db_session: AsyncSession,
+):
+    """
+    SQL condition on the courses / collections `authorize_many` lets the user
+    read, so that listings are filtered before their LIMIT and pages are full
+    """
+    model, uuid_column = BATCH_AUTHORIZATION_ELEMENTS[element_type]
+
+    if current_user.id == 0:
+        return model.public == True
+
+    rights = await get_user_rights(current_user.id, db_session)
+    authored = select(ResourceAuthor.id).where(
+        ResourceAuthor.resource_uuid == uuid_column,
+        ResourceAuthor.user_id == current_user.id,
+    )
+
+    is_creator_or_maintainer = authored.where(
+        ResourceAuthor.authorship.in_(  # type: ignore
+            [ResourceAuthorshipEnum.CREATOR, ResourceAuthorshipEnum.MAINTAINER]
+        )
+    ).exists()
+
+    # Organizations where one of the user's roles grants the read
+    read_orgs = rights.table.get((element_type, "read"))
+    if not read_orgs:
+        return or_(model.public == True, is_creator_or_maintainer)
+
+    # Private elements in usergroups are for their members and authors
+    in_usergroup = select(UserGroupResource.id).where(
+        UserGroupResource.resource_uuid == uuid_column
+    )
+    in_user_usergroup = in_usergroup.join(
+        UserGroupUser,
+        and_(
+            UserGroupUser.usergroup_id == UserGroupResource.usergroup_id,
+            UserGroupUser.user_id == current_user.id,
+        ),
+    )
+    return or_(
+        model.public == True,
+        is_creator_or_maintainer,
+        and_(
+            model.org_id.in_(read_orgs),  # type: ignore
+            or_(
+                ~in_usergroup.exists(),
+                in_user_usergroup.exists(),
+                authored.exists(),
+            ),
+        ),
+    )
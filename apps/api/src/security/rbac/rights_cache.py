@@ -0,0 +1,192 @@
+from typing import Iterable, Optional
+from pydantic import BaseModel
+from sqlalchemy import event, null, or_
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from config.config import get_learnhouse_config
+from src.core.cache import InvalidationChannel, TTLCache
+from src.db.resource_authors import ResourceAuthor, ResourceAuthorshipEnum
+from src.db.roles import Role
+from src.db.user_organizations import UserOrganization
+
+RBAC_INVALIDATION_CHANNEL = "learnhouse:rbac:invalidate"
+
+# Global roles granting the organization admin status (Admin, Maintainer)
+ORG_ADMIN_ROLE_IDS = (1, 2)
+
+
+class CompiledRights:
+    """
+    Resolved rights of a user, compiled from its roles in every organization.
+
+    `table` maps (element_type, action) to the organizations where one of the
+    user's roles grants it, so that a check is a single dict lookup.
+    """
+
+    __slots__ = ("table", "admin_orgs", "authored")
+
+    def __init__(
+        self,
+        table: dict[tuple[str, str], frozenset[int]],
+        admin_orgs: frozenset[int],
+        authored: frozenset[str],
+    ):
+        self.table = table
+        self.admin_orgs = admin_orgs
+        # Resources the user created or maintains
+        self.authored = authored
+
+    def allows(self, element_type: str, action: str, org_id: Optional[int] = None) -> bool:
+        orgs = self.table.get((element_type, action))
+        if not orgs:
+            return False
+        return org_id is None or org_id in orgs
+
+    def is_org_admin(self, org_id: Optional[int] = None) -> bool:
+        if org_id is None:
+            return bool(self.admin_orgs)
+        return org_id in self.admin_orgs
+
+    def is_author(self, element_uuid: str) -> bool:
+        return element_uuid in self.authored
+
+
+def compile_rights(
+    roles: Iterable[tuple[int, Role]], authored: Iterable[str]
+) -> CompiledRights:
+    table: dict[tuple[str, str], set[int]] = {}
+    admin_orgs: set[int] = set()
+
+    for org_id, role in roles:
+        if role.id in ORG_ADMIN_ROLE_IDS:
+            admin_orgs.add(org_id)
+
+        rights = role.rights.dict() if isinstance(role.rights, BaseModel) else role.rights
+        for element_type, permissions in (rights or {}).items():
+            if not isinstance(permissions, dict):
+                continue
+            for permission, granted in permissions.items():
+                if granted is True and permission.startswith("action_"):
+                    table.setdefault(
+                        (element_type, permission.removeprefix("action_")), set()
+                    ).add(org_id)
+
+    return CompiledRights(
+        table={key: frozenset(orgs) for key, orgs in table.items()},
+        admin_orgs=frozenset(admin_orgs),
+        authored=frozenset(authored),
+    )
+
+
+# In-process cache of the compiled rights, keyed by user id
+rights_cache: TTLCache[int, CompiledRights] = TTLCache(
+    ttl=get_learnhouse_config().security_config.rbac_cache_ttl
+)
+
+
+## 📡 Cross-process invalidation ##
+
+
+def _handle_invalidation_message(data: str):
+    if data == "all":
+        rights_cache.invalidate()
+    else:
+        rights_cache.invalidate(int(user_id) for user_id in data.split(","))
+
+
+rbac_invalidation_channel = InvalidationChannel(
+    RBAC_INVALIDATION_CHANNEL,
+    on_message=_handle_invalidation_message,
+    # Messages may have been missed, restart from an empty cache
+    on_reset=rights_cache.invalidate,
+)
+
+
+def ensure_invalidation_listener():
+    """
+    Subscribe this process to the invalidations published by the others
+    """
+    if rights_cache.ttl > 0:
+        rbac_invalidation_channel.ensure_listener()
+
+
+def publish_invalidation(user_ids: Optional[Iterable[int]] = None):
+    """
+    Invalidate the rights of the given users (every user when None),
+    in this process and in every process listening on Redis
+    """
+    rbac_invalidation_channel.publish(
+        "all"
+        if user_ids is None
+        else ",".join(str(user_id) for user_id in sorted(set(user_ids)))
+    )
+
+
+# Role, UserOrganization and ResourceAuthor changes are collected on flush and
+# published once the transaction is committed
+
+@event.listens_for(SASession, "after_flush")
+def _collect_invalidations(session, flush_context):
+    pending = session.info.setdefault("rbac_invalidations", set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Role):
+            pending.add(None)
+        elif isinstance(instance, (UserOrganization, ResourceAuthor)):
+            pending.add(instance.user_id)
+
+
+@event.listens_for(SASession, "after_commit")
+def _publish_invalidations(session):
+    pending = session.info.pop("rbac_invalidations", None)
+    if not pending:
+        return
+    if None in pending:
+        publish_invalidation()
+    else:
+        publish_invalidation(pending)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop("rbac_invalidations", None)
+
+
+## 🔑 Rights resolution ##
+
+
+async def get_user_rights(
+    user_id: int, db_session: AsyncSession
+) -> CompiledRights:
+    """
+    Compiled rights of a user, from the cache or from two queries
+    """
+    rights = rights_cache.get(user_id)
+    if rights:
+        return rights
+
+    ensure_invalidation_listener()
+    generation = rights_cache.generation
+
+    # User roles bound to an organization and standard roles
+    statement = (
+        select(UserOrganization.org_id, Role)
+        .join(Role, Role.id == UserOrganization.role_id)  # type: ignore
+        .where(or_(UserOrganization.org_id == Role.org_id, Role.org_id == null()))
+        .where(UserOrganization.user_id == user_id)
+    )
+    result = await db_session.exec(statement)
+    roles = result.all()
+
+    statement = select(ResourceAuthor.resource_uuid).where(
+        ResourceAuthor.user_id == user_id,
+        ResourceAuthor.authorship.in_(  # type: ignore
+            [ResourceAuthorshipEnum.CREATOR, ResourceAuthorshipEnum.MAINTAINER]
+        ),
+    )
+    result = await db_session.exec(statement)
+    authored = result.all()
+
+    rights = compile_rights(roles, authored)
+    rights_cache.set(user_id, rights, generation)
+    return rights
@@ -1,12 +1,9 @@
 from passlib.context import CryptContext
-from passlib.hash import pbkdf2_sha256
 from config.config import get_learnhouse_config
 
 
 ### 🔒 JWT ##############################################################
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 SECRET_KEY = get_learnhouse_config().security_config.auth_jwt_secret_key
 ALGORITHM = "HS256"
@@ -17,12 +14,32 @@ ALGORITHM = "HS256"
 ### 🔒 Passwords Hashing ##############################################################
 
 
+PASSWORD_HASH_ROUNDS = get_learnhouse_config().security_config.password_hash_rounds
+
+# Hashes with other rounds than the configured ones need an update
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=PASSWORD_HASH_ROUNDS,
+)
+
+
 def security_hash_password(password: str):
-    return pbkdf2_sha256.hash(password)
+    return pwd_context.hash(password)
 
 
 def security_verify_password(plain_password: str, hashed_password: str):
-    return pbkdf2_sha256.verify(plain_password, hashed_password)
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def security_verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and return its new hash when the stored one is outdated
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
 
 ### 🔒 Passwords Hashing ##############################################################
@@ -0,0 +1,35 @@
+from config.config import get_learnhouse_config
+from src.core.cache import InvalidationChannel, TTLCache
+from src.db.users import PublicUser
+
+USER_INVALIDATION_CHANNEL = "learnhouse:users:invalidate"
+
+# Users resolved by get_current_user, keyed by token subject
+current_user_cache: TTLCache[str, PublicUser] = TTLCache(
+    ttl=get_learnhouse_config().security_config.user_cache_ttl, max_size=10000
+)
+
+
+def _handle_invalidation_message(data: str):
+    user_id = int(data)
+    current_user_cache.invalidate_where(lambda subject, user: user.id == user_id)
+
+
+user_invalidation_channel = InvalidationChannel(
+    USER_INVALIDATION_CHANNEL,
+    on_message=_handle_invalidation_message,
+    on_reset=current_user_cache.invalidate,
+)
+
+
+def ensure_invalidation_listener():
+    if current_user_cache.ttl > 0:
+        user_invalidation_channel.ensure_listener()
+
+
+def invalidate_cached_user(user_id: int):
+    """
+    Drop a user from the cache of every process, to be called once a change
+    to the user is committed
+    """
+    user_invalidation_channel.publish(str(user_id))
@@ -1,5 +1,6 @@
 from fastapi import Depends, HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.organization_config import OrganizationConfig
 from src.db.organizations import Organization
 from src.security.features_utils.usage import (
@@ -7,7 +8,7 @@ from src.security.features_utils.usage import (
     increase_feature_usage,
 )
 from src.db.courses.courses import Course, CourseRead
-from src.core.events.database import get_db_session
+from src.core.events.database import get_async_db_session
 from src.db.users import PublicUser
 from src.db.courses.activities import Activity, ActivityRead
 from src.security.auth import get_current_user
@@ -24,11 +25,11 @@ from src.services.courses.activities.utils import (
 )
 
 
-def ai_start_activity_chat_session(
+async def ai_start_activity_chat_session(
     request: Request,
     chat_session_object: StartActivityAIChatSession,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> ActivityAIChatSessionResponse:
     """
     Start a new AI Chat session with a Course Activity
@@ -38,7 +39,7 @@ def ai_start_activity_chat_session(
     statement = select(Activity).where(
         Activity.activity_uuid == chat_session_object.activity_uuid
     )
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     activity = ActivityRead.model_validate(activity)
 
@@ -48,12 +49,12 @@ def ai_start_activity_chat_session(
         .join(Activity)
         .where(Activity.activity_uuid == chat_session_object.activity_uuid)
     )
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
     course = CourseRead.model_validate(course)
 
     # Get the Organization
     statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     if not org or org.id is None:
         raise HTTPException(
@@ -62,7 +63,7 @@ def ai_start_activity_chat_session(
         )
 
     # Check limits and usage
-    check_limits_with_usage("ai", org.id, db_session)
+    await check_limits_with_usage("ai", org.id, db_session)
     increase_feature_usage("ai", org.id, db_session)
 
     if not activity:
@@ -85,13 +86,13 @@ def ai_start_activity_chat_session(
 
     # Get Activity Organization
     statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     # Get Organization Config
     statement = select(OrganizationConfig).where(
         OrganizationConfig.org_id == org.id  # type: ignore
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     org_config = result.first()
 
     org_config = OrganizationConfig.model_validate(org_config)
@@ -125,11 +126,11 @@ def ai_start_activity_chat_session(
     )
 
 
-def ai_send_activity_chat_message(
+async def ai_send_activity_chat_message(
     request: Request,
     chat_session_object: SendActivityAIChatMessage,
     current_user: PublicUser = Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> ActivityAIChatSessionResponse:
     """
     Start a new AI Chat session with a Course Activity
@@ -138,7 +139,7 @@ def ai_send_activity_chat_message(
     statement = select(Activity).where(
         Activity.activity_uuid == chat_session_object.activity_uuid
     )
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     activity = ActivityRead.model_validate(activity)
 
@@ -148,15 +149,15 @@ def ai_send_activity_chat_message(
         .join(Activity)
         .where(Activity.activity_uuid == chat_session_object.activity_uuid)
     )
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
     course = CourseRead.model_validate(course)
 
     # Get the Organization
     statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     # Check limits and usage
-    check_limits_with_usage("ai", course.org_id, db_session)
+    await check_limits_with_usage("ai", course.org_id, db_session)
     increase_feature_usage("ai", course.org_id, db_session)
 
     if not activity:
@@ -176,13 +177,13 @@ def ai_send_activity_chat_message(
 
     # Get Activity Organization
     statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     # Get Organization Config
     statement = select(OrganizationConfig).where(
         OrganizationConfig.org_id == org.id  # type: ignore
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     org_config = result.first()
 
     org_config = OrganizationConfig.model_validate(org_config)
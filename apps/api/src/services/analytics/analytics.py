@@ -0,0 +1,109 @@
+from fastapi import HTTPException, Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.db.analytics import (
+    ActivityFunnelRead,
+    AnalyticsWatermark,
+    CourseActivityAnalytics,
+    CourseAnalytics,
+    CourseAnalyticsRead,
+    CourseCompletionTimeAnalytics,
+)
+from src.db.courses.courses import Course
+from src.db.trail_steps import TrailStep
+from src.db.users import AnonymousUser, PublicUser
+from src.security.features_utils.usage import check_limits_with_usage
+from src.security.rbac.rbac import authorization_verify_if_user_is_anon
+from src.security.rbac.rights_cache import get_user_rights
+from src.services.analytics.rollups import get_bucket_seconds
+from src.services.courses.outline_cache import get_course_outline
+
+
+def get_median_seconds(histogram: dict[int, int]) -> float | None:
+    """
+    Median (upper one for an even count) of a completion time histogram, at
+    the middle of its bucket
+    """
+    total = sum(histogram.values())
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen * 2 > total:
+            return get_bucket_seconds(bucket)
+    return None
+
+
+async def get_course_analytics(
+    request: Request,
+    course_uuid: str,
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+) -> CourseAnalyticsRead:
+    """
+    Funnel of a course from the rollups, as of their last refresh
+    """
+    statement = select(Course).where(Course.course_uuid == course_uuid)
+    course = (await db_session.exec(statement)).first()
+
+    if not course:
+        raise HTTPException(
+            status_code=404,
+            detail="Course not found",
+        )
+
+    # RBAC check, analytics are for the authors of the course and the
+    # teachers of its org
+    await authorization_verify_if_user_is_anon(current_user.id)
+    rights = await get_user_rights(current_user.id, db_session)
+    if not (
+        rights.is_author(course.course_uuid)
+        or rights.allows("courses", "update", org_id=course.org_id)
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail="User rights (roles & authorship) : You don't have the right to perform this action",
+        )
+
+    await check_limits_with_usage("analytics", course.org_id, db_session)
+
+    outline = await get_course_outline(course, db_session)
+
+    rollup = await db_session.get(CourseAnalytics, course.id)
+
+    statement = select(
+        CourseActivityAnalytics.activity_id, CourseActivityAnalytics.completions
+    ).where(CourseActivityAnalytics.course_id == course.id)
+    completions = dict((await db_session.exec(statement)).all())
+
+    statement = select(
+        CourseCompletionTimeAnalytics.bucket, CourseCompletionTimeAnalytics.learners
+    ).where(CourseCompletionTimeAnalytics.course_id == course.id)
+    histogram = dict((await db_session.exec(statement)).all())
+
+    watermark = await db_session.get(AnalyticsWatermark, TrailStep.__tablename__)
+
+    # Activities in course order, each losing the learners who stopped before it
+    learners_started = rollup.learners_started if rollup else 0
+    activities = []
+    previous = learners_started
+    for chapter in outline.chapters:
+        for activity in chapter.activities:
+            count = completions.get(activity.id, 0)
+            activities.append(
+                ActivityFunnelRead(
+                    activity_uuid=activity.activity_uuid,
+                    name=activity.name,
+                    completions=count,
+                    drop_off=max(previous - count, 0),
+                )
+            )
+            previous = count
+
+    return CourseAnalyticsRead(
+        course_uuid=course.course_uuid,
+        learners_started=learners_started,
+        learners_completed=rollup.learners_completed if rollup else 0,
+        median_time_to_complete=get_median_seconds(histogram),
+        activities=activities,
+        refreshed_at=watermark.update_date if watermark else None,
+    )
@@ -0,0 +1,247 @@
+"""
+Course analytics rollups.
+
+Trail runs and trail steps are append-mostly, so the rollup tables are
+refreshed incrementally: every refresh aggregates the rows whose id is past
+the watermark of their table and adds the result to the rollups. A refresh
+only rolls up to the highest id seen by the previous refresh, which leaves a
+whole refresh interval for transactions that took an id to commit. Deleted
+runs and steps are not subtracted, `rebuild_analytics` recomputes everything.
+"""
+
+import logging
+import math
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, delete, func
+from sqlmodel import Session, select
+from config.config import get_learnhouse_config
+from src.core.events.database import get_upsert_insert
+from src.db.analytics import (
+    AnalyticsWatermark,
+    CourseActivityAnalytics,
+    CourseAnalytics,
+    CourseCompletionTimeAnalytics,
+)
+from src.db.courses.courses import Course
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+
+BUCKETS_PER_DOUBLING = 4
+
+
+def get_time_bucket(seconds: float) -> int:
+    return max(0, math.floor(math.log2(max(seconds, 1)) * BUCKETS_PER_DOUBLING))
+
+
+def get_bucket_seconds(bucket: int) -> float:
+    """
+    Geometric middle of a bucket
+    """
+    return 2 ** ((bucket + 0.5) / BUCKETS_PER_DOUBLING)
+
+
+def get_duration(start: str, end: str) -> Optional[float]:
+    try:
+        return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+    except ValueError:
+        return None
+
+
+def advance_watermark(db_session: Session, model) -> tuple[int, int]:
+    """
+    Locks the watermark of a table and moves it, returns the id range to roll up
+    """
+    name = model.__tablename__
+    db_session.connection().execute(
+        get_upsert_insert(db_session)(AnalyticsWatermark)
+        .values(name=name)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    statement = (
+        select(AnalyticsWatermark)
+        .where(AnalyticsWatermark.name == name)
+        .with_for_update()
+    )
+    watermark = db_session.exec(statement).one()
+    start, end = watermark.last_id, watermark.next_id
+
+    watermark.last_id = end
+    watermark.next_id = db_session.exec(select(func.max(model.id))).one() or end
+    watermark.update_date = str(datetime.now())
+    db_session.add(watermark)
+    return start, end
+
+
+def _add_counts(db_session: Session, model, keys: list[str], column: str, rows: list[dict]):
+    """
+    Add counts to a rollup table, creating the missing rows
+    """
+    if not rows:
+        return
+    statement = get_upsert_insert(db_session)(model).values(rows)
+    db_session.connection().execute(
+        statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={column: getattr(model, column) + getattr(statement.excluded, column)},
+        )
+    )
+
+
+def refresh_analytics(db_session: Session) -> int:
+    """
+    Roll up the trail runs and steps created since the previous refresh,
+    returns the number of completed steps rolled up
+    """
+    runs_start, runs_end = advance_watermark(db_session, TrailRun)
+    steps_start, steps_end = advance_watermark(db_session, TrailStep)
+
+    # Learners who started each course
+    statement = (
+        select(TrailRun.course_id, TrailRun.org_id, func.count())
+        .where(TrailRun.id > runs_start, TrailRun.id <= runs_end)  # type: ignore
+        .group_by(TrailRun.course_id, TrailRun.org_id)  # type: ignore
+    )
+    _add_counts(
+        db_session,
+        CourseAnalytics,
+        ["course_id"],
+        "learners_started",
+        [
+            dict(course_id=course_id, org_id=org_id, learners_started=count)
+            for course_id, org_id, count in db_session.exec(statement).all()
+        ],
+    )
+
+    # Completions of each activity
+    in_window = (TrailStep.id > steps_start) & (TrailStep.id <= steps_end)  # type: ignore
+    statement = (
+        select(TrailStep.course_id, TrailStep.activity_id, func.count())
+        .where(in_window, TrailStep.complete == True)
+        .group_by(TrailStep.course_id, TrailStep.activity_id)  # type: ignore
+    )
+    completions = [
+        dict(course_id=course_id, activity_id=activity_id, completions=count)
+        for course_id, activity_id, count in db_session.exec(statement).all()
+    ]
+    _add_counts(
+        db_session,
+        CourseActivityAnalytics,
+        ["course_id", "activity_id"],
+        "completions",
+        completions,
+    )
+
+    # Runs whose completed steps reached the activities of their course in
+    # this window, timed from their first completed step
+    before = func.sum(case((TrailStep.id <= steps_start, 1), else_=0))
+    statement = (
+        select(
+            TrailRun.course_id,
+            TrailRun.org_id,
+            func.min(TrailStep.creation_date),
+            func.max(TrailStep.creation_date),
+        )
+        .join(TrailStep, TrailStep.trailrun_id == TrailRun.id)  # type: ignore
+        .join(Course, Course.id == TrailRun.course_id)  # type: ignore
+        .where(
+            TrailRun.id.in_(select(TrailStep.trailrun_id).where(in_window)),  # type: ignore
+            TrailStep.id <= steps_end,
+            TrailStep.complete == True,
+            Course.activity_count > 0,
+        )
+        .group_by(
+            TrailRun.id, TrailRun.course_id, TrailRun.org_id, Course.activity_count
+        )
+        .having(before < Course.activity_count, func.count() >= Course.activity_count)
+    )
+    completed: Counter[tuple[int, int]] = Counter()
+    times: Counter[tuple[int, int]] = Counter()
+    for course_id, org_id, started_at, completed_at in db_session.exec(statement).all():
+        completed[(course_id, org_id)] += 1
+        duration = get_duration(started_at, completed_at)
+        if duration is not None:
+            times[(course_id, get_time_bucket(duration))] += 1
+
+    _add_counts(
+        db_session,
+        CourseAnalytics,
+        ["course_id"],
+        "learners_completed",
+        [
+            dict(course_id=course_id, org_id=org_id, learners_completed=count)
+            for (course_id, org_id), count in completed.items()
+        ],
+    )
+    _add_counts(
+        db_session,
+        CourseCompletionTimeAnalytics,
+        ["course_id", "bucket"],
+        "learners",
+        [
+            dict(course_id=course_id, bucket=bucket, learners=count)
+            for (course_id, bucket), count in times.items()
+        ],
+    )
+
+    db_session.commit()
+    return sum(row["completions"] for row in completions)
+
+
+def rebuild_analytics(db_session: Session) -> int:
+    """
+    Recompute the rollups from every trail run and step
+    """
+    for model in (CourseAnalytics, CourseActivityAnalytics, CourseCompletionTimeAnalytics):
+        db_session.connection().execute(delete(model))
+
+    for model in (TrailRun, TrailStep):
+        watermark = db_session.get(AnalyticsWatermark, model.__tablename__)
+        if watermark is None:
+            watermark = AnalyticsWatermark(name=model.__tablename__)
+        watermark.last_id = 0
+        watermark.next_id = db_session.exec(select(func.max(model.id))).one() or 0
+        db_session.add(watermark)
+    db_session.flush()
+
+    return refresh_analytics(db_session)
+
+
+class AnalyticsRefresher:
+    """
+    Background thread refreshing the rollups of a worker
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self, engine, interval: int):
+        while not self._stop.wait(interval):
+            try:
+                with Session(engine) as db_session:
+                    refresh_analytics(db_session)
+            except Exception:
+                logging.exception("Analytics refresh failed")
+
+    def start(self, engine):
+        interval = get_learnhouse_config().database_config.analytics_refresh_interval
+        if self._thread is not None or interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(engine, interval), name="analytics-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+
+analytics_refresher = AnalyticsRefresher()
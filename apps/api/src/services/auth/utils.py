@@ -2,8 +2,9 @@ import random
 from typing import Optional
 from fastapi import Depends, HTTPException, Request
 import httpx
-from sqlmodel import Session, select
-from src.core.events.database import get_db_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import get_async_db_session
 from src.db.users import User, UserCreate, UserRead
 from src.security.auth import get_current_user
 from src.services.users.users import create_user, create_user_without_org
@@ -30,14 +31,14 @@ async def signWithGoogle(
     email: str,
     org_id: Optional[int] = None,
     current_user=Depends(get_current_user),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     # Google
     google_user = await get_google_user_info(access_token)
 
-    user = db_session.exec(
+    user = (await db_session.exec(
         select(User).where(User.email == google_user["email"])
-    ).first()
+    )).first()
 
     if not user:
         username = (
@@ -2,7 +2,8 @@ from datetime import datetime
 from uuid import uuid4
 from src.db.organizations import Organization
 from fastapi import HTTPException, status, UploadFile, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.courses.activities import Activity
 from src.db.courses.blocks import Block, BlockRead, BlockTypeEnum
 from src.db.courses.courses import Course
@@ -11,10 +12,10 @@ from src.services.users.users import PublicUser
 
 
 async def create_image_block(
-    request: Request, image_file: UploadFile, activity_uuid: str, db_session: Session
+    request: Request, image_file: UploadFile, activity_uuid: str, db_session: AsyncSession
 ):
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -25,11 +26,11 @@ async def create_image_block(
 
     # get org_uuid 
     statement = select(Organization).where(Organization.id == activity.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     # get course
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -64,8 +65,8 @@ async def create_image_block(
 
     # insert block
     db_session.add(block)
-    db_session.commit()
-    db_session.refresh(block)
+    await db_session.commit()
+    await db_session.refresh(block)
 
     block = BlockRead.model_validate(block)
 
@@ -73,10 +74,10 @@ async def create_image_block(
 
 
 async def get_image_block(
-    request: Request, block_uuid: str, current_user: PublicUser, db_session: Session
+    request: Request, block_uuid: str, current_user: PublicUser, db_session: AsyncSession
 ):
     statement = select(Block).where(Block.block_uuid == block_uuid)
-    block = db_session.exec(statement).first()
+    block = (await db_session.exec(statement)).first()
 
     if block:
 
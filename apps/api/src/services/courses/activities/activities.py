@@ -1,5 +1,6 @@
 from typing import Literal
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.courses.courses import Course
 from src.db.courses.chapters import Chapter
 from src.security.rbac.rbac import (
@@ -26,12 +27,12 @@ async def create_activity(
     request: Request,
     activity_object: ActivityCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     # CHeck if org exists
     statement = select(Chapter).where(Chapter.id == activity_object.chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -53,8 +54,8 @@ async def create_activity(
 
     # Insert Activity in DB
     db_session.add(activity)
-    db_session.commit()
-    db_session.refresh(activity)
+    await db_session.commit()
+    await db_session.refresh(activity)
 
     # Find the last activity in the Chapter and add it to the list
     statement = (
@@ -62,7 +63,7 @@ async def create_activity(
         .where(ChapterActivity.chapter_id == activity_object.chapter_id)
         .order_by(ChapterActivity.order) # type: ignore
     )
-    chapter_activities = db_session.exec(statement).all()
+    chapter_activities = (await db_session.exec(statement)).all()
 
     last_order = chapter_activities[-1].order if chapter_activities else 0
     to_be_used_order = last_order + 1
@@ -80,8 +81,8 @@ async def create_activity(
 
     # Insert ChapterActivity link in DB
     db_session.add(activity_chapter)
-    db_session.commit()
-    db_session.refresh(activity_chapter)
+    await db_session.commit()
+    await db_session.refresh(activity_chapter)
 
     return ActivityRead.model_validate(activity)
 
@@ -90,10 +91,10 @@ async def get_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -103,7 +104,7 @@ async def get_activity(
 
     # Get course from that activity
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -132,10 +133,10 @@ async def get_activityby_id(
     request: Request,
     activity_id: str,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Activity).where(Activity.id == activity_id)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -145,7 +146,7 @@ async def get_activityby_id(
 
     # Get course from that activity
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -166,10 +167,10 @@ async def update_activity(
     activity_object: ActivityUpdate,
     activity_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -188,8 +189,8 @@ async def update_activity(
             setattr(activity, var, value)
 
     db_session.add(activity)
-    db_session.commit()
-    db_session.refresh(activity)
+    await db_session.commit()
+    await db_session.refresh(activity)
 
     activity = ActivityRead.model_validate(activity)
 
@@ -200,10 +201,10 @@ async def delete_activity(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -220,7 +221,7 @@ async def delete_activity(
     statement = select(ChapterActivity).where(
         ChapterActivity.activity_id == activity.id
     )
-    activity_chapter = db_session.exec(statement).first()
+    activity_chapter = (await db_session.exec(statement)).first()
 
     if not activity_chapter:
         raise HTTPException(
@@ -228,9 +229,9 @@ async def delete_activity(
             detail="Activity not found in chapter",
         )
 
-    db_session.delete(activity_chapter)
-    db_session.delete(activity)
-    db_session.commit()
+    await db_session.delete(activity_chapter)
+    await db_session.delete(activity)
+    await db_session.commit()
 
     return {"detail": "Activity deleted"}
 
@@ -244,12 +245,12 @@ async def get_activities(
     request: Request,
     coursechapter_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[ActivityRead]:
     statement = select(ChapterActivity).where(
         ChapterActivity.chapter_id == coursechapter_id
     )
-    activities = db_session.exec(statement).all()
+    activities = (await db_session.exec(statement)).all()
 
     if not activities:
         raise HTTPException(
@@ -273,7 +274,7 @@ async def rbac_check(
     element_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     
 
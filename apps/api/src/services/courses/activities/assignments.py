@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 from fastapi import HTTPException, Request, UploadFile
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.db.courses.activities import Activity
 from src.db.courses.assignments import (
@@ -51,11 +52,11 @@ async def create_assignment(
     request: Request,
     assignment_object: AssignmentCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if org exists
     statement = select(Course).where(Course.id == assignment_object.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -67,7 +68,7 @@ async def create_assignment(
     await rbac_check(request, course.course_uuid, current_user, "create", db_session)
 
     # Usage check
-    check_limits_with_usage("assignments", course.org_id, db_session)
+    await check_limits_with_usage("assignments", course.org_id, db_session)
 
     # Create Assignment
     assignment = Assignment(**assignment_object.model_dump())
@@ -79,8 +80,8 @@ async def create_assignment(
 
     # Insert Assignment in DB
     db_session.add(assignment)
-    db_session.commit()
-    db_session.refresh(assignment)
+    await db_session.commit()
+    await db_session.refresh(assignment)
 
     # Feature usage
     increase_feature_usage("assignments", course.org_id, db_session)
@@ -93,11 +94,11 @@ async def read_assignment(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -107,7 +108,7 @@ async def read_assignment(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -126,11 +127,11 @@ async def read_assignment_from_activity_uuid(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if activity exists
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -140,7 +141,7 @@ async def read_assignment_from_activity_uuid(
 
     # Check if course exists
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -150,7 +151,7 @@ async def read_assignment_from_activity_uuid(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.activity_id == activity.id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -170,11 +171,11 @@ async def update_assignment(
     assignment_uuid: str,
     assignment_object: AssignmentUpdate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -184,7 +185,7 @@ async def update_assignment(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -203,8 +204,8 @@ async def update_assignment(
 
     # Insert Assignment in DB
     db_session.add(assignment)
-    db_session.commit()
-    db_session.refresh(assignment)
+    await db_session.commit()
+    await db_session.refresh(assignment)
 
     # return assignment read
     return AssignmentRead.model_validate(assignment)
@@ -214,11 +215,11 @@ async def delete_assignment(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -228,7 +229,7 @@ async def delete_assignment(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -243,8 +244,8 @@ async def delete_assignment(
     decrease_feature_usage("assignments", course.org_id, db_session)
 
     # Delete Assignment
-    db_session.delete(assignment)
-    db_session.commit()
+    await db_session.delete(assignment)
+    await db_session.commit()
 
     return {"message": "Assignment deleted"}
 
@@ -253,12 +254,12 @@ async def delete_assignment_from_activity_uuid(
     request: Request,
     activity_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if activity exists
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
 
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -268,7 +269,7 @@ async def delete_assignment_from_activity_uuid(
 
     # Check if course exists
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -278,7 +279,7 @@ async def delete_assignment_from_activity_uuid(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.activity_id == activity.id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -293,9 +294,9 @@ async def delete_assignment_from_activity_uuid(
     decrease_feature_usage("assignments", course.org_id, db_session)
 
     # Delete Assignment
-    db_session.delete(assignment)
+    await db_session.delete(assignment)
 
-    db_session.commit()
+    await db_session.commit()
 
     return {"message": "Assignment deleted"}
 
@@ -308,11 +309,11 @@ async def create_assignment_task(
     assignment_uuid: str,
     assignment_task_object: AssignmentTaskCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -322,7 +323,7 @@ async def create_assignment_task(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -347,8 +348,8 @@ async def create_assignment_task(
 
     # Insert Assignment Task in DB
     db_session.add(assignment_task)
-    db_session.commit()
-    db_session.refresh(assignment_task)
+    await db_session.commit()
+    await db_session.refresh(assignment_task)
 
     # return assignment task read
     return AssignmentTaskRead.model_validate(assignment_task)
@@ -358,11 +359,11 @@ async def read_assignment_tasks(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Find assignment
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -372,7 +373,7 @@ async def read_assignment_tasks(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -391,7 +392,7 @@ async def read_assignment_tasks(
     # return assignment tasks read
     return [
         AssignmentTaskRead.model_validate(assignment_task)
-        for assignment_task in db_session.exec(statement).all()
+        for assignment_task in (await db_session.exec(statement)).all()
     ]
 
 
@@ -399,13 +400,13 @@ async def read_assignment_task(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Find assignment
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignmenttask = db_session.exec(statement).first()
+    assignmenttask = (await db_session.exec(statement)).first()
 
     if not assignmenttask:
         raise HTTPException(
@@ -415,7 +416,7 @@ async def read_assignment_task(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignmenttask.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -425,7 +426,7 @@ async def read_assignment_task(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -442,7 +443,7 @@ async def read_assignment_task(
 
 async def put_assignment_task_reference_file(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     assignment_task_uuid: str,
     current_user: PublicUser | AnonymousUser,
     reference_file: UploadFile | None = None,
@@ -451,7 +452,7 @@ async def put_assignment_task_reference_file(
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -461,7 +462,7 @@ async def put_assignment_task_reference_file(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -471,11 +472,11 @@ async def put_assignment_task_reference_file(
 
     # Check for activity
     statement = select(Activity).where(Activity.id == assignment.activity_id)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -485,7 +486,7 @@ async def put_assignment_task_reference_file(
 
     # Get org uuid
     org_statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(org_statement).first()
+    org = (await db_session.exec(org_statement)).first()
 
     # RBAC check
     await rbac_check(request, course.course_uuid, current_user, "update", db_session)
@@ -511,8 +512,8 @@ async def put_assignment_task_reference_file(
 
     # Insert Assignment Task in DB
     db_session.add(assignment_task)
-    db_session.commit()
-    db_session.refresh(assignment_task)
+    await db_session.commit()
+    await db_session.refresh(assignment_task)
 
     # return assignment task read
     return AssignmentTaskRead.model_validate(assignment_task)
@@ -520,7 +521,7 @@ async def put_assignment_task_reference_file(
 
 async def put_assignment_task_submission_file(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     assignment_task_uuid: str,
     current_user: PublicUser | AnonymousUser,
     sub_file: UploadFile | None = None,
@@ -529,7 +530,7 @@ async def put_assignment_task_submission_file(
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -539,7 +540,7 @@ async def put_assignment_task_submission_file(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -549,11 +550,11 @@ async def put_assignment_task_submission_file(
 
     # Check for activity
     statement = select(Activity).where(Activity.id == assignment.activity_id)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -563,7 +564,7 @@ async def put_assignment_task_submission_file(
 
     # Get org uuid
     org_statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(org_statement).first()
+    org = (await db_session.exec(org_statement)).first()
 
     # RBAC check
     await rbac_check(request, course.course_uuid, current_user, "update", db_session)
@@ -589,13 +590,13 @@ async def update_assignment_task(
     assignment_task_uuid: str,
     assignment_task_object: AssignmentTaskUpdate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment task exists
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -605,7 +606,7 @@ async def update_assignment_task(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -615,7 +616,7 @@ async def update_assignment_task(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -634,8 +635,8 @@ async def update_assignment_task(
 
     # Insert Assignment Task in DB
     db_session.add(assignment_task)
-    db_session.commit()
-    db_session.refresh(assignment_task)
+    await db_session.commit()
+    await db_session.refresh(assignment_task)
 
     # return assignment task read
     return AssignmentTaskRead.model_validate(assignment_task)
@@ -645,13 +646,13 @@ async def delete_assignment_task(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment task exists
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -661,7 +662,7 @@ async def delete_assignment_task(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -671,7 +672,7 @@ async def delete_assignment_task(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -683,8 +684,8 @@ async def delete_assignment_task(
     await rbac_check(request, course.course_uuid, current_user, "delete", db_session)
 
     # Delete Assignment Task
-    db_session.delete(assignment_task)
-    db_session.commit()
+    await db_session.delete(assignment_task)
+    await db_session.commit()
 
     return {"message": "Assignment Task deleted"}
 
@@ -697,14 +698,14 @@ async def handle_assignment_task_submission(
     assignment_task_uuid: str,
     assignment_task_submission_object: AssignmentTaskSubmissionUpdate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # TODO: Improve terrible implementation of this function
     # Check if assignment task exists
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -714,7 +715,7 @@ async def handle_assignment_task_submission(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -727,7 +728,7 @@ async def handle_assignment_task_submission(
         AssignmentTaskSubmission.assignment_task_id == assignment_task.id,
         AssignmentTaskSubmission.user_id == current_user.id,
     )
-    assignment_task_submission = db_session.exec(statement).first()
+    assignment_task_submission = (await db_session.exec(statement)).first()
 
     # Update Task submission if it exists
     if assignment_task_submission:
@@ -739,8 +740,8 @@ async def handle_assignment_task_submission(
 
         # Insert Assignment Task Submission in DB
         db_session.add(assignment_task_submission)
-        db_session.commit()
-        db_session.refresh(assignment_task_submission)
+        await db_session.commit()
+        await db_session.refresh(assignment_task_submission)
 
         # return assignment task submission read
         return AssignmentTaskSubmissionRead.model_validate(assignment_task_submission)
@@ -769,7 +770,7 @@ async def handle_assignment_task_submission(
 
         # Insert Assignment Task Submission in DB
         db_session.add(assignment_task_submission)
-        db_session.commit()
+        await db_session.commit()
 
         # return assignment task submission read
         return AssignmentTaskSubmissionRead.model_validate(assignment_task_submission)
@@ -780,14 +781,14 @@ async def read_user_assignment_task_submissions(
     assignment_task_uuid: str,
     user_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     # Check if assignment task exists
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_task_uuid == assignment_task_uuid
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -800,7 +801,7 @@ async def read_user_assignment_task_submissions(
         AssignmentTaskSubmission.assignment_task_id == assignment_task.id,
         AssignmentTaskSubmission.user_id == user_id,
     )
-    assignment_task_submission = db_session.exec(statement).first()
+    assignment_task_submission = (await db_session.exec(statement)).first()
 
     if not assignment_task_submission:
         raise HTTPException(
@@ -810,7 +811,7 @@ async def read_user_assignment_task_submissions(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -820,7 +821,7 @@ async def read_user_assignment_task_submissions(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -839,7 +840,7 @@ async def read_user_assignment_task_submissions_me(
     request: Request,
     assignment_task_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     return await read_user_assignment_task_submissions(
         request,
@@ -854,14 +855,14 @@ async def read_assignment_task_submissions(
     request: Request,
     assignment_task_submission_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment task submission exists
     statement = select(AssignmentTaskSubmission).where(
         AssignmentTaskSubmission.assignment_task_submission_uuid
         == assignment_task_submission_uuid,
     )
-    assignment_task_submission = db_session.exec(statement).first()
+    assignment_task_submission = (await db_session.exec(statement)).first()
 
     if not assignment_task_submission:
         raise HTTPException(
@@ -873,7 +874,7 @@ async def read_assignment_task_submissions(
     statement = select(AssignmentTask).where(
         AssignmentTask.id == assignment_task_submission.assignment_task_id
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -883,7 +884,7 @@ async def read_assignment_task_submissions(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -893,7 +894,7 @@ async def read_assignment_task_submissions(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -913,14 +914,14 @@ async def update_assignment_task_submission(
     assignment_task_submission_uuid: str,
     assignment_task_submission_object: AssignmentTaskSubmissionCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment task submission exists
     statement = select(AssignmentTaskSubmission).where(
         AssignmentTaskSubmission.assignment_task_submission_uuid
         == assignment_task_submission_uuid
     )
-    assignment_task_submission = db_session.exec(statement).first()
+    assignment_task_submission = (await db_session.exec(statement)).first()
 
     if not assignment_task_submission:
         raise HTTPException(
@@ -932,7 +933,7 @@ async def update_assignment_task_submission(
     statement = select(AssignmentTask).where(
         AssignmentTask.id == assignment_task_submission.assignment_task_id
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -942,7 +943,7 @@ async def update_assignment_task_submission(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -952,7 +953,7 @@ async def update_assignment_task_submission(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -971,8 +972,8 @@ async def update_assignment_task_submission(
 
     # Insert Assignment Task Submission in DB
     db_session.add(assignment_task_submission)
-    db_session.commit()
-    db_session.refresh(assignment_task_submission)
+    await db_session.commit()
+    await db_session.refresh(assignment_task_submission)
 
     # return assignment task submission read
     return AssignmentTaskSubmissionRead.model_validate(assignment_task_submission)
@@ -982,14 +983,14 @@ async def delete_assignment_task_submission(
     request: Request,
     assignment_task_submission_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment task submission exists
     statement = select(AssignmentTaskSubmission).where(
         AssignmentTaskSubmission.assignment_task_submission_uuid
         == assignment_task_submission_uuid
     )
-    assignment_task_submission = db_session.exec(statement).first()
+    assignment_task_submission = (await db_session.exec(statement)).first()
 
     if not assignment_task_submission:
         raise HTTPException(
@@ -1001,7 +1002,7 @@ async def delete_assignment_task_submission(
     statement = select(AssignmentTask).where(
         AssignmentTask.id == assignment_task_submission.assignment_task_id
     )
-    assignment_task = db_session.exec(statement).first()
+    assignment_task = (await db_session.exec(statement)).first()
 
     if not assignment_task:
         raise HTTPException(
@@ -1011,7 +1012,7 @@ async def delete_assignment_task_submission(
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.id == assignment_task.assignment_id)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1021,7 +1022,7 @@ async def delete_assignment_task_submission(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1033,8 +1034,8 @@ async def delete_assignment_task_submission(
     await rbac_check(request, course.course_uuid, current_user, "delete", db_session)
 
     # Delete Assignment Task Submission
-    db_session.delete(assignment_task_submission)
-    db_session.commit()
+    await db_session.delete(assignment_task_submission)
+    await db_session.commit()
 
     return {"message": "Assignment Task Submission deleted"}
 
@@ -1046,11 +1047,11 @@ async def create_assignment_submission(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1064,7 +1065,7 @@ async def create_assignment_submission(
         AssignmentUserSubmission.user_id == current_user.id,
     )
 
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if assignment_user_submission:
         raise HTTPException(
@@ -1074,7 +1075,7 @@ async def create_assignment_submission(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1087,7 +1088,7 @@ async def create_assignment_submission(
         AssignmentUserSubmission.assignment_id == assignment.id,
         AssignmentUserSubmission.user_id == current_user.id,
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if assignment_user_submission:
         raise HTTPException(
@@ -1111,11 +1112,11 @@ async def create_assignment_submission(
 
     # Insert Assignment User Submission in DB
     db_session.add(assignment_user_submission)
-    db_session.commit()
+    await db_session.commit()
 
     # User
     statement = select(User).where(User.id == current_user.id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -1125,7 +1126,7 @@ async def create_assignment_submission(
 
     # Activity
     statement = select(Activity).where(Activity.id == assignment.activity_id)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -1147,7 +1148,7 @@ async def create_assignment_submission(
         TrailRun.course_id == course.id,
         TrailRun.user_id == user.id,
     )
-    trailrun = db_session.exec(statement).first()
+    trailrun = (await db_session.exec(statement)).first()
 
     if not trailrun:
         trailrun = TrailRun(
@@ -1159,15 +1160,15 @@ async def create_assignment_submission(
             update_date=str(datetime.now()),
         )
         db_session.add(trailrun)
-        db_session.commit()
-        db_session.refresh(trailrun)
+        await db_session.commit()
+        await db_session.refresh(trailrun)
 
     statement = select(TrailStep).where(
         TrailStep.trailrun_id == trailrun.id,
         TrailStep.activity_id == activity.id,
         TrailStep.user_id == user.id,
     )
-    trailstep = db_session.exec(statement).first()
+    trailstep = (await db_session.exec(statement)).first()
 
     if not trailstep:
         trailstep = TrailStep(
@@ -1184,8 +1185,8 @@ async def create_assignment_submission(
             update_date=str(datetime.now()),
         )
         db_session.add(trailstep)
-        db_session.commit()
-        db_session.refresh(trailstep)
+        await db_session.commit()
+        await db_session.refresh(trailstep)
 
     # return assignment user submission read
     return AssignmentUserSubmissionRead.model_validate(assignment_user_submission)
@@ -1195,11 +1196,11 @@ async def read_assignment_submissions(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Find assignment
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1209,7 +1210,7 @@ async def read_assignment_submissions(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1228,7 +1229,7 @@ async def read_assignment_submissions(
     # return assignment tasks read
     return [
         AssignmentUserSubmissionRead.model_validate(assignment_user_submission)
-        for assignment_user_submission in db_session.exec(statement).all()
+        for assignment_user_submission in (await db_session.exec(statement)).all()
     ]
 
 
@@ -1237,11 +1238,11 @@ async def read_user_assignment_submissions(
     assignment_uuid: str,
     user_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Find assignment
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1251,7 +1252,7 @@ async def read_user_assignment_submissions(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1271,7 +1272,7 @@ async def read_user_assignment_submissions(
     # return assignment tasks read
     return [
         AssignmentUserSubmissionRead.model_validate(assignment_user_submission)
-        for assignment_user_submission in db_session.exec(statement).all()
+        for assignment_user_submission in (await db_session.exec(statement)).all()
     ]
 
 
@@ -1279,7 +1280,7 @@ async def read_user_assignment_submissions_me(
     request: Request,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     return await read_user_assignment_submissions(
         request,
@@ -1295,13 +1296,13 @@ async def update_assignment_submission(
     user_id: str,
     assignment_user_submission_object: AssignmentUserSubmissionCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment user submission exists
     statement = select(AssignmentUserSubmission).where(
         AssignmentUserSubmission.user_id == user_id
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if not assignment_user_submission:
         raise HTTPException(
@@ -1313,7 +1314,7 @@ async def update_assignment_submission(
     statement = select(Assignment).where(
         Assignment.id == assignment_user_submission.assignment_id
     )
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1323,7 +1324,7 @@ async def update_assignment_submission(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1342,8 +1343,8 @@ async def update_assignment_submission(
 
     # Insert Assignment User Submission in DB
     db_session.add(assignment_user_submission)
-    db_session.commit()
-    db_session.refresh(assignment_user_submission)
+    await db_session.commit()
+    await db_session.refresh(assignment_user_submission)
 
     # return assignment user submission read
     return AssignmentUserSubmissionRead.model_validate(assignment_user_submission)
@@ -1354,11 +1355,11 @@ async def delete_assignment_submission(
     user_id: str,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1371,7 +1372,7 @@ async def delete_assignment_submission(
         AssignmentUserSubmission.user_id == user_id,
         AssignmentUserSubmission.assignment_id == assignment.id,
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if not assignment_user_submission:
         raise HTTPException(
@@ -1381,7 +1382,7 @@ async def delete_assignment_submission(
 
     # Check if course exists
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1393,8 +1394,8 @@ async def delete_assignment_submission(
     await rbac_check(request, course.course_uuid, current_user, "delete", db_session)
 
     # Delete Assignment User Submission
-    db_session.delete(assignment_user_submission)
-    db_session.commit()
+    await db_session.delete(assignment_user_submission)
+    await db_session.commit()
 
     return {"message": "Assignment User Submission deleted"}
 
@@ -1405,12 +1406,12 @@ async def grade_assignment_submission(
     user_id: str,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1419,7 +1420,7 @@ async def grade_assignment_submission(
         )
 
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1434,7 +1435,7 @@ async def grade_assignment_submission(
         AssignmentUserSubmission.user_id == user_id,
         AssignmentUserSubmission.assignment_id == assignment.id,
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if not assignment_user_submission:
         raise HTTPException(
@@ -1447,7 +1448,7 @@ async def grade_assignment_submission(
         AssignmentTaskSubmission.user_id == user_id,
         AssignmentTaskSubmission.activity_id == assignment.activity_id,
     )
-    task_submissions = db_session.exec(task_subs).all()
+    task_submissions = (await db_session.exec(task_subs)).all()
 
     # Calculate the grade
     grade = 0
@@ -1459,16 +1460,16 @@ async def grade_assignment_submission(
 
     # Insert Assignment User Submission in DB
     db_session.add(assignment_user_submission)
-    db_session.commit()
-    db_session.refresh(assignment_user_submission)
+    await db_session.commit()
+    await db_session.refresh(assignment_user_submission)
 
     # Change the status of the submission
     assignment_user_submission.submission_status = AssignmentUserSubmissionStatus.GRADED
 
     # Insert Assignment User Submission in DB
     db_session.add(assignment_user_submission)
-    db_session.commit()
-    db_session.refresh(assignment_user_submission)
+    await db_session.commit()
+    await db_session.refresh(assignment_user_submission)
 
     # return OK
     return {
@@ -1481,12 +1482,12 @@ async def get_grade_assignment_submission(
     user_id: str,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     # Check if assignment exists
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1499,7 +1500,7 @@ async def get_grade_assignment_submission(
         AssignmentUserSubmission.user_id == user_id,
         AssignmentUserSubmission.assignment_id == assignment.id,
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if not assignment_user_submission:
         raise HTTPException(
@@ -1511,7 +1512,7 @@ async def get_grade_assignment_submission(
     statement = select(AssignmentTask).where(
         AssignmentTask.assignment_id == assignment.id
     )
-    assignment_tasks = db_session.exec(statement).all()
+    assignment_tasks = (await db_session.exec(statement)).all()
     max_grade = 0
 
     for task in assignment_tasks:
@@ -1522,7 +1523,7 @@ async def get_grade_assignment_submission(
         AssignmentUserSubmission.user_id == user_id,
         AssignmentUserSubmission.assignment_id == assignment.id,
     )
-    assignment_user_submission = db_session.exec(statement).first()
+    assignment_user_submission = (await db_session.exec(statement)).first()
 
     if not assignment_user_submission:
         raise HTTPException(
@@ -1543,11 +1544,11 @@ async def mark_activity_as_done_for_user(
     user_id: str,
     assignment_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Get Assignment
     statement = select(Assignment).where(Assignment.assignment_uuid == assignment_uuid)
-    assignment = db_session.exec(statement).first()
+    assignment = (await db_session.exec(statement)).first()
 
     if not assignment:
         raise HTTPException(
@@ -1557,10 +1558,10 @@ async def mark_activity_as_done_for_user(
 
     # Check if activity exists
     statement = select(Activity).where(Activity.id == assignment.activity_id)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     statement = select(Course).where(Course.id == assignment.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1578,7 +1579,7 @@ async def mark_activity_as_done_for_user(
 
     # Check if user exists
     statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -1591,7 +1592,7 @@ async def mark_activity_as_done_for_user(
         TrailStep.activity_id == activity.id,
         TrailStep.user_id == user_id,
     )
-    trailstep = db_session.exec(trailsteps).first()
+    trailstep = (await db_session.exec(trailsteps)).first()
 
     if not trailstep:
         raise HTTPException(
@@ -1605,8 +1606,8 @@ async def mark_activity_as_done_for_user(
 
     # Insert TrailStep in DB
     db_session.add(trailstep)
-    db_session.commit()
-    db_session.refresh(trailstep)
+    await db_session.commit()
+    await db_session.refresh(trailstep)
 
     # return OK
     return {"message": "Activity marked as done for user"}
@@ -1616,11 +1617,11 @@ async def get_assignments_from_course(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Find course
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -1630,13 +1631,13 @@ async def get_assignments_from_course(
 
     # Get Activities
     statement = select(Activity).where(Activity.course_id == course.id)
-    activities = db_session.exec(statement).all()
+    activities = (await db_session.exec(statement)).all()
 
     # Get Assignments
     assignments = []
     for activity in activities:
         statement = select(Assignment).where(Assignment.activity_id == activity.id)
-        assignment = db_session.exec(statement).first()
+        assignment = (await db_session.exec(statement)).first()
         if assignment:
             assignments.append(assignment)
 
@@ -1655,7 +1656,7 @@ async def rbac_check(
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
 
     if action == "read":
@@ -1,7 +1,8 @@
 from typing import Literal
 from src.db.courses.courses import Course
 from src.db.organizations import Organization
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
     authorization_verify_if_user_is_anon,
@@ -27,7 +28,7 @@ async def create_documentpdf_activity(
     name: str,
     chapter_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
     pdf_file: UploadFile | None = None,
 ):
     # RBAC check
@@ -35,7 +36,7 @@ async def create_documentpdf_activity(
 
     # get chapter_id
     statement = select(Chapter).where(Chapter.id == chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -44,7 +45,7 @@ async def create_documentpdf_activity(
         )
 
     statement = select(CourseChapter).where(CourseChapter.chapter_id == chapter_id)
-    coursechapter = db_session.exec(statement).first()
+    coursechapter = (await db_session.exec(statement)).first()
 
     if not coursechapter:
         raise HTTPException(
@@ -57,11 +58,11 @@ async def create_documentpdf_activity(
 
     # Get org_uuid
     statement = select(Organization).where(Organization.id == coursechapter.org_id)
-    organization = db_session.exec(statement).first()
+    organization = (await db_session.exec(statement)).first()
 
     # Get course_uuid
     statement = select(Course).where(Course.id == coursechapter.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     # create activity uuid
     activity_uuid = f"activity_{uuid4()}"
@@ -106,8 +107,8 @@ async def create_documentpdf_activity(
 
     # Insert Activity in DB
     db_session.add(activity)
-    db_session.commit()
-    db_session.refresh(activity)
+    await db_session.commit()
+    await db_session.refresh(activity)
 
     # Add activity to chapter
     activity_chapter = ChapterActivity(
@@ -132,8 +133,8 @@ async def create_documentpdf_activity(
 
     # Insert ChapterActivity link in DB
     db_session.add(activity_chapter)
-    db_session.commit()
-    db_session.refresh(activity_chapter)
+    await db_session.commit()
+    await db_session.refresh(activity_chapter)
 
     return ActivityRead.model_validate(activity)
 
@@ -146,7 +147,7 @@ async def rbac_check(
     course_id: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     await authorization_verify_if_user_is_anon(current_user.id)
 
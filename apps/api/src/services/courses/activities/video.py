@@ -3,7 +3,8 @@ from src.db.courses.courses import Course
 from src.db.organizations import Organization
 
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
     authorization_verify_if_user_is_anon,
@@ -29,7 +30,7 @@ async def create_video_activity(
     name: str,
     chapter_id: str,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
     video_file: UploadFile | None = None,
 ):
     # RBAC check
@@ -37,7 +38,7 @@ async def create_video_activity(
 
     # get chapter_id
     statement = select(Chapter).where(Chapter.id == chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -46,7 +47,7 @@ async def create_video_activity(
         )
 
     statement = select(CourseChapter).where(CourseChapter.chapter_id == chapter_id)
-    coursechapter = db_session.exec(statement).first()
+    coursechapter = (await db_session.exec(statement)).first()
 
     if not coursechapter:
         raise HTTPException(
@@ -56,11 +57,11 @@ async def create_video_activity(
 
     # Get org_uuid
     statement = select(Organization).where(Organization.id == coursechapter.org_id)
-    organization = db_session.exec(statement).first()
+    organization = (await db_session.exec(statement)).first()
 
     # Get course_uuid
     statement = select(Course).where(Course.id == coursechapter.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     # generate activity_uuid
     activity_uuid = str(f"activity_{uuid4()}")
@@ -107,8 +108,8 @@ async def create_video_activity(
     # create activity
     activity = Activity.model_validate(activity_object)
     db_session.add(activity)
-    db_session.commit()
-    db_session.refresh(activity)
+    await db_session.commit()
+    await db_session.refresh(activity)
 
     # upload video
     if video_file:
@@ -133,8 +134,8 @@ async def create_video_activity(
 
     # Insert ChapterActivity link in DB
     db_session.add(chapter_activity_object)
-    db_session.commit()
-    db_session.refresh(chapter_activity_object)
+    await db_session.commit()
+    await db_session.refresh(chapter_activity_object)
 
     return ActivityRead.model_validate(activity)
 
@@ -154,14 +155,14 @@ async def create_external_video_activity(
     request: Request,
     current_user: PublicUser | AnonymousUser,
     data: ExternalVideo,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # RBAC check
     await rbac_check(request, "activity_x", current_user, "create", db_session)
 
     # get chapter_id
     statement = select(Chapter).where(Chapter.id == data.chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -170,7 +171,7 @@ async def create_external_video_activity(
         )
 
     statement = select(CourseChapter).where(CourseChapter.chapter_id == data.chapter_id)
-    coursechapter = db_session.exec(statement).first()
+    coursechapter = (await db_session.exec(statement)).first()
 
     if not coursechapter:
         raise HTTPException(
@@ -202,8 +203,8 @@ async def create_external_video_activity(
     # create activity
     activity = Activity.model_validate(activity_object)
     db_session.add(activity)
-    db_session.commit()
-    db_session.refresh(activity)
+    await db_session.commit()
+    await db_session.refresh(activity)
 
     # update chapter
     chapter_activity_object = ChapterActivity(
@@ -218,7 +219,7 @@ async def create_external_video_activity(
 
     # Insert ChapterActivity link in DB
     db_session.add(chapter_activity_object)
-    db_session.commit()
+    await db_session.commit()
 
     return ActivityRead.model_validate(activity)
 
@@ -228,7 +229,7 @@ async def rbac_check(
     course_id: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     await authorization_verify_if_user_is_anon(current_user.id)
 
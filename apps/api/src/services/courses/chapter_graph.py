@@ -0,0 +1,189 @@
+"""
+Chapter graph of a course.
+
+Chapters form a DAG through their predecessors (CourseChapter_Graph). The
+graph keeps, for every chapter, the set of chapters reachable from it as a
+bitset, so checking whether a new edge closes a cycle is a lookup and adding
+an edge only updates the ancestors of its source. Graphs are cached per
+course under the outline version of the course, which every committed change
+to the chapters or their edges bumps.
+"""
+
+import heapq
+from typing import Iterable, Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.cache import TTLCache
+from src.db.courses.chapters import Chapter
+from src.db.courses.course_chapters import CourseChapter_Graph
+
+CHAPTER_GRAPH_CACHE_TTL = 300
+
+
+class ChapterGraph:
+    def __init__(self, chapter_ids: Iterable[int], edges: Iterable[tuple[int, int]]):
+        """
+        `edges` are (predecessor_id, chapter_id) pairs, edges to unknown
+        chapters are ignored
+        """
+        self._index: dict[int, int] = {}
+        self.predecessors: dict[int, set[int]] = {}
+        self.successors: dict[int, set[int]] = {}
+        for chapter_id in sorted(chapter_ids):
+            self.add_chapter(chapter_id)
+
+        for predecessor_id, chapter_id in edges:
+            if predecessor_id in self._index and chapter_id in self._index:
+                self.predecessors[chapter_id].add(predecessor_id)
+                self.successors[predecessor_id].add(chapter_id)
+
+        self._build_reachability()
+
+    def copy(self) -> "ChapterGraph":
+        graph = ChapterGraph.__new__(ChapterGraph)
+        graph._index = dict(self._index)
+        graph.predecessors = {key: set(value) for key, value in self.predecessors.items()}
+        graph.successors = {key: set(value) for key, value in self.successors.items()}
+        graph._reachable = dict(self._reachable)
+        return graph
+
+    def __contains__(self, chapter_id: int) -> bool:
+        return chapter_id in self._index
+
+    def _bit(self, chapter_id: int) -> int:
+        return 1 << self._index[chapter_id]
+
+    def _build_reachability(self):
+        self._reachable: dict[int, int] = {chapter_id: 0 for chapter_id in self._index}
+        order, unordered = self._kahn()
+
+        # Successors come after their chapter in a topological order
+        for chapter_id in reversed(order):
+            for successor_id in self.successors[chapter_id]:
+                self._reachable[chapter_id] |= (
+                    self._bit(successor_id) | self._reachable[successor_id]
+                )
+
+        # Chapters on a cycle (inconsistent data) are walked one by one
+        for chapter_id in unordered:
+            reachable, stack = 0, list(self.successors[chapter_id])
+            while stack:
+                successor_id = stack.pop()
+                if not reachable & self._bit(successor_id):
+                    reachable |= self._bit(successor_id)
+                    stack.extend(self.successors[successor_id])
+            self._reachable[chapter_id] = reachable
+
+    def _kahn(self) -> tuple[list[int], list[int]]:
+        """
+        Topological order (smallest id first among ready chapters) and the
+        chapters left out because they are on a cycle
+        """
+        in_degree = {
+            chapter_id: len(predecessors)
+            for chapter_id, predecessors in self.predecessors.items()
+        }
+        ready = [chapter_id for chapter_id, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+
+        order = []
+        while ready:
+            chapter_id = heapq.heappop(ready)
+            order.append(chapter_id)
+            for successor_id in self.successors[chapter_id]:
+                in_degree[successor_id] -= 1
+                if in_degree[successor_id] == 0:
+                    heapq.heappush(ready, successor_id)
+
+        ordered = set(order)
+        unordered = sorted(
+            chapter_id for chapter_id in self._index if chapter_id not in ordered
+        )
+        return order, unordered
+
+    def topological_order(self) -> list[int]:
+        """
+        Every chapter after its predecessors, chapters on a cycle last
+        """
+        order, unordered = self._kahn()
+        return order + unordered
+
+    def reaches(self, from_chapter_id: int, to_chapter_id: int) -> bool:
+        return bool(self._reachable[from_chapter_id] & self._bit(to_chapter_id))
+
+    def creates_cycle(self, predecessor_id: int, chapter_id: int) -> bool:
+        return predecessor_id == chapter_id or self.reaches(chapter_id, predecessor_id)
+
+    def add_chapter(self, chapter_id: int):
+        if chapter_id in self._index:
+            return
+        self._index[chapter_id] = len(self._index)
+        self.predecessors[chapter_id] = set()
+        self.successors[chapter_id] = set()
+        if hasattr(self, "_reachable"):
+            self._reachable[chapter_id] = 0
+
+    def add_edge(self, predecessor_id: int, chapter_id: int):
+        if self.creates_cycle(predecessor_id, chapter_id):
+            raise ValueError("Cyclic course structure")
+        if chapter_id in self.successors[predecessor_id]:
+            return
+
+        self.predecessors[chapter_id].add(predecessor_id)
+        self.successors[predecessor_id].add(chapter_id)
+
+        # The predecessor and its ancestors now reach the chapter and its descendants
+        added = self._bit(chapter_id) | self._reachable[chapter_id]
+        predecessor_bit = self._bit(predecessor_id)
+        for ancestor_id, reachable in self._reachable.items():
+            if ancestor_id == predecessor_id or reachable & predecessor_bit:
+                self._reachable[ancestor_id] = reachable | added
+
+    def remove_edge(self, predecessor_id: int, chapter_id: int):
+        if chapter_id not in self.successors.get(predecessor_id, ()):
+            return
+        self.predecessors[chapter_id].discard(predecessor_id)
+        self.successors[predecessor_id].discard(chapter_id)
+        # Other paths may still connect the ancestors, reachability is rebuilt
+        self._build_reachability()
+
+
+chapter_graph_cache: TTLCache[tuple[int, str], ChapterGraph] = TTLCache(
+    ttl=CHAPTER_GRAPH_CACHE_TTL, max_size=1000
+)
+
+
+async def load_chapter_graph(
+    course_id: int, db_session: AsyncSession
+) -> ChapterGraph:
+    statement = select(Chapter.id).where(Chapter.course_id == course_id)
+    chapter_ids = (await db_session.exec(statement)).all()
+
+    statement = select(
+        CourseChapter_Graph.predecessor_id, CourseChapter_Graph.chapter_id
+    ).where(CourseChapter_Graph.course_id == course_id)
+    edges = (await db_session.exec(statement)).all()
+
+    return ChapterGraph(chapter_ids, edges)  # type: ignore
+
+
+async def get_chapter_graph(
+    course_id: int, db_session: AsyncSession
+) -> ChapterGraph:
+    """
+    Chapter graph of a course, a copy that callers may change
+    """
+    # Imported here, outline_cache orders its course trees with this module
+    from src.services.courses.outline_cache import get_course_outline_versions
+
+    versions = get_course_outline_versions([course_id])
+    key: Optional[tuple[int, str]] = (course_id, versions[0]) if versions else None
+
+    graph = chapter_graph_cache.get(key) if key else None
+    if graph is None:
+        generation = chapter_graph_cache.generation
+        graph = await load_chapter_graph(course_id, db_session)
+        if key:
+            chapter_graph_cache.set(key, graph, generation)
+
+    return graph.copy()
@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import List, Dict, Literal
+from typing import List, Literal
 from uuid import uuid4
-from sqlmodel import Session, select
+from sqlalchemy import tuple_
+from sqlmodel import or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.users import AnonymousUser
 from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
@@ -17,8 +19,12 @@ from src.db.courses.chapters import (
     ChapterRead,
     ChapterUpdate,
     ChapterEdge,
+    ChapterEdgeBatch,
+    ChapterEdgeBatchResult,
 )
+from src.services.courses.chapter_graph import get_chapter_graph
 from src.services.courses.courses import Course
+from src.services.courses.outline_cache import get_course_outline
 from src.services.users.users import PublicUser
 from fastapi import HTTPException, status, Request
 
@@ -32,14 +38,14 @@ async def create_chapter(
     request: Request,
     chapter_object: ChapterCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> ChapterRead:
     chapter = Chapter.model_validate(chapter_object)
 
     # Get Course
     statement = select(Course).where(Course.id == chapter_object.course_id)
 
-    course = db_session.exec(statement).one()
+    course = (await db_session.exec(statement)).one()
 
     # RBAC check
     await rbac_check(request, "chapter_x", current_user, "create", db_session)
@@ -53,8 +59,8 @@ async def create_chapter(
 
     # Add chapter to database.
     db_session.add(chapter)
-    db_session.commit()
-    db_session.refresh(chapter)
+    await db_session.commit()
+    await db_session.refresh(chapter)
 
     chapter = ChapterRead(**chapter.model_dump(), activities=[], predecessors=[])
 
@@ -65,7 +71,7 @@ async def create_chapter(
         .where(CourseChapter.course_id == chapter.course_id)
         # .where(CourseChapter.order == to_be_used_order)
     )
-    course_chapter = db_session.exec(statement).first()
+    course_chapter = (await db_session.exec(statement)).first()
 
     if not course_chapter:
         # Add CourseChapter link
@@ -80,35 +86,26 @@ async def create_chapter(
 
         # Insert CourseChapter link in DB
         db_session.add(course_chapter)
-        db_session.commit()
+        await db_session.commit()
 
-    # NOTE: all of this code is only used to determine the last course chapter.
-    # Find the last chapter in the course.
-    # This is required so that we can add it as an automatic predecessor.
-    # TODO: this will not work right now, we need to do a graph traversal (in a nutshell)
-    statement = (
-        select(CourseChapter)
-        .where(CourseChapter.course_id == chapter.course_id)
-        .where(CourseChapter.chapter_id != chapter.id)
-        # .order_by(CourseChapter.order)
-    )
-    course_chapters = db_session.exec(statement).all()
-    print(f"COURSE_CHAPTERS={course_chapters}")
+    # The new chapter follows the last chapter of the course
+    graph = await get_chapter_graph(chapter.course_id, db_session)
+    order = [
+        chapter_id for chapter_id in graph.topological_order() if chapter_id != chapter.id
+    ]
 
-    if course_chapters:
-        print("NOTE: previous chapters exist, adding an edge...")
-
-        predecessor_id = course_chapters[-1].chapter_id
+    if order:
+        predecessor_id = order[-1]
         chapter.predecessors = [predecessor_id]
 
         course_chapter_graph_edge = CourseChapter_Graph(
-                course_id=chapter.course_id,
-                chapter_id=chapter.id,
-                predecessor_id=predecessor_id,
+            course_id=chapter.course_id,
+            chapter_id=chapter.id,
+            predecessor_id=predecessor_id,
         )
 
         db_session.add(course_chapter_graph_edge)
-        db_session.commit()
+        await db_session.commit()
 
     return chapter
 
@@ -117,10 +114,10 @@ async def get_chapter(
     request: Request,
     chapter_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> ChapterRead:
     statement = select(Chapter).where(Chapter.id == chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -129,7 +126,7 @@ async def get_chapter(
 
     # get COurse
     statement = select(Course).where(Course.id == chapter.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -144,14 +141,21 @@ async def get_chapter(
         select(Activity)
         .join(ChapterActivity, Activity.id == ChapterActivity.activity_id)
         .where(ChapterActivity.chapter_id == chapter_id)
-        .distinct(Activity.id)
+        .order_by(ChapterActivity.order, ChapterActivity.id)
     )
 
-    activities = db_session.exec(statement).all()
+    activities = (await db_session.exec(statement)).all()
+
+    statement = select(CourseChapter_Graph.predecessor_id).where(
+        CourseChapter_Graph.course_id == chapter.course_id,
+        CourseChapter_Graph.chapter_id == chapter.id,
+    )
+    predecessors = (await db_session.exec(statement)).all()
 
     chapter = ChapterRead(
         **chapter.model_dump(),
         activities=[ActivityRead(**activity.model_dump()) for activity in activities],
+        predecessors=list(predecessors),
     )
 
     return chapter
@@ -162,10 +166,10 @@ async def update_chapter(
     chapter_object: ChapterUpdate,
     chapter_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> ChapterRead:
     statement = select(Chapter).where(Chapter.id == chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -182,8 +186,8 @@ async def update_chapter(
 
     chapter.update_date = str(datetime.now())
 
-    db_session.commit()
-    db_session.refresh(chapter)
+    await db_session.commit()
+    await db_session.refresh(chapter)
 
     if chapter:
         chapter = await get_chapter(
@@ -197,10 +201,10 @@ async def delete_chapter(
     request: Request,
     chapter_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Chapter).where(Chapter.id == chapter_id)
-    chapter = db_session.exec(statement).first()
+    chapter = (await db_session.exec(statement)).first()
 
     if not chapter:
         raise HTTPException(
@@ -212,14 +216,40 @@ async def delete_chapter(
 
     # Remove all linked chapter activities
     statement = select(ChapterActivity).where(ChapterActivity.chapter_id == chapter.id)
-    chapter_activities = db_session.exec(statement).all()
+    chapter_activities = (await db_session.exec(statement)).all()
 
     for chapter_activity in chapter_activities:
-        db_session.delete(chapter_activity)
+        await db_session.delete(chapter_activity)
+
+    # Chapters following this one now follow its predecessors
+    statement = select(CourseChapter_Graph).where(
+        CourseChapter_Graph.course_id == chapter.course_id,
+        or_(
+            CourseChapter_Graph.chapter_id == chapter.id,
+            CourseChapter_Graph.predecessor_id == chapter.id,
+        ),
+    )
+    edges = (await db_session.exec(statement)).all()
+    predecessor_ids = {edge.predecessor_id for edge in edges if edge.chapter_id == chapter.id}
+    successor_ids = {edge.chapter_id for edge in edges if edge.predecessor_id == chapter.id}
+
+    graph = await get_chapter_graph(chapter.course_id, db_session)
+
+    for edge in edges:
+        await db_session.delete(edge)
+    for successor_id in successor_ids:
+        for predecessor_id in predecessor_ids - graph.predecessors.get(successor_id, set()):
+            db_session.add(
+                CourseChapter_Graph(
+                    course_id=chapter.course_id,
+                    chapter_id=successor_id,
+                    predecessor_id=predecessor_id,
+                )
+            )
 
     # Delete the chapter
-    db_session.delete(chapter)
-    db_session.commit()
+    await db_session.delete(chapter)
+    await db_session.commit()
 
     return {"detail": "chapter deleted"}
 
@@ -227,82 +257,40 @@ async def delete_chapter(
 async def get_course_chapters(
     request: Request,
     course_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     page: int = 1,
     limit: int = 10,
 ) -> List[ChapterRead]:
 
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
-
-    statement = (
-        select(Chapter)
-        .join(CourseChapter, Chapter.id == CourseChapter.chapter_id)
-        .where(CourseChapter.course_id == course_id)
-        .where(Chapter.course_id == course_id)
-        # .order_by(CourseChapter.order)
-        # .group_by(Chapter.id, CourseChapter.order)
-    )
-    chapters = db_session.exec(statement).all()
-
-    chapters = [ChapterRead(**chapter.model_dump(), activities=[], predecessors=[]) for chapter in chapters]
-
-    # RBAC check
-    await rbac_check(request, course.course_uuid, current_user, "read", db_session)  # type: ignore
-
-    # Get activities and predecessor(s) for each chapter
-    for chapter in chapters:
-        #
-        # Activities.
-        #
-        statement = (
-            select(ChapterActivity)
-            .where(ChapterActivity.chapter_id == chapter.id)
-            .order_by(ChapterActivity.order)
-            .distinct(ChapterActivity.id, ChapterActivity.order)
-        )
-        chapter_activities = db_session.exec(statement).all()
-
-        for chapter_activity in chapter_activities:
-            statement = (
-                select(Activity)
-                .where(Activity.id == chapter_activity.activity_id)
-                .distinct(Activity.id)
-            )
-            activity = db_session.exec(statement).first()
-
-            if activity:
-                chapter.activities.append(ActivityRead(**activity.model_dump()))
+    course = (await db_session.exec(statement)).first()
 
-        #
-        # Predecessors.
-        #
-
-        statement = (
-            select(CourseChapter_Graph)
-            .where(CourseChapter_Graph.course_id == course_id)
-            .where(CourseChapter_Graph.chapter_id == chapter.id)
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Course does not exist"
         )
 
-        incoming_edges = db_session.exec(statement).all()
-        print(f"INCOMING={incoming_edges}")
-        chapter.predecessors = [chapter.predecessor_id for chapter in incoming_edges if chapter.predecessor_id]
+    # RBAC check
+    await rbac_check(request, course.course_uuid, current_user, "read", db_session)
 
-    return chapters
+    outline = await get_course_outline(course, db_session)
+    return outline.chapters
 
 
-# Important Note : this is legacy code that has been used because
-# the frontend is still not adapted for the new data structure, this implementation is absolutely not the best one
-# and should not be used for future features
-async def DEPRECEATED_get_course_chapters(
+async def get_course_chapters_meta(
     request: Request,
     course_uuid: str,
-    current_user: PublicUser,
-    db_session: Session,
-):
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+    with_content: bool = True,
+) -> dict:
+    """
+    Chapters of a course in the legacy `{chapters, chapterOrder, activities}`
+    shape still used by the course editor, built from the course outline
+    """
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -312,190 +300,57 @@ async def DEPRECEATED_get_course_chapters(
     # RBAC check
     await rbac_check(request, course.course_uuid, current_user, "read", db_session)
 
-    chapters_in_db = await get_course_chapters(request, course.id, db_session, current_user)  # type: ignore
-
-    # activities
+    outline = await get_course_outline(course, db_session)
 
-    # chapters
     chapters = {}
+    activities = {}
 
-    for chapter in chapters_in_db:
-        chapter_activityIds = []
-
-        for activity in chapter.activities:
-            print("test", activity)
-            chapter_activityIds.append(activity.activity_uuid)
-
+    for chapter in outline.chapters:
         chapters[chapter.chapter_uuid] = {
             "uuid": chapter.chapter_uuid,
             "id": chapter.id,
             "name": chapter.name,
-            "activityIds": chapter_activityIds,
+            "activityIds": [activity.activity_uuid for activity in chapter.activities],
         }
 
-    # activities
-    activities_list = {}
-    statement = (
-        select(Activity)
-        .join(ChapterActivity, ChapterActivity.activity_id == Activity.id)
-        .where(ChapterActivity.activity_id == Activity.id)
-        .group_by(Activity.id)
-    )
-    activities_in_db = db_session.exec(statement).all()
-
-    for activity in activities_in_db:
-        activities_list[activity.activity_uuid] = {
-            "uuid": activity.activity_uuid,
-            "id": activity.id,
-            "name": activity.name,
-            "type": activity.activity_type,
-            "content": activity.content,
-        }
-
-    # get chapter order
-    statement = (
-        select(Chapter)
-        .join(CourseChapter, CourseChapter.chapter_id == Chapter.id)
-        .where(CourseChapter.chapter_id == Chapter.id)
-        .group_by(Chapter.id, CourseChapter.order)
-        .order_by(CourseChapter.order)
-    )
-    chapters_in_db = db_session.exec(statement).all()
-
-    chapterOrder = []
-
-    for chapter in chapters_in_db:
-        chapterOrder.append(chapter.chapter_uuid)
-
-    final = {
+        for activity in chapter.activities:
+            activities[activity.activity_uuid] = {
+                "uuid": activity.activity_uuid,
+                "id": activity.id,
+                "name": activity.name,
+                "type": activity.activity_type,
+            }
+            if with_content:
+                activities[activity.activity_uuid]["content"] = activity.content
+
+    return {
         "chapters": chapters,
-        "chapterOrder": chapterOrder,
-        "activities": activities_list,
+        "chapterOrder": [chapter.chapter_uuid for chapter in outline.chapters],
+        "activities": activities,
     }
 
-    return final
-
-#
-#
-# Graph utilities.
-#
-#
-
-
-def is_cyclic_helper(
-    adjacency_list: List[List[int]],
-    current_index: int,
-    visited: Dict[int, bool],
-    recursion_stack: Dict[int, bool],
-):
-    if not visited[current_index]:
-        # Mark the current node as visited.
-        # and part of recursion stack.
-        visited[current_index] = True
-        print(f"current_index={current_index} | stack={recursion_stack}")
-        recursion_stack[current_index] = True
-
-        # Recur for all the vertices.
-        # adjacent to this vertex
-        for neightbour in adjacency_list[current_index]:
-            if not visited[neightbour] and is_cyclic_helper(
-                    adjacency_list,
-                    neightbour,
-                    visited,
-                    recursion_stack,
-            ):
-                return True
-            elif recursion_stack[neightbour]:
-                return True
-
-    # Remove the vertex from recursion stack
-    recursion_stack[current_index] = False
-    return False
-
-
-def is_new_graph_cyclic_after_new_edge(
-    course_id: int,
-    new_edge: ChapterEdge,
-    db_session: Session,
-) -> bool:
-    #
-    # Step 1: fetch all nodes & edges of
-    # this course and construct a in-memory graph.
-    #
-
-    statement_edges = select(CourseChapter_Graph).where(
-            CourseChapter_Graph.course_id == course_id
-    )
-    edges: [CourseChapter_Graph] = db_session.exec(statement_edges).all()
-    edges.append(CourseChapter_Graph(
-        course_id=course_id,
-        chapter_id=new_edge.to_chapter_id,
-        predecessor_id=new_edge.from_chapter_id,
-    ))
-
-    statement_nodes = select(Chapter).where(Chapter.course_id == course_id)
-    nodes: [Chapter] = db_session.exec(statement_nodes).all()
-
-    #
-    # Step 2: Construct adjacency list
-    #
-
-    adjacency_list = {}
-    for node in nodes:
-        print(f"node={node}")
-        adjacency_list[node.id] = []
-
-    for edge in edges:
-        print(f"edge={edge}")
-        adjacency_list[edge.chapter_id].append(edge.predecessor_id)
-
-    print(f"adjacency_list={adjacency_list}")
-
-    #
-    # Step 3: get the initial nodes (no predecessors).
-    # In case multiple elements are found in the list, we can terminate here
-    # and just return `false` since no loops are possible.
-    #
-
-    initial_nodes = []
-    rec_stack = {}
-    visited = {}
-
-    for node_id in adjacency_list.keys():
-        visited[node_id] = False
-        rec_stack[node_id] = False
-
-        if len(adjacency_list[node_id]) == 0:
-            initial_nodes.append(node_id)
-
-    #
-    # Step 4: perform DFS on the graph.
-    #
-
-    for node in nodes:
-        if not visited[node.id] and is_cyclic_helper(
-                adjacency_list,
-                node.id,
-                visited,
-                rec_stack,
-        ):
-            return True
-
-    return False
-
 
 async def modify_chapter_edge(
     request: Request,
     course_uuid: str,
     edge_param: ChapterEdge,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
+    # Get course from DB in order to get its ID, not UUID.
+    statement = select(Course).where(Course.course_uuid == course_uuid)
+    course = (await db_session.exec(statement)).first()
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Course does not exist"
+        )
+
     statement = select(CourseChapter_Graph).where(
-            CourseChapter_Graph.chapter_id == edge_param.to_chapter_id
-            and CourseChapter_Graph.predecessor_id == edge_param.from_chapter_id
+            CourseChapter_Graph.course_id == course.id,
+            CourseChapter_Graph.chapter_id == edge_param.to_chapter_id,
+            CourseChapter_Graph.predecessor_id == edge_param.from_chapter_id,
     )
-    selected_edge = db_session.exec(statement).first()
+    selected_edge = (await db_session.exec(statement)).first()
 
     if edge_param.delete:
         # RBAC check
@@ -506,8 +361,8 @@ async def modify_chapter_edge(
                 status_code=status.HTTP_409_CONFLICT, detail="Edge does not exist"
             )
 
-        db_session.delete(selected_edge)
-        db_session.commit()
+        await db_session.delete(selected_edge)
+        await db_session.commit()
     else:
         # RBAC check
         await rbac_check(request, course_uuid, current_user, "update", db_session)
@@ -517,20 +372,16 @@ async def modify_chapter_edge(
                 status_code=status.HTTP_409_CONFLICT, detail="Edge already exists"
             )
 
-
-        # Get course from DB in order to get its ID, not UUID.
-        statement = select(Course).where(Course.course_uuid == course_uuid)
-        course = db_session.exec(statement).first()
-        if not course:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, detail="Course does not exist"
-            )
-
         #
         # Check the integrity of the new graph: is the new graph cyclic?
         #
 
-        if is_new_graph_cyclic_after_new_edge(course.id, edge_param, db_session):
+        graph = await get_chapter_graph(course.id, db_session)  # type: ignore
+        if edge_param.from_chapter_id not in graph or edge_param.to_chapter_id not in graph:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Chapter does not exist"
+            )
+        if graph.creates_cycle(edge_param.from_chapter_id, edge_param.to_chapter_id):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Cyclic course structure"
             )
@@ -543,11 +394,104 @@ async def modify_chapter_edge(
 
         # Insert ChapterEdge link in DB
         db_session.add(new_edge)
-        db_session.commit()
+        await db_session.commit()
 
     return
 
 
+async def modify_chapter_edges(
+    request: Request,
+    course_uuid: str,
+    batch: ChapterEdgeBatch,
+    current_user: PublicUser,
+    db_session: AsyncSession,
+) -> ChapterEdgeBatchResult:
+    """
+    Apply a batch of edge additions and removals to the chapter graph of a
+    course, validated on the graph in memory and committed at once
+    """
+    statement = select(Course).where(Course.course_uuid == course_uuid)
+    course = (await db_session.exec(statement)).first()
+    if not course:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Course does not exist"
+        )
+
+    # RBAC check
+    await rbac_check(request, course_uuid, current_user, "update", db_session)
+
+    graph = await get_chapter_graph(course.id, db_session)  # type: ignore
+    original_edges = {
+        (predecessor_id, chapter_id)
+        for chapter_id, predecessor_ids in graph.predecessors.items()
+        for predecessor_id in predecessor_ids
+    }
+
+    for index, edge in enumerate(batch.edges):
+        predecessor_id, chapter_id = edge.from_chapter_id, edge.to_chapter_id
+        if predecessor_id not in graph or chapter_id not in graph:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Edge {index}: Chapter does not exist",
+            )
+
+        exists = predecessor_id in graph.predecessors[chapter_id]
+        if edge.delete:
+            if not exists:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Edge {index}: Edge does not exist",
+                )
+            graph.remove_edge(predecessor_id, chapter_id)
+        else:
+            if exists:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Edge {index}: Edge already exists",
+                )
+            if graph.creates_cycle(predecessor_id, chapter_id):
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Edge {index}: Cyclic course structure",
+                )
+            graph.add_edge(predecessor_id, chapter_id)
+
+    final_edges = {
+        (predecessor_id, chapter_id)
+        for chapter_id, predecessor_ids in graph.predecessors.items()
+        for predecessor_id in predecessor_ids
+    }
+    added = final_edges - original_edges
+    removed = original_edges - final_edges
+
+    if removed:
+        statement = select(CourseChapter_Graph).where(
+            CourseChapter_Graph.course_id == course.id,
+            tuple_(
+                CourseChapter_Graph.predecessor_id, CourseChapter_Graph.chapter_id
+            ).in_(removed),
+        )
+        for edge in (await db_session.exec(statement)).all():
+            await db_session.delete(edge)
+
+    for predecessor_id, chapter_id in added:
+        db_session.add(
+            CourseChapter_Graph(
+                course_id=course.id,
+                chapter_id=chapter_id,
+                predecessor_id=predecessor_id,
+            )
+        )
+
+    await db_session.commit()
+
+    return ChapterEdgeBatchResult(
+        added=len(added),
+        removed=len(removed),
+        chapter_order=graph.topological_order(),
+    )
+
+
 # async def reorder_chapters_and_activities(
 #     request: Request,
 #     course_uuid: str,
@@ -756,7 +700,7 @@ async def rbac_check(
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     if action == "read":
         if current_user.id == 0:  # Anonymous user
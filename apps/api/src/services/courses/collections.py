@@ -1,12 +1,15 @@
 from datetime import datetime
-from typing import List, Literal
+from typing import List, Literal, Optional
 from uuid import uuid4
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.pagination import DEFAULT_PAGE_LIMIT, Page, paginate
 from src.db.users import AnonymousUser
 from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
     authorization_verify_if_element_is_public,
     authorization_verify_if_user_is_anon,
+    get_visibility_filter,
 )
 from src.db.collections import (
     Collection,
@@ -29,10 +32,10 @@ async def get_collection(
     request: Request,
     collection_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> CollectionRead:
     statement = select(Collection).where(Collection.collection_uuid == collection_uuid)
-    collection = db_session.exec(statement).first()
+    collection = (await db_session.exec(statement)).first()
 
     if not collection:
         raise HTTPException(
@@ -63,7 +66,7 @@ async def get_collection(
     else:
         statement = statement_all
 
-    courses = db_session.exec(statement).all()
+    courses = (await db_session.exec(statement)).all()
 
     collection = CollectionRead(**collection.model_dump(), courses=courses)
 
@@ -74,7 +77,7 @@ async def create_collection(
     request: Request,
     collection_object: CollectionCreate,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> CollectionRead:
     collection = Collection.model_validate(collection_object)
 
@@ -88,8 +91,8 @@ async def create_collection(
 
     # Add collection to database
     db_session.add(collection)
-    db_session.commit()
-    db_session.refresh(collection)
+    await db_session.commit()
+    await db_session.refresh(collection)
 
     # Link courses to collection
     if collection:
@@ -104,8 +107,8 @@ async def create_collection(
             # Add collection_course to database
             db_session.add(collection_course)
 
-    db_session.commit()
-    db_session.refresh(collection)
+    await db_session.commit()
+    await db_session.refresh(collection)
 
     # Get courses once again
     statement = (
@@ -113,7 +116,7 @@ async def create_collection(
         .join(CollectionCourse, Course.id == CollectionCourse.course_id)
         .distinct(Course.id)
     )
-    courses = db_session.exec(statement).all()
+    courses = (await db_session.exec(statement)).all()
 
     collection = CollectionRead(**collection.model_dump(), courses=courses)
 
@@ -125,10 +128,10 @@ async def update_collection(
     collection_object: CollectionUpdate,
     collection_uuid: str,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> CollectionRead:
     statement = select(Collection).where(Collection.collection_uuid == collection_uuid)
-    collection = db_session.exec(statement).first()
+    collection = (await db_session.exec(statement)).first()
 
     if not collection:
         raise HTTPException(
@@ -159,11 +162,11 @@ async def update_collection(
     statement = select(CollectionCourse).where(
         CollectionCourse.collection_id == collection.id
     )
-    collection_courses = db_session.exec(statement).all()
+    collection_courses = (await db_session.exec(statement)).all()
 
     # Delete all collection_courses
     for collection_course in collection_courses:
-        db_session.delete(collection_course)
+        await db_session.delete(collection_course)
 
     # Add new collection_courses
     for course in courses or []:
@@ -177,8 +180,8 @@ async def update_collection(
         # Add collection_course to database
         db_session.add(collection_course)
 
-    db_session.commit()
-    db_session.refresh(collection)
+    await db_session.commit()
+    await db_session.refresh(collection)
 
     # Get courses once again
     statement = (
@@ -188,7 +191,7 @@ async def update_collection(
         .distinct(Course.id)
     )
 
-    courses = db_session.exec(statement).all()
+    courses = (await db_session.exec(statement)).all()
 
     collection = CollectionRead(**collection.model_dump(), courses=courses)
 
@@ -199,10 +202,10 @@ async def delete_collection(
     request: Request,
     collection_uuid: str,
     current_user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Collection).where(Collection.collection_uuid == collection_uuid)
-    collection = db_session.exec(statement).first()
+    collection = (await db_session.exec(statement)).first()
 
     if not collection:
         raise HTTPException(
@@ -216,8 +219,8 @@ async def delete_collection(
     )
 
     # delete collection from database
-    db_session.delete(collection)
-    db_session.commit()
+    await db_session.delete(collection)
+    await db_session.commit()
 
     return {"detail": "Collection deleted"}
 
@@ -227,55 +230,91 @@ async def delete_collection(
 ####################################################
 
 
-async def get_collections(
-    request: Request,
-    org_id: str,
-    current_user: PublicUser | AnonymousUser,
-    db_session: Session,
-    page: int = 1,
-    limit: int = 10,
-) -> List[CollectionRead]:
-
-    statement_public = select(Collection).where(
-        Collection.org_id == org_id, Collection.public == True
-    )
-    statement_all = (
-        select(Collection).where(Collection.org_id == org_id).distinct(Collection.id)
+async def get_collections_statement(
+    org_id: str, current_user: PublicUser | AnonymousUser, db_session: AsyncSession
+):
+    """
+    Collections of an org the user may read
+    """
+    return (
+        select(Collection)
+        .where(Collection.org_id == org_id)
+        .where(await get_visibility_filter(current_user, "collections", db_session))
     )
 
-    if current_user.id == 0:
-        statement = statement_public
-    else:
-        statement = statement_all
 
-    collections = db_session.exec(statement).all()
-
-    collections_with_courses = []
-
-    for collection in collections:
-        statement_all = (
-            select(Course)
-            .join(CollectionCourse, Course.id == CollectionCourse.course_id)
-            .where(CollectionCourse.org_id == collection.org_id)
-            .distinct(Course.id)
+async def get_collection_reads(
+    collections: List[Collection],
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+) -> List[CollectionRead]:
+    """
+    Collections of a listing, already filtered by the visibility rules, with
+    the courses the user may read
+    """
+    # Courses of every collection in one query
+    statement = (
+        select(CollectionCourse.collection_id, Course)
+        .join(Course, Course.id == CollectionCourse.course_id)  # type: ignore
+        .where(
+            CollectionCourse.collection_id.in_(  # type: ignore
+                [collection.id for collection in collections]
+            )
         )
-        statement_public = (
-            select(Course)
-            .join(CollectionCourse, Course.id == CollectionCourse.course_id)
-            .where(CollectionCourse.org_id == org_id, Course.public == True)
+        .where(await get_visibility_filter(current_user, "courses", db_session))
+    )
+    courses_by_collection: dict[int, list[Course]] = {}
+    for collection_id, course in (await db_session.exec(statement)).all():
+        courses_by_collection.setdefault(collection_id, []).append(course)
+
+    return [
+        CollectionRead(
+            **collection.model_dump(),
+            courses=courses_by_collection.get(collection.id, []),  # type: ignore
         )
-        if current_user.id == 0:
-            statement = statement_public
-        else:
-            # RBAC check
-            statement = statement_all
+        for collection in collections
+    ]
+
+
+async def get_collections_page(
+    request: Request,
+    org_id: str,
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    include_total: bool = False,
+) -> Page[CollectionRead]:
+    page = await paginate(
+        await get_collections_statement(org_id, current_user, db_session),
+        Collection.id,
+        db_session,
+        cursor,
+        limit,
+        include_total,
+    )
+    collection_reads = await get_collection_reads(page.items, current_user, db_session)
+    return page.copy(update={"items": collection_reads})
 
-        courses = db_session.exec(statement).all()
 
-        collection = CollectionRead(**collection.model_dump(), courses=courses)
-        collections_with_courses.append(collection)
+async def get_collections(
+    request: Request,
+    org_id: str,
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+    page: int = 1,
+    limit: int = 10,
+) -> List[CollectionRead]:
+    """
+    Every collection of the org, kept for clients of the page/limit route
+    which never paginated
+    """
+    statement = (
+        await get_collections_statement(org_id, current_user, db_session)
+    ).order_by(Collection.id)
+    collections = (await db_session.exec(statement)).all()
 
-    return collections_with_courses
+    return await get_collection_reads(list(collections), current_user, db_session)
 
 
 ## 🔒 RBAC Utils ##
@@ -286,7 +325,7 @@ async def rbac_check(
     collection_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     if action == "read":
         if current_user.id == 0:  # Anonymous user
@@ -0,0 +1,58 @@
+from typing import List
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.db.courses.activities import Activity, ActivityRead
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.chapters import Chapter, ChapterRead
+from src.db.courses.course_chapters import CourseChapter, CourseChapter_Graph
+from src.services.courses.chapter_graph import ChapterGraph
+
+
+async def build_course_tree(
+    course_id: int,
+    db_session: AsyncSession,
+) -> List[ChapterRead]:
+    """
+    Chapters of a course with their activities and predecessors, assembled in
+    memory from three queries whatever the size of the course, in topological
+    order
+    """
+    statement = (
+        select(Chapter)
+        .join(CourseChapter, Chapter.id == CourseChapter.chapter_id)  # type: ignore
+        .where(CourseChapter.course_id == course_id)
+        .where(Chapter.course_id == course_id)
+    )
+    result = await db_session.exec(statement)
+    chapters = {
+        chapter.id: ChapterRead(**chapter.model_dump(), activities=[], predecessors=[])
+        for chapter in result.all()
+    }
+
+    if not chapters:
+        return []
+
+    # Activities of every chapter, in their order within the chapter
+    statement = (
+        select(ChapterActivity.chapter_id, Activity)
+        .join(Activity, Activity.id == ChapterActivity.activity_id)  # type: ignore
+        .where(ChapterActivity.chapter_id.in_(list(chapters)))  # type: ignore
+        .order_by(ChapterActivity.chapter_id, ChapterActivity.order, ChapterActivity.id)  # type: ignore
+    )
+    result = await db_session.exec(statement)
+    for chapter_id, activity in result.all():
+        chapters[chapter_id].activities.append(ActivityRead(**activity.model_dump()))
+
+    # Predecessors
+    statement = select(CourseChapter_Graph).where(
+        CourseChapter_Graph.course_id == course_id
+    )
+    result = await db_session.exec(statement)
+    edges = []
+    for edge in result.all():
+        if edge.chapter_id in chapters and edge.predecessor_id:
+            chapters[edge.chapter_id].predecessors.append(edge.predecessor_id)
+            edges.append((edge.predecessor_id, edge.chapter_id))
+
+    graph = ChapterGraph(chapters, edges)
+    return [chapters[chapter_id] for chapter_id in graph.topological_order()]
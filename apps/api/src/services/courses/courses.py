@@ -1,17 +1,19 @@
-from typing import Literal, List
+from typing import Literal, List, Optional
 from uuid import uuid4
-from sqlmodel import Session, select, or_, and_
-from src.db.usergroup_resources import UserGroupResource
-from src.db.usergroup_user import UserGroupUser
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.organizations import Organization
 from src.security.features_utils.usage import (
     check_limits_with_usage,
     decrease_feature_usage,
     increase_feature_usage,
 )
+from src.core.http_cache import check_not_modified, make_etag
+from src.core.pagination import DEFAULT_PAGE_LIMIT, Page, paginate
 from src.services.trail.trail import get_user_trail_with_orgid
+from src.services.trail.trail_versions import get_trail_course_ids, get_trail_version
 from src.db.resource_authors import ResourceAuthor, ResourceAuthorshipEnum
-from src.db.users import PublicUser, AnonymousUser, User, UserRead
+from src.db.users import PublicUser, AnonymousUser, UserRead
 from src.db.courses.courses import (
     Course,
     CourseCreate,
@@ -23,9 +25,15 @@ from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
     authorization_verify_if_element_is_public,
     authorization_verify_if_user_is_anon,
+    get_visibility_filter,
+)
+from src.services.courses.outline_cache import (
+    get_course_outline,
+    get_course_outline_versions,
 )
 from src.services.courses.thumbnails import upload_thumbnail
-from fastapi import HTTPException, Request, UploadFile
+from src.services.loaders import get_loaders
+from fastapi import HTTPException, Request, Response, UploadFile
 from datetime import datetime
 
 
@@ -33,10 +41,10 @@ async def get_course(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -48,12 +56,9 @@ async def get_course(
     await rbac_check(request, course.course_uuid, current_user, "read", db_session)
 
     # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    authors = await get_loaders(request, db_session).authors_by_resource_uuid.load(
+        course.course_uuid
     )
-    authors = db_session.exec(authors_statement).all()
 
     # convert from User to UserRead
     authors = [UserRead.model_validate(author) for author in authors]
@@ -67,10 +72,10 @@ async def get_course_by_id(
     request: Request,
     course_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -82,12 +87,9 @@ async def get_course_by_id(
     await rbac_check(request, course.course_uuid, current_user, "read", db_session)
 
     # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    authors = await get_loaders(request, db_session).authors_by_resource_uuid.load(
+        course.course_uuid
     )
-    authors = db_session.exec(authors_statement).all()
 
     # convert from User to UserRead
     authors = [UserRead.model_validate(author) for author in authors]
@@ -101,13 +103,11 @@ async def get_course_meta(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
-) -> FullCourseReadWithTrail:
-    # Avoid circular import
-    from src.services.courses.chapters import get_course_chapters
-
+    db_session: AsyncSession,
+    response: Optional[Response] = None,
+) -> FullCourseReadWithTrail | Response:
     course_statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(course_statement).first()
+    course = (await db_session.exec(course_statement)).first()
 
     if not course:
         raise HTTPException(
@@ -118,26 +118,53 @@ async def get_course_meta(
     # RBAC check
     await rbac_check(request, course.course_uuid, current_user, "read", db_session)
 
-    # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    is_anonymous = isinstance(current_user, AnonymousUser)
+
+    # Versions of the course and of everything embedded in the user's trail
+    trail_version = None
+    trail_course_ids = []
+    if response is not None and not is_anonymous:
+        trail_version = get_trail_version(current_user.id, course.org_id)
+        trail_course_ids = await get_trail_course_ids(
+            current_user.id, course.org_id, db_session
+        )
+    versions = get_course_outline_versions([course.id, *trail_course_ids])  # type: ignore
+
+    # Chapters, activities, predecessors and authors, from the outline cache
+    outline = await get_course_outline(
+        course, db_session, version=versions[0] if versions else None
+    )
+
+    # Author profiles are not cached, they change independently of the course
+    authors = await get_loaders(request, db_session).users_by_id.load_many(
+        outline.author_ids
     )
-    authors = db_session.exec(authors_statement).all()
 
     # convert from User to UserRead
-    authors = [UserRead.model_validate(author) for author in authors]
+    authors = [UserRead.model_validate(author) for author in authors if author]
 
-    course = CourseRead(**course.model_dump(), authors=authors)
+    # Without Redis there are no versions to derive an ETag from
+    if versions is not None and (is_anonymous or trail_version is not None):
+        etag = make_etag(
+            "course_meta",
+            current_user.id,
+            trail_version,
+            *zip([course.id, *trail_course_ids], versions),
+            *[author.model_dump() for author in authors],
+        )
+        not_modified = check_not_modified(
+            request, response, etag, public=is_anonymous and course.public
+        )
+        if not_modified:
+            return not_modified
 
-    # Get course chapters
-    chapters = await get_course_chapters(request, course.id, db_session, current_user)
+    course = CourseRead(**course.model_dump(), authors=authors)
+    chapters = outline.chapters
 
     # Trail
     trail = None
 
-    if isinstance(current_user, AnonymousUser):
+    if is_anonymous:
         trail = None
     else:
         trail = await get_user_trail_with_orgid(
@@ -150,63 +177,39 @@ async def get_course_meta(
         trail=trail if trail else None,
     )
 
-async def get_courses_orgslug(
-    request: Request,
+async def get_courses_orgslug_statement(
     current_user: PublicUser | AnonymousUser,
     org_slug: str,
-    db_session: Session,
-    page: int = 1,
-    limit: int = 10,
-) -> List[CourseRead]:
-    offset = (page - 1) * limit
-
-    # Base query
-    query = (
+    db_session: AsyncSession,
+):
+    """
+    Courses of an org the user may read, without duplicates
+    """
+    return (
         select(Course)
         .join(Organization)
         .where(Organization.slug == org_slug)
+        .where(await get_visibility_filter(current_user, "courses", db_session))
     )
 
-    if isinstance(current_user, AnonymousUser):
-        # For anonymous users, only show public courses
-        query = query.where(Course.public == True)
-    else:
-        # For authenticated users, show:
-        # 1. Public courses
-        # 2. Courses not in any UserGroup
-        # 3. Courses in UserGroups where the user is a member
-        # 4. Courses where the user is a resource author
-        query = (
-            query
-            .outerjoin(UserGroupResource, UserGroupResource.resource_uuid == Course.course_uuid)  # type: ignore
-            .outerjoin(UserGroupUser, and_(
-                UserGroupUser.usergroup_id == UserGroupResource.usergroup_id,
-                UserGroupUser.user_id == current_user.id
-            ))
-            .outerjoin(ResourceAuthor, ResourceAuthor.resource_uuid == Course.course_uuid)  # type: ignore
-            .where(or_(
-                Course.public == True,
-                UserGroupResource.resource_uuid == None,  # Courses not in any UserGroup # noqa: E711
-                UserGroupUser.user_id == current_user.id,  # Courses in UserGroups where user is a member
-                ResourceAuthor.user_id == current_user.id  # Courses where user is a resource author
-            ))
-        )
-
-    # Apply pagination
-    query = query.offset(offset).limit(limit).distinct()
 
-    courses = db_session.exec(query).all()
+async def get_course_reads(
+    request: Request,
+    courses: List[Course],
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+) -> List[CourseRead]:
+    """
+    Courses of a listing, already filtered by the visibility rules, with their
+    authors
+    """
+    # Fetch the authors of the whole page
+    authors_by_course = await get_loaders(
+        request, db_session
+    ).authors_by_resource_uuid.load_many([course.course_uuid for course in courses])
 
-    # Fetch authors for each course
     course_reads = []
-    for course in courses:
-        authors_query = (
-            select(User)
-            .join(ResourceAuthor, ResourceAuthor.user_id == User.id)  # type: ignore
-            .where(ResourceAuthor.resource_uuid == course.course_uuid)
-        )
-        authors = db_session.exec(authors_query).all()
-        
+    for course, authors in zip(courses, authors_by_course):
         course_read = CourseRead.model_validate(course)
         course_read.authors = [UserRead.model_validate(author) for author in authors]
         course_reads.append(course_read)
@@ -214,12 +217,59 @@ async def get_courses_orgslug(
     return course_reads
 
 
+async def get_courses_orgslug_page(
+    request: Request,
+    current_user: PublicUser | AnonymousUser,
+    org_slug: str,
+    db_session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    include_total: bool = False,
+) -> Page[CourseRead]:
+    page = await paginate(
+        await get_courses_orgslug_statement(current_user, org_slug, db_session),
+        Course.id,
+        db_session,
+        cursor,
+        limit,
+        include_total,
+    )
+    course_reads = await get_course_reads(
+        request, page.items, current_user, db_session
+    )
+    return page.copy(update={"items": course_reads})
+
+
+async def get_courses_orgslug(
+    request: Request,
+    current_user: PublicUser | AnonymousUser,
+    org_slug: str,
+    db_session: AsyncSession,
+    page: int = 1,
+    limit: int = 10,
+) -> List[CourseRead]:
+    """
+    Offset pagination, kept for clients of the page/limit route
+    """
+    offset = (page - 1) * limit
+
+    query = (
+        (await get_courses_orgslug_statement(current_user, org_slug, db_session))
+        .order_by(Course.id)
+        .offset(offset)
+        .limit(limit)
+    )
+    courses = (await db_session.exec(query)).all()
+
+    return await get_course_reads(request, list(courses), current_user, db_session)
+
+
 async def create_course(
     request: Request,
     org_id: int,
     course_object: CourseCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
     thumbnail_file: UploadFile | None = None,
 ):
     course = Course.model_validate(course_object)
@@ -228,14 +278,13 @@ async def create_course(
     await rbac_check(request, "course_x", current_user, "create", db_session)
 
     # Usage check
-    check_limits_with_usage("courses", org_id, db_session)
+    await check_limits_with_usage("courses", org_id, db_session)
 
     # Complete course object
     course.org_id = course.org_id
 
     # Get org uuid
-    org_statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(org_statement).first()
+    org = await get_loaders(request, db_session).orgs_by_id.load(org_id)
 
     course.course_uuid = str(f"course_{uuid4()}")
     course.creation_date = str(datetime.now())
@@ -254,8 +303,8 @@ async def create_course(
 
     # Insert course
     db_session.add(course)
-    db_session.commit()
-    db_session.refresh(course)
+    await db_session.commit()
+    await db_session.refresh(course)
 
     # Make the user the creator of the course
     resource_author = ResourceAuthor(
@@ -268,16 +317,13 @@ async def create_course(
 
     # Insert course author
     db_session.add(resource_author)
-    db_session.commit()
-    db_session.refresh(resource_author)
+    await db_session.commit()
+    await db_session.refresh(resource_author)
 
     # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    authors = await get_loaders(request, db_session).authors_by_resource_uuid.load(
+        course.course_uuid
     )
-    authors = db_session.exec(authors_statement).all()
 
     # Feature usage
     increase_feature_usage("courses", course.org_id, db_session)
@@ -294,11 +340,11 @@ async def update_course_thumbnail(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
     thumbnail_file: UploadFile | None = None,
 ):
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     name_in_disk = None
 
@@ -312,8 +358,7 @@ async def update_course_thumbnail(
     await rbac_check(request, course.course_uuid, current_user, "update", db_session)
 
     # Get org uuid
-    org_statement = select(Organization).where(Organization.id == course.org_id)
-    org = db_session.exec(org_statement).first()
+    org = await get_loaders(request, db_session).orgs_by_id.load(course.org_id)
 
     # Upload thumbnail
     if thumbnail_file and thumbnail_file.filename:
@@ -335,16 +380,13 @@ async def update_course_thumbnail(
     course.update_date = str(datetime.now())
 
     db_session.add(course)
-    db_session.commit()
-    db_session.refresh(course)
+    await db_session.commit()
+    await db_session.refresh(course)
 
     # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    authors = await get_loaders(request, db_session).authors_by_resource_uuid.load(
+        course.course_uuid
     )
-    authors = db_session.exec(authors_statement).all()
 
     # convert from User to UserRead
     authors = [UserRead.model_validate(author) for author in authors]
@@ -359,10 +401,10 @@ async def update_course(
     course_object: CourseUpdate,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -382,16 +424,13 @@ async def update_course(
     course.update_date = str(datetime.now())
 
     db_session.add(course)
-    db_session.commit()
-    db_session.refresh(course)
+    await db_session.commit()
+    await db_session.refresh(course)
 
     # Get course authors
-    authors_statement = (
-        select(User)
-        .join(ResourceAuthor)
-        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+    authors = await get_loaders(request, db_session).authors_by_resource_uuid.load(
+        course.course_uuid
     )
-    authors = db_session.exec(authors_statement).all()
 
     # convert from User to UserRead
     authors = [UserRead.model_validate(author) for author in authors]
@@ -405,10 +444,10 @@ async def delete_course(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -422,8 +461,8 @@ async def delete_course(
     # Feature usage
     decrease_feature_usage("courses", course.org_id, db_session)
 
-    db_session.delete(course)
-    db_session.commit()
+    await db_session.delete(course)
+    await db_session.commit()
 
     return {"detail": "Course deleted"}
 
@@ -439,7 +478,7 @@ async def rbac_check(
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     if action == "read":
         if current_user.id == 0:  # Anonymous user
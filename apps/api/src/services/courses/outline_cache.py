@@ -0,0 +1,224 @@
+"""
+Versioned Redis cache of compiled course outlines.
+
+An outline is the user-independent part of a course page: chapters, ordered
+activities, predecessors and author ids. It is stored under the current
+version of its course, and every committed change to the course structure
+bumps that version, so readers never see a stale outline and old versions
+simply expire. Per-user data (trail, author profiles) is layered on top by
+the callers.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+import redis
+from pydantic import BaseModel
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from config.config import get_learnhouse_config
+from src.core.cache import bump_entity_versions, get_entity_versions, get_redis_client
+from src.db.courses.activities import Activity
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.chapters import Chapter, ChapterRead
+from src.db.courses.course_chapters import CourseChapter, CourseChapter_Graph
+from src.db.courses.courses import Course
+from src.db.resource_authors import ResourceAuthor
+from src.services.courses.course_tree import build_course_tree
+
+OUTLINE_KEY_PREFIX = "learnhouse:course_outline"
+
+# A worker missing an outline that another worker is building polls for it
+# before building it too
+BUILD_LOCK_MS = 5000
+BUILD_POLL_INTERVAL = 0.05
+BUILD_POLL_ATTEMPTS = 40
+
+# Rows whose course_id belongs to the outline of that course
+OUTLINE_MODELS = (Chapter, CourseChapter, CourseChapter_Graph, ChapterActivity, Activity)
+
+
+class CourseOutline(BaseModel):
+    chapters: List[ChapterRead]
+    author_ids: List[int]
+
+
+def get_version_key(course_id: int) -> str:
+    return f"{OUTLINE_KEY_PREFIX}:{course_id}:version"
+
+
+def get_outline_key(course_id: int, version: str) -> str:
+    return f"{OUTLINE_KEY_PREFIX}:{course_id}:v{version}"
+
+
+async def build_course_outline(
+    course: Course, db_session: AsyncSession
+) -> CourseOutline:
+    chapters = await build_course_tree(course.id, db_session)  # type: ignore
+
+    statement = (
+        select(ResourceAuthor.user_id)
+        .where(ResourceAuthor.resource_uuid == course.course_uuid)
+        .order_by(ResourceAuthor.id)  # type: ignore
+    )
+    result = await db_session.exec(statement)
+
+    return CourseOutline(chapters=chapters, author_ids=list(result.all()))
+
+
+## 🗃️ Cached reads ##
+
+# Builds in progress in this worker, so that concurrent misses share one build
+_builds: dict[str, asyncio.Future] = {}
+
+
+async def get_course_outline(
+    course: Course,
+    db_session: AsyncSession,
+    version: Optional[str] = None,
+) -> CourseOutline:
+    """
+    Outline of a course from Redis, built from the database on a miss.
+    `version` is the already known version of the course, if any.
+    """
+    ttl = get_learnhouse_config().redis_config.course_outline_cache_ttl
+    client = get_redis_client()
+    if not client or ttl <= 0:
+        return await build_course_outline(course, db_session)
+
+    if version is None:
+        versions = get_course_outline_versions([course.id])  # type: ignore
+        if not versions:
+            return await build_course_outline(course, db_session)
+        version = versions[0]
+
+    try:
+        key = get_outline_key(course.id, version)  # type: ignore
+        cached = client.get(key)
+    except redis.RedisError as error:
+        logging.warning("Course outline cache unavailable: %s", error)
+        return await build_course_outline(course, db_session)
+
+    if cached:
+        return CourseOutline.parse_raw(cached)
+
+    build = _builds.get(key)
+    if build:
+        try:
+            return await asyncio.shield(build)
+        except Exception:
+            return await build_course_outline(course, db_session)
+
+    build = asyncio.get_running_loop().create_future()
+    _builds[key] = build
+    try:
+        outline = await _build_and_store(client, key, ttl, course, db_session)
+    except Exception as error:
+        build.set_exception(error)
+        # Waiters fall back to their own build, the error is raised here
+        build.exception()
+        raise
+    else:
+        build.set_result(outline)
+        return outline
+    finally:
+        _builds.pop(key, None)
+
+
+async def _build_and_store(
+    client: redis.Redis,
+    key: str,
+    ttl: int,
+    course: Course,
+    db_session: AsyncSession,
+) -> CourseOutline:
+    lock_key = f"{key}:lock"
+    try:
+        locked = client.set(lock_key, "1", nx=True, px=BUILD_LOCK_MS)
+        if not locked:
+            for _ in range(BUILD_POLL_ATTEMPTS):
+                await asyncio.sleep(BUILD_POLL_INTERVAL)
+                cached = client.get(key)
+                if cached:
+                    return CourseOutline.parse_raw(cached)
+    except redis.RedisError as error:
+        logging.warning("Course outline cache unavailable: %s", error)
+        return await build_course_outline(course, db_session)
+
+    outline = await build_course_outline(course, db_session)
+
+    try:
+        client.set(key, outline.json(), ex=ttl)
+        if locked:
+            client.delete(lock_key)
+    except redis.RedisError as error:
+        logging.warning("Could not store course outline: %s", error)
+
+    return outline
+
+
+## 🔁 Versioning ##
+
+
+def get_course_outline_versions(course_ids: list[int]) -> Optional[list[str]]:
+    """
+    Current outline version of each course, None without Redis
+    """
+    return get_entity_versions([get_version_key(course_id) for course_id in course_ids])
+
+
+def bump_course_outline_versions(course_ids: set[int]):
+    bump_entity_versions(get_version_key(course_id) for course_id in course_ids)
+
+
+def _get_course_ids(instance) -> set[Optional[int]]:
+    """
+    Current and previous course of a row, chapters and activities can move
+    """
+    if isinstance(instance, Course):
+        return {instance.id}
+    history = inspect(instance).attrs.course_id.history
+    return {instance.course_id, *history.deleted}
+
+
+# Structure changes are collected on flush and bump the versions once the
+# transaction is committed
+
+
+@event.listens_for(SASession, "after_flush")
+def _collect_outline_changes(session, flush_context):
+    pending: set[Optional[int]] = session.info.setdefault("course_outline_changes", set())
+    author_course_uuids = set()
+
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, (Course, *OUTLINE_MODELS)):
+            pending.update(_get_course_ids(instance))
+        elif isinstance(instance, ResourceAuthor) and instance.resource_uuid.startswith(
+            "course_"
+        ):
+            author_course_uuids.add(instance.resource_uuid)
+
+    if author_course_uuids:
+        pending.update(
+            session.connection()
+            .execute(
+                select(Course.id).where(Course.course_uuid.in_(author_course_uuids))  # type: ignore
+            )
+            .scalars()
+        )
+
+
+@event.listens_for(SASession, "after_commit")
+def _publish_outline_changes(session):
+    pending = session.info.pop("course_outline_changes", None)
+    if pending:
+        bump_course_outline_versions(
+            {course_id for course_id in pending if course_id is not None}
+        )
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_outline_changes(session):
+    session.info.pop("course_outline_changes", None)
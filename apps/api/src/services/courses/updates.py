@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import uuid4
-from fastapi import HTTPException, Request, status
-from sqlmodel import Session, col, select
+from fastapi import HTTPException, Request, Response, status
+from sqlmodel import col, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.http_cache import check_not_modified, make_etag
 from src.db.courses.course_updates import (
     CourseUpdate,
     CourseUpdateCreate,
@@ -20,12 +22,12 @@ async def create_update(
     course_uuid: str,
     update_object: CourseUpdateCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> CourseUpdateRead:
 
     # CHekc if org exists
     statement_org = select(Organization).where(Organization.id == update_object.org_id)
-    org = db_session.exec(statement_org).first()
+    org = (await db_session.exec(statement_org)).first()
 
     if not org or org.id is None:
         raise HTTPException(
@@ -33,7 +35,7 @@ async def create_update(
         )
 
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course or course.id is None:
         raise HTTPException(
@@ -56,8 +58,8 @@ async def create_update(
 
     db_session.add(update)
 
-    db_session.commit()
-    db_session.refresh(update)
+    await db_session.commit()
+    await db_session.refresh(update)
 
     return CourseUpdateRead(**update.model_dump())
 
@@ -68,12 +70,12 @@ async def update_update(
     courseupdate_uuid: str,
     update_object: CourseUpdateUpdate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> CourseUpdateRead:
     statement = select(CourseUpdate).where(
         CourseUpdate.courseupdate_uuid == courseupdate_uuid
     )
-    update = db_session.exec(statement).first()
+    update = (await db_session.exec(statement)).first()
 
     if not update or update.id is None:
         raise HTTPException(
@@ -89,10 +91,12 @@ async def update_update(
         if value is not None:
             setattr(update, key, value)
 
+    update.update_date = str(datetime.now())
+
     db_session.add(update)
 
-    db_session.commit()
-    db_session.refresh(update)
+    await db_session.commit()
+    await db_session.refresh(update)
 
     return CourseUpdateRead(**update.model_dump())
 
@@ -102,12 +106,12 @@ async def delete_update(
     request: Request,
     courseupdate_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(CourseUpdate).where(
         CourseUpdate.courseupdate_uuid == courseupdate_uuid
     )
-    update = db_session.exec(statement).first()
+    update = (await db_session.exec(statement)).first()
 
     if not update or update.id is None:
         raise HTTPException(
@@ -119,8 +123,8 @@ async def delete_update(
         request, update.courseupdate_uuid, current_user, "delete", db_session
     )
 
-    db_session.delete(update)
-    db_session.commit()
+    await db_session.delete(update)
+    await db_session.commit()
 
     return {"message": "Update deleted successfully"}
 
@@ -130,22 +134,39 @@ async def get_updates_by_course_uuid(
     request: Request,
     course_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
-) -> List[CourseUpdateRead]:
+    db_session: AsyncSession,
+    response: Optional[Response] = None,
+) -> List[CourseUpdateRead] | Response:
     # FInd if course exists
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course or course.id is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Course does not exist"
         )
 
+    # Updates are only created, edited (bumping their update date) or deleted
+    statement = select(
+        func.count(CourseUpdate.id),  # type: ignore
+        func.max(CourseUpdate.id),
+        func.max(CourseUpdate.update_date),
+    ).where(CourseUpdate.course_id == course.id)
+    etag = make_etag("course_updates", course.id, *(await db_session.exec(statement)).one())
+    not_modified = check_not_modified(
+        request,
+        response,
+        etag,
+        public=isinstance(current_user, AnonymousUser) and course.public,
+    )
+    if not_modified:
+        return not_modified
+
     statement = (
         select(CourseUpdate)
         .where(CourseUpdate.course_id == course.id)
         .order_by(col(CourseUpdate.creation_date).desc())
     )  # https://sqlmodel.tiangolo.com/tutorial/where/#type-annotations-and-errors
-    updates = db_session.exec(statement).all()
+    updates = (await db_session.exec(statement)).all()
 
     return [CourseUpdateRead(**update.model_dump()) for update in updates]
@@ -1,17 +1,27 @@
-from fastapi import HTTPException
-from sqlmodel import Session, select
+from typing import List
+from fastapi import HTTPException, Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import (
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from src.core.events.database_pool import PoolStatsRead, get_pool_stats
 from src.db.organizations import Organization
+from src.security.password_hashing import PasswordHashingStatsRead, password_hashing_pool
 
-async def check_database_health(db_session: Session) -> bool:
+async def check_database_health(db_session: AsyncSession) -> bool:
     statement = select(Organization)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if not result:
         return False
 
     return True
 
-async def check_health(db_session: Session) -> bool:
+async def check_health(db_session: AsyncSession) -> bool:
     # Check database health
     database_healthy = await check_database_health(db_session)
 
@@ -19,3 +29,22 @@ async def check_health(db_session: Session) -> bool:
         raise HTTPException(status_code=503, detail="Database is not healthy")
 
     return True
+
+
+async def get_database_pool_stats(request: Request) -> List[PoolStatsRead]:
+    stats = [
+        get_pool_stats("primary", engine),
+        get_pool_stats("primary_async", async_engine),
+    ]
+
+    for index, replica_engine in enumerate(replica_engines):
+        stats.append(get_pool_stats(f"replica_{index}", replica_engine))
+
+    for index, async_replica_engine in enumerate(async_replica_engines):
+        stats.append(get_pool_stats(f"replica_{index}_async", async_replica_engine))
+
+    return stats
+
+
+async def get_password_hashing_stats(request: Request) -> PasswordHashingStatsRead:
+    return password_hashing_pool.get_stats()
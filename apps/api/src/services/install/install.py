@@ -4,6 +4,7 @@ from uuid import uuid4
 from fastapi import HTTPException, Request
 from sqlalchemy import desc
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.install import Install, InstallRead
 from src.db.organization_config import (
     AIOrgConfig,
@@ -43,7 +44,7 @@ async def isInstallModeEnabled():
         )
 
 
-async def create_install_instance(request: Request, data: dict, db_session: Session):
+async def create_install_instance(request: Request, data: dict, db_session: AsyncSession):
     install = Install.model_validate(data)
 
     # complete install instance
@@ -55,19 +56,19 @@ async def create_install_instance(request: Request, data: dict, db_session: Sess
     db_session.add(install)
 
     # commit changes
-    db_session.commit()
+    await db_session.commit()
 
     # refresh install instance
-    db_session.refresh(install)
+    await db_session.refresh(install)
 
     install = InstallRead.model_validate(install)
 
     return install
 
 
-async def get_latest_install_instance(request: Request, db_session: Session):
+async def get_latest_install_instance(request: Request, db_session: AsyncSession):
     statement = select(Install).order_by(desc(Install.creation_date)).limit(1)
-    install = db_session.exec(statement).first()
+    install = (await db_session.exec(statement)).first()
 
     if install is None:
         raise HTTPException(
@@ -81,10 +82,10 @@ async def get_latest_install_instance(request: Request, db_session: Session):
 
 
 async def update_install_instance(
-    request: Request, data: dict, step: int, db_session: Session
+    request: Request, data: dict, step: int, db_session: AsyncSession
 ):
     statement = select(Install).order_by(desc(Install.creation_date)).limit(1)
-    install = db_session.exec(statement).first()
+    install = (await db_session.exec(statement)).first()
 
     if install is None:
         raise HTTPException(
@@ -96,10 +97,10 @@ async def update_install_instance(
     install.data = data
 
     # commit changes
-    db_session.commit()
+    await db_session.commit()
 
     # refresh install instance
-    db_session.refresh(install)
+    await db_session.refresh(install)
 
     install = InstallRead.model_validate(install)
 
@@ -0,0 +1,140 @@
+"""
+Request-scoped batch loaders.
+
+Services ask a loader for rows by key instead of querying them one by one in
+a loop. Keys requested during the same event loop iteration are resolved with
+a single IN query per relation, and results are memoized for the rest of the
+request:
+
+    loaders = get_loaders(request, db_session)
+    authors = await loaders.authors_by_resource_uuid.load_many(course_uuids)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, Optional, TypeVar
+from fastapi import Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.db.courses.courses import Course
+from src.db.organizations import Organization
+from src.db.resource_authors import ResourceAuthor
+from src.db.roles import Role
+from src.db.users import User
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Collects the keys loaded during an event loop iteration and resolves them
+    with one call to `batch_load`, which returns a mapping of the found keys.
+    Missing keys resolve to `default()`.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[dict[K, V]]],
+        default: Callable[[], Any] = lambda: None,
+    ):
+        self.batch_load = batch_load
+        self.default = default
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._dispatch_task: Optional[asyncio.Future] = None
+
+    def load(self, key: K) -> Awaitable[V]:
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            # Dispatched once the caller yields, so that the keys loaded
+            # in the meantime join the same batch
+            if len(self._queue) == 1:
+                self._dispatch_task = asyncio.ensure_future(self._dispatch())
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def clear(self, key: K):
+        """
+        Forget a memoized key, to be called after changing its rows
+        """
+        self._futures.pop(key, None)
+
+    async def _dispatch(self):
+        keys, self._queue = self._queue, []
+        try:
+            results = await self.batch_load(keys)
+        except Exception as error:
+            for key in keys:
+                future = self._futures.pop(key, None)
+                if future and not future.done():
+                    future.set_exception(error)
+            return
+
+        for key in keys:
+            future = self._futures.get(key)
+            if future and not future.done():
+                future.set_result(results[key] if key in results else self.default())
+
+
+class Loaders:
+    """
+    Loaders of one request, bound to its database session
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.authors_by_resource_uuid: DataLoader[str, list[User]] = DataLoader(
+            self._load_authors, default=list
+        )
+        self.users_by_id: DataLoader[int, Optional[User]] = DataLoader(
+            lambda ids: self._load_by_id(User, ids)
+        )
+        self.orgs_by_id: DataLoader[int, Optional[Organization]] = DataLoader(
+            lambda ids: self._load_by_id(Organization, ids)
+        )
+        self.courses_by_id: DataLoader[int, Optional[Course]] = DataLoader(
+            lambda ids: self._load_by_id(Course, ids)
+        )
+        self.roles_by_id: DataLoader[int, Optional[Role]] = DataLoader(
+            lambda ids: self._load_by_id(Role, ids)
+        )
+
+    async def _load_authors(self, resource_uuids: list[str]) -> dict[str, list[User]]:
+        statement = (
+            select(ResourceAuthor.resource_uuid, User)
+            .join(User, User.id == ResourceAuthor.user_id)  # type: ignore
+            .where(ResourceAuthor.resource_uuid.in_(resource_uuids))  # type: ignore
+            .order_by(ResourceAuthor.id)  # type: ignore
+        )
+        result = await self.db_session.exec(statement)
+
+        authors: dict[str, list[User]] = {}
+        for resource_uuid, user in result.all():
+            authors.setdefault(resource_uuid, []).append(user)
+        return authors
+
+    async def _load_by_id(self, model, ids: list[int]) -> dict[int, Any]:
+        statement = select(model).where(model.id.in_(ids))
+        result = await self.db_session.exec(statement)
+        return {row.id: row for row in result.all()}
+
+
+def get_loaders(request: Request, db_session: AsyncSession) -> Loaders:
+    """
+    Loaders of the current request, created on first use
+    """
+    state = getattr(request, "state", None)
+    loaders: Optional[Loaders] = getattr(state, "loaders", None)
+
+    # A request using another session (or no request, e.g. the CLI) gets its own loaders
+    if loaders is None or loaders.db_session is not db_session:
+        loaders = Loaders(db_session)
+        if state is not None:
+            state.loaders = loaders
+
+    return loaders
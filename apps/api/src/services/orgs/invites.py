@@ -5,7 +5,8 @@ import uuid
 from pydantic import EmailStr
 import redis
 from datetime import datetime, timedelta
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.services.email.utils import send_email
 from config.config import get_learnhouse_config
 from src.services.orgs.orgs import rbac_check
@@ -21,7 +22,7 @@ async def create_invite_code(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Redis init
     LH_CONFIG = get_learnhouse_config()
@@ -34,7 +35,7 @@ async def create_invite_code(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -99,7 +100,7 @@ async def create_invite_code_with_usergroup(
     org_id: int,
     usergroup_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Redis init
     LH_CONFIG = get_learnhouse_config()
@@ -112,7 +113,7 @@ async def create_invite_code_with_usergroup(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -177,7 +178,7 @@ async def get_invite_codes(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Redis init
     LH_CONFIG = get_learnhouse_config()
@@ -190,7 +191,7 @@ async def get_invite_codes(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -232,7 +233,7 @@ async def get_invite_code(
     org_id: int,
     invite_code: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Redis init
     LH_CONFIG = get_learnhouse_config()
@@ -245,7 +246,7 @@ async def get_invite_code(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -287,7 +288,7 @@ async def delete_invite_code(
     org_id: int,
     invite_code_uuid: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Redis init
     LH_CONFIG = get_learnhouse_config()
@@ -300,7 +301,7 @@ async def delete_invite_code(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Optional
 from fastapi import HTTPException, Request
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.organizations import Organization
 from src.db.user_organizations import UserOrganization
 from src.db.users import AnonymousUser, PublicUser, User
@@ -24,10 +25,10 @@ async def join_org(
     request: Request,
     args: JoinOrg,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == args.org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -37,7 +38,7 @@ async def join_org(
             detail="Organization not found",
         )
 
-    check_limits_with_usage("members", org.id, db_session)
+    await check_limits_with_usage("members", org.id, db_session)
 
     join_method = await get_org_join_mechanism(
         request, args.org_id, current_user, db_session
@@ -45,7 +46,7 @@ async def join_org(
 
     # Get User
     statement = select(User).where(User.id == args.user_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     user = result.first()
 
@@ -53,7 +54,7 @@ async def join_org(
     statement = select(UserOrganization).where(
         UserOrganization.user_id == args.user_id, UserOrganization.org_id == args.org_id
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     userorg = result.first()
 
@@ -86,7 +87,7 @@ async def join_org(
             )
 
             db_session.add(user_organization)
-            db_session.commit()
+            await db_session.commit()
 
             return "Great, You're part of the Organization"
 
@@ -108,7 +109,7 @@ async def join_org(
             )
 
             db_session.add(user_organization)
-            db_session.commit()
+            await db_session.commit()
 
             increase_feature_usage("members", org.id, db_session)
 
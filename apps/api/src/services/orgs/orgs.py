@@ -1,9 +1,11 @@
 import json
 import logging
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional
 from uuid import uuid4
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.http_cache import check_not_modified, make_etag
 from src.db.organization_config import (
     AIOrgConfig,
     APIOrgConfig,
@@ -34,7 +36,7 @@ from src.db.organizations import (
     OrganizationRead,
     OrganizationUpdate,
 )
-from fastapi import HTTPException, UploadFile, status, Request
+from fastapi import HTTPException, Response, UploadFile, status, Request
 
 from src.services.orgs.uploads import upload_org_logo, upload_org_thumbnail
 
@@ -42,11 +44,11 @@ from src.services.orgs.uploads import upload_org_logo, upload_org_thumbnail
 async def get_organization(
     request: Request,
     org_id: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ) -> OrganizationRead:
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -61,7 +63,7 @@ async def get_organization(
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -78,11 +80,12 @@ async def get_organization(
 async def get_organization_by_slug(
     request: Request,
     org_slug: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
-) -> OrganizationRead:
+    response: Optional[Response] = None,
+) -> OrganizationRead | Response:
     statement = select(Organization).where(Organization.slug == org_slug)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -97,13 +100,27 @@ async def get_organization_by_slug(
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
     if org_config is None:
         logging.error(f"Organization {org_slug} has no config")
 
+    # Every change to an org or its config bumps its update date
+    etag = make_etag(
+        "org",
+        org.id,
+        org.update_date,
+        org_config.id if org_config else None,
+        org_config.update_date if org_config else None,
+    )
+    not_modified = check_not_modified(
+        request, response, etag, public=isinstance(current_user, AnonymousUser)
+    )
+    if not_modified:
+        return not_modified
+
     config = OrganizationConfig.model_validate(org_config) if org_config else {}
 
     org = OrganizationRead(**org.model_dump(), config=config)
@@ -115,10 +132,10 @@ async def create_org(
     request: Request,
     org_object: OrganizationCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.slug == org_object.slug)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -142,8 +159,8 @@ async def create_org(
     org.update_date = str(datetime.now())
 
     db_session.add(org)
-    db_session.commit()
-    db_session.refresh(org)
+    await db_session.commit()
+    await db_session.refresh(org)
 
     # Link user to org
     user_org = UserOrganization(
@@ -155,8 +172,8 @@ async def create_org(
     )
 
     db_session.add(user_org)
-    db_session.commit()
-    db_session.refresh(user_org)
+    await db_session.commit()
+    await db_session.refresh(user_org)
 
     org_config = org_config = OrganizationConfigBase(
         config_version="1.1å",
@@ -194,12 +211,12 @@ async def create_org(
     )
 
     db_session.add(org_settings)
-    db_session.commit()
-    db_session.refresh(org_settings)
+    await db_session.commit()
+    await db_session.refresh(org_settings)
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -217,11 +234,11 @@ async def create_org_with_config(
     request: Request,
     org_object: OrganizationCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
     submitted_config: OrganizationConfigBase,
 ):
     statement = select(Organization).where(Organization.slug == org_object.slug)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -245,8 +262,8 @@ async def create_org_with_config(
     org.update_date = str(datetime.now())
 
     db_session.add(org)
-    db_session.commit()
-    db_session.refresh(org)
+    await db_session.commit()
+    await db_session.refresh(org)
 
     # Link user to org
     user_org = UserOrganization(
@@ -258,8 +275,8 @@ async def create_org_with_config(
     )
 
     db_session.add(user_org)
-    db_session.commit()
-    db_session.refresh(user_org)
+    await db_session.commit()
+    await db_session.refresh(user_org)
 
     org_config = submitted_config
 
@@ -274,12 +291,12 @@ async def create_org_with_config(
     )
 
     db_session.add(org_settings)
-    db_session.commit()
-    db_session.refresh(org_settings)
+    await db_session.commit()
+    await db_session.refresh(org_settings)
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -298,10 +315,10 @@ async def update_org(
     org_object: OrganizationUpdate,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -316,7 +333,7 @@ async def update_org(
 
     # Verify if the new slug is already in use
     statement = select(Organization).where(Organization.slug == org_object.slug)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     slug_available = result.first()
 
@@ -335,8 +352,8 @@ async def update_org(
     org.update_date = str(datetime.now())
 
     db_session.add(org)
-    db_session.commit()
-    db_session.refresh(org)
+    await db_session.commit()
+    await db_session.refresh(org)
 
     org = OrganizationRead.model_validate(org)
 
@@ -347,10 +364,10 @@ async def update_org_with_config_no_auth(
     request: Request,
     orgconfig: OrganizationConfigBase,
     org_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -362,7 +379,7 @@ async def update_org_with_config_no_auth(
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -380,8 +397,8 @@ async def update_org_with_config_no_auth(
     org_config.update_date = str(datetime.now())
 
     db_session.add(org_config)
-    db_session.commit()
-    db_session.refresh(org_config)
+    await db_session.commit()
+    await db_session.refresh(org_config)
 
     return {"detail": "Organization updated"}
 
@@ -391,10 +408,10 @@ async def update_org_logo(
     logo_file: UploadFile,
     org_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -417,8 +434,8 @@ async def update_org_logo(
     org.update_date = str(datetime.now())
 
     db_session.add(org)
-    db_session.commit()
-    db_session.refresh(org)
+    await db_session.commit()
+    await db_session.refresh(org)
 
     return {"detail": "Logo updated"}
 
@@ -427,10 +444,10 @@ async def update_org_thumbnail(
     thumbnail_file: UploadFile,
     org_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -453,8 +470,8 @@ async def update_org_thumbnail(
     org.update_date = str(datetime.now())
 
     db_session.add(org)
-    db_session.commit()
-    db_session.refresh(org)
+    await db_session.commit()
+    await db_session.refresh(org)
 
     return {"detail": "Thumbnail updated"}
 
@@ -463,10 +480,10 @@ async def delete_org(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -479,27 +496,27 @@ async def delete_org(
     # RBAC check
     await rbac_check(request, org.org_uuid, current_user, "delete", db_session)
 
-    db_session.delete(org)
-    db_session.commit()
+    await db_session.delete(org)
+    await db_session.commit()
 
     # Delete links to org
     statement = select(UserOrganization).where(UserOrganization.org_id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     user_orgs = result.all()
 
     for user_org in user_orgs:
-        db_session.delete(user_org)
-        db_session.commit()
+        await db_session.delete(user_org)
+        await db_session.commit()
 
-    db_session.refresh(org)
+    await db_session.refresh(org)
 
     return {"detail": "Organization deleted"}
 
 
 async def get_orgs_by_user_admin(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     user_id: str,
     page: int = 1,
     limit: int = 10,
@@ -517,7 +534,7 @@ async def get_orgs_by_user_admin(
     )
 
     # Get organizations where the user is an admin
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     orgs = result.all()
 
     orgsWithConfig = []
@@ -528,7 +545,7 @@ async def get_orgs_by_user_admin(
         statement = select(OrganizationConfig).where(
             OrganizationConfig.org_id == org.id
         )
-        result = db_session.exec(statement)
+        result = await db_session.exec(statement)
 
         org_config = result.first()
 
@@ -543,7 +560,7 @@ async def get_orgs_by_user_admin(
 
 async def get_orgs_by_user(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     user_id: str,
     page: int = 1,
     limit: int = 10,
@@ -558,7 +575,7 @@ async def get_orgs_by_user(
     )
 
     # Get organizations where the user is an admin
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     orgs = result.all()
 
     orgsWithConfig = []
@@ -569,7 +586,7 @@ async def get_orgs_by_user(
         statement = select(OrganizationConfig).where(
             OrganizationConfig.org_id == org.id
         )
-        result = db_session.exec(statement)
+        result = await db_session.exec(statement)
 
         org_config = result.first()
 
@@ -588,10 +605,10 @@ async def update_org_signup_mechanism(
     signup_mechanism: Literal["open", "inviteOnly"],
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -606,7 +623,7 @@ async def update_org_signup_mechanism(
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -628,8 +645,8 @@ async def update_org_signup_mechanism(
     org_config.update_date = str(datetime.now())
 
     db_session.add(org_config)
-    db_session.commit()
-    db_session.refresh(org_config)
+    await db_session.commit()
+    await db_session.refresh(org_config)
 
     return {"detail": "Signup mechanism updated"}
 
@@ -638,10 +655,10 @@ async def get_org_join_mechanism(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -656,7 +673,7 @@ async def get_org_join_mechanism(
 
     # Get org config
     statement = select(OrganizationConfig).where(OrganizationConfig.org_id == org.id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org_config = result.first()
 
@@ -684,7 +701,7 @@ async def rbac_check(
     org_uuid: str,
     current_user: PublicUser | AnonymousUser | InternalUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Organizations are readable by anyone
     if action == "read":
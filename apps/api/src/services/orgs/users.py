@@ -1,14 +1,18 @@
 from datetime import datetime, timedelta
 import json
 import logging
+from typing import Optional
 
 import redis
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.pagination import DEFAULT_PAGE_LIMIT, Page, paginate
 from src.security.features_utils.usage import decrease_feature_usage
 from src.services.orgs.invites import send_invite_email
 from config.config import get_learnhouse_config
 from src.services.orgs.orgs import rbac_check
+from src.services.loaders import get_loaders
 from src.db.roles import Role, RoleRead
 from src.db.users import AnonymousUser, PublicUser, User, UserRead
 from src.db.user_organizations import UserOrganization
@@ -19,14 +23,14 @@ from src.db.organizations import (
 )
 
 
-async def get_organization_users(
+async def get_organization_for_users(
     request: Request,
     org_id: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
-) -> list[OrganizationUser]:
+) -> Organization:
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -39,46 +43,32 @@ async def get_organization_users(
     # RBAC check
     await rbac_check(request, org.org_uuid, current_user, "read", db_session)
 
-    statement = (
-        select(User)
-        .join(UserOrganization)
-        .join(Organization)
-        .where(Organization.id == org_id)
-    )
-    users = db_session.exec(statement)
-    users = users.all()
-
-    org_users_list = []
-
-    for user in users:
-        statement = select(UserOrganization).where(
-            UserOrganization.user_id == user.id, UserOrganization.org_id == org_id
-        )
-        result = db_session.exec(statement)
-        user_org = result.first()
-
-        if not user_org:
-            logging.error(f"User {user.id} not found")
+    return org
 
-            # skip this user
-            continue
 
-        statement = select(Role).where(Role.id == user_org.role_id)
-        result = db_session.exec(statement)
+async def get_organization_user_reads(
+    request: Request,
+    user_orgs: list[UserOrganization],
+    db_session: AsyncSession,
+) -> list[OrganizationUser]:
+    # Users and roles of the whole listing, one query each
+    loaders = get_loaders(request, db_session)
+    users = await loaders.users_by_id.load_many(
+        [user_org.user_id for user_org in user_orgs]
+    )
+    roles = await loaders.roles_by_id.load_many(
+        [user_org.role_id for user_org in user_orgs]
+    )
 
-        role = result.first()
+    org_users_list = []
 
+    for user_org, user, role in zip(user_orgs, users, roles):
         if not role:
             logging.error(f"Role {user_org.role_id} not found")
 
             # skip this user
             continue
 
-        statement = select(User).where(User.id == user_org.user_id)
-        result = db_session.exec(statement)
-
-        user = result.first()
-
         if not user:
             logging.error(f"User {user_org.user_id} not found")
 
@@ -98,15 +88,56 @@ async def get_organization_users(
     return org_users_list
 
 
+async def get_organization_users(
+    request: Request,
+    org_id: str,
+    db_session: AsyncSession,
+    current_user: PublicUser | AnonymousUser,
+) -> list[OrganizationUser]:
+    org = await get_organization_for_users(request, org_id, db_session, current_user)
+
+    statement = (
+        select(UserOrganization)
+        .where(UserOrganization.org_id == org.id)
+        .order_by(UserOrganization.id)  # type: ignore
+    )
+    user_orgs = (await db_session.exec(statement)).all()
+
+    return await get_organization_user_reads(request, list(user_orgs), db_session)
+
+
+async def get_organization_users_page(
+    request: Request,
+    org_id: str,
+    db_session: AsyncSession,
+    current_user: PublicUser | AnonymousUser,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    include_total: bool = False,
+) -> Page[OrganizationUser]:
+    org = await get_organization_for_users(request, org_id, db_session, current_user)
+
+    page = await paginate(
+        select(UserOrganization).where(UserOrganization.org_id == org.id),
+        UserOrganization.id,
+        db_session,
+        cursor,
+        limit,
+        include_total,
+    )
+    org_users = await get_organization_user_reads(request, page.items, db_session)
+    return page.copy(update={"items": org_users})
+
+
 async def remove_user_from_org(
     request: Request,
     org_id: int,
     user_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ):
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -122,7 +153,7 @@ async def remove_user_from_org(
     statement = select(UserOrganization).where(
         UserOrganization.user_id == user_id, UserOrganization.org_id == org.id
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     user_org = result.first()
 
@@ -136,7 +167,7 @@ async def remove_user_from_org(
     statement = select(UserOrganization).where(
         UserOrganization.org_id == org.id, UserOrganization.role_id == 1
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     admins = result.all()
 
     if len(admins) == 1 and admins[0].user_id == user_id:
@@ -145,8 +176,8 @@ async def remove_user_from_org(
             detail="You can't remove the last admin of the organization",
         )
 
-    db_session.delete(user_org)
-    db_session.commit()
+    await db_session.delete(user_org)
+    await db_session.commit()
 
     decrease_feature_usage("members", org_id, db_session)
 
@@ -158,12 +189,12 @@ async def update_user_role(
     org_id: str,
     user_id: str,
     role_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ):
     # find role
     statement = select(Role).where(Role.role_uuid == role_uuid)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     role = result.first()
 
@@ -176,7 +207,7 @@ async def update_user_role(
     role_id = role.id
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -193,7 +224,7 @@ async def update_user_role(
     statement = select(UserOrganization).where(
         UserOrganization.org_id == org.id, UserOrganization.role_id == 1
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
     admins = result.all()
 
     if not admins:
@@ -215,7 +246,7 @@ async def update_user_role(
     statement = select(UserOrganization).where(
         UserOrganization.user_id == user_id, UserOrganization.org_id == org.id
     )
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     user_org = result.first()
 
@@ -229,8 +260,8 @@ async def update_user_role(
         user_org.role_id = role_id
 
     db_session.add(user_org)
-    db_session.commit()
-    db_session.refresh(user_org)
+    await db_session.commit()
+    await db_session.refresh(user_org)
 
     return {"detail": "User role updated"}
 
@@ -240,7 +271,7 @@ async def invite_batch_users(
     org_id: int,
     emails: str,
     invite_code_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ):
     # Redis init
@@ -254,7 +285,7 @@ async def invite_batch_users(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -266,7 +297,7 @@ async def invite_batch_users(
 
     # get User sender
     statement = select(User).where(User.id == current_user.id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     # RBAC check
     await rbac_check(request, org.org_uuid, current_user, "create", db_session)
@@ -329,7 +360,7 @@ async def invite_batch_users(
 async def get_list_of_invited_users(
     request: Request,
     org_id: int,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ):
     # Redis init
@@ -343,7 +374,7 @@ async def get_list_of_invited_users(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
@@ -382,7 +413,7 @@ async def remove_invited_user(
     request: Request,
     org_id: int,
     email: str,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ):
     # Redis init
@@ -396,7 +427,7 @@ async def remove_invited_user(
         )
 
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     org = result.first()
 
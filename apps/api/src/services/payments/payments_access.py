@@ -1,4 +1,5 @@
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.rbac.rbac import authorization_verify_if_user_is_author
 from src.db.payments.payments_users import PaymentStatusEnum, PaymentsUser
 from src.db.users import PublicUser, AnonymousUser
@@ -11,7 +12,7 @@ async def check_activity_paid_access(
     request: Request,
     activity_id: int,
     user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> bool:
     """
     Check if a user has access to a specific activity
@@ -24,14 +25,16 @@ async def check_activity_paid_access(
 
     # Get activity and associated course
     statement = select(Activity).where(Activity.id == activity_id)
-    activity = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    activity = result.first()
 
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Check if course exists
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    course = result.first()
 
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -44,7 +47,8 @@ async def check_activity_paid_access(
 
     # Check if course is linked to a product
     statement = select(PaymentsCourse).where(PaymentsCourse.course_id == course.id)
-    course_payment = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    course_payment = result.first()
 
     # If course is not linked to any product, it's free
     if not course_payment:
@@ -62,14 +66,15 @@ async def check_activity_paid_access(
             [PaymentStatusEnum.ACTIVE, PaymentStatusEnum.COMPLETED]
         ),
     )
-    access = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    access = result.first()
 
     return bool(access)
 
 async def check_course_paid_access(
     course_id: int,
     user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> bool:
     """
     Check if a user has paid access to a specific course
@@ -80,14 +85,14 @@ async def check_course_paid_access(
     """
     # Check if course exists
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
     # Check if course is linked to a product
     statement = select(PaymentsCourse).where(PaymentsCourse.course_id == course.id)
-    course_payment = db_session.exec(statement).first()
+    course_payment = (await db_session.exec(statement)).first()
 
     # If course is not linked to any product, it's free
     if not course_payment:
@@ -101,6 +106,6 @@ async def check_course_paid_access(
             [PaymentStatusEnum.ACTIVE, PaymentStatusEnum.COMPLETED]
         ),
     )
-    subscription = db_session.exec(statement).first()
+    subscription = (await db_session.exec(statement)).first()
 
     return bool(subscription)
@@ -1,6 +1,7 @@
 from typing import Literal
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.payments.payments import (
     PaymentProviderEnum,
     PaymentsConfig,
@@ -17,12 +18,12 @@ async def init_payments_config(
     org_id: int,
     provider: Literal["stripe"],
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsConfig:
     # Validate organization exists
-    org = db_session.exec(
+    org = (await db_session.exec(
         select(Organization).where(Organization.id == org_id)
-    ).first()
+    )).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -30,9 +31,9 @@ async def init_payments_config(
     await rbac_check(request, org.org_uuid, current_user, "create", db_session)
 
     # Check for existing config
-    existing_config = db_session.exec(
+    existing_config = (await db_session.exec(
         select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    ).first()
+    )).first()
     
     if existing_config:
         raise HTTPException(
@@ -52,8 +53,8 @@ async def init_payments_config(
 
     # Save to database
     db_session.add(new_config)
-    db_session.commit()
-    db_session.refresh(new_config)
+    await db_session.commit()
+    await db_session.refresh(new_config)
 
     return new_config
 
@@ -62,11 +63,11 @@ async def get_payments_config(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[PaymentsConfigRead]:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -75,7 +76,7 @@ async def get_payments_config(
 
     # Get payments config
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    configs = db_session.exec(statement).all()
+    configs = (await db_session.exec(statement)).all()
 
     return [PaymentsConfigRead.model_validate(config) for config in configs]
 
@@ -85,11 +86,11 @@ async def update_payments_config(
     org_id: int,
     payments_config: PaymentsConfigUpdate,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsConfig:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -98,7 +99,7 @@ async def update_payments_config(
 
     # Get existing payments config
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    config = db_session.exec(statement).first()
+    config = (await db_session.exec(statement)).first()
     if not config:
         raise HTTPException(status_code=404, detail="Payments config not found")
 
@@ -107,8 +108,8 @@ async def update_payments_config(
         setattr(config, key, value)
 
     db_session.add(config)
-    db_session.commit()
-    db_session.refresh(config)
+    await db_session.commit()
+    await db_session.refresh(config)
 
     return config
 
@@ -117,11 +118,11 @@ async def delete_payments_config(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> None:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -130,10 +131,10 @@ async def delete_payments_config(
 
     # Get existing payments config
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    config = db_session.exec(statement).first()
+    config = (await db_session.exec(statement)).first()
     if not config:
         raise HTTPException(status_code=404, detail="Payments config not found")
 
     # Delete config
-    db_session.delete(config)
-    db_session.commit()
+    await db_session.delete(config)
+    await db_session.commit()
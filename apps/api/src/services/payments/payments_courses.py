@@ -1,5 +1,6 @@
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.payments.payments_courses import PaymentsCourse
 from src.db.payments.payments_products import PaymentsProduct
 from src.db.courses.courses import Course
@@ -12,11 +13,11 @@ async def link_course_to_product(
     course_id: int,
     product_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if course exists and user has permission
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -29,14 +30,14 @@ async def link_course_to_product(
         PaymentsProduct.id == product_id,
         PaymentsProduct.org_id == org_id
     )
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
 
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
     # Check if course is already linked to another product
     statement = select(PaymentsCourse).where(PaymentsCourse.course_id == course.id)
-    existing_link = db_session.exec(statement).first()
+    existing_link = (await db_session.exec(statement)).first()
 
     if existing_link:
         raise HTTPException(
@@ -52,7 +53,7 @@ async def link_course_to_product(
     )
 
     db_session.add(payment_course)
-    db_session.commit()
+    await db_session.commit()
 
     return {"message": "Course linked to product successfully"}
 
@@ -61,11 +62,11 @@ async def unlink_course_from_product(
     org_id: int,
     course_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if course exists and user has permission
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -78,7 +79,7 @@ async def unlink_course_from_product(
         PaymentsCourse.course_id == course.id,
         PaymentsCourse.org_id == org_id
     )
-    payment_course = db_session.exec(statement).first()
+    payment_course = (await db_session.exec(statement)).first()
 
     if not payment_course:
         raise HTTPException(
@@ -86,8 +87,8 @@ async def unlink_course_from_product(
             detail="Course is not linked to any product"
         )
 
-    db_session.delete(payment_course)
-    db_session.commit()
+    await db_session.delete(payment_course)
+    await db_session.commit()
 
     return {"message": "Course unlinked from product successfully"}
 
@@ -96,14 +97,14 @@ async def get_courses_by_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if product exists
     statement = select(PaymentsProduct).where(
         PaymentsProduct.id == product_id,
         PaymentsProduct.org_id == org_id
     )
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
 
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -118,6 +119,6 @@ async def get_courses_by_product(
             PaymentsCourse.org_id == org_id
         )
     )
-    courses = db_session.exec(statement).all()
+    courses = (await db_session.exec(statement)).all()
 
     return courses
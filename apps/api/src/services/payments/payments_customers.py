@@ -1,5 +1,6 @@
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.organizations import Organization
 from src.db.users import PublicUser, AnonymousUser
 from src.db.payments.payments_users import PaymentsUser
@@ -11,11 +12,11 @@ async def get_customers(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -24,7 +25,7 @@ async def get_customers(
 
     # Get all payment users for the organization
     statement = select(PaymentsUser).where(PaymentsUser.org_id == org_id)
-    payment_users = db_session.exec(statement).all()
+    payment_users = (await db_session.exec(statement)).all()
 
     customers_data = []
     
@@ -1,5 +1,6 @@
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.courses.courses import Course
 from src.db.payments.payments import PaymentsConfig
 from src.db.payments.payments_courses import PaymentsCourse
@@ -22,11 +23,11 @@ async def create_payments_product(
     org_id: int,
     payments_product: PaymentsProductCreate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsProductRead:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -35,7 +36,7 @@ async def create_payments_product(
 
     # Check if payments config exists, has a valid id, and is active
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    config = db_session.exec(statement).first()
+    config = (await db_session.exec(statement)).first()
     if not config or config.id is None:
         raise HTTPException(status_code=404, detail="Valid payments config not found")
 
@@ -53,8 +54,8 @@ async def create_payments_product(
 
     # Save to DB
     db_session.add(new_product)
-    db_session.commit()
-    db_session.refresh(new_product)    
+    await db_session.commit()
+    await db_session.refresh(new_product)    
 
     return PaymentsProductRead.model_validate(new_product)
 
@@ -63,11 +64,11 @@ async def get_payments_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsProductRead:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -76,7 +77,7 @@ async def get_payments_product(
 
     # Get payments product
     statement = select(PaymentsProduct).where(PaymentsProduct.id == product_id, PaymentsProduct.org_id == org_id)
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
     if not product:
         raise HTTPException(status_code=404, detail="Payments product not found")
 
@@ -88,11 +89,11 @@ async def update_payments_product(
     product_id: int,
     payments_product: PaymentsProductUpdate,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsProductRead:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -101,7 +102,7 @@ async def update_payments_product(
 
     # Get existing payments product
     statement = select(PaymentsProduct).where(PaymentsProduct.id == product_id, PaymentsProduct.org_id == org_id)
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
     if not product:
         raise HTTPException(status_code=404, detail="Payments product not found")
 
@@ -112,8 +113,8 @@ async def update_payments_product(
     product.update_date = datetime.now()
 
     db_session.add(product)
-    db_session.commit()
-    db_session.refresh(product)
+    await db_session.commit()
+    await db_session.refresh(product)
 
     # Update product in Stripe
     await update_stripe_product(request, org_id, product.provider_product_id, product, current_user, db_session)
@@ -125,11 +126,11 @@ async def delete_payments_product(
     org_id: int,
     product_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> None:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -138,7 +139,7 @@ async def delete_payments_product(
 
     # Get existing payments product
     statement = select(PaymentsProduct).where(PaymentsProduct.id == product_id, PaymentsProduct.org_id == org_id)
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
     if not product:
         raise HTTPException(status_code=404, detail="Payments product not found")
     
@@ -147,7 +148,7 @@ async def delete_payments_product(
         PaymentsUser.payment_product_id == product_id,
         PaymentsUser.status.in_([PaymentStatusEnum.ACTIVE, PaymentStatusEnum.COMPLETED]) # type: ignore
     )
-    payment_users = db_session.exec(statement).all()
+    payment_users = (await db_session.exec(statement)).all()
     if payment_users:
         raise HTTPException(
             status_code=400, 
@@ -158,18 +159,18 @@ async def delete_payments_product(
     await archive_stripe_product(request, org_id, product.provider_product_id, current_user, db_session)
 
     # Delete product
-    db_session.delete(product)
-    db_session.commit()
+    await db_session.delete(product)
+    await db_session.commit()
 
 async def list_payments_products(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[PaymentsProductRead]:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -178,7 +179,7 @@ async def list_payments_products(
 
     # Get payments products ordered by id
     statement = select(PaymentsProduct).where(PaymentsProduct.org_id == org_id).order_by(PaymentsProduct.id.desc()) # type: ignore
-    products = db_session.exec(statement).all()
+    products = (await db_session.exec(statement)).all()
 
     return [PaymentsProductRead.model_validate(product) for product in products]
 
@@ -187,11 +188,11 @@ async def get_products_by_course(
     org_id: int,
     course_id: int,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[PaymentsProductRead]:
     # Check if course exists and user has permission
     statement = select(Course).where(Course.id == course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
@@ -209,7 +210,7 @@ async def get_products_by_course(
             PaymentsCourse.org_id == org_id
         )
     )
-    products = db_session.exec(statement).all()
+    products = (await db_session.exec(statement)).all()
 
     return [PaymentsProductRead.model_validate(product) for product in products]
 
@@ -1,7 +1,7 @@
 import logging
 from typing import Literal
 from fastapi import HTTPException, Request
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 import stripe
 from config.config import  get_learnhouse_config
 from src.db.payments.payments import PaymentsConfigUpdate, PaymentsConfig
@@ -28,7 +28,7 @@ async def get_stripe_connected_account_id(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Get payments config
     payments_config = await get_payments_config(request, org_id, current_user, db_session)
@@ -62,7 +62,7 @@ async def create_stripe_product(
     org_id: int,
     product_data: PaymentsProduct,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     creds = await get_stripe_internal_credentials()
 
@@ -109,7 +109,7 @@ async def archive_stripe_product(
     org_id: int,
     product_id: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     creds = await get_stripe_internal_credentials()
 
@@ -136,7 +136,7 @@ async def update_stripe_product(
     product_id: str,
     product_data: PaymentsProduct,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     creds = await get_stripe_internal_credentials()
 
@@ -203,7 +203,7 @@ async def create_checkout_session(
     product_id: int,
     redirect_uri: str,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Get Stripe credentials
     creds = await get_stripe_internal_credentials()
@@ -216,7 +216,7 @@ async def create_checkout_session(
     statement = select(PaymentsProduct).where(
         PaymentsProduct.id == product_id, PaymentsProduct.org_id == org_id
     )
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
 
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -325,7 +325,7 @@ async def generate_stripe_connect_link(
     org_id: int,
     redirect_uri: str,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     """
     Generate a Stripe OAuth link for connecting a Stripe account
@@ -353,7 +353,7 @@ async def create_stripe_account(
     org_id: int,
     type: Literal["standard"], # Only standard is supported for now, we'll see if we need express later
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     # Get credentials
     creds = await get_stripe_internal_credentials()
@@ -361,7 +361,7 @@ async def create_stripe_account(
 
     # Get existing payments config
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    existing_config = db_session.exec(statement).first()
+    existing_config = (await db_session.exec(statement)).first()
 
     if existing_config and existing_config.provider_specific_id:
         logging.error(f"A Stripe Account is already linked to this organization: {existing_config.provider_specific_id}")
@@ -400,14 +400,14 @@ async def update_stripe_account_id(
     org_id: int,
     stripe_account_id: str,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     """
     Update the Stripe account ID for an organization
     """
     # Get existing payments config
     statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-    existing_config = db_session.exec(statement).first()
+    existing_config = (await db_session.exec(statement)).first()
 
     if not existing_config:
         raise HTTPException(
@@ -435,7 +435,7 @@ async def handle_stripe_oauth_callback(
     org_id: int,
     code: str,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     """
     Handle the OAuth callback from Stripe and complete the account connection
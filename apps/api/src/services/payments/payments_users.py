@@ -1,14 +1,16 @@
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Any
 from src.db.courses.courses import Course, CourseRead
 from src.db.payments.payments_courses import PaymentsCourse
 from src.db.payments.payments_users import PaymentsUser, PaymentStatusEnum, ProviderSpecificData
 from src.db.payments.payments_products import PaymentsProduct
-from src.db.resource_authors import ResourceAuthor
-from src.db.users import InternalUser, PublicUser, AnonymousUser, User, UserRead
+from src.db.users import InternalUser, PublicUser, AnonymousUser, UserRead
 from src.db.organizations import Organization
+from src.security.rbac.rbac import authorize_many
 from src.services.orgs.orgs import rbac_check
+from src.services.loaders import get_loaders
 from datetime import datetime
 
 async def create_payment_user(
@@ -19,11 +21,11 @@ async def create_payment_user(
     status: PaymentStatusEnum,
     provider_data: Any,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsUser:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -35,7 +37,7 @@ async def create_payment_user(
         PaymentsProduct.id == product_id,
         PaymentsProduct.org_id == org_id
     )
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
@@ -49,7 +51,7 @@ async def create_payment_user(
         PaymentsUser.org_id == org_id,
         PaymentsUser.payment_product_id == product_id
     )
-    existing_payment_user = db_session.exec(statement).first()
+    existing_payment_user = (await db_session.exec(statement)).first()
 
     if existing_payment_user:
         # If status is PENDING, CANCELLED, or FAILED, delete the existing record
@@ -58,8 +60,8 @@ async def create_payment_user(
             PaymentStatusEnum.CANCELLED,
             PaymentStatusEnum.FAILED
         ]:
-            db_session.delete(existing_payment_user)
-            db_session.commit()
+            await db_session.delete(existing_payment_user)
+            await db_session.commit()
         else:
             raise HTTPException(status_code=400, detail="User already has purchase for this product")
 
@@ -73,8 +75,8 @@ async def create_payment_user(
     )
 
     db_session.add(payment_user)
-    db_session.commit()
-    db_session.refresh(payment_user)
+    await db_session.commit()
+    await db_session.refresh(payment_user)
 
     return payment_user
 
@@ -83,11 +85,11 @@ async def get_payment_user(
     org_id: int,
     payment_user_id: int,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsUser:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -99,7 +101,7 @@ async def get_payment_user(
         PaymentsUser.id == payment_user_id,
         PaymentsUser.org_id == org_id
     )
-    payment_user = db_session.exec(statement).first()
+    payment_user = (await db_session.exec(statement)).first()
     if not payment_user:
         raise HTTPException(status_code=404, detail="Payment user not found")
 
@@ -111,11 +113,11 @@ async def update_payment_user_status(
     payment_user_id: int,
     status: PaymentStatusEnum,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> PaymentsUser:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -127,7 +129,7 @@ async def update_payment_user_status(
         PaymentsUser.id == payment_user_id,
         PaymentsUser.org_id == org_id
     )
-    payment_user = db_session.exec(statement).first()
+    payment_user = (await db_session.exec(statement)).first()
     if not payment_user:
         raise HTTPException(status_code=404, detail="Payment user not found")
 
@@ -136,8 +138,8 @@ async def update_payment_user_status(
     payment_user.update_date = datetime.now()
 
     db_session.add(payment_user)
-    db_session.commit()
-    db_session.refresh(payment_user)
+    await db_session.commit()
+    await db_session.refresh(payment_user)
 
     return payment_user
 
@@ -145,11 +147,11 @@ async def list_payment_users(
     request: Request,
     org_id: int,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[PaymentsUser]:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -160,7 +162,7 @@ async def list_payment_users(
     statement = select(PaymentsUser).where(
         PaymentsUser.org_id == org_id
     ).order_by(PaymentsUser.id.desc()) # type: ignore
-    payment_users = list(db_session.exec(statement).all())  # Convert to list
+    payment_users = list((await db_session.exec(statement)).all())  # Convert to list
 
     return payment_users
 
@@ -169,11 +171,11 @@ async def delete_payment_user(
     org_id: int,
     payment_user_id: int,
     current_user: PublicUser | AnonymousUser | InternalUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> None:
     # Check if organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
 
@@ -185,19 +187,19 @@ async def delete_payment_user(
         PaymentsUser.id == payment_user_id,
         PaymentsUser.org_id == org_id
     )
-    payment_user = db_session.exec(statement).first()
+    payment_user = (await db_session.exec(statement)).first()
     if not payment_user:
         raise HTTPException(status_code=404, detail="Payment user not found")
 
     # Delete payment user
-    db_session.delete(payment_user)
-    db_session.commit()
+    await db_session.delete(payment_user)
+    await db_session.commit()
 
 
 async def get_owned_courses(
     request: Request,
     current_user: PublicUser | AnonymousUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> list[CourseRead]:
     # Anonymous users don't own any courses
     if isinstance(current_user, AnonymousUser):
@@ -208,37 +210,37 @@ async def get_owned_courses(
         PaymentsUser.user_id == current_user.id,
         PaymentsUser.status.in_([PaymentStatusEnum.ACTIVE, PaymentStatusEnum.COMPLETED])  # type: ignore
     )
-    payment_users = db_session.exec(statement).all()
+    payment_users = (await db_session.exec(statement)).all()
 
     # Get all product IDs from payment users
     product_ids = [pu.payment_product_id for pu in payment_users]
 
-    # Get all courses linked to these products
-    courses = []
-    for product_id in product_ids:
-        # Get courses linked to this product through PaymentsCourse
-        statement = (
-            select(Course)
-            .join(PaymentsCourse, Course.id == PaymentsCourse.course_id)  # type: ignore
-            .where(PaymentsCourse.payment_product_id == product_id)
-        )
-        product_courses = db_session.exec(statement).all()
-        courses.extend(product_courses)
+    # Get all courses linked to these products through PaymentsCourse
+    statement = (
+        select(Course)
+        .join(PaymentsCourse, Course.id == PaymentsCourse.course_id)  # type: ignore
+        .where(PaymentsCourse.payment_product_id.in_(product_ids))  # type: ignore
+    )
+    courses = (await db_session.exec(statement)).all()
 
     # Remove duplicates by converting to set and back to list
     unique_courses = list({course.id: course for course in courses}.values())
 
-    # Get authors for each course and convert to CourseRead
-    course_reads = []
-    for course in unique_courses:
-        # Get course authors
-        authors_statement = (
-            select(User)
-            .join(ResourceAuthor)
-            .where(ResourceAuthor.resource_uuid == course.course_uuid)
-        )
-        authors = db_session.exec(authors_statement).all()
+    # RBAC check of the owned courses
+    allowed = await authorize_many(
+        current_user, "read", [course.course_uuid for course in unique_courses], db_session
+    )
+    unique_courses = [course for course in unique_courses if allowed[course.course_uuid]]
 
+    # Get the authors of every course and convert to CourseRead
+    authors_by_course = await get_loaders(
+        request, db_session
+    ).authors_by_resource_uuid.load_many(
+        [course.course_uuid for course in unique_courses]
+    )
+
+    course_reads = []
+    for course, authors in zip(unique_courses, authors_by_course):
         # Convert authors to UserRead
         author_reads = [UserRead.model_validate(author) for author in authors]
 
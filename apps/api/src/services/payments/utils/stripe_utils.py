@@ -1,5 +1,6 @@
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 import stripe
 import logging
 
@@ -9,12 +10,12 @@ from src.db.payments.payments import PaymentsConfig
 
 logger = logging.getLogger(__name__)
 
-async def get_user_from_customer(customer_id: str, db_session: Session) -> User:
+async def get_user_from_customer(customer_id: str, db_session: AsyncSession) -> User:
     """Helper function to get user from Stripe customer ID"""
     try:
         customer = stripe.Customer.retrieve(customer_id)
         statement = select(User).where(User.email == customer.email)
-        user = db_session.exec(statement).first()
+        user = (await db_session.exec(statement)).first()
         if not user:
             raise HTTPException(
                 status_code=404, detail=f"User not found for customer {customer_id}"
@@ -28,13 +29,13 @@ async def get_user_from_customer(customer_id: str, db_session: Session) -> User:
 
 
 async def get_product_from_stripe_id(
-    product_id: str, db_session: Session
+    product_id: str, db_session: AsyncSession
 ) -> PaymentsProduct:
     """Helper function to get product from Stripe product ID"""
     statement = select(PaymentsProduct).where(
         PaymentsProduct.provider_product_id == product_id
     )
-    product = db_session.exec(statement).first()
+    product = (await db_session.exec(statement)).first()
     if not product:
         raise HTTPException(status_code=404, detail=f"Product not found: {product_id}")
     return product
@@ -42,13 +43,13 @@ async def get_product_from_stripe_id(
 
 async def get_org_id_from_stripe_account(
     stripe_account_id: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> int:
     """Get organization ID from Stripe account ID"""
     statement = select(PaymentsConfig).where(
         PaymentsConfig.provider_specific_id == stripe_account_id
     )
-    config = db_session.exec(statement).first()
+    config = (await db_session.exec(statement)).first()
 
     if not config:
         raise HTTPException(
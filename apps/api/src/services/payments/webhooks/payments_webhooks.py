@@ -1,6 +1,7 @@
 from typing import Literal
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 import stripe
 import logging
 from src.db.payments.payments_users import PaymentStatusEnum
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 async def handle_stripe_webhook(
     request: Request,
     webhook_type: Literal["connect", "standard"],
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> dict:
     # Get Stripe credentials
     creds = await get_stripe_internal_credentials()
@@ -57,7 +58,7 @@ async def handle_stripe_webhook(
         # Handle internal account events
         if event_type == 'account.application.authorized':
             statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-            config = db_session.exec(statement).first()
+            config = (await db_session.exec(statement)).first()
             
             if not config:
                 logger.error("No payments configuration found for this organization")
@@ -88,7 +89,7 @@ async def handle_stripe_webhook(
 
         elif event_type == 'account.application.deauthorized':
             statement = select(PaymentsConfig).where(PaymentsConfig.org_id == org_id)
-            config = db_session.exec(statement).first()
+            config = (await db_session.exec(statement)).first()
             
             if not config:
                 raise HTTPException(
@@ -1,6 +1,7 @@
 from typing import Literal
 from uuid import uuid4
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.rbac.rbac import (
     authorization_verify_based_on_roles_and_authorship,
     authorization_verify_if_user_is_anon,
@@ -13,7 +14,7 @@ from datetime import datetime
 
 async def create_role(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     role_object: RoleCreate,
     current_user: PublicUser,
 ):
@@ -28,8 +29,8 @@ async def create_role(
     role.update_date = str(datetime.now())
 
     db_session.add(role)
-    db_session.commit()
-    db_session.refresh(role)
+    await db_session.commit()
+    await db_session.refresh(role)
 
     role = RoleRead(**role.model_dump())
 
@@ -37,10 +38,10 @@ async def create_role(
 
 
 async def read_role(
-    request: Request, db_session: Session, role_id: str, current_user: PublicUser
+    request: Request, db_session: AsyncSession, role_id: str, current_user: PublicUser
 ):
     statement = select(Role).where(Role.id == role_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     role = result.first()
 
@@ -60,12 +61,12 @@ async def read_role(
 
 async def update_role(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     role_object: RoleUpdate,
     current_user: PublicUser,
 ):
     statement = select(Role).where(Role.id == role_object.role_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     role = result.first()
 
@@ -90,8 +91,8 @@ async def update_role(
             setattr(role, var, value)
 
     db_session.add(role)
-    db_session.commit()
-    db_session.refresh(role)
+    await db_session.commit()
+    await db_session.refresh(role)
 
     role = RoleRead(**role.model_dump())
 
@@ -99,13 +100,13 @@ async def update_role(
 
 
 async def delete_role(
-    request: Request, db_session: Session, role_id: str, current_user: PublicUser
+    request: Request, db_session: AsyncSession, role_id: str, current_user: PublicUser
 ):
     # RBAC check
     await rbac_check(request, current_user, "delete", role_id, db_session)
 
     statement = select(Role).where(Role.id == role_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     role = result.first()
 
@@ -115,8 +116,8 @@ async def delete_role(
             detail="Role not found",
         )
 
-    db_session.delete(role)
-    db_session.commit()
+    await db_session.delete(role)
+    await db_session.commit()
 
     return "Role deleted"
 
@@ -129,7 +130,7 @@ async def rbac_check(
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
     role_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     await authorization_verify_if_user_is_anon(current_user.id)
 
@@ -0,0 +1,152 @@
+"""
+Incremental maintenance of the full-text search index.
+
+Every flush that creates, changes or deletes a course, an activity or a
+collection rewrites its search document in the same transaction, so the
+index follows the create / update / delete services (and rolls back with
+them). `reindex_search_documents` rebuilds it from scratch.
+"""
+
+from typing import Any, Optional
+from sqlalchemy import delete, event, insert, or_
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session, select
+from src.db.collections import Collection
+from src.db.courses.activities import Activity
+from src.db.courses.courses import Course
+from src.db.search_documents import SearchDocument, SearchResourceTypeEnum
+
+INDEXED_MODELS = (Course, Activity, Collection)
+
+# Longer activities are only searchable by their beginning
+MAX_BODY_LENGTH = 100_000
+
+REINDEX_BATCH_SIZE = 500
+
+
+def extract_text(content: Any) -> str:
+    """
+    Text of a rich text document (activity content), in document order
+    """
+    parts = []
+    stack = [content]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            text = node.get("text")
+            if isinstance(text, str):
+                parts.append(text)
+            stack.extend(
+                reversed([value for key, value in node.items() if key != "text"])
+            )
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return " ".join(parts)[:MAX_BODY_LENGTH]
+
+
+def get_resource_uuid(instance) -> str:
+    if isinstance(instance, Course):
+        return instance.course_uuid
+    if isinstance(instance, Activity):
+        return instance.activity_uuid
+    return instance.collection_uuid
+
+
+def get_search_document(instance) -> Optional[dict]:
+    """
+    Row of the search document of a course, activity or collection
+    """
+    resource_uuid = get_resource_uuid(instance)
+    if not resource_uuid or instance.org_id is None:
+        return None
+
+    if isinstance(instance, Course):
+        return dict(
+            org_id=instance.org_id,
+            resource_type=SearchResourceTypeEnum.COURSE,
+            resource_uuid=resource_uuid,
+            course_id=instance.id,
+            title=instance.name,
+            body=" ".join(filter(None, [instance.description, instance.about])),
+        )
+    if isinstance(instance, Activity):
+        return dict(
+            org_id=instance.org_id,
+            resource_type=SearchResourceTypeEnum.ACTIVITY,
+            resource_uuid=resource_uuid,
+            course_id=instance.course_id,
+            title=instance.name,
+            body=extract_text(instance.content),
+        )
+    return dict(
+        org_id=instance.org_id,
+        resource_type=SearchResourceTypeEnum.COLLECTION,
+        resource_uuid=resource_uuid,
+        course_id=None,
+        title=instance.name,
+        body=instance.description or "",
+    )
+
+
+@event.listens_for(SASession, "after_flush")
+def _index_search_documents(session, flush_context):
+    documents = {}
+    removed_uuids = set()
+    removed_course_ids = set()
+
+    for instance in session.deleted:
+        if isinstance(instance, INDEXED_MODELS):
+            removed_uuids.add(get_resource_uuid(instance))
+            # Activities are deleted with their course by the database
+            if isinstance(instance, Course):
+                removed_course_ids.add(instance.id)
+
+    for instance in (*session.new, *session.dirty):
+        if isinstance(instance, INDEXED_MODELS) and instance not in session.deleted:
+            document = get_search_document(instance)
+            if document:
+                documents[document["resource_uuid"]] = document
+
+    if not documents and not removed_uuids:
+        return
+
+    connection = session.connection()
+    connection.execute(
+        delete(SearchDocument).where(
+            or_(
+                SearchDocument.resource_uuid.in_([*removed_uuids, *documents]),  # type: ignore
+                SearchDocument.course_id.in_(removed_course_ids),  # type: ignore
+            )
+        )
+    )
+    if documents:
+        connection.execute(insert(SearchDocument), list(documents.values()))
+
+
+def reindex_search_documents(db_session: Session, org_id: Optional[int] = None) -> int:
+    """
+    Rebuild the search documents (of an org), returns the number of documents
+    """
+    statement = delete(SearchDocument)
+    if org_id is not None:
+        statement = statement.where(SearchDocument.org_id == org_id)
+    db_session.connection().execute(statement)
+
+    count = 0
+    for model in INDEXED_MODELS:
+        statement = select(model).execution_options(yield_per=REINDEX_BATCH_SIZE)
+        if org_id is not None:
+            statement = statement.where(model.org_id == org_id)
+
+        for partition in db_session.exec(statement).partitions():
+            documents = [
+                document
+                for document in map(get_search_document, partition)
+                if document
+            ]
+            if documents:
+                db_session.connection().execute(insert(SearchDocument), documents)
+                count += len(documents)
+
+    db_session.commit()
+    return count
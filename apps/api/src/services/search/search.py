@@ -0,0 +1,115 @@
+import re
+from typing import List
+from fastapi import HTTPException, Request
+from sqlalchemy import and_, column, func, literal_column, or_, table
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.db.collections import Collection
+from src.db.courses.courses import Course
+from src.db.organizations import Organization
+from src.db.search_documents import (
+    SEARCH_TEXT_CONFIG,
+    SEARCH_TSVECTOR,
+    SearchDocument,
+    SearchResourceTypeEnum,
+    SearchResult,
+)
+from src.db.users import AnonymousUser, PublicUser
+from src.security.rbac.rbac import get_visibility_filter
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+MAX_QUERY_TERMS = 8
+EXCERPT_LENGTH = 200
+
+
+def get_query_terms(query: str) -> list[str]:
+    """
+    Words of a query, anything else is dropped so that no user input reaches
+    the full-text query syntax
+    """
+    return re.findall(r"\w+", query.lower())[:MAX_QUERY_TERMS]
+
+
+def get_match_and_rank(terms: list[str], dialect_name: str):
+    """
+    Full-text condition matching every term as a prefix, and its rank ordering
+    """
+    if dialect_name == "postgresql":
+        tsvector = literal_column(SEARCH_TSVECTOR)
+        tsquery = func.to_tsquery(
+            SEARCH_TEXT_CONFIG, " & ".join(f"{term}:*" for term in terms)
+        )
+        return tsvector.op("@@")(tsquery), func.ts_rank(tsvector, tsquery).desc()
+
+    # SQLite FTS5, rank is better when lower
+    fts = table(
+        "searchdocument_fts", column("rowid"), column("rank"), column("searchdocument_fts")
+    )
+    match = and_(
+        fts.c.rowid == SearchDocument.id,
+        fts.c.searchdocument_fts.op("MATCH")(" ".join(f'"{term}"*' for term in terms)),
+    )
+    return match, fts.c.rank
+
+
+async def search_org(
+    request: Request,
+    org_slug: str,
+    query: str,
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[SearchResult]:
+    statement = select(Organization).where(Organization.slug == org_slug)
+    org = (await db_session.exec(statement)).first()
+
+    if not org:
+        raise HTTPException(
+            status_code=404,
+            detail="Organization not found",
+        )
+
+    terms = get_query_terms(query)
+    if not terms:
+        return []
+
+    match, rank = get_match_and_rank(terms, db_session.get_bind().dialect.name)
+
+    # Courses and activities follow the access rules of their course
+    course_visible = await get_visibility_filter(current_user, "courses", db_session)
+    collection_visible = await get_visibility_filter(
+        current_user, "collections", db_session
+    )
+    statement = (
+        select(SearchDocument, Course.course_uuid)
+        .outerjoin(Course, Course.id == SearchDocument.course_id)  # type: ignore
+        .outerjoin(
+            Collection,
+            and_(
+                SearchDocument.resource_type == SearchResourceTypeEnum.COLLECTION,
+                Collection.collection_uuid == SearchDocument.resource_uuid,
+            ),
+        )
+        .where(SearchDocument.org_id == org.id, match)
+        .where(
+            or_(
+                and_(Course.id != None, course_visible),  # noqa: E711
+                and_(Collection.id != None, collection_visible),  # noqa: E711
+            )
+        )
+        .order_by(rank)
+        .limit(max(1, min(limit, MAX_SEARCH_LIMIT)))
+    )
+    rows = (await db_session.exec(statement)).all()
+
+    return [
+        SearchResult(
+            resource_type=document.resource_type,
+            resource_uuid=document.resource_uuid,
+            course_uuid=course_uuid,
+            title=document.title,
+            excerpt=document.body[:EXCERPT_LENGTH],
+        )
+        for document, course_uuid in rows
+    ]
@@ -0,0 +1,221 @@
+"""
+Streaming export of the learning records of an org.
+
+Trails, runs, steps and assignment grades are read with server-side cursors
+(`yield_per`) and written as NDJSON or CSV in chunks, so that an export holds
+one batch of rows and one chunk of output in memory whatever its size. Rows
+are selected as columns, never as entities, to keep the identity map empty.
+"""
+
+import csv
+import io
+import json
+from typing import Iterator, Literal
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.events.database import replica_engines
+from src.core.events.database_routing import RoutingSession
+from src.db.courses.activities import Activity
+from src.db.courses.assignments import Assignment, AssignmentUserSubmission
+from src.db.courses.courses import Course
+from src.db.organizations import Organization
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+from src.db.users import AnonymousUser, PublicUser, User
+from src.security.rbac.rbac import authorization_verify_if_user_is_anon
+from src.security.rbac.rights_cache import get_user_rights
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_COLUMNS = [
+    "record_type",
+    "user_id",
+    "username",
+    "course_uuid",
+    "course_name",
+    "activity_uuid",
+    "activity_name",
+    "status",
+    "completed_steps",
+    "course_total_steps",
+    "complete",
+    "grade",
+    "creation_date",
+    "update_date",
+]
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _stream(db_session: Session, statement, record_type: str) -> Iterator[dict]:
+    result = db_session.exec(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for row in result:
+        yield {"record_type": record_type, **row._asdict()}
+
+
+def get_learning_records(db_session: Session, org_id: int) -> Iterator[dict]:
+    """
+    Trails, runs, steps and assignment grades of an org, one dict per record
+    """
+    if db_session.get_bind().dialect.name == "postgresql":
+        # One snapshot for every query, runs and steps of the export agree
+        db_session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    statement = (
+        select(
+            Trail.user_id,
+            User.username,
+            Trail.creation_date,
+            Trail.update_date,
+        )
+        .join(User, User.id == Trail.user_id)  # type: ignore
+        .where(Trail.org_id == org_id)
+        .order_by(Trail.id)  # type: ignore
+    )
+    yield from _stream(db_session, statement, "trail")
+
+    statement = (
+        select(
+            TrailRun.user_id,
+            User.username,
+            Course.course_uuid,
+            Course.name.label("course_name"),  # type: ignore
+            TrailRun.status,
+            TrailRun.completed_steps,
+            Course.activity_count.label("course_total_steps"),  # type: ignore
+            TrailRun.creation_date,
+            TrailRun.update_date,
+        )
+        .join(User, User.id == TrailRun.user_id)  # type: ignore
+        .join(Course, Course.id == TrailRun.course_id)  # type: ignore
+        .where(TrailRun.org_id == org_id)
+        .order_by(TrailRun.id)  # type: ignore
+    )
+    yield from _stream(db_session, statement, "run")
+
+    statement = (
+        select(
+            TrailStep.user_id,
+            User.username,
+            Course.course_uuid,
+            Course.name.label("course_name"),  # type: ignore
+            Activity.activity_uuid,
+            Activity.name.label("activity_name"),  # type: ignore
+            TrailStep.complete,
+            TrailStep.grade,
+            TrailStep.creation_date,
+            TrailStep.update_date,
+        )
+        .join(User, User.id == TrailStep.user_id)  # type: ignore
+        .join(Course, Course.id == TrailStep.course_id)  # type: ignore
+        .join(Activity, Activity.id == TrailStep.activity_id)  # type: ignore
+        .where(TrailStep.org_id == org_id)
+        .order_by(TrailStep.id)  # type: ignore
+    )
+    yield from _stream(db_session, statement, "step")
+
+    statement = (
+        select(
+            AssignmentUserSubmission.user_id,
+            User.username,
+            Course.course_uuid,
+            Course.name.label("course_name"),  # type: ignore
+            Activity.activity_uuid,
+            Activity.name.label("activity_name"),  # type: ignore
+            AssignmentUserSubmission.submission_status.label("status"),  # type: ignore
+            AssignmentUserSubmission.grade,
+            AssignmentUserSubmission.creation_date,
+            AssignmentUserSubmission.update_date,
+        )
+        .join(Assignment, Assignment.id == AssignmentUserSubmission.assignment_id)  # type: ignore
+        .join(User, User.id == AssignmentUserSubmission.user_id)  # type: ignore
+        .join(Course, Course.id == Assignment.course_id)  # type: ignore
+        .join(Activity, Activity.id == Assignment.activity_id)  # type: ignore
+        .where(Assignment.org_id == org_id)
+        .order_by(AssignmentUserSubmission.id)  # type: ignore
+    )
+    yield from _stream(db_session, statement, "grade")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    # Enums are written by value
+    return getattr(value, "value", value)
+
+
+def write_learning_records(
+    records: Iterator[dict], format: ExportFormat, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Serialize records to chunks of about `chunk_size` characters
+    """
+    buffer = io.StringIO()
+
+    if format == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+
+        def write(record: dict):
+            writer.writerow([_csv_value(record.get(column)) for column in EXPORT_COLUMNS])
+
+    else:
+
+        def write(record: dict):
+            values = {column: record.get(column) for column in EXPORT_COLUMNS}
+            buffer.write(json.dumps(values) + "\n")
+
+    for record in records:
+        write(record)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_org_learning_records(engine, org_id: int, format: ExportFormat) -> Iterator[str]:
+    """
+    Export chunks read with a session of their own, the request session is
+    closed before the response is streamed
+    """
+    with RoutingSession(engine, replicas=replica_engines) as db_session:
+        yield from write_learning_records(get_learning_records(db_session, org_id), format)
+
+
+async def export_learning_records(
+    request: Request,
+    org_id: int,
+    format: ExportFormat,
+    current_user: PublicUser | AnonymousUser,
+    db_session: AsyncSession,
+) -> StreamingResponse:
+    org = await db_session.get(Organization, org_id)
+
+    if not org:
+        raise HTTPException(
+            status_code=404,
+            detail="Organization not found",
+        )
+
+    # RBAC check, learning records of the org are for its own admins
+    await authorization_verify_if_user_is_anon(current_user.id)
+    rights = await get_user_rights(current_user.id, db_session)
+    if not rights.is_org_admin(org.id):
+        raise HTTPException(
+            status_code=403,
+            detail="User rights (admin status) : You don't have the right to perform this action",
+        )
+
+    return StreamingResponse(
+        export_org_learning_records(request.app.db_engine, org_id, format),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="learning-records-{org.slug}.{format}"'
+        },
+    )
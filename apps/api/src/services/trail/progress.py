@@ -0,0 +1,380 @@
+"""
+Batched progress recording.
+
+`record_progress` only checks the activity and queues a progress event: on a
+Redis stream shared by the workers, or in memory without Redis. A flusher
+thread in every worker reads the events in batches and upserts the trails,
+runs and steps they imply with INSERT ... ON CONFLICT, a fixed number of
+statements per batch. Stream events are acknowledged once written, events
+left pending by a worker that stopped are claimed by another one.
+"""
+
+import logging
+import os
+import socket
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+import redis
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from config.config import get_learnhouse_config
+from src.core.cache import get_redis_client
+from src.core.events.database import get_upsert_insert
+from src.db.courses.activities import Activity
+from src.db.trail_runs import StatusEnum, TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+from src.db.users import AnonymousUser, PublicUser
+from src.services.trail.progress_counters import refresh_completed_steps
+from src.services.trail.trail_versions import bump_trail_versions
+
+PROGRESS_STREAM = "learnhouse:trail:progress"
+PROGRESS_GROUP = "trail_flushers"
+PROGRESS_STREAM_MAX_LENGTH = 1_000_000
+# Events not acknowledged after this long are claimed by another flusher
+PROGRESS_CLAIM_IDLE_MS = 60_000
+
+
+class ProgressEvent(BaseModel):
+    user_id: int
+    activity_id: int
+    recorded_at: str
+
+
+class ProgressQueue:
+    """
+    Progress events waiting to be written, on the Redis stream or in memory
+    (also used when Redis is unavailable)
+    """
+
+    def __init__(self):
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}"
+        self._local: deque[ProgressEvent] = deque()
+        self._lock = threading.Lock()
+        self._group_ready = False
+
+    def push(self, event: ProgressEvent):
+        client = get_redis_client()
+        if client:
+            try:
+                client.xadd(
+                    PROGRESS_STREAM,
+                    event.dict(),  # type: ignore
+                    maxlen=PROGRESS_STREAM_MAX_LENGTH,
+                    approximate=True,
+                )
+                return
+            except redis.RedisError as error:
+                logging.warning("Progress stream unavailable: %s", error)
+
+        with self._lock:
+            self._local.append(event)
+
+    def read(self, count: int) -> tuple[list[ProgressEvent], list[bytes]]:
+        """
+        Up to `count` events, and the stream ids to acknowledge once written
+        """
+        with self._lock:
+            events = [
+                self._local.popleft() for _ in range(min(count, len(self._local)))
+            ]
+        if events:
+            return events, []
+
+        client = get_redis_client()
+        if not client:
+            return [], []
+        try:
+            messages = self._read_stream(client, count)
+        except redis.RedisError as error:
+            # The group is recreated if the stream was lost
+            self._group_ready = False
+            logging.warning("Progress stream unavailable: %s", error)
+            return [], []
+
+        ids, events = [], []
+        for message_id, fields in messages:
+            ids.append(message_id)
+            # Claimed events may have been trimmed from the stream
+            if fields:
+                events.append(
+                    ProgressEvent(
+                        **{key.decode(): value.decode() for key, value in fields.items()}
+                    )
+                )
+        return events, ids
+
+    def _read_stream(self, client: redis.Redis, count: int) -> list:
+        if not self._group_ready:
+            try:
+                client.xgroup_create(PROGRESS_STREAM, PROGRESS_GROUP, id="0", mkstream=True)
+            except redis.ResponseError as error:
+                if "BUSYGROUP" not in str(error):
+                    raise
+            self._group_ready = True
+
+        claimed = client.xautoclaim(
+            PROGRESS_STREAM,
+            PROGRESS_GROUP,
+            self.consumer,
+            min_idle_time=PROGRESS_CLAIM_IDLE_MS,
+            count=count,
+        )
+        if claimed[1]:
+            return claimed[1]
+
+        response = client.xreadgroup(
+            PROGRESS_GROUP, self.consumer, {PROGRESS_STREAM: ">"}, count=count
+        )
+        return response[0][1] if response else []
+
+    def ack(self, ids: list[bytes]):
+        client = get_redis_client()
+        if not client or not ids:
+            return
+        try:
+            pipeline = client.pipeline(transaction=False)
+            pipeline.xack(PROGRESS_STREAM, PROGRESS_GROUP, *ids)
+            pipeline.xdel(PROGRESS_STREAM, *ids)
+            pipeline.execute()
+        except redis.RedisError as error:
+            # Claimed again later, writing events twice is harmless
+            logging.warning("Could not acknowledge progress events: %s", error)
+
+    def requeue(self, events: list[ProgressEvent]):
+        with self._lock:
+            self._local.extendleft(reversed(events))
+
+
+progress_queue = ProgressQueue()
+
+
+async def record_progress(
+    request: Request,
+    user: PublicUser | AnonymousUser,
+    activity_uuid: str,
+    db_session: AsyncSession,
+) -> dict:
+    if isinstance(user, AnonymousUser):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Anonymous users cannot record progress",
+        )
+
+    statement = select(Activity.id).where(Activity.activity_uuid == activity_uuid)
+    activity_id = (await db_session.exec(statement)).first()
+
+    if not activity_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Activity not found"
+        )
+
+    progress_queue.push(
+        ProgressEvent(
+            user_id=user.id, activity_id=activity_id, recorded_at=str(datetime.now())
+        )
+    )
+
+    return {"detail": "Progress recorded"}
+
+
+def write_progress(db_session: Session, events: list[ProgressEvent]) -> int:
+    """
+    Upsert the trails, runs and steps of progress events, returns the number
+    of distinct steps (steps of already completed activities are left as is)
+    """
+    statement = select(Activity.id, Activity.course_id, Activity.org_id).where(
+        Activity.id.in_(list({event.activity_id for event in events}))  # type: ignore
+    )
+    activities = {row[0]: row for row in db_session.exec(statement).all()}
+
+    # Events of deleted activities are dropped, the first event of a step wins
+    steps: dict[tuple[int, int], ProgressEvent] = {}
+    for event in sorted(events, key=lambda event: event.recorded_at):
+        if event.activity_id in activities:
+            steps.setdefault((event.user_id, event.activity_id), event)
+    if not steps:
+        return 0
+
+    insert = get_upsert_insert(db_session)
+    now = str(datetime.now())
+
+    trail_keys = {
+        (activities[activity_id].org_id, user_id) for user_id, activity_id in steps
+    }
+    db_session.connection().execute(
+        insert(Trail)
+        .values(
+            [
+                dict(
+                    org_id=org_id,
+                    user_id=user_id,
+                    trail_uuid=f"trail_{uuid4()}",
+                    creation_date=now,
+                    update_date=now,
+                )
+                for org_id, user_id in trail_keys
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["org_id", "user_id"])
+    )
+    statement = select(Trail.org_id, Trail.user_id, Trail.id).where(
+        tuple_(Trail.org_id, Trail.user_id).in_(list(trail_keys))
+    )
+    trail_ids = {(row[0], row[1]): row[2] for row in db_session.exec(statement).all()}
+
+    run_keys = {
+        (activities[activity_id].course_id, user_id): activities[activity_id].org_id
+        for user_id, activity_id in steps
+    }
+    statement = insert(TrailRun).values(
+        [
+            dict(
+                trail_id=trail_ids[(org_id, user_id)],
+                course_id=course_id,
+                org_id=org_id,
+                user_id=user_id,
+                data={},
+                status=StatusEnum.STATUS_IN_PROGRESS,
+                creation_date=now,
+                update_date=now,
+            )
+            for (course_id, user_id), org_id in run_keys.items()
+        ]
+    )
+    db_session.connection().execute(
+        statement.on_conflict_do_update(
+            index_elements=["course_id", "user_id"],
+            set_=dict(update_date=statement.excluded.update_date),
+        )
+    )
+    statement = select(TrailRun.course_id, TrailRun.user_id, TrailRun.id).where(
+        tuple_(TrailRun.course_id, TrailRun.user_id).in_(list(run_keys))
+    )
+    run_ids = {(row[0], row[1]): row[2] for row in db_session.exec(statement).all()}
+
+    values = []
+    for (user_id, activity_id), event in steps.items():
+        _, course_id, org_id = activities[activity_id]
+        values.append(
+            dict(
+                trailrun_id=run_ids[(course_id, user_id)],
+                activity_id=activity_id,
+                course_id=course_id,
+                trail_id=trail_ids[(org_id, user_id)],
+                org_id=org_id,
+                complete=True,
+                teacher_verified=False,
+                grade="",
+                data={},
+                user_id=user_id,
+                creation_date=event.recorded_at,
+                update_date=event.recorded_at,
+            )
+        )
+    db_session.connection().execute(
+        insert(TrailStep)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["trailrun_id", "activity_id"])
+    )
+    refresh_completed_steps(db_session.connection(), run_ids=run_ids.values())
+
+    db_session.commit()
+    # Core statements skip the ORM events bumping the trail versions
+    bump_trail_versions({(user_id, org_id) for org_id, user_id in trail_keys})
+    return len(values)
+
+
+def flush_progress(db_session: Session, batch_size: int) -> int:
+    """
+    Write the queued progress events until the queue is empty, returns the
+    number of events read
+    """
+    total = 0
+    while True:
+        events, ids = progress_queue.read(batch_size)
+        if not events and not ids:
+            return total
+
+        try:
+            write_progress(db_session, events)
+        except OperationalError:
+            # Database unavailable, the events are retried on the next flush
+            db_session.rollback()
+            if not ids:
+                progress_queue.requeue(events)
+            raise
+        except SQLAlchemyError:
+            # One bad event must not hold back the others
+            db_session.rollback()
+            logging.exception("Could not write a batch of progress events")
+            for event in events:
+                try:
+                    write_progress(db_session, [event])
+                except SQLAlchemyError:
+                    db_session.rollback()
+                    logging.exception("Dropped progress event %s", event)
+
+        progress_queue.ack(ids)
+        total += len(events)
+
+
+class ProgressFlusher:
+    """
+    Background thread flushing the progress queue of a worker
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self, engine, interval: float, batch_size: int):
+        while not self._stop.wait(interval):
+            try:
+                with Session(engine) as db_session:
+                    flush_progress(db_session, batch_size)
+            except Exception:
+                logging.exception("Progress flush failed")
+
+    def start(self, engine):
+        if self._thread is not None:
+            return
+        database_config = get_learnhouse_config().database_config
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(
+                engine,
+                database_config.progress_flush_interval_ms / 1000,
+                database_config.progress_flush_batch_size,
+            ),
+            name="progress-flusher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, engine):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        # Events queued in memory would be lost with the worker
+        try:
+            with Session(engine) as db_session:
+                flush_progress(
+                    db_session, get_learnhouse_config().database_config.progress_flush_batch_size
+                )
+        except Exception:
+            logging.exception("Progress flush failed")
+
+
+progress_flusher = ProgressFlusher()
@@ -0,0 +1,150 @@
+"""
+Materialized progress counters.
+
+`Course.activity_count` (activities linked to the chapters of the course) and
+`TrailRun.completed_steps` (completed steps of the run) are recounted in the
+flush that changes their rows, in the same transaction, so progress reads
+never count rows. Deletions cascading in the database (activities, chapters)
+are covered by recounting the courses they belong to. Writes bypassing the
+ORM call `refresh_completed_steps` themselves, `rebuild_progress_counters`
+recounts everything.
+
+The counted rows are locked before their recount: under READ COMMITTED two
+transactions adding steps to a run would otherwise each miss the other's
+uncommitted step, and the last one would store a stale count. The lock
+waits for the other transaction to commit, the recount then sees its rows.
+"""
+
+from typing import Iterable, Optional
+from sqlalchemy import Connection, event, func, inspect, or_, update
+from sqlalchemy.orm import Session as SASession
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, select
+from src.db.courses.activities import Activity
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.chapters import Chapter
+from src.db.courses.courses import Course
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+
+
+def _lock_counted_rows(connection: Connection, model, *conditions):
+    # In id order against deadlocks, NO KEY so that inserts of steps and
+    # chapter activities referencing the rows are not blocked
+    connection.execute(
+        select(model.id)
+        .where(*conditions)
+        .order_by(model.id)
+        .with_for_update(key_share=True)
+    )
+
+
+def refresh_course_activity_counts(
+    connection: Connection, course_ids: Optional[Iterable[int]] = None
+) -> dict[int, int]:
+    """
+    Recount the activities of courses (all of them when `course_ids` is None)
+    """
+    statement = update(Course).values(
+        activity_count=select(func.count())
+        .where(ChapterActivity.course_id == Course.id)
+        .scalar_subquery()
+    )
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        _lock_counted_rows(connection, Course, Course.id.in_(course_ids))  # type: ignore
+        statement = statement.where(Course.id.in_(course_ids))  # type: ignore
+    result = connection.execute(statement.returning(Course.id, Course.activity_count))
+    return dict(result.all())  # type: ignore
+
+
+def refresh_completed_steps(
+    connection: Connection,
+    run_ids: Iterable[int] = (),
+    course_ids: Iterable[int] = (),
+    all_runs: bool = False,
+) -> dict[int, int]:
+    """
+    Recount the completed steps of runs, by id or by course
+    """
+    statement = update(TrailRun).values(
+        completed_steps=select(func.count())
+        .where(TrailStep.trailrun_id == TrailRun.id, TrailStep.complete == True)
+        .scalar_subquery()
+    )
+    if not all_runs:
+        condition = or_(
+            TrailRun.id.in_(list(run_ids)),  # type: ignore
+            TrailRun.course_id.in_(list(course_ids)),  # type: ignore
+        )
+        _lock_counted_rows(connection, TrailRun, condition)
+        statement = statement.where(condition)
+    result = connection.execute(statement.returning(TrailRun.id, TrailRun.completed_steps))
+    return dict(result.all())  # type: ignore
+
+
+def _history(instance, attribute: str) -> list:
+    """
+    Current and previous (if changed in the flush) value of an attribute
+    """
+    history = getattr(inspect(instance).attrs, attribute).history
+    return [getattr(instance, attribute), *history.deleted]
+
+
+def _set_loaded_counts(session, model, attribute: str, counts: dict[int, int]):
+    # Instances already loaded in the session would keep their old count
+    for instance in list(session.identity_map.values()):
+        if isinstance(instance, model) and instance.id in counts:
+            set_committed_value(instance, attribute, counts[instance.id])
+
+
+@event.listens_for(SASession, "after_flush")
+def _refresh_progress_counters(session, flush_context):
+    course_ids: set[int] = set()
+    run_ids: set[int] = set()
+    # Courses whose trail steps may have been deleted by the database
+    cascaded_course_ids: set[int] = set()
+
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, ChapterActivity):
+            course_ids.update(_history(instance, "course_id"))
+        elif isinstance(instance, TrailStep):
+            run_ids.update(_history(instance, "trailrun_id"))
+        elif isinstance(instance, (Activity, Chapter)) and instance in session.deleted:
+            course_ids.add(instance.course_id)
+            if isinstance(instance, Activity):
+                cascaded_course_ids.add(instance.course_id)
+
+    course_ids.discard(None)  # type: ignore
+    run_ids.discard(None)  # type: ignore
+    cascaded_course_ids.discard(None)  # type: ignore
+
+    if course_ids:
+        counts = refresh_course_activity_counts(session.connection(), course_ids)
+        _set_loaded_counts(session, Course, "activity_count", counts)
+    if run_ids or cascaded_course_ids:
+        counts = refresh_completed_steps(
+            session.connection(), run_ids, cascaded_course_ids
+        )
+        _set_loaded_counts(session, TrailRun, "completed_steps", counts)
+
+
+def rebuild_progress_counters(
+    db_session: Session, org_id: Optional[int] = None
+) -> tuple[int, int]:
+    """
+    Recount every counter (of an org), returns the number of courses and runs
+    """
+    connection = db_session.connection()
+    if org_id is None:
+        courses = refresh_course_activity_counts(connection)
+        runs = refresh_completed_steps(connection, all_runs=True)
+    else:
+        course_ids = db_session.exec(
+            select(Course.id).where(Course.org_id == org_id)
+        ).all()
+        courses = refresh_course_activity_counts(connection, course_ids)  # type: ignore
+        runs = refresh_completed_steps(connection, course_ids=course_ids)  # type: ignore
+
+    db_session.commit()
+    return len(courses), len(runs)
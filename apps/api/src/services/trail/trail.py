@@ -1,26 +1,44 @@
 from datetime import datetime
 from uuid import uuid4
-from src.db.courses.chapter_activities import ChapterActivity
 from fastapi import HTTPException, Request, status
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.courses.activities import Activity
 from src.db.courses.courses import Course
 from src.db.trail_runs import TrailRun, TrailRunRead
 from src.db.trail_steps import TrailStep
 from src.db.trails import Trail, TrailCreate, TrailRead
 from src.db.users import AnonymousUser, PublicUser
+from src.services.loaders import get_loaders
+from src.services.trail import progress_counters  # noqa: F401
+
+
+async def insert_or_get(db_session: AsyncSession, instance, statement):
+    """
+    Insert a trail / run / step, or return the row a concurrent request (or
+    the progress flusher) inserted first under the same unique key, which
+    `statement` selects
+    """
+    try:
+        async with db_session.begin_nested():
+            db_session.add(instance)
+    except IntegrityError:
+        return (await db_session.exec(statement)).one()
+    return instance
 
 
 async def create_user_trail(
     request: Request,
     user: PublicUser,
     trail_object: TrailCreate,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> Trail:
     statement = select(Trail).where(
         Trail.org_id == trail_object.org_id, Trail.user_id == user.id
     )
-    trail = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    trail = result.first()
 
     if trail:
         raise HTTPException(
@@ -36,66 +54,96 @@ async def create_user_trail(
     trail.trail_uuid = str(f"trail_{uuid4()}")
 
     # create trail
-    db_session.add(trail)
-    db_session.commit()
-    db_session.refresh(trail)
+    if await insert_or_get(db_session, trail, statement) is not trail:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Trail already exists",
+        )
+    await db_session.commit()
+    await db_session.refresh(trail)
 
     return trail
 
 
-async def get_user_trails(
-    request: Request,
-    user: PublicUser,
-    db_session: Session,
+async def get_trail_read(
+    request: Request, trail: Trail, db_session: AsyncSession
 ) -> TrailRead:
-    statement = select(Trail).where(Trail.user_id == user.id)
-    trail = db_session.exec(statement).first()
+    """
+    Trail with its runs, their steps, courses and number of activities, in a
+    fixed number of queries whatever the number of runs and steps (the
+    counters are materialized, see progress_counters)
+    """
+    statement = (
+        select(TrailRun)
+        .where(TrailRun.trail_id == trail.id, TrailRun.user_id == trail.user_id)
+        .order_by(TrailRun.id)  # type: ignore
+    )
+    trail_runs = (await db_session.exec(statement)).all()
 
-    if not trail:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Trail not found"
+    statement = (
+        select(TrailStep)
+        .where(
+            TrailStep.trailrun_id.in_([trail_run.id for trail_run in trail_runs]),  # type: ignore
+            TrailStep.user_id == trail.user_id,
+        )
+        .order_by(TrailStep.id)  # type: ignore
+    )
+    steps_by_run: dict[int, list[TrailStep]] = {}
+    for trail_step in (await db_session.exec(statement)).all():
+        steps_by_run.setdefault(trail_step.trailrun_id, []).append(
+            TrailStep(**trail_step.__dict__)
         )
 
-    statement = select(TrailRun).where(TrailRun.trail_id == trail.id)
-    trail_runs = db_session.exec(statement).all()
-
-    trail_runs = [
-        TrailRunRead(**trail_run.__dict__, course={}, steps=[], course_total_steps=0)
-        for trail_run in trail_runs
-    ]
+    course_ids = list(
+        {trail_run.course_id for trail_run in trail_runs}
+        | {
+            trail_step.course_id
+            for trail_steps in steps_by_run.values()
+            for trail_step in trail_steps
+        }
+    )
+    courses = dict(
+        zip(
+            course_ids,
+            await get_loaders(request, db_session).courses_by_id.load_many(course_ids),
+        )
+    )
 
-    # Add course object and total activities in a course to trail runs
+    runs = []
     for trail_run in trail_runs:
-        statement = select(Course).where(Course.id == trail_run.course_id)
-        course = db_session.exec(statement).first()
-        trail_run.course = course
-
-        # Add number of activities (steps) in a course
-        statement = select(ChapterActivity).where(
-            ChapterActivity.course_id == trail_run.course_id
+        course = courses.get(trail_run.course_id)
+        run = TrailRunRead(
+            **trail_run.__dict__,
+            course={},
+            steps=[],
+            course_total_steps=course.activity_count if course else 0,
         )
-        course_total_steps = db_session.exec(statement)
-        # count number of activities in a this list
-        trail_run.course_total_steps = len(course_total_steps.all())
+        run.course = course  # type: ignore
+        run.steps = steps_by_run.get(trail_run.id, [])  # type: ignore
+        for trail_step in run.steps:
+            trail_step.data = dict(course=courses.get(trail_step.course_id))
+        runs.append(run)
 
-    for trail_run in trail_runs:
-        statement = select(TrailStep).where(TrailStep.trailrun_id == trail_run.id)
-        trail_steps = db_session.exec(statement).all()
+    return TrailRead(
+        **trail.model_dump(),
+        runs=runs,
+    )
 
-        trail_steps = [TrailStep(**trail_step.__dict__) for trail_step in trail_steps]
-        trail_run.steps = trail_steps
 
-        for trail_step in trail_steps:
-            statement = select(Course).where(Course.id == trail_step.course_id)
-            course = db_session.exec(statement).first()
-            trail_step.data = dict(course=course)
+async def get_user_trails(
+    request: Request,
+    user: PublicUser,
+    db_session: AsyncSession,
+) -> TrailRead:
+    statement = select(Trail).where(Trail.user_id == user.id)
+    trail = (await db_session.exec(statement)).first()
 
-    trail_read = TrailRead(
-        **trail.model_dump(),
-        runs=trail_runs,
-    )
+    if not trail:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trail not found"
+        )
 
-    return trail_read
+    return await get_trail_read(request, trail, db_session)
 
 
 async def check_trail_presence(
@@ -103,28 +151,27 @@ async def check_trail_presence(
     user_id: int,
     request: Request,
     user: PublicUser,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     statement = select(Trail).where(Trail.org_id == org_id, Trail.user_id == user_id)
-    trail = db_session.exec(statement).first()
+    result = await db_session.exec(statement)
+    trail = result.first()
 
     if not trail:
-        trail = await create_user_trail(
-            request,
-            user,
-            TrailCreate(
-                org_id=org_id,
-                user_id=user.id,
-            ),
-            db_session,
-        )
-        return trail
+        trail = Trail.model_validate(TrailCreate(org_id=org_id, user_id=user.id))
+        trail.creation_date = str(datetime.now())
+        trail.update_date = str(datetime.now())
+        trail.trail_uuid = str(f"trail_{uuid4()}")
+
+        trail = await insert_or_get(db_session, trail, statement)
+        await db_session.commit()
+        await db_session.refresh(trail)
 
     return trail
 
 
 async def get_user_trail_with_orgid(
-    request: Request, user: PublicUser | AnonymousUser, org_id: int, db_session: Session
+    request: Request, user: PublicUser | AnonymousUser, org_id: int, db_session: AsyncSession
 ) -> TrailRead:
 
     if isinstance(user, AnonymousUser):
@@ -141,57 +188,18 @@ async def get_user_trail_with_orgid(
         db_session=db_session,
     )
 
-    statement = select(TrailRun).where(TrailRun.trail_id == trail.id)
-    trail_runs = db_session.exec(statement).all()
-
-    trail_runs = [
-        TrailRunRead(**trail_run.__dict__, course={}, steps=[], course_total_steps=0)
-        for trail_run in trail_runs
-    ]
-
-    # Add course object and total activities in a course to trail runs
-    for trail_run in trail_runs:
-        statement = select(Course).where(Course.id == trail_run.course_id)
-        course = db_session.exec(statement).first()
-        trail_run.course = course 
-
-        # Add number of activities (steps) in a course
-        statement = select(ChapterActivity).where(
-            ChapterActivity.course_id == trail_run.course_id
-        )
-        course_total_steps = db_session.exec(statement)
-        # count number of activities in a this list
-        trail_run.course_total_steps = len(course_total_steps.all())
-
-    for trail_run in trail_runs:
-        statement = select(TrailStep).where(TrailStep.trailrun_id == trail_run.id)
-        trail_steps = db_session.exec(statement).all()
-
-        trail_steps = [TrailStep(**trail_step.__dict__) for trail_step in trail_steps]
-        trail_run.steps = trail_steps
-
-        for trail_step in trail_steps:
-            statement = select(Course).where(Course.id == trail_step.course_id)
-            course = db_session.exec(statement).first()
-            trail_step.data = dict(course=course)
-
-    trail_read = TrailRead(
-        **trail.model_dump(),
-        runs=trail_runs,
-    )
-
-    return trail_read
+    return await get_trail_read(request, trail, db_session)
 
 
 async def add_activity_to_trail(
     request: Request,
     user: PublicUser,
     activity_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> TrailRead:
     # Look for the activity
     statement = select(Activity).where(Activity.activity_uuid == activity_uuid)
-    activity = db_session.exec(statement).first()
+    activity = (await db_session.exec(statement)).first()
 
     if not activity:
         raise HTTPException(
@@ -199,7 +207,7 @@ async def add_activity_to_trail(
         )
 
     statement = select(Course).where(Course.id == activity.course_id)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -217,7 +225,7 @@ async def add_activity_to_trail(
     statement = select(TrailRun).where(
         TrailRun.trail_id == trail.id, TrailRun.course_id == course.id, TrailRun.user_id == user.id
     )
-    trailrun = db_session.exec(statement).first()
+    trailrun = (await db_session.exec(statement)).first()
 
     if not trailrun:
         trailrun = TrailRun(
@@ -228,14 +236,14 @@ async def add_activity_to_trail(
             creation_date=str(datetime.now()),
             update_date=str(datetime.now()),
         )
-        db_session.add(trailrun)
-        db_session.commit()
-        db_session.refresh(trailrun)
+        trailrun = await insert_or_get(db_session, trailrun, statement)
+        await db_session.commit()
+        await db_session.refresh(trailrun)
 
     statement = select(TrailStep).where(
         TrailStep.trailrun_id == trailrun.id, TrailStep.activity_id == activity.id, TrailStep.user_id == user.id
     )
-    trailstep = db_session.exec(statement).first()
+    trailstep = (await db_session.exec(statement)).first()
 
     if not trailstep:
         trailstep = TrailStep(
@@ -251,46 +259,21 @@ async def add_activity_to_trail(
             creation_date=str(datetime.now()),
             update_date=str(datetime.now()),
         )
-        db_session.add(trailstep)
-        db_session.commit()
-        db_session.refresh(trailstep)
-
-    statement = select(TrailRun).where(TrailRun.trail_id == trail.id , TrailRun.user_id == user.id)
-    trail_runs = db_session.exec(statement).all()
-
-    trail_runs = [
-        TrailRunRead(**trail_run.__dict__, course={}, steps=[], course_total_steps=0)
-        for trail_run in trail_runs
-    ]
-
-    for trail_run in trail_runs:
-        statement = select(TrailStep).where(TrailStep.trailrun_id == trail_run.id, TrailStep.user_id == user.id)
-        trail_steps = db_session.exec(statement).all()
-
-        trail_steps = [TrailStep(**trail_step.__dict__) for trail_step in trail_steps]
-        trail_run.steps = trail_steps
-
-        for trail_step in trail_steps:
-            statement = select(Course).where(Course.id == trail_step.course_id)
-            course = db_session.exec(statement).first()
-            trail_step.data = dict(course=course)
-
-    trail_read = TrailRead(
-        **trail.model_dump(),
-        runs=trail_runs,
-    )
+        trailstep = await insert_or_get(db_session, trailstep, statement)
+        await db_session.commit()
+        await db_session.refresh(trailstep)
 
-    return trail_read
+    return await get_trail_read(request, trail, db_session)
 
 
 async def add_course_to_trail(
     request: Request,
     user: PublicUser,
     course_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> TrailRead:
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -301,7 +284,7 @@ async def add_course_to_trail(
     statement = select(TrailRun).where(
         TrailRun.course_id == course.id, TrailRun.user_id == user.id
     )
-    trailrun = db_session.exec(statement).first()
+    trailrun = (await db_session.exec(statement)).first()
 
     if trailrun:
         raise HTTPException(
@@ -311,7 +294,7 @@ async def add_course_to_trail(
     statement = select(Trail).where(
         Trail.org_id == course.org_id, Trail.user_id == user.id
     )
-    trail = db_session.exec(statement).first()
+    trail = (await db_session.exec(statement)).first()
 
     if not trail:
         raise HTTPException(
@@ -321,7 +304,7 @@ async def add_course_to_trail(
     statement = select(TrailRun).where(
         TrailRun.trail_id == trail.id, TrailRun.course_id == course.id, TrailRun.user_id == user.id
     )
-    trail_run = db_session.exec(statement).first()
+    trail_run = (await db_session.exec(statement)).first()
 
     if not trail_run:
         trail_run = TrailRun(
@@ -332,46 +315,21 @@ async def add_course_to_trail(
             creation_date=str(datetime.now()),
             update_date=str(datetime.now()),
         )
-        db_session.add(trail_run)
-        db_session.commit()
-        db_session.refresh(trail_run)
-
-    statement = select(TrailRun).where(TrailRun.trail_id == trail.id, TrailRun.user_id == user.id)
-    trail_runs = db_session.exec(statement).all()
-
-    trail_runs = [
-        TrailRunRead(**trail_run.__dict__, course={}, steps=[], course_total_steps=0)
-        for trail_run in trail_runs
-    ]
-
-    for trail_run in trail_runs:
-        statement = select(TrailStep).where(TrailStep.trailrun_id == trail_run.id , TrailStep.user_id == user.id)
-        trail_steps = db_session.exec(statement).all()
-
-        trail_steps = [TrailStep(**trail_step.__dict__) for trail_step in trail_steps]
-        trail_run.steps = trail_steps
-
-        for trail_step in trail_steps:
-            statement = select(Course).where(Course.id == trail_step.course_id)
-            course = db_session.exec(statement).first()
-            trail_step.data = dict(course=course)
-
-    trail_read = TrailRead(
-        **trail.model_dump(),
-        runs=trail_runs,
-    )
+        trail_run = await insert_or_get(db_session, trail_run, statement)
+        await db_session.commit()
+        await db_session.refresh(trail_run)
 
-    return trail_read
+    return await get_trail_read(request, trail, db_session)
 
 
 async def remove_course_from_trail(
     request: Request,
     user: PublicUser,
     course_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ) -> TrailRead:
     statement = select(Course).where(Course.course_uuid == course_uuid)
-    course = db_session.exec(statement).first()
+    course = (await db_session.exec(statement)).first()
 
     if not course:
         raise HTTPException(
@@ -381,7 +339,7 @@ async def remove_course_from_trail(
     statement = select(Trail).where(
         Trail.org_id == course.org_id, Trail.user_id == user.id
     )
-    trail = db_session.exec(statement).first()
+    trail = (await db_session.exec(statement)).first()
 
     if not trail:
         raise HTTPException(
@@ -391,43 +349,18 @@ async def remove_course_from_trail(
     statement = select(TrailRun).where(
         TrailRun.trail_id == trail.id, TrailRun.course_id == course.id, TrailRun.user_id == user.id
     )
-    trail_run = db_session.exec(statement).first()
+    trail_run = (await db_session.exec(statement)).first()
 
     if trail_run:
-        db_session.delete(trail_run)
-        db_session.commit()
+        await db_session.delete(trail_run)
+        await db_session.commit()
 
     # Delete all trail steps for this course
     statement = select(TrailStep).where(TrailStep.course_id == course.id, TrailStep.user_id == user.id)
-    trail_steps = db_session.exec(statement).all()
+    trail_steps = (await db_session.exec(statement)).all()
 
     for trail_step in trail_steps:
-        db_session.delete(trail_step)
-        db_session.commit()
-
-    statement = select(TrailRun).where(TrailRun.trail_id == trail.id, TrailRun.user_id == user.id)
-    trail_runs = db_session.exec(statement).all()
-
-    trail_runs = [
-        TrailRunRead(**trail_run.__dict__, course={}, steps=[], course_total_steps=0)
-        for trail_run in trail_runs
-    ]
-
-    for trail_run in trail_runs:
-        statement = select(TrailStep).where(TrailStep.trailrun_id == trail_run.id, TrailStep.user_id == user.id)
-        trail_steps = db_session.exec(statement).all()
-
-        trail_steps = [TrailStep(**trail_step.__dict__) for trail_step in trail_steps]
-        trail_run.steps = trail_steps
-
-        for trail_step in trail_steps:
-            statement = select(Course).where(Course.id == trail_step.course_id)
-            course = db_session.exec(statement).first()
-            trail_step.data = dict(course=course)
-
-    trail_read = TrailRead(
-        **trail.model_dump(),
-        runs=trail_runs,
-    )
+        await db_session.delete(trail_step)
+    await db_session.commit()
 
-    return trail_read
+    return await get_trail_read(request, trail, db_session)
@@ -0,0 +1,91 @@
+"""
+Version of each user's trail in an organization.
+
+Every committed change to a trail, its runs or its steps bumps the version of
+the trail, so that responses embedding a trail can be validated against it
+without loading it.
+"""
+
+from typing import Optional
+from sqlalchemy import event, inspect, union
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.core.cache import bump_entity_versions, get_entity_versions
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+
+TRAIL_VERSION_KEY_PREFIX = "learnhouse:trail"
+
+
+def get_version_key(user_id: int, org_id: int) -> str:
+    return f"{TRAIL_VERSION_KEY_PREFIX}:{user_id}:{org_id}:version"
+
+
+def get_trail_version(user_id: int, org_id: int) -> Optional[str]:
+    """
+    Current version of the trail of a user, None without Redis
+    """
+    versions = get_entity_versions([get_version_key(user_id, org_id)])
+    return versions[0] if versions else None
+
+
+async def get_trail_course_ids(
+    user_id: int, org_id: int, db_session: AsyncSession
+) -> list[int]:
+    """
+    Courses embedded in the trail of a user
+    """
+    statement = union(
+        select(TrailRun.course_id).where(
+            TrailRun.user_id == user_id, TrailRun.org_id == org_id
+        ),
+        select(TrailStep.course_id).where(
+            TrailStep.user_id == user_id, TrailStep.org_id == org_id
+        ),
+    )
+    result = await db_session.execute(statement)
+    return sorted(result.scalars().all())
+
+
+def bump_trail_versions(trails: set[tuple[int, int]]):
+    bump_entity_versions(get_version_key(user_id, org_id) for user_id, org_id in trails)
+
+
+# Trail changes are collected on flush and bump the versions once the
+# transaction is committed
+
+
+@event.listens_for(SASession, "after_flush")
+def _collect_trail_changes(session, flush_context):
+    pending: set[tuple[int, int]] = session.info.setdefault("trail_changes", set())
+
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, (Trail, TrailRun, TrailStep)):
+            attrs = inspect(instance).attrs
+            pending.add((instance.user_id, instance.org_id))
+            pending.update(
+                zip(
+                    attrs.user_id.history.deleted or [instance.user_id],
+                    attrs.org_id.history.deleted or [instance.org_id],
+                )
+            )
+
+
+@event.listens_for(SASession, "after_commit")
+def _publish_trail_changes(session):
+    pending = session.info.pop("trail_changes", None)
+    if pending:
+        bump_trail_versions(
+            {
+                (user_id, org_id)
+                for user_id, org_id in pending
+                if user_id is not None and org_id is not None
+            }
+        )
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_trail_changes(session):
+    session.info.pop("trail_changes", None)
@@ -6,9 +6,11 @@ import string
 import uuid
 from fastapi import HTTPException, Request
 from pydantic import EmailStr
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.db.organizations import Organization, OrganizationRead
-from src.security.security import security_hash_password
+from src.security.password_hashing import hash_password
+from src.security.user_cache import invalidate_cached_user
 from config.config import get_learnhouse_config
 from src.services.users.emails import (
     send_password_reset_email,
@@ -23,14 +25,14 @@ from src.db.users import (
 
 async def send_reset_password_code(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     org_id: int,
     email: EmailStr,
 ):
     # Get user
     statement = select(User).where(User.email == email)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -40,7 +42,7 @@ async def send_reset_password_code(
 
     # Get org
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     if not org:
         raise HTTPException(
@@ -116,7 +118,7 @@ async def send_reset_password_code(
 
 async def change_password_with_reset_code(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     new_password: str,
     org_id: int,
@@ -125,7 +127,7 @@ async def change_password_with_reset_code(
 ):
     # Get user
     statement = select(User).where(User.email == email)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -135,7 +137,7 @@ async def change_password_with_reset_code(
 
     # Get org
     statement = select(Organization).where(Organization.id == org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     if not org:
         raise HTTPException(
@@ -190,11 +192,12 @@ async def change_password_with_reset_code(
         )
 
     # Change password
-    user.password = security_hash_password(new_password)
+    user.password = await hash_password(new_password)
     db_session.add(user)
 
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    invalidate_cached_user(user.id)  # type: ignore
 
     # Delete reset code
     r.delete(keys[0])
@@ -3,7 +3,8 @@ import logging
 from typing import Literal
 from uuid import uuid4
 from fastapi import HTTPException, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.features_utils.usage import (
     check_limits_with_usage,
     increase_feature_usage,
@@ -17,11 +18,12 @@ from src.db.usergroup_user import UserGroupUser
 from src.db.organizations import Organization
 from src.db.usergroups import UserGroup, UserGroupCreate, UserGroupRead, UserGroupUpdate
 from src.db.users import AnonymousUser, PublicUser, User, UserRead
+from src.services.loaders import get_loaders
 
 
 async def create_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_create: UserGroupCreate,
 ) -> UserGroupRead:
@@ -39,7 +41,7 @@ async def create_usergroup(
 
     # Check if Organization exists
     statement = select(Organization).where(Organization.id == usergroup_create.org_id)
-    org = db_session.exec(statement).first()
+    org = (await db_session.exec(statement)).first()
 
     if not org or org.id is None:
         raise HTTPException(
@@ -48,7 +50,7 @@ async def create_usergroup(
         )
 
     # Usage check
-    check_limits_with_usage("courses", org.id, db_session)
+    await check_limits_with_usage("courses", org.id, db_session)
 
     # Complete the object
     usergroup.usergroup_uuid = f"usergroup_{uuid4()}"
@@ -57,8 +59,8 @@ async def create_usergroup(
 
     # Save the object
     db_session.add(usergroup)
-    db_session.commit()
-    db_session.refresh(usergroup)
+    await db_session.commit()
+    await db_session.refresh(usergroup)
 
     # Feature usage
     increase_feature_usage("usergroups", org.id, db_session)
@@ -70,13 +72,13 @@ async def create_usergroup(
 
 async def read_usergroup_by_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
 ) -> UserGroupRead:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -100,13 +102,13 @@ async def read_usergroup_by_id(
 
 async def get_users_linked_to_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
 ) -> list[UserRead]:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -124,16 +126,12 @@ async def get_users_linked_to_usergroup(
     )
 
     statement = select(UserGroupUser).where(UserGroupUser.usergroup_id == usergroup_id)
-    usergroup_users = db_session.exec(statement).all()
+    usergroup_users = (await db_session.exec(statement)).all()
 
     user_ids = [usergroup_user.user_id for usergroup_user in usergroup_users]
 
     # get users
-    users = []
-    for user_id in user_ids:
-        statement = select(User).where(User.id == user_id)
-        user = db_session.exec(statement).first()
-        users.append(user)
+    users = await get_loaders(request, db_session).users_by_id.load_many(user_ids)
 
     users = [UserRead.model_validate(user) for user in users]
 
@@ -142,13 +140,13 @@ async def get_users_linked_to_usergroup(
 
 async def read_usergroups_by_org_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     org_id: int,
 ) -> list[UserGroupRead]:
 
     statement = select(UserGroup).where(UserGroup.org_id == org_id)
-    usergroups = db_session.exec(statement).all()
+    usergroups = (await db_session.exec(statement)).all()
 
     # RBAC check
     await rbac_check(
@@ -166,7 +164,7 @@ async def read_usergroups_by_org_id(
 
 async def get_usergroups_by_resource(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     resource_uuid: str,
 ) -> list[UserGroupRead]:
@@ -174,7 +172,7 @@ async def get_usergroups_by_resource(
     statement = select(UserGroupResource).where(
         UserGroupResource.resource_uuid == resource_uuid
     )
-    usergroup_resources = db_session.exec(statement).all()
+    usergroup_resources = (await db_session.exec(statement)).all()
 
     # RBAC check
     await rbac_check(
@@ -191,7 +189,7 @@ async def get_usergroups_by_resource(
     usergroups = []
     for usergroup_id in usergroup_ids:
         statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-        usergroup = db_session.exec(statement).first()
+        usergroup = (await db_session.exec(statement)).first()
         usergroups.append(usergroup)
 
     usergroups = [UserGroupRead.model_validate(usergroup) for usergroup in usergroups]
@@ -201,14 +199,14 @@ async def get_usergroups_by_resource(
 
 async def update_usergroup_by_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
     usergroup_update: UserGroupUpdate,
 ) -> UserGroupRead:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -230,8 +228,8 @@ async def update_usergroup_by_id(
     usergroup.update_date = str(datetime.now())
 
     db_session.add(usergroup)
-    db_session.commit()
-    db_session.refresh(usergroup)
+    await db_session.commit()
+    await db_session.refresh(usergroup)
 
     usergroup = UserGroupRead.model_validate(usergroup)
 
@@ -240,13 +238,13 @@ async def update_usergroup_by_id(
 
 async def delete_usergroup_by_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
 ) -> str:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -266,22 +264,22 @@ async def delete_usergroup_by_id(
     # Feature usage
     increase_feature_usage("usergroups", usergroup.org_id, db_session)
 
-    db_session.delete(usergroup)
-    db_session.commit()
+    await db_session.delete(usergroup)
+    await db_session.commit()
 
     return "UserGroup deleted successfully"
 
 
 async def add_users_to_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
     user_ids: str,
 ) -> str:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -302,14 +300,14 @@ async def add_users_to_usergroup(
 
     for user_id in user_ids_array:
         statement = select(User).where(User.id == user_id)
-        user = db_session.exec(statement).first()
+        user = (await db_session.exec(statement)).first()
 
         # Check if User is already Linked to UserGroup
         statement = select(UserGroupUser).where(
             UserGroupUser.usergroup_id == usergroup_id,
             UserGroupUser.user_id == user_id,
         )
-        usergroup_user = db_session.exec(statement).first()
+        usergroup_user = (await db_session.exec(statement)).first()
 
         if usergroup_user:
             logging.error(f"User with id {user_id} already exists in UserGroup")
@@ -327,8 +325,8 @@ async def add_users_to_usergroup(
                 )
 
                 db_session.add(usergroup_obj)
-                db_session.commit()
-                db_session.refresh(usergroup_obj)
+                await db_session.commit()
+                await db_session.refresh(usergroup_obj)
         else:
             logging.error(f"User with id {user_id} not found")
 
@@ -337,14 +335,14 @@ async def add_users_to_usergroup(
 
 async def remove_users_from_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
     user_ids: str,
 ) -> str:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -367,11 +365,11 @@ async def remove_users_from_usergroup(
         statement = select(UserGroupUser).where(
             UserGroupUser.user_id == user_id, UserGroupUser.usergroup_id == usergroup_id
         )
-        usergroup_user = db_session.exec(statement).first()
+        usergroup_user = (await db_session.exec(statement)).first()
 
         if usergroup_user:
-            db_session.delete(usergroup_user)
-            db_session.commit()
+            await db_session.delete(usergroup_user)
+            await db_session.commit()
         else:
             logging.error(f"User with id {user_id} not found in UserGroup")
 
@@ -380,14 +378,14 @@ async def remove_users_from_usergroup(
 
 async def add_resources_to_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
     resources_uuids: str,
 ) -> str:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -412,7 +410,7 @@ async def add_resources_to_usergroup(
             UserGroupResource.usergroup_id == usergroup_id,
             UserGroupResource.resource_uuid == resource_uuid,
         )
-        usergroup_resource = db_session.exec(statement).first()
+        usergroup_resource = (await db_session.exec(statement)).first()
 
         if usergroup_resource:
             raise HTTPException(
@@ -431,22 +429,22 @@ async def add_resources_to_usergroup(
         )
 
         db_session.add(usergroup_obj)
-        db_session.commit()
-        db_session.refresh(usergroup_obj)
+        await db_session.commit()
+        await db_session.refresh(usergroup_obj)
 
     return "Resources added to UserGroup successfully"
 
 
 async def remove_resources_from_usergroup(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     usergroup_id: int,
     resources_uuids: str,
 ) -> str:
 
     statement = select(UserGroup).where(UserGroup.id == usergroup_id)
-    usergroup = db_session.exec(statement).first()
+    usergroup = (await db_session.exec(statement)).first()
 
     if not usergroup:
         raise HTTPException(
@@ -469,11 +467,11 @@ async def remove_resources_from_usergroup(
         statement = select(UserGroupResource).where(
             UserGroupResource.resource_uuid == resource_uuid
         )
-        usergroup_resource = db_session.exec(statement).first()
+        usergroup_resource = (await db_session.exec(statement)).first()
 
         if usergroup_resource:
-            db_session.delete(usergroup_resource)
-            db_session.commit()
+            await db_session.delete(usergroup_resource)
+            await db_session.commit()
         else:
             logging.error(f"resource with uuid {resource_uuid} not found in UserGroup")
 
@@ -488,7 +486,7 @@ async def rbac_check(
     usergroup_uuid: str,
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     await authorization_verify_if_user_is_anon(current_user.id)
 
@@ -2,7 +2,8 @@ from datetime import datetime
 from typing import Literal
 from uuid import uuid4
 from fastapi import HTTPException, Request, UploadFile, status
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.security.features_utils.usage import (
     check_limits_with_usage,
     increase_feature_usage,
@@ -31,12 +32,13 @@ from src.db.users import (
     UserUpdatePassword,
 )
 from src.db.user_organizations import UserOrganization
-from src.security.security import security_hash_password, security_verify_password
+from src.security.password_hashing import hash_password, verify_password
+from src.security.user_cache import invalidate_cached_user
 
 
 async def create_user(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_object: UserCreate,
     org_id: int,
@@ -48,7 +50,7 @@ async def create_user(
 
     # Complete the user object
     user.user_uuid = f"user_{uuid4()}"
-    user.password = security_hash_password(user_object.password)
+    user.password = await hash_password(user_object.password)
     user.email_verified = False
     user.creation_date = str(datetime.now())
     user.update_date = str(datetime.now())
@@ -57,7 +59,7 @@ async def create_user(
 
     # Check if Organization exists
     statement = select(Organization).where(Organization.id == org_id)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if not result.first():
         raise HTTPException(
@@ -66,11 +68,11 @@ async def create_user(
         )
 
     # Usage check
-    check_limits_with_usage("members", org_id, db_session)
+    await check_limits_with_usage("members", org_id, db_session)
 
     # Username
     statement = select(User).where(User.username == user.username)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if result.first():
         raise HTTPException(
@@ -80,7 +82,7 @@ async def create_user(
 
     # Email
     statement = select(User).where(User.email == user.email)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if result.first():
         raise HTTPException(
@@ -95,8 +97,8 @@ async def create_user(
 
     # Add user to database
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
 
     # Link user and organization
     user_organization = UserOrganization(
@@ -108,8 +110,8 @@ async def create_user(
     )
 
     db_session.add(user_organization)
-    db_session.commit()
-    db_session.refresh(user_organization)
+    await db_session.commit()
+    await db_session.refresh(user_organization)
 
     user = UserRead.model_validate(user)
 
@@ -126,7 +128,7 @@ async def create_user(
 
 async def create_user_with_invite(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_object: UserCreate,
     org_id: int,
@@ -145,7 +147,7 @@ async def create_user_with_invite(
         )
 
     # Usage check
-    check_limits_with_usage("members", org_id, db_session)
+    await check_limits_with_usage("members", org_id, db_session)
 
     # Check if invite code contains UserGroup
     if inviteCode.usergroup_id:
@@ -167,7 +169,7 @@ async def create_user_with_invite(
 
 async def create_user_without_org(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_object: UserCreate,
 ):
@@ -178,7 +180,7 @@ async def create_user_without_org(
 
     # Complete the user object
     user.user_uuid = f"user_{uuid4()}"
-    user.password = security_hash_password(user_object.password)
+    user.password = await hash_password(user_object.password)
     user.email_verified = False
     user.creation_date = str(datetime.now())
     user.update_date = str(datetime.now())
@@ -187,7 +189,7 @@ async def create_user_without_org(
 
     # Username
     statement = select(User).where(User.username == user.username)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if result.first():
         raise HTTPException(
@@ -197,7 +199,7 @@ async def create_user_without_org(
 
     # Email
     statement = select(User).where(User.email == user.email)
-    result = db_session.exec(statement)
+    result = await db_session.exec(statement)
 
     if result.first():
         raise HTTPException(
@@ -212,8 +214,8 @@ async def create_user_without_org(
 
     # Add user to database
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
 
     user = UserRead.model_validate(user)
 
@@ -228,14 +230,14 @@ async def create_user_without_org(
 
 async def update_user(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     user_id: int,
     current_user: PublicUser | AnonymousUser,
     user_object: UserUpdate,
 ):
     # Get user
     statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -250,7 +252,7 @@ async def update_user(
 
     # Username
     statement = select(User).where(User.username == user_object.username)
-    username_user = db_session.exec(statement).first()
+    username_user = (await db_session.exec(statement)).first()
 
     if username_user:
         isSameUser = username_user.id == current_user.id
@@ -262,7 +264,7 @@ async def update_user(
 
     # Email
     statement = select(User).where(User.email == user_object.email)
-    email_user = db_session.exec(statement).first()
+    email_user = (await db_session.exec(statement)).first()
 
     if email_user:
         isSameUser = email_user.id == current_user.id
@@ -281,8 +283,9 @@ async def update_user(
 
     # Update user in database
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    invalidate_cached_user(user.id)  # type: ignore
 
     user = UserRead.model_validate(user)
 
@@ -291,13 +294,13 @@ async def update_user(
 
 async def update_user_avatar(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     avatar_file: UploadFile | None = None,
 ):
     # Get user
     statement = select(User).where(User.id == current_user.id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -326,8 +329,9 @@ async def update_user_avatar(
 
     # Update user in database
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    invalidate_cached_user(user.id)  # type: ignore
 
     user = UserRead.model_validate(user)
 
@@ -336,14 +340,14 @@ async def update_user_avatar(
 
 async def update_user_password(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_id: int,
     form: UserUpdatePassword,
 ):
     # Get user
     statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -354,19 +358,20 @@ async def update_user_password(
     # RBAC check
     await rbac_check(request, current_user, "update", user.user_uuid, db_session)
 
-    if not security_verify_password(form.old_password, user.password):
+    if not await verify_password(form.old_password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Wrong password"
         )
 
     # Update user
-    user.password = security_hash_password(form.new_password)
+    user.password = await hash_password(form.new_password)
     user.update_date = str(datetime.now())
 
     # Update user in database
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    invalidate_cached_user(user.id)  # type: ignore
 
     user = UserRead.model_validate(user)
 
@@ -375,13 +380,13 @@ async def update_user_password(
 
 async def read_user_by_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_id: int,
 ):
     # Get user
     statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -399,13 +404,13 @@ async def read_user_by_id(
 
 async def read_user_by_uuid(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_uuid: str,
 ):
     # Get user
     statement = select(User).where(User.user_uuid == user_uuid)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -423,12 +428,12 @@ async def read_user_by_uuid(
 
 async def get_user_session(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
 ) -> UserSession:
     # Get user
     statement = select(User).where(User.user_uuid == current_user.user_uuid)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -444,18 +449,18 @@ async def get_user_session(
         .where(UserOrganization.user_id == user.id)
         .join(Organization)
     )
-    user_organizations = db_session.exec(statement).all()
+    user_organizations = (await db_session.exec(statement)).all()
 
     roles = []
 
     for user_organization in user_organizations:
         role_statement = select(Role).where(Role.id == user_organization.role_id)
-        role = db_session.exec(role_statement).first()
+        role = (await db_session.exec(role_statement)).first()
 
         org_statement = select(Organization).where(
             Organization.id == user_organization.org_id
         )
-        org = db_session.exec(org_statement).first()
+        org = (await db_session.exec(org_statement)).first()
 
         roles.append(
             UserRoleWithOrg(
@@ -474,14 +479,14 @@ async def get_user_session(
 
 async def authorize_user_action(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     resource_uuid: str,
     action: Literal["create", "read", "update", "delete"],
 ):
     # Get user
     statement = select(User).where(User.user_uuid == current_user.user_uuid)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -507,13 +512,13 @@ async def authorize_user_action(
 
 async def delete_user_by_id(
     request: Request,
-    db_session: Session,
+    db_session: AsyncSession,
     current_user: PublicUser | AnonymousUser,
     user_id: int,
 ):
     # Get user
     statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -525,8 +530,9 @@ async def delete_user_by_id(
     await rbac_check(request, current_user, "delete", user.user_uuid, db_session)
 
     # Delete user
-    db_session.delete(user)
-    db_session.commit()
+    await db_session.delete(user)
+    await db_session.commit()
+    invalidate_cached_user(user_id)
 
     return "User deleted"
 
@@ -534,10 +540,10 @@ async def delete_user_by_id(
 # Utils & Security functions
 
 
-async def security_get_user(request: Request, db_session: Session, email: str) -> User:
+async def security_get_user(request: Request, db_session: AsyncSession, email: str) -> User:
     # Check if user exists
     statement = select(User).where(User.email == email)
-    user = db_session.exec(statement).first()
+    user = (await db_session.exec(statement)).first()
 
     if not user:
         raise HTTPException(
@@ -558,7 +564,7 @@ async def rbac_check(
     current_user: PublicUser | AnonymousUser,
     action: Literal["create", "read", "update", "delete"],
     user_uuid: str,
-    db_session: Session,
+    db_session: AsyncSession,
 ):
     if action == "create":
         if current_user.id == 0:  # if user is anonymous
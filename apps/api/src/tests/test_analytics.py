@@ -0,0 +1,118 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.db.analytics import CourseAnalytics
+from src.db.courses.activities import Activity
+from src.db.courses.courses import Course
+from src.db.users import AnonymousUser
+from src.security.rbac.rights_cache import compile_rights, rights_cache
+from src.services.analytics import analytics
+from src.services.analytics.analytics import get_course_analytics, get_median_seconds
+from src.services.analytics.rollups import get_time_bucket, rebuild_analytics, refresh_analytics
+from src.services.trail import progress
+from src.services.trail.progress import ProgressEvent, write_progress
+from src.tests.test_course_tree import seed_course
+from src.tests.test_rbac import create_schema, make_role, seed_authorizations
+
+
+def record(db_session: Session, user_id: int, activity_ids: list[int], day: int):
+    write_progress(
+        db_session,
+        [
+            ProgressEvent(user_id=user_id, activity_id=activity_id, recorded_at=f"2026-01-{day:02d} 10:00:00")
+            for activity_id in activity_ids
+        ],
+    )
+
+
+def rollup_progress(db_session: Session) -> str:
+    seed_course(db_session, "funnel", 1, 3)
+    course = db_session.exec(select(Course)).one()
+    activity_ids = db_session.exec(select(Activity.id).order_by(Activity.id)).all()  # type: ignore
+
+    record(db_session, 1, activity_ids, 1)
+    record(db_session, 2, activity_ids[:2], 1)
+    record(db_session, 3, activity_ids[:1], 1)
+
+    # Rows are rolled up one refresh after they are first seen
+    assert refresh_analytics(db_session) == 0
+    assert refresh_analytics(db_session) == 6
+
+    record(db_session, 2, activity_ids[2:], 3)
+    refresh_analytics(db_session)
+    assert refresh_analytics(db_session) == 1
+    assert refresh_analytics(db_session) == 0
+
+    rollup = db_session.get(CourseAnalytics, course.id)
+    assert (rollup.learners_started, rollup.learners_completed) == (3, 2)  # type: ignore
+    return course.course_uuid
+
+
+def test_rollups_are_refreshed_incrementally(monkeypatch):
+    monkeypatch.setattr(progress, "bump_trail_versions", lambda trails: None)
+    monkeypatch.setattr(analytics, "check_limits_with_usage", lambda *args: asyncio.sleep(0))
+    teacher = compile_rights([(1, make_role(4, None, courses={"action_update": True}))], [])
+    monkeypatch.setattr(analytics, "get_user_rights", lambda *args: asyncio.sleep(0, teacher))
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def run():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            course_uuid = await db_session.run_sync(rollup_progress)
+            read = await get_course_analytics(
+                SimpleNamespace(state=SimpleNamespace()), course_uuid, SimpleNamespace(id=1), db_session  # type: ignore
+            )
+            rebuilt = await db_session.run_sync(rebuild_analytics)
+        return read, rebuilt
+
+    read, rebuilt = asyncio.run(run())
+
+    assert [activity.completions for activity in read.activities] == [3, 2, 2]
+    assert [activity.drop_off for activity in read.activities] == [0, 1, 0]
+    # Learners took a few seconds and two days, the median is the upper one
+    assert read.median_time_to_complete and read.median_time_to_complete > 86400
+    assert read.refreshed_at
+    assert rebuilt == 7
+
+
+def test_analytics_are_only_read_by_teachers_of_the_course_org(monkeypatch):
+    monkeypatch.setattr(analytics, "check_limits_with_usage", lambda *args: asyncio.sleep(0))
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    request = SimpleNamespace(state=SimpleNamespace())
+
+    async def run():
+        await create_schema(engine)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            _, _, joker = await db_session.run_sync(seed_authorizations)
+
+            # The joker runs Arkham, not Wayne
+            read = await get_course_analytics(request, "course_asylum", joker, db_session)  # type: ignore
+            denied = []
+            for user in (joker, AnonymousUser()):
+                with pytest.raises(HTTPException) as error:
+                    await get_course_analytics(request, "course_public", user, db_session)  # type: ignore
+                denied.append(error.value.status_code)
+        return read, denied
+
+    try:
+        read, denied = asyncio.run(run())
+    finally:
+        rights_cache.invalidate()
+
+    assert read.activities == []
+    assert denied == [403, 403]
+
+
+def test_median_of_completion_time_histogram():
+    histogram = {get_time_bucket(60): 1, get_time_bucket(3600): 2, get_time_bucket(86400): 1}
+    assert 3000 < get_median_seconds(histogram) < 4300  # type: ignore
+    assert get_median_seconds({}) is None
@@ -0,0 +1,36 @@
+import pytest
+from src.services.courses.chapter_graph import ChapterGraph
+
+
+def test_topological_order_follows_predecessors():
+    graph = ChapterGraph([1, 2, 3, 4, 5], [(3, 1), (1, 2), (3, 4)])
+
+    assert graph.topological_order() == [3, 1, 2, 4, 5]
+    assert graph.reaches(3, 2) and not graph.reaches(2, 3)
+
+
+def test_edges_closing_a_cycle_are_rejected():
+    graph = ChapterGraph([1, 2, 3], [(1, 2)])
+    graph.add_edge(2, 3)
+
+    assert graph.creates_cycle(3, 1)
+    assert graph.creates_cycle(2, 2)
+    with pytest.raises(ValueError):
+        graph.add_edge(3, 1)
+
+    graph.remove_edge(1, 2)
+    assert not graph.creates_cycle(3, 1)
+    graph.add_edge(3, 1)
+    assert graph.topological_order() == [2, 3, 1]
+
+
+def test_long_courses_and_inconsistent_data():
+    size = 5000
+    chain = ChapterGraph(range(size), [(index, index + 1) for index in range(size - 1)])
+    assert chain.topological_order() == list(range(size))
+    assert chain.creates_cycle(size - 1, 0)
+
+    # Chapters stored on a cycle are still listed, last
+    cyclic = ChapterGraph([1, 2, 3], [(2, 3), (3, 2)])
+    assert cyclic.topological_order() == [1, 2, 3]
+    assert cyclic.reaches(2, 2)
@@ -0,0 +1,146 @@
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.core.events.database_profiling import track_queries
+from src.db.courses.activities import Activity, ActivitySubTypeEnum, ActivityTypeEnum
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.chapters import Chapter
+from src.db.courses.course_chapters import CourseChapter, CourseChapter_Graph
+from src.db.courses.courses import Course
+from src.db.organizations import Organization
+from src.db.resource_authors import ResourceAuthor
+from src.db.users import AnonymousUser
+from src.services.courses import outline_cache
+from src.services.courses.chapters import get_course_chapters_meta
+from src.services.courses.courses import get_course_meta
+
+
+def seed_course(db_session: Session, name: str, chapters: int, activities: int) -> str:
+    org = db_session.get(Organization, 1)
+    if not org:
+        org = Organization(id=1, name="Wayne", description="", slug="wayne", email="", logo_image="", thumbnail_image="")
+        db_session.add(org)
+
+    course = Course(
+        name=name, description="", about="", learnings="", tags="", thumbnail_image="",
+        public=True, org_id=1, course_uuid=f"course_{name}",
+    )
+    db_session.add(course)
+    db_session.flush()
+
+    previous = None
+    for chapter_index in range(chapters):
+        chapter = Chapter(name=f"{name}_{chapter_index}", org_id=1, course_id=course.id, chapter_uuid=f"chapter_{name}_{chapter_index}")  # type: ignore
+        db_session.add(chapter)
+        db_session.flush()
+        db_session.add(CourseChapter(course_id=course.id, chapter_id=chapter.id, org_id=1, creation_date="", update_date=""))  # type: ignore
+        if previous:
+            db_session.add(CourseChapter_Graph(course_id=course.id, chapter_id=chapter.id, predecessor_id=previous.id))  # type: ignore
+
+        for order in range(activities):
+            activity = Activity(
+                name=f"activity_{order}",
+                activity_type=ActivityTypeEnum.TYPE_DYNAMIC,
+                activity_sub_type=ActivitySubTypeEnum.SUBTYPE_DYNAMIC_PAGE,
+                org_id=1,
+                course_id=course.id,  # type: ignore
+                activity_uuid=f"activity_{name}_{chapter_index}_{order}",
+            )
+            db_session.add(activity)
+            db_session.flush()
+            db_session.add(ChapterActivity(order=order, chapter_id=chapter.id, activity_id=activity.id, course_id=course.id, org_id=1, creation_date="", update_date=""))  # type: ignore
+        previous = chapter
+
+    db_session.commit()
+    return course.course_uuid
+
+
+def test_course_meta_query_count_does_not_depend_on_course_size():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def run():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            small = await db_session.run_sync(lambda session: seed_course(session, "small", 1, 1))
+            large = await db_session.run_sync(lambda session: seed_course(session, "large", 20, 10))
+
+        counts = {}
+        metas = {}
+        for course_uuid in (small, large):
+            async with AsyncSession(engine, expire_on_commit=False) as db_session:
+                request = SimpleNamespace(state=SimpleNamespace())
+                with track_queries() as stats:
+                    metas[course_uuid] = await get_course_meta(
+                        request, course_uuid, AnonymousUser(), db_session  # type: ignore
+                    )
+                counts[course_uuid] = stats.count
+        return counts[small], counts[large], metas[large]
+
+    small_count, large_count, meta = asyncio.run(run())
+
+    assert small_count == large_count
+    assert len(meta.chapters) == 20
+    assert all(len(chapter.activities) == 10 for chapter in meta.chapters)
+    assert [activity.name for activity in meta.chapters[0].activities] == [
+        f"activity_{order}" for order in range(10)
+    ]
+    assert sum(len(chapter.predecessors) for chapter in meta.chapters) == 19
+
+
+def test_structure_changes_bump_the_outline_version_on_commit(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    bumped: list[set[int]] = []
+    monkeypatch.setattr(outline_cache, "bump_course_outline_versions", bumped.append)
+
+    with Session(engine) as db_session:
+        seed_course(db_session, "bumped", 2, 1)
+        bumped.clear()
+
+        activity = db_session.exec(select(Activity)).first()
+        activity.name = "renamed"  # type: ignore
+        db_session.add(activity)
+        db_session.flush()
+        assert bumped == []
+        db_session.commit()
+        assert bumped == [{activity.course_id}]  # type: ignore
+
+        db_session.add(ResourceAuthor(resource_uuid="course_bumped", user_id=1))
+        db_session.flush()
+        db_session.rollback()
+        assert len(bumped) == 1
+
+        db_session.add(ResourceAuthor(resource_uuid="course_bumped", user_id=1))
+        db_session.commit()
+        assert bumped[-1] == {activity.course_id}  # type: ignore
+
+
+def test_legacy_chapters_meta_is_scoped_to_the_course():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def run():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            course_uuid = await db_session.run_sync(lambda session: seed_course(session, "legacy", 2, 3))
+            await db_session.run_sync(lambda session: seed_course(session, "other", 4, 4))
+            request = SimpleNamespace(state=SimpleNamespace())
+            return await get_course_chapters_meta(
+                request, course_uuid, AnonymousUser(), db_session, with_content=False  # type: ignore
+            )
+
+    meta = asyncio.run(run())
+
+    assert meta["chapterOrder"] == ["chapter_legacy_0", "chapter_legacy_1"]
+    assert meta["chapters"]["chapter_legacy_1"]["activityIds"] == [
+        f"activity_legacy_1_{order}" for order in range(3)
+    ]
+    assert len(meta["activities"]) == 6
+    assert all("content" not in activity for activity in meta["activities"].values())
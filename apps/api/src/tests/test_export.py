@@ -0,0 +1,160 @@
+import asyncio
+import csv
+import io
+import json
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.db.courses.activities import Activity
+from src.db.courses.assignments import (
+    Assignment,
+    AssignmentUserSubmission,
+    AssignmentUserSubmissionStatus,
+    GradingTypeEnum,
+)
+from src.db.courses.chapters import Chapter
+from src.db.organizations import Organization
+from src.db.users import User
+from src.security.rbac.rights_cache import rights_cache
+from src.services.trail import progress
+from src.services.trail.export import (
+    EXPORT_COLUMNS,
+    export_learning_records,
+    get_learning_records,
+    write_learning_records,
+)
+from src.services.trail.progress import ProgressEvent, write_progress
+from src.tests.test_course_tree import seed_course
+from src.tests.test_rbac import create_schema, seed_authorizations
+
+
+def seed_learning_records(db_session: Session) -> str:
+    """
+    Two learners of a three activity course, the second one graded once,
+    returns the uuid of the graded activity
+    """
+    seed_course(db_session, "export", 1, 3)
+    activities = db_session.exec(select(Activity).order_by(Activity.id)).all()  # type: ignore
+    chapter = db_session.exec(select(Chapter)).one()
+
+    for user_id in (1, 2):
+        db_session.add(
+            User(
+                id=user_id,
+                username=f"learner_{user_id}",
+                first_name="",
+                last_name="",
+                email=f"learner_{user_id}@wayne.org",
+            )
+        )
+    db_session.add(
+        Assignment(
+            id=1,
+            title="",
+            description="",
+            due_date="",
+            grading_type=GradingTypeEnum.NUMERIC,
+            org_id=1,
+            course_id=activities[0].course_id,
+            chapter_id=chapter.id,  # type: ignore
+            activity_id=activities[0].id,  # type: ignore
+            assignment_uuid="assignment_export",
+        )
+    )
+    db_session.add(
+        AssignmentUserSubmission(
+            grade=80,
+            user_id=2,
+            assignment_id=1,
+            submission_status=AssignmentUserSubmissionStatus.GRADED,
+            creation_date="",
+            update_date="",
+            assignmentusersubmission_uuid="submission_export",
+        )
+    )
+    db_session.commit()
+
+    write_progress(
+        db_session,
+        [
+            ProgressEvent(user_id=1, activity_id=activity.id, recorded_at="2026-01-01")  # type: ignore
+            for activity in activities
+        ],
+    )
+    write_progress(
+        db_session,
+        [ProgressEvent(user_id=2, activity_id=activities[0].id, recorded_at="2026-01-02")],  # type: ignore
+    )
+    return activities[0].activity_uuid
+
+
+def test_learning_records_are_exported_in_chunks(monkeypatch):
+    monkeypatch.setattr(progress, "bump_trail_versions", lambda trails: None)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as db_session:
+        graded_activity_uuid = seed_learning_records(db_session)
+
+        chunks = list(
+            write_learning_records(get_learning_records(db_session, 1), "ndjson", chunk_size=512)
+        )
+        csv_export = "".join(
+            write_learning_records(get_learning_records(db_session, 1), "csv")
+        )
+        other_org_records = list(get_learning_records(db_session, 2))
+
+    records = [json.loads(line) for line in "".join(chunks).splitlines()]
+    rows = list(csv.reader(io.StringIO(csv_export)))
+
+    # Chunks end on record boundaries
+    assert len(chunks) > 1
+    assert all(chunk.endswith("\n") for chunk in chunks)
+
+    assert [record["record_type"] for record in records] == [
+        *["trail"] * 2,
+        *["run"] * 2,
+        *["step"] * 4,
+        "grade",
+    ]
+    run = records[2]
+    assert run["username"] == "learner_1"
+    assert (run["completed_steps"], run["course_total_steps"]) == (3, 3)
+    grade = records[-1]
+    assert (grade["status"], grade["grade"]) == ("GRADED", 80)
+    assert grade["activity_uuid"] == graded_activity_uuid
+
+    assert rows[0] == EXPORT_COLUMNS
+    assert len(rows) == len(records) + 1
+    assert rows[-1][EXPORT_COLUMNS.index("status")] == "GRADED"
+
+    assert other_org_records == []
+
+
+def test_learning_records_are_only_exported_to_the_org_admins():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    request = SimpleNamespace(app=SimpleNamespace(db_engine=engine))
+
+    async def run():
+        await create_schema(engine)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            _, _, joker = await db_session.run_sync(seed_authorizations)
+            wayne, arkham = (await db_session.exec(select(Organization).order_by(Organization.id))).all()
+
+            # The joker runs Arkham, not Wayne
+            response = await export_learning_records(request, arkham.id, "csv", joker, db_session)  # type: ignore
+            assert response.status_code == 200
+            with pytest.raises(HTTPException) as denied:
+                await export_learning_records(request, wayne.id, "csv", joker, db_session)  # type: ignore
+            return denied.value.status_code
+
+    try:
+        assert asyncio.run(run()) == 403
+    finally:
+        rights_cache.invalidate()
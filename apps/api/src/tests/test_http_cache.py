@@ -0,0 +1,29 @@
+from fastapi import Response
+from starlette.requests import Request
+from src.core.http_cache import check_not_modified, make_etag
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_check_not_modified_returns_304_for_a_known_etag():
+    etag = make_etag("org", 1, "2024-01-01")
+    assert etag == make_etag("org", 1, "2024-01-01")
+    assert etag != make_etag("org", 1, "2024-01-02")
+
+    response = Response()
+    assert check_not_modified(make_request(), response, etag, public=True) is None
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    for header in (etag, f'"other", W/{etag}', "*"):
+        not_modified = check_not_modified(make_request(header), Response(), etag)
+        assert not_modified is not None
+        assert not_modified.status_code == 304
+        assert not_modified.headers["cache-control"] == "private, no-cache"
+
+    assert check_not_modified(make_request('"other"'), Response(), etag) is None
+    # Internal calls are never answered with a 304
+    assert check_not_modified(make_request(etag), None, etag) is None
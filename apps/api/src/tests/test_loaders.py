@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.core.events.database_profiling import track_queries
+from src.db.resource_authors import ResourceAuthor
+from src.db.users import User
+from src.services.loaders import get_loaders
+
+
+def seed_authors(db_session: Session) -> tuple[list[str], User]:
+    users = [
+        User(username=name, first_name="", last_name="", email=f"{name}@wayne.com", user_uuid=f"user_{name}")
+        for name in ("bruce", "alfred")
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    bruce, alfred = users
+    course_uuids = [f"course_{index}" for index in range(50)]
+    db_session.add_all(
+        [ResourceAuthor(resource_uuid=uuid, user_id=bruce.id) for uuid in course_uuids]  # type: ignore
+        + [ResourceAuthor(resource_uuid=course_uuids[0], user_id=alfred.id)]  # type: ignore
+    )
+    db_session.commit()
+    return course_uuids, bruce
+
+
+def test_loaders_batch_and_memoize_per_request():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    request = SimpleNamespace(state=SimpleNamespace())
+
+    async def load():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            course_uuids, bruce = await db_session.run_sync(seed_authors)
+
+            with track_queries() as stats:
+                loaders = get_loaders(request, db_session)  # type: ignore
+                authors = await loaders.authors_by_resource_uuid.load_many(
+                    [*course_uuids, "course_unknown"]
+                )
+                # Loads awaited together share a batch
+                user, missing = await asyncio.gather(
+                    loaders.users_by_id.load(bruce.id),  # type: ignore
+                    loaders.users_by_id.load(0),
+                )
+                # Memoized for the rest of the request
+                await get_loaders(request, db_session).authors_by_resource_uuid.load(course_uuids[1])  # type: ignore
+        return stats, authors, user, bruce, missing
+
+    stats, authors, user, bruce, missing = asyncio.run(load())
+
+    assert stats.count == 2
+    assert [author.username for author in authors[0]] == ["bruce", "alfred"]
+    assert all(len(course_authors) == 1 for course_authors in authors[1:50])
+    assert authors[50] == []
+    assert user is bruce and missing is None
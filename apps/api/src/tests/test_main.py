@@ -1,11 +1,14 @@
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.tests.utils.init_data_for_tests import create_initial_data_for_tests
-from src.core.events.database import get_db_session
+from src.core.events.database import (
+    get_async_connection_string,
+    get_async_db_session,
+)
 import pytest
-import asyncio
 from app import app
 
 client = TestClient(app)
@@ -13,22 +16,29 @@ client = TestClient(app)
 # TODO : fix this later https://stackoverflow.com/questions/10253826/path-issue-with-pytest-importerror-no-module-named
 
 
+@pytest.fixture(name="db_url", scope="session")
+def db_url_fixture(tmp_path_factory):
+    # File based so that the sync and async engines share the same database
+    return f"sqlite:///{tmp_path_factory.mktemp('db') / 'learnhouse.db'}"
+
+
 @pytest.fixture(name="session", scope="session")
-def session_fixture():
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
-    )
+def session_fixture(db_url: str):
+    engine = create_engine(db_url, connect_args={"check_same_thread": False})
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         yield session
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
-    def get_session_override():
-        return session
+def client_fixture(db_url: str):
+    async_engine = create_async_engine(get_async_connection_string(db_url))
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
 
-    app.dependency_overrides[get_db_session] = get_session_override
+    app.dependency_overrides[get_async_db_session] = get_async_session_override
 
     client = TestClient(app)
     yield client
@@ -38,7 +48,7 @@ def client_fixture(session: Session):
 @pytest.fixture(scope="session", autouse=True)
 def execute_before_all_tests(session: Session):
     # This function will run once before all tests.
-    asyncio.run(create_initial_data_for_tests(session))
+    create_initial_data_for_tests(session)
 
 
 def test_create_default_elements(client: TestClient, session: Session):
@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.core import pagination
+from src.core.pagination import decode_cursor, encode_cursor, paginate
+from src.db.users import User
+
+
+def test_paginate_walks_every_row_once(monkeypatch):
+    monkeypatch.setattr(pagination, "TOTAL_COUNT_CAP", 20)
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    statement = select(User).where(User.username != "user3")
+
+    async def walk():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            db_session.add_all(
+                [
+                    User(username=f"user{index}", first_name="", last_name="", email=f"user{index}@wayne.com", user_uuid=f"user_{index}")
+                    for index in range(25)
+                ]
+            )
+            await db_session.commit()
+
+            pages, cursor = [], None
+            while True:
+                page = await paginate(statement, User.id, db_session, cursor, 10, include_total=not pages)
+                pages.append(page)
+                cursor = page.next_cursor
+                if not cursor:
+                    return pages
+
+    pages = asyncio.run(walk())
+
+    assert [len(page.items) for page in pages] == [10, 10, 4]
+    usernames = [user.username for page in pages for user in page.items]
+    assert usernames == [f"user{index}" for index in range(25) if index != 3]
+    assert (pages[0].total, pages[0].total_is_exact) == (20, False)
+    assert pages[1].total is None
+
+
+def test_invalid_cursors_are_rejected():
+    assert decode_cursor(encode_cursor(42)) == 42
+
+    # Keys that decode but are not integer ids are rejected as well
+    crafted = [encode_cursor(key) for key in ("1", {"id": 1}, [1], True, 1.5, None)]  # type: ignore
+    for cursor in ("not a cursor", encode_cursor(1) + "x", "W10", *crafted):
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor)
+        assert error.value.status_code == 400
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+from fastapi import HTTPException
+from passlib.hash import pbkdf2_sha256
+from src.security.password_hashing import PasswordHashingPool, verify_and_update_password
+from src.security.security import PASSWORD_HASH_ROUNDS
+
+
+def test_pool_rejects_operations_past_the_queue_limit():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def run():
+        return await asyncio.gather(
+            *[pool.run(release.wait) for _ in range(3)],
+            asyncio.get_running_loop().run_in_executor(None, release.set),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+    assert len(rejected) == 1 and rejected[0].status_code == 503
+    assert pool.get_stats().completed == 2
+    assert pool.get_stats().rejected == 1
+
+
+def test_outdated_hashes_are_upgraded():
+    outdated = pbkdf2_sha256.using(rounds=PASSWORD_HASH_ROUNDS + 1).hash("imbatman")
+
+    verified, new_hash = asyncio.run(verify_and_update_password("imbatman", outdated))
+    assert verified and new_hash
+    assert pbkdf2_sha256.from_string(new_hash).rounds == PASSWORD_HASH_ROUNDS
+
+    verified, new_hash = asyncio.run(verify_and_update_password("imbatman", new_hash))
+    assert verified and new_hash is None
+
+    verified, _ = asyncio.run(verify_and_update_password("robin", outdated))
+    assert not verified
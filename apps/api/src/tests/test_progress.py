@@ -0,0 +1,77 @@
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, func, select, update
+import src.db.models  # noqa: F401
+from src.db.courses.activities import Activity
+from src.db.courses.chapter_activities import ChapterActivity
+from src.db.courses.courses import Course
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+from src.services.trail import progress
+from src.services.trail.progress import ProgressEvent, flush_progress, progress_queue
+from src.services.trail.progress_counters import rebuild_progress_counters
+from src.tests.test_course_tree import seed_course
+
+
+def count(db_session: Session, model) -> int:
+    return db_session.exec(select(func.count()).select_from(model)).one()
+
+
+def test_progress_events_are_upserted_in_batches(monkeypatch):
+    monkeypatch.setattr(progress, "get_redis_client", lambda: None)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as db_session:
+        seed_course(db_session, "progress", 2, 3)
+        activity_ids = db_session.exec(select(Activity.id)).all()
+
+        for user_id in (1, 2):
+            for activity_id in [*activity_ids, activity_ids[0], 999]:
+                progress_queue.push(
+                    ProgressEvent(user_id=user_id, activity_id=activity_id, recorded_at=f"2026-01-0{user_id}")
+                )
+        assert flush_progress(db_session, batch_size=5) == 16
+
+        # Repeated and unknown activities are ignored, one trail and run per user
+        assert count(db_session, Trail) == 2
+        assert count(db_session, TrailRun) == 2
+        assert count(db_session, TrailStep) == 12
+
+        progress_queue.push(ProgressEvent(user_id=1, activity_id=activity_ids[1], recorded_at="2026-02-01"))
+        assert flush_progress(db_session, batch_size=5) == 1
+        assert count(db_session, TrailStep) == 12
+        step = db_session.exec(select(TrailStep).where(TrailStep.user_id == 1, TrailStep.activity_id == activity_ids[1])).one()
+        assert step.creation_date == "2026-01-01" and step.complete
+
+
+def test_progress_counters_follow_changes_and_rebuild(monkeypatch):
+    monkeypatch.setattr(progress, "get_redis_client", lambda: None)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as db_session:
+        seed_course(db_session, "counted", 2, 3)
+        course = db_session.exec(select(Course)).one()
+        assert course.activity_count == 6
+
+        activity_ids = db_session.exec(select(Activity.id)).all()
+        for activity_id in activity_ids[:4]:
+            progress_queue.push(ProgressEvent(user_id=1, activity_id=activity_id, recorded_at="2026-01-01"))
+        flush_progress(db_session, batch_size=10)
+        run = db_session.exec(select(TrailRun)).one()
+        assert run.completed_steps == 4
+
+        # Counters of the objects loaded in the session are updated too
+        db_session.delete(db_session.exec(select(ChapterActivity)).first())
+        db_session.delete(db_session.exec(select(TrailStep)).first())
+        db_session.commit()
+        assert course.activity_count == 5
+        assert run.completed_steps == 3
+
+        db_session.exec(update(Course).values(activity_count=0))  # type: ignore
+        db_session.exec(update(TrailRun).values(completed_steps=0))  # type: ignore
+        assert rebuild_progress_counters(db_session) == (1, 1)
+        db_session.refresh(course)
+        db_session.refresh(run)
+        assert (course.activity_count, run.completed_steps) == (5, 3)
@@ -0,0 +1,91 @@
+import importlib.util
+from pathlib import Path
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlmodel import SQLModel, select
+import src.db.models  # noqa: F401
+from src.db.courses.activities import Activity
+from src.db.courses.assignments import Assignment
+from src.db.courses.blocks import Block
+from src.db.courses.courses import Course
+from src.db.resource_authors import ResourceAuthor
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.usergroup_resources import UserGroupResource
+
+INDEX_MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "migrations/versions/f953ae4a2785_uuid_and_lookup_indexes.py"
+)
+
+# Lookups every request starts with, shaped like the service queries
+HOT_QUERIES = {
+    "course_by_uuid": select(Course).where(Course.course_uuid == "course_x"),
+    "activity_by_uuid": select(Activity).where(Activity.activity_uuid == "activity_x"),
+    "assignment_by_uuid": select(Assignment).where(
+        Assignment.assignment_uuid == "assignment_x"
+    ),
+    "block_by_uuid": select(Block).where(Block.block_uuid == "block_x"),
+    "authors_by_resource": select(ResourceAuthor).where(
+        ResourceAuthor.resource_uuid == "course_x"
+    ),
+    "author_of_resource": select(ResourceAuthor).where(
+        ResourceAuthor.resource_uuid == "course_x", ResourceAuthor.user_id == 1
+    ),
+    "usergroups_by_resource": select(UserGroupResource).where(
+        UserGroupResource.resource_uuid == "course_x"
+    ),
+    "trailsteps_of_run": select(TrailStep).where(
+        TrailStep.trailrun_id == 1, TrailStep.user_id == 1
+    ),
+    "trailstep_of_activity": select(TrailStep).where(
+        TrailStep.trailrun_id == 1, TrailStep.activity_id == 1, TrailStep.user_id == 1
+    ),
+    "trailsteps_of_course": select(TrailStep).where(
+        TrailStep.course_id == 1, TrailStep.user_id == 1
+    ),
+    "trailruns_of_trail": select(TrailRun).where(
+        TrailRun.trail_id == 1, TrailRun.user_id == 1
+    ),
+    "trailrun_of_course": select(TrailRun).where(
+        TrailRun.trail_id == 1, TrailRun.course_id == 1, TrailRun.user_id == 1
+    ),
+}
+
+
+@pytest.fixture(name="engine", scope="module")
+def engine_fixture():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def get_query_plan(engine: Engine, statement) -> list[str]:
+    compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return [row.detail for row in rows]
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES.keys())
+def test_hot_query_uses_an_index(engine: Engine, name: str):
+    plan = get_query_plan(engine, HOT_QUERIES[name])
+
+    # SQLite reports "SCAN <table>" for a full table scan and
+    # "SEARCH <table> USING INDEX ..." for an index lookup
+    assert not [step for step in plan if step.startswith("SCAN")], plan
+
+
+def test_index_migration_matches_models():
+    spec = importlib.util.spec_from_file_location("index_migration", INDEX_MIGRATION)
+    migration = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(migration)  # type: ignore
+
+    for name, table, columns, unique in migration.INDEXES:
+        index = next(
+            index
+            for index in SQLModel.metadata.tables[table].indexes
+            if index.name == name
+        )
+        assert [column.name for column in index.columns] == columns
+        assert bool(index.unique) == unique
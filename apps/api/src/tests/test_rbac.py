@@ -0,0 +1,267 @@
+import asyncio
+from datetime import datetime
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.core.events.database_profiling import track_queries
+from src.db.courses.courses import Course
+from src.db.organizations import OrganizationCreate
+from src.db.resource_authors import ResourceAuthor
+from src.db.roles import Role
+from src.db.usergroup_resources import UserGroupResource
+from src.db.usergroup_user import UserGroupUser
+from src.db.usergroups import UserGroup
+from src.db.user_organizations import UserOrganization
+from src.db.users import AnonymousUser, PublicUser, User
+from src.security.rbac.rbac import authorize_many, get_visibility_filter
+from src.core.cache import TTLCache
+from src.db.collections import Collection
+from src.security.rbac.rights_cache import compile_rights, rights_cache
+from src.services.courses.collections import get_collections_page
+from src.services.install.install import (
+    install_create_organization,
+    install_default_elements,
+)
+
+
+def make_role(role_id: int, org_id: int | None, **rights: dict) -> Role:
+    return Role(id=role_id, org_id=org_id, name="role", description="", rights=rights)
+
+
+def test_compile_rights_is_scoped_by_org():
+    rights = compile_rights(
+        [
+            (1, make_role(3, None, courses={"action_read": True, "action_update": False})),
+            (2, make_role(1, None, courses={"action_read": True, "action_update": True})),
+        ],
+        ["course_authored"],
+    )
+
+    assert rights.allows("courses", "read")
+    assert rights.allows("courses", "update")
+    assert rights.allows("courses", "update", org_id=2)
+    assert not rights.allows("courses", "update", org_id=1)
+    assert not rights.allows("collections", "read")
+    assert rights.is_org_admin(2) and not rights.is_org_admin(1)
+    assert rights.is_author("course_authored")
+    assert not rights.is_author("course_other")
+
+
+def test_rights_cache_ignores_loads_started_before_an_invalidation():
+    cache = TTLCache(ttl=60)
+    rights = compile_rights([], [])
+
+    generation = cache.generation
+    cache.invalidate([1])
+    cache.set(1, rights, generation)
+    assert cache.get(1) is None
+
+    cache.set(1, rights, cache.generation)
+    assert cache.get(1) is rights
+
+    cache.invalidate()
+    assert cache.get(1) is None
+
+
+def test_ttl_cache_evicts_oldest_entries():
+    cache = TTLCache(ttl=60, max_size=2)
+    for key in (1, 2, 3):
+        cache.set(key, str(key), cache.generation)
+
+    assert cache.get(1) is None
+    assert cache.get(2) == "2" and cache.get(3) == "3"
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    yield create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    rights_cache.invalidate()
+
+
+async def create_schema(engine: AsyncEngine):
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+
+
+def create_course(db_session: Session, org_id: int, name: str, public: bool) -> Course:
+    course = Course(
+        name=name,
+        description="",
+        about="",
+        learnings="",
+        tags="",
+        thumbnail_image="",
+        public=public,
+        org_id=org_id,
+        course_uuid=f"course_{name}",
+    )
+    db_session.add(course)
+    return course
+
+
+def seed_authorizations(db_session: Session) -> list[PublicUser]:
+    now = str(datetime.now())
+    install_default_elements(db_session)
+    org = install_create_organization(
+        OrganizationCreate(
+            name="Wayne", description="", slug="wayne", email="", logo_image="", thumbnail_image=""
+        ),
+        db_session,
+    )
+    users = [
+        User(username=name, first_name="", last_name="", email=f"{name}@wayne.com", user_uuid=f"user_{name}")
+        for name in ("robin", "alfred", "joker")
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    robin, alfred, joker = users
+    # The joker is signed in but not a member of the organization, he runs another one
+    for user in (robin, alfred):
+        db_session.add(
+            UserOrganization(user_id=user.id, org_id=org.id, role_id=3, creation_date=now, update_date=now)  # type: ignore
+        )
+    arkham = install_create_organization(
+        OrganizationCreate(
+            name="Arkham", description="", slug="arkham", email="", logo_image="", thumbnail_image=""
+        ),
+        db_session,
+    )
+    db_session.add(
+        UserOrganization(user_id=joker.id, org_id=arkham.id, role_id=1, creation_date=now, update_date=now)  # type: ignore
+    )
+    create_course(db_session, arkham.id, "asylum", public=False)  # type: ignore
+
+    create_course(db_session, org.id, "public", public=True)  # type: ignore
+    create_course(db_session, org.id, "private", public=False)  # type: ignore
+    create_course(db_session, org.id, "grouped", public=False)  # type: ignore
+    create_course(db_session, org.id, "authored", public=False)  # type: ignore
+    usergroup = UserGroup(name="Robins", description="", org_id=org.id, usergroup_uuid="usergroup_robins")  # type: ignore
+    db_session.add(usergroup)
+    db_session.commit()
+    db_session.add_all(
+        [
+            UserGroupResource(usergroup_id=usergroup.id, resource_uuid="course_grouped", org_id=org.id),  # type: ignore
+            UserGroupUser(usergroup_id=usergroup.id, user_id=robin.id, org_id=org.id),  # type: ignore
+            ResourceAuthor(resource_uuid="course_authored", user_id=alfred.id),  # type: ignore
+        ]
+    )
+    db_session.commit()
+    return [PublicUser.model_validate(user) for user in users]
+
+
+def test_authorize_many(engine: AsyncEngine):
+    uuids = ["course_public", "course_private", "course_grouped", "course_authored"]
+
+    async def run():
+        await create_schema(engine)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            robin, alfred, joker = await db_session.run_sync(seed_authorizations)
+            decisions = [
+                await authorize_many(user, action, uuids, db_session)
+                for user, action in (
+                    (AnonymousUser(), "read"),
+                    (robin, "read"),
+                    (alfred, "read"),
+                    (joker, "read"),
+                    (alfred, "update"),
+                )
+            ]
+
+            # The number of queries does not depend on the page size
+            with track_queries() as small_page:
+                await authorize_many(robin, "read", uuids[:1], db_session)
+            with track_queries() as full_page:
+                await authorize_many(robin, "read", uuids, db_session)
+        return decisions, small_page.count, full_page.count
+
+    decisions, small_page_count, full_page_count = asyncio.run(run())
+    anonymous, robin, alfred, joker, alfred_update = decisions
+
+    assert anonymous == {
+        "course_public": True,
+        "course_private": False,
+        "course_grouped": False,
+        "course_authored": False,
+    }
+    assert robin == {
+        "course_public": True,
+        "course_private": True,
+        "course_grouped": True,
+        "course_authored": True,
+    }
+    assert alfred["course_grouped"] is False
+    assert joker == {
+        "course_public": True,
+        "course_private": False,
+        "course_grouped": False,
+        "course_authored": False,
+    }
+    assert alfred_update == {
+        "course_public": False,
+        "course_private": False,
+        "course_grouped": False,
+        "course_authored": True,
+    }
+    assert small_page_count == full_page_count == 3
+
+
+def test_roles_are_scoped_to_their_org(engine: AsyncEngine):
+    uuids = ["course_public", "course_private", "course_grouped", "course_authored", "course_asylum"]
+
+    async def run():
+        await create_schema(engine)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            robin, _, joker = await db_session.run_sync(seed_authorizations)
+            joker_update = await authorize_many(joker, "update", uuids, db_session)
+
+            listings = []
+            for user in (robin, joker):
+                visible = await get_visibility_filter(user, "courses", db_session)
+                statement = select(Course.course_uuid).where(visible).order_by(Course.id)
+                listings.append((await db_session.exec(statement)).all())
+        return joker_update, listings
+
+    joker_update, (robin_listing, joker_listing) = asyncio.run(run())
+
+    # An admin of Arkham has no rights over the courses of Wayne
+    assert joker_update == {
+        "course_public": False,
+        "course_private": False,
+        "course_grouped": False,
+        "course_authored": False,
+        "course_asylum": True,
+    }
+    assert robin_listing == ["course_public", "course_private", "course_grouped", "course_authored"]
+    assert joker_listing == ["course_asylum", "course_public"]
+
+
+def test_listings_are_filtered_before_pagination(engine: AsyncEngine):
+    non_member = PublicUser(id=42, user_uuid="user_joker", username="joker", first_name="", last_name="", email="joker@gotham.com")
+
+    async def walk():
+        await create_schema(engine)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            # Private collections come first, a page must still be filled with public ones
+            db_session.add_all(
+                [
+                    Collection(name=f"collection_{index}", public=index >= 3, org_id=1, collection_uuid=f"collection_{index}")
+                    for index in range(6)
+                ]
+            )
+            await db_session.commit()
+
+            pages, cursor = [], None
+            while True:
+                page = await get_collections_page(None, "1", non_member, db_session, cursor, limit=2)  # type: ignore
+                pages.append([collection.collection_uuid for collection in page.items])
+                cursor = page.next_cursor
+                if not cursor:
+                    return pages
+
+    assert asyncio.run(walk()) == [["collection_3", "collection_4"], ["collection_5"]]
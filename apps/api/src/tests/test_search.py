@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.db.collections import Collection
+from src.db.courses.activities import Activity, ActivitySubTypeEnum, ActivityTypeEnum
+from src.db.courses.courses import Course
+from src.db.organizations import Organization
+from src.db.users import AnonymousUser
+from src.services.search.indexing import extract_text, reindex_search_documents
+from src.services.search.search import search_org
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    return create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+
+async def add_course(db_session: AsyncSession, name: str, public: bool) -> Course:
+    course = Course(
+        name=name, description=f"All about {name}", about="", learnings="", tags="",
+        thumbnail_image="", public=public, org_id=1, course_uuid=f"course_{name}",
+    )
+    db_session.add(course)
+    await db_session.commit()
+    return course
+
+
+async def search(db_session: AsyncSession, query: str) -> list[str]:
+    request = SimpleNamespace(state=SimpleNamespace())
+    results = await search_org(request, "wayne", query, AnonymousUser(), db_session)  # type: ignore
+    return [result.resource_uuid for result in results]
+
+
+def test_extract_text_keeps_document_order():
+    content = {
+        "type": "doc",
+        "content": [
+            {"type": "heading", "content": [{"type": "text", "text": "Gotham"}]},
+            {"type": "paragraph", "content": [{"type": "text", "text": "at"}, {"type": "text", "text": "night"}]},
+        ],
+    }
+    assert extract_text(content) == "Gotham at night"
+
+
+def test_search_index_follows_changes_and_access_rules(engine: AsyncEngine):
+    async def run():
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            db_session.add(Organization(id=1, name="Wayne", description="", slug="wayne", email="", logo_image="", thumbnail_image=""))
+            public = await add_course(db_session, "batmobile", public=True)
+            await add_course(db_session, "batcave", public=False)
+            db_session.add(
+                Activity(
+                    name="Engines",
+                    activity_type=ActivityTypeEnum.TYPE_DYNAMIC,
+                    activity_sub_type=ActivitySubTypeEnum.SUBTYPE_DYNAMIC_PAGE,
+                    content={"type": "doc", "content": [{"type": "text", "text": "Turbine maintenance"}]},
+                    org_id=1, course_id=public.id, activity_uuid="activity_engines",  # type: ignore
+                )
+            )
+            db_session.add(Collection(name="Vehicles", public=True, org_id=1, collection_uuid="collection_vehicles"))
+            await db_session.commit()
+
+            # Prefix matches, private courses are hidden from anonymous users
+            assert await search(db_session, "bat") == ["course_batmobile"]
+            assert await search(db_session, "turb") == ["activity_engines"]
+            assert await search(db_session, "vehicles") == ["collection_vehicles"]
+            assert await search(db_session, 'mainte" OR *') == []
+
+            public.name = "tumbler"
+            public.description = "Fast cars"
+            db_session.add(public)
+            await db_session.commit()
+            assert await search(db_session, "batmobile") == []
+            assert await search(db_session, "tumbler") == ["course_batmobile"]
+
+            activity = (await db_session.exec(select(Activity))).one()
+            await db_session.delete(activity)
+            await db_session.flush()
+            await db_session.rollback()
+            assert await search(db_session, "turbine") == ["activity_engines"]
+
+            assert await db_session.run_sync(reindex_search_documents) == 4
+            assert await search(db_session, "turbine") == ["activity_engines"]
+
+            await db_session.delete(public)
+            await db_session.commit()
+            assert await search(db_session, "tumbler") == []
+            assert await search(db_session, "turbine") == []
+
+    asyncio.run(run())
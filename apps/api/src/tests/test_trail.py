@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+import src.db.models  # noqa: F401
+from src.core.events.database_profiling import track_queries
+from src.db.courses.activities import Activity
+from src.db.courses.courses import Course
+from src.db.trail_runs import TrailRun
+from src.db.trail_steps import TrailStep
+from src.db.trails import Trail
+from src.db.users import PublicUser
+from src.services.trail.trail import add_activity_to_trail, get_trail_read, insert_or_get
+from src.tests.test_course_tree import seed_course
+
+
+def seed_progress(db_session: Session, courses: int, activities: int) -> Trail:
+    trail = Trail(org_id=1, user_id=1, trail_uuid="trail_1", creation_date="", update_date="")
+    db_session.add(trail)
+    db_session.flush()
+
+    for index in range(courses):
+        seed_course(db_session, f"course{index}", 2, activities)
+        course = db_session.exec(select(Course).where(Course.course_uuid == f"course_course{index}")).one()
+        run = TrailRun(trail_id=trail.id, course_id=course.id, org_id=1, user_id=1, creation_date="", update_date="")  # type: ignore
+        db_session.add(run)
+        db_session.flush()
+        for activity in db_session.exec(select(Activity).where(Activity.course_id == course.id)).all():
+            db_session.add(
+                TrailStep(
+                    trailrun_id=run.id, activity_id=activity.id, course_id=course.id, trail_id=trail.id,  # type: ignore
+                    org_id=1, complete=True, teacher_verified=False, grade="", user_id=1,
+                    creation_date="", update_date="",
+                )
+            )
+
+    db_session.commit()
+    return trail
+
+
+def test_trail_read_query_count_does_not_depend_on_progress():
+    async def read(courses: int, activities: int):
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            trail = await db_session.run_sync(lambda session: seed_progress(session, courses, activities))
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            request = SimpleNamespace(state=SimpleNamespace())
+            with track_queries() as stats:
+                trail_read = await get_trail_read(request, trail, db_session)  # type: ignore
+        return stats.count, trail_read
+
+    small_count, _ = asyncio.run(read(1, 1))
+    large_count, trail_read = asyncio.run(read(5, 10))
+
+    assert small_count == large_count
+    assert len(trail_read.runs) == 5
+    run = trail_read.runs[0]
+    assert run.course_total_steps == 20 and len(run.steps) == 20
+    assert run.course.course_uuid == "course_course0"  # type: ignore
+    assert all(step.data["course"] is run.course for step in run.steps)
+
+
+def test_concurrent_first_visits_share_their_trail_rows():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+        async with AsyncSession(engine, expire_on_commit=False) as db_session:
+            trail = await db_session.run_sync(lambda session: seed_progress(session, 1, 1))
+            run_id = (await db_session.exec(select(TrailRun.id))).one()
+
+            # A run inserted by another request between the select and the insert
+            statement = select(TrailRun).where(TrailRun.course_id == 1, TrailRun.user_id == 1)
+            duplicate = TrailRun(trail_id=trail.id, course_id=1, org_id=1, user_id=1, creation_date="", update_date="")  # type: ignore
+            existing = await insert_or_get(db_session, duplicate, statement)
+            await db_session.commit()
+
+            # First visit of another learner creates the trail, run and step
+            learner = PublicUser(id=2, user_uuid="user_2", username="learner", first_name="", last_name="", email="learner@wayne.com")
+            request = SimpleNamespace(state=SimpleNamespace())
+            activity_uuid = (await db_session.exec(select(Activity.activity_uuid))).first()
+            trail_read = await add_activity_to_trail(request, learner, activity_uuid, db_session)  # type: ignore
+            runs = (await db_session.exec(select(TrailRun.user_id))).all()
+        return run_id, existing, trail_read, runs
+
+    run_id, existing, trail_read, runs = asyncio.run(run())
+
+    assert existing.id == run_id
+    assert sorted(runs) == [1, 2]
+    assert trail_read.user_id == 2
+    assert [len(run.steps) for run in trail_read.runs] == [1]
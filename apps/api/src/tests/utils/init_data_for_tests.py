@@ -8,10 +8,9 @@ from src.services.install.install import (
     install_default_elements,
 )
 
-# TODO: Depreceated and need to be removed and remade
-async def create_initial_data_for_tests(db_session: Session):
+def create_initial_data_for_tests(db_session: Session):
     # Install default elements
-    await install_default_elements({}, db_session)
+    install_default_elements(db_session)
 
     # Initiate test Organization
     test_org = OrganizationCreate(
@@ -23,7 +22,7 @@ async def create_initial_data_for_tests(db_session: Session):
     )
 
     # Create test organization
-    await install_create_organization(test_org, db_session)
+    install_create_organization(test_org, db_session)
 
     users = [
         UserCreate(
@@ -44,7 +43,7 @@ async def create_initial_data_for_tests(db_session: Session):
 
     # Create 2 users in that Organization
     for user in users:
-        await install_create_organization_user(user, "wayne", db_session)
+        install_create_organization_user(user, "wayne", db_session)
 
     # Make robin a normal user
     statement = select(UserOrganization).join(User).where(User.username == "robin")